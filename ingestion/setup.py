@@ -178,7 +178,8 @@ base_requirements = {
     VERSIONS["snowflake-connector"],
     "mysql-connector-python>=8.0.29;python_version<'3.9'",
     "mysql-connector-python>=9.1;python_version>='3.9'",
-    "httpx~=0.28.0",
+    "httpx[http2]~=0.28.0",
+    "greenlet>=1.0",
 }
 
 plugins: Dict[str, Set[str]] = {
@@ -41,12 +41,13 @@ def delete_entity_from_source(
     :param params: param to fetch the entity state
     """
     try:
-        entity_state = metadata.list_all_entities(entity=entity_type, params=params)
+        # Only the entities to delete are worth building their models
+        entity_state = metadata.list_all_entity_dicts(entity=entity_type, params=params)
         for entity in entity_state:
-            if str(entity.fullyQualifiedName.root) not in entity_source_state:
+            if entity["fullyQualifiedName"] not in entity_source_state:
                 yield Either(
                     right=DeleteEntity(
-                        entity=entity,
+                        entity=entity_type(**entity),
                         mark_deleted_entities=mark_deleted_entity,
                     )
                 )
@@ -125,6 +125,19 @@ class Status(BaseModel):
         """
         self.failures.extend(failures)
 
+    def merge(self, other: "Status") -> None:
+        """
+        Add the results of another status, e.g., from the same step
+        running in a different process
+        """
+        self.source_start_time = min(self.source_start_time, other.source_start_time)
+        self.records.extend(other.records)
+        self.record_count += other.record_count
+        self.updated_records.extend(other.updated_records)
+        self.warnings.extend(other.warnings)
+        self.filtered.extend(other.filtered)
+        self.failures.extend(other.failures)
+
     def calculate_success(self) -> float:
         record_count = self.record_count if self.record_count > 0 else len(self.records)
         source_success = max(
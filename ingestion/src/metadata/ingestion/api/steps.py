@@ -12,7 +12,7 @@
 Abstract definition of each step
 """
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Optional
+from typing import Any, Hashable, Iterable, Optional
 
 from metadata.ingestion.api.models import Entity
 from metadata.ingestion.api.step import BulkStep, IterStep, ReturnStep, StageStep
@@ -22,6 +22,7 @@ from metadata.utils.execution_time_tracker import (
     calculate_execution_time_generator,
 )
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.tracer import Tracer
 
 logger = ingestion_logger()
 
@@ -59,6 +60,21 @@ class Source(IterStep, ABC):
     def run(self) -> Iterable[Optional[Entity]]:
         yield from super().run()
 
+    def get_record_ordering_key(  # pylint: disable=unused-argument
+        self, record: Entity
+    ) -> Optional[Hashable]:
+        """
+        Used by the pipelined workflow execution with the record that was just yielded.
+
+        Records sharing a key are processed in order, while records with different keys
+        can be processed concurrently. A `None` key means that the record is a barrier:
+        everything yielded before is processed first, and the source won't be asked for
+        more records until the record has been processed.
+
+        By default, every record is a barrier, keeping the sequential behavior.
+        """
+        return None
+
 
 class Sink(ReturnStep, ABC):
     """All Sinks must inherit this base class."""
@@ -69,7 +85,16 @@ class Sink(ReturnStep, ABC):
 
     @calculate_execution_time(context="Sink")
     def run(self, record: Entity) -> Optional[Entity]:
-        return super().run(record)
+        with Tracer().span(
+            "Sink", category="sink", args={"record": type(record).__name__}
+        ):
+            return super().run(record)
+
+    def flush(self) -> None:
+        """
+        Persist the records the sink holds back, e.g., buffered for bulk requests.
+        The workflow calls it before checkpointing its progress.
+        """
 
 
 class Processor(ReturnStep, ABC):
@@ -12,12 +12,26 @@
 Mixin to be used by service sources to dynamically
 generate the _run based on their topology.
 """
-import math
-import time
+import itertools
+import queue
+import threading
 import traceback
 from collections import defaultdict
+from contextlib import nullcontext
 from functools import singledispatchmethod
-from typing import Any, Generic, Iterable, List, Type, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel
 
@@ -31,11 +45,12 @@ from metadata.ingestion.models.ometa_classification import OMetaTagAndClassifica
 from metadata.ingestion.models.patch_request import PatchRequest
 from metadata.ingestion.models.topology import (
     NodeStage,
-    Queue,
     ServiceTopology,
     TopologyContextManager,
     TopologyNode,
+    TopologyShard,
     get_topology_node,
+    get_topology_nodes,
     get_topology_root,
 )
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
@@ -43,13 +58,23 @@ from metadata.ingestion.ometa.utils import model_str
 from metadata.utils.custom_thread_pool import CustomThreadPoolExecutor
 from metadata.utils.execution_time_tracker import ExecutionTimeTrackerContextMap
 from metadata.utils.logger import ingestion_logger
-from metadata.utils.source_hash import generate_source_hash
+from metadata.utils.source_hash import LEGACY_SOURCE_HASH_VERSION, generate_source_hash
+from metadata.utils.source_hash_snapshot import SourceHashRecord, SourceHashSnapshot
+from metadata.utils.topology_checkpoint import TopologyCheckpoint
+from metadata.utils.tracer import Tracer
+from metadata.utils.worker_autoscaler import WorkerAutoscaler
 
 logger = ingestion_logger()
 
 C = TypeVar("C", bound=BaseModel)
 
 
+# Markers exchanged between the streaming multithread workers and the consumer
+_STOP_WORKER = object()
+_ENTITY_PROCESSED = object()
+_PRODUCER_EXHAUSTED = object()
+
+
 class MissingExpectedEntityAckException(Exception):
     """
     After running the ack to the sink, we got no
@@ -57,6 +82,13 @@ class MissingExpectedEntityAckException(Exception):
     """
 
 
+class _WorkerFailure:
+    """Wraps an exception raised in a worker so that the consumer can re-raise it"""
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
 class TopologyRunnerMixin(Generic[C]):
     """
     Prepares the _run function
@@ -73,79 +105,290 @@ class TopologyRunnerMixin(Generic[C]):
     # The deleted will have the shape {`child_stage.type_`: {`name`: `hash`}}
     # and will keep track of entities which were deleted and are being restored
     deleted = defaultdict(dict)
-    queue = Queue()
+
+    # Bounds of the streaming multithread execution, per worker thread:
+    # - entities pulled from the node producer that are waiting for a worker
+    # - results waiting for the consumer before the workers are blocked
+    work_prefetch_per_thread: int = 2
+    results_buffer_per_thread: int = 100
+
+    # Unique ordering keys for the records of each leaf node entity
+    _ordering_keys = itertools.count()
+
+    # Entities of the sharded nodes processed by this source, if the workflow is sharded
+    shard: Optional[TopologyShard] = None
+
+    # Local snapshot of the fingerprints, if enabled in the workflow
+    source_hash_snapshot: Optional[SourceHashSnapshot] = None
+
+    # Format of the fingerprints we compute
+    source_hash_version: int = LEGACY_SOURCE_HASH_VERSION
+
+    # Completed entities of the checkpoint nodes, if enabled in the workflow
+    checkpoint: Optional[TopologyCheckpoint] = None
+
+    # Persists the records already processed by the workflow steps, set with the checkpoint
+    flush_steps: Optional[Callable[[], None]] = None
+
+    # Adjusts the active workers of the multithread nodes, if enabled in the workflow
+    worker_autoscaler: Optional[WorkerAutoscaler] = None
 
     def _run_node_producer(self, node: TopologyNode) -> Iterable[Entity]:
         """Run the node producer"""
         try:
             node_producer = getattr(self, node.producer)
-            yield from node_producer() or []
+            for node_entity in Tracer().trace_generator(
+                node_producer() or [], name=node.producer, category="topology"
+            ):
+                if (
+                    node.shard
+                    and self.shard
+                    and not self.shard.owns(
+                        self._get_node_entity_fqn(node, node_entity)
+                    )
+                ):
+                    continue
+                if self._is_checkpoint_completed(node, node_entity):
+                    continue
+                yield node_entity
         except Exception as exc:
             logger.debug(traceback.format_exc())
             logger.error(f"Error running node producer: {exc}")
 
+    def _get_node_entity_fqn(self, node: TopologyNode, node_entity: Any) -> str:
+        """
+        The FQN of the node entity, built from the context of the stage consuming it,
+        e.g., `service.database.schema` for the schemas.
+        """
+        stage = next((stage for stage in node.stages if stage.consumer), node.stages[0])
+        entity_name = model_str(getattr(node_entity, "name", node_entity))
+        return self.context.get().fqn_from_stage(stage=stage, entity_name=entity_name)
+
+    def is_shardable(self) -> bool:
+        """Check if the topology has any node whose entities can be split across processes"""
+        return any(node.shard for node in get_topology_nodes(self.topology))
+
+    def _is_shared_node(self, node: TopologyNode) -> bool:
+        """
+        Check if the node is processed by all the shards, i.e., it is neither
+        a sharded node nor one of their children
+        """
+        sharded_producers = self.__dict__.get("_sharded_producers")
+        if sharded_producers is None:
+            sharded_producers = set()
+            pending = [
+                topology_node
+                for topology_node in get_topology_nodes(self.topology)
+                if topology_node.shard
+            ]
+            while pending:
+                sharded_node = pending.pop()
+                sharded_producers.add(sharded_node.producer)
+                pending.extend(self._get_child_nodes(sharded_node))
+            self.__dict__["_sharded_producers"] = sharded_producers
+        return node.producer not in sharded_producers
+
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """
+        Lists, sets or dicts the source collects while processing the entities and that
+        its post processes rely on, e.g., the foreign keys to tables created later on.
+        When sharding the workflow, the coordinator runs these post processes with the
+        values collected by all the workers.
+        """
+        return {}
+
+    def merge_post_process_state(self, post_process_state: Dict[str, Any]) -> None:
+        """Add the values collected by a shard of the workflow"""
+        state = self.get_post_process_state()
+        for name, values in post_process_state.items():
+            if isinstance(values, list):
+                state[name].extend(values)
+            else:
+                state[name].update(values)
+
+    def get_source_state(self) -> Dict[str, Set[str]]:
+        """
+        FQNs of the entities found in the source, used to mark the deleted entities.
+        Sources keep them in the `*_source_state` sets.
+        """
+        return {
+            name: set(getattr(self, name))
+            for name in dir(self)
+            if name.endswith("_source_state")
+            and isinstance(getattr(self, name, None), set)
+        }
+
+    def merge_source_state(self, source_state: Dict[str, Set[str]]) -> None:
+        """Add the FQNs found by other shards of the workflow or a previous run"""
+        for name, fqns in source_state.items():
+            getattr(self, name).update(fqns)
+
+    def _is_checkpoint_completed(self, node: TopologyNode, node_entity: Any) -> bool:
+        """Check if a previous run already processed the node entity and its children"""
+        if not (node.checkpoint and self.checkpoint and self.checkpoint.completed):
+            return False
+        entity_fqn = self._get_node_entity_fqn(node, node_entity)
+        if self.checkpoint.is_completed(entity_fqn):
+            logger.info(f"Skipping [{entity_fqn}], completed in a previous run")
+            return True
+        return False
+
+    def _complete_node_entity(self, node: TopologyNode, node_entity: Any) -> None:
+        """
+        Flag the node entity as completed once it and its children are processed.
+        With shards, the shared nodes are only completed once all the shards finish.
+        """
+        if (
+            node.checkpoint
+            and self.checkpoint
+            and not (self.shard and self._is_shared_node(node))
+        ):
+            self.checkpoint.complete(self._get_node_entity_fqn(node, node_entity))
+
     def _multithread_process_node(
         self, node: TopologyNode, threads: int
     ) -> Iterable[Entity]:
-        """Multithread Processing of a Node"""
-        child_nodes = self._get_child_nodes(node)
+        """
+        Multithread Processing of a Node.
 
-        node_entities = list(self._run_node_producer(node) or [])
-        node_entities_length = len(node_entities)
+        The node producer runs in the calling thread - it relies on its context - and its
+        output is streamed to the workers through a work queue. We only pull entities
+        from the producer while there are less than `work_prefetch_per_thread` per thread
+        waiting, so we never hold the whole producer output in memory.
 
-        if node_entities_length == 0:
+        Each worker picks one entity at a time, so a slow entity does not leave the other
+        threads idle. The results are handed back through a bounded queue: the workers
+        block when the consumer falls behind, and we block until a result is ready.
+        """
+        child_nodes = self._get_child_nodes(node)
+        parent_thread_id = self.context.get_current_thread_id()
+
+        producer = iter(self._run_node_producer(node) or [])
+        node_entity = next(producer, _PRODUCER_EXHAUSTED)
+        if node_entity is _PRODUCER_EXHAUSTED:
             return
-        else:
-            chunksize = int(math.ceil(node_entities_length / threads))
-            chunks: list[list[Entity]] = [
-                node_entities[i : i + chunksize]
-                for i in range(0, node_entities_length, chunksize)
-            ]
 
-            with CustomThreadPoolExecutor(max_workers=threads) as pool:
-                futures = [
-                    pool.submit(
-                        self._multithread_process_entity,
-                        node,
-                        chunk,
-                        child_nodes,
-                        self.context.get_current_thread_id(),
-                    )
-                    for chunk in chunks
-                ]
+        work_queue: queue.Queue = queue.Queue()
+        results: queue.Queue = queue.Queue(
+            maxsize=threads * self.results_buffer_per_thread
+        )
+        cancelled = threading.Event()
+        max_in_flight = threads * self.work_prefetch_per_thread
+        in_flight = 0
+        workers = []
 
+        with CustomThreadPoolExecutor(max_workers=threads) as pool:
+            try:
                 while True:
-                    if self.queue.has_tasks():
-                        yield from self.queue.process()
+                    while node_entity is not _PRODUCER_EXHAUSTED and (
+                        in_flight < max_in_flight
+                    ):
+                        work_queue.put(node_entity)
+                        in_flight += 1
+                        # Only spin up as many workers as entities we have seen
+                        if len(workers) < threads:
+                            workers.append(
+                                pool.submit(
+                                    self._multithread_process_entity,
+                                    node,
+                                    work_queue,
+                                    results,
+                                    child_nodes,
+                                    parent_thread_id,
+                                    cancelled,
+                                )
+                            )
+                        node_entity = next(producer, _PRODUCER_EXHAUSTED)
+
+                    if not in_flight:
+                        break
+
+                    result = results.get()
+                    if isinstance(result, _WorkerFailure):
+                        raise result.exc
 
+                    ordering_key, record = result
+                    if ordering_key is _ENTITY_PROCESSED:
+                        # All the records of the entity were already yielded
+                        in_flight -= 1
+                        self._complete_node_entity(node=node, node_entity=record)
                     else:
-                        if not futures:
-                            break
+                        self._record_ordering().key = ordering_key
+                        yield record
+            finally:
+                self._stop_multithread_workers(
+                    workers=workers,
+                    work_queue=work_queue,
+                    results=results,
+                    cancelled=cancelled,
+                )
+
+    @staticmethod
+    def _stop_multithread_workers(
+        workers: list,
+        work_queue: queue.Queue,
+        results: queue.Queue,
+        cancelled: threading.Event,
+    ) -> None:
+        """
+        Signal the workers to finish. If we are stopping before consuming all the
+        results (e.g., a worker failed or the consumer closed the generator), we
+        discard the pending results so that no worker stays blocked on a full queue.
+        """
+        cancelled.set()
+        for _ in workers:
+            work_queue.put(_STOP_WORKER)
+        while any(not worker.done() for worker in workers):
+            try:
+                results.get(timeout=0.1)
+            except queue.Empty:
+                continue
 
-                        for i, future in enumerate(futures):
-                            if future.done():
-                                future.result()
-                                futures.pop(i)
+    def _process_node_entity(
+        self,
+        node: TopologyNode,
+        node_entity: Any,
+        child_nodes: List[TopologyNode],
+    ) -> Iterable[Entity]:
+        """Run all the stages of a node for a produced entity, then its children"""
+        ordering_key = self._get_node_entity_ordering_key(
+            node=node, child_nodes=child_nodes
+        )
+        sends_records = not self.shard or self.shard.sends_records(
+            shared=self._is_shared_node(node)
+        )
+        for stage in node.stages:
+            for record in Tracer().trace_generator(
+                self._process_stage(
+                    stage=stage, node_entity=node_entity, child_nodes=child_nodes
+                ),
+                name=stage.processor,
+                category="topology",
+                args={"type": stage.type_.__name__},
+            ):
+                if not sends_records:
+                    # Another shard sends them, we only need the context of the stages
+                    continue
+                self._record_ordering().key = ordering_key
+                yield record
+
+        # Once we are done processing all the stages,
+        for stage in node.stages:
+            if stage.clear_context:
+                self.context.get().clear_stage(stage=stage)
 
-                    time.sleep(0.01)
+        # process all children from the node being run
+        yield from self.process_nodes(child_nodes)
 
     def _process_node(self, node: TopologyNode) -> Iterable[Entity]:
         """Processing of a Node in a single thread."""
         child_nodes = self._get_child_nodes(node)
 
         for node_entity in self._run_node_producer(node) or []:
-            for stage in node.stages:
-                yield from self._process_stage(
-                    stage=stage, node_entity=node_entity, child_nodes=child_nodes
-                )
-
-            # Once we are done processing all the stages,
-            for stage in node.stages:
-                if stage.clear_context:
-                    self.context.get().clear_stage(stage=stage)
-
-            # process all children from the node being run
-            yield from self.process_nodes(child_nodes)
+            yield from self._process_node_entity(
+                node=node, node_entity=node_entity, child_nodes=child_nodes
+            )
+            self._complete_node_entity(node=node, node_entity=node_entity)
 
     def process_nodes(self, nodes: List[TopologyNode]) -> Iterable[Entity]:
         """
@@ -179,8 +422,13 @@ class TopologyRunnerMixin(Generic[C]):
             # to process. Each of the internal stages will sink result to OM API.
             # E.g., in the DB topology, at the Table TopologyNode, the node_entity
             # will be each `table`
-            if node.threads and self.context.threads > 1:
-                yield from self._multithread_process_node(node, self.context.threads)
+            threads = (
+                self.worker_autoscaler.max_workers
+                if self.worker_autoscaler
+                else self.context.threads
+            )
+            if node.threads and threads > 1:
+                yield from self._multithread_process_node(node, threads)
             else:
                 yield from self._process_node(node)
 
@@ -189,35 +437,82 @@ class TopologyRunnerMixin(Generic[C]):
     def _multithread_process_entity(
         self,
         node: TopologyNode,
-        node_entities: List[Any],
+        work_queue: queue.Queue,
+        results: queue.Queue,
         child_nodes: List[TopologyNode],
         parent_thread_id: int,
+        cancelled: threading.Event,
     ):
-        """Multithread processing of a Node Entity"""
+        """
+        Multithread worker: pulls Node Entities one at a time from the work queue
+        and puts their stage and children results in the results queue.
+        """
         # Generates a new context based on the parent thread.
         self.context.copy_from(parent_thread_id)
         ExecutionTimeTrackerContextMap().copy_from_parent(parent_thread_id)
 
-        for node_entity in node_entities:
-            # For each stage, we get all the stage results and one by one yield them by adding them to the Queue.
-            for stage in node.stages:
-                for stage_result in self._process_stage(
-                    stage=stage, node_entity=node_entity, child_nodes=child_nodes
-                ):
-                    self.queue.put(stage_result)
-
-            # After all the stages are done, we clear the context if needed.
-            for stage in node.stages:
-                if stage.clear_context:
-                    self.context.get().clear_stage(stage=stage)
-
-            # If the Entity has child nodes that need processing we proceed to processing them with the same logic as above.
-
-            for child_result in self.process_nodes(child_nodes):
-                self.queue.put(child_result)
+        try:
+            while True:
+                node_entity = work_queue.get()
+                if node_entity is _STOP_WORKER or cancelled.is_set():
+                    break
 
-        # Finally we pop the context and finish the thread
-        self.context.pop()
+                try:
+                    with self._worker_slot(cancelled):
+                        for result in self._process_node_entity(
+                            node=node, node_entity=node_entity, child_nodes=child_nodes
+                        ):
+                            results.put((self._record_ordering().key, result))
+                except Exception as exc:  # pylint: disable=broad-except
+                    results.put(_WorkerFailure(exc))
+                    break
+
+                # Let the consumer know there is room for the next entity
+                results.put((_ENTITY_PROCESSED, node_entity))
+        finally:
+            # Finally we pop the context and finish the thread
+            self.context.pop()
+
+    def _worker_slot(self, cancelled: threading.Event):
+        """With autoscaling, workers wait until the autoscaler lets them process an entity"""
+        if self.worker_autoscaler:
+            return self.worker_autoscaler.slot(cancelled)
+        return nullcontext()
+
+    def _record_ordering(self) -> threading.local:
+        """Ordering key of the last record yielded by each thread"""
+        return self.__dict__.setdefault("_record_ordering_state", threading.local())
+
+    def _get_node_entity_ordering_key(
+        self, node: TopologyNode, child_nodes: List[TopologyNode]
+    ) -> Optional[Hashable]:
+        """
+        The records of a leaf node entity - e.g., a table, its tags and life cycle - only
+        need to keep their relative order. Nodes with children or post processes, or
+        whose entities need to be acknowledged by the sink are barriers, since whatever
+        comes next might depend on them.
+        """
+        if (
+            child_nodes
+            or node.post_process
+            or any(stage.must_return for stage in node.stages)
+        ):
+            return None
+        return next(self._ordering_keys)
+
+    # The key was set by the topology node that yielded the record, so we don't
+    # need to look at it. Renaming it would differ from the signature of Source.
+    def get_record_ordering_key(  # pylint: disable=unused-argument
+        self, record: Entity
+    ) -> Optional[Hashable]:
+        """
+        Return the ordering key of the record that was just yielded. We reset it so that
+        records yielded outside the topology processing are treated as barriers.
+        """
+        ordering = self._record_ordering()
+        ordering_key = getattr(ordering, "key", None)
+        ordering.key = None
+        return ordering_key
 
     def _get_child_nodes(self, node: TopologyNode) -> List[TopologyNode]:
         """Compute children nodes if any"""
@@ -273,9 +568,17 @@ class TopologyRunnerMixin(Generic[C]):
         if node.post_process:
             logger.debug(f"Post processing node {node}")
             for process in node.post_process:
+                if self.shard and not self.shard.runs_post_process(
+                    process, shared=self._is_shared_node(node)
+                ):
+                    continue
                 try:
                     node_post_process = getattr(self, process)
-                    for entity_request in node_post_process() or []:
+                    for entity_request in Tracer().trace_generator(
+                        node_post_process() or [], name=process, category="topology"
+                    ):
+                        # Post processes rely on everything sent before
+                        self._record_ordering().key = None
                         yield entity_request
                 except Exception as exc:
                     logger.debug(traceback.format_exc())
@@ -318,18 +621,35 @@ class TopologyRunnerMixin(Generic[C]):
                 params = {"database": entity_fqn}
         else:
             params = {"service": entity_fqn}
-        entities_list = self.metadata.list_all_entities(
-            entity=child_type, params=params, fields=["sourceHash"], include="all"
-        )
-        for entity in entities_list:
-            if entity.sourceHash:
-                self.cache[child_type][
-                    model_str(entity.fullyQualifiedName)
-                ] = entity.sourceHash
-            if entity.deleted:
-                self.deleted[child_type][
-                    model_str(entity.fullyQualifiedName)
-                ] = entity.sourceHash
+
+        if self.source_hash_snapshot:
+            source_hashes = self.source_hash_snapshot.refresh(
+                metadata=self.metadata,
+                entity=child_type,
+                parent_fqn=entity_fqn,
+                params=params,
+            )
+        else:
+            # We only need the FQN and hash of the children, not their models
+            source_hashes = (
+                SourceHashRecord(
+                    fqn=entity["fullyQualifiedName"],
+                    source_hash=entity.get("sourceHash"),
+                    deleted=bool(entity.get("deleted")),
+                )
+                for entity in self.metadata.list_all_entity_dicts(
+                    entity=child_type,
+                    params=params,
+                    fields=["sourceHash"],
+                    include="all",
+                )
+            )
+
+        for record in source_hashes:
+            if record.source_hash:
+                self.cache[child_type][record.fqn] = record.source_hash
+            if record.deleted:
+                self.deleted[child_type][record.fqn] = record.source_hash
 
     def _iter(self) -> Iterable[Either]:
         """
@@ -341,7 +661,38 @@ class TopologyRunnerMixin(Generic[C]):
         to yield data to the sink
         :return: Iterable of the Entities yielded by all nodes in the topology
         """
-        yield from self.process_nodes(get_topology_root(self.topology))
+        if not self.checkpoint:
+            yield from self.process_nodes(get_topology_root(self.topology))
+            return
+
+        yield from self._checkpointed_process_nodes()
+
+    def _checkpointed_process_nodes(self) -> Iterable[Either]:
+        """
+        Process the topology, resuming from the checkpoint.
+
+        Entities are flagged as completed once their records are yielded, but the workflow
+        might still be processing them, e.g., with the pipelined execution. We only commit
+        them after yielding a record without ordering key: the workflow processes everything
+        sent before it prior to asking for the next record. The sink might still hold these
+        records in its buffers though, so it is flushed before committing.
+        """
+        self.merge_source_state(self.checkpoint.source_state)
+
+        for record in self.process_nodes(get_topology_root(self.topology)):
+            is_barrier = getattr(self._record_ordering(), "key", None) is None
+            completed = self.checkpoint.take_completed() if is_barrier else []
+            yield record
+            if completed:
+                if self.flush_steps:
+                    self.flush_steps()
+                self.checkpoint.commit(
+                    completed=completed, source_state=self.get_source_state()
+                )
+
+        # Shards only process part of the service. The coordinator clears it after all of them
+        if self.shard is None or self.shard.clears_checkpoint:
+            self.checkpoint.clear()
 
     def create_patch_request(
         self, original_entity: Entity, create_request: C
@@ -392,6 +743,7 @@ class TopologyRunnerMixin(Generic[C]):
         if hasattr(entity_request.right, "sourceHash"):
             create_entity_request_hash = generate_source_hash(
                 create_request=entity_request.right,
+                version=self.source_hash_version,
             )
             entity_request.right.sourceHash = create_entity_request_hash
 
@@ -431,7 +783,8 @@ class TopologyRunnerMixin(Generic[C]):
                         logger.warning(
                             f"Failed to restore deleted {str(stage.type_.__name__)} '{entity_fqn}'"
                         )
-            # if the source hash is not present or different from new hash, update the entity
+            # if the source hash is not present or different from new hash, update the entity.
+            # Hashes stored with another version differ too, so that the patch migrates them.
             # if overrideMetadata is true, we will always update the entity
             elif (
                 entity_source_hash != create_entity_request_hash
@@ -17,7 +17,6 @@ as well as populating JOIN information.
 It picks up the information from reading the files
 produced by the stage. At the end, the path is removed.
 """
-import json
 import os
 import shutil
 import traceback
@@ -56,6 +55,7 @@ from metadata.ingestion.ometa.client import APIError
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils import fqn
 from metadata.utils.constants import UTF_8
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.life_cycle_utils import get_query_type
 from metadata.utils.logger import ingestion_logger
 from metadata.utils.time_utils import convert_timestamp
@@ -198,8 +198,11 @@ class MetadataUsageBulkSink(BulkSink):
         for file_handler in self.iterate_files():
             self.table_usage_map = {}
             for usage_record in file_handler.readlines():
-                record = json.loads(usage_record)
-                table_usage = TableUsageCount(**json.loads(record))
+                record = get_json_codec().decode(usage_record)
+                # Older stages wrote each record as a JSON encoded string
+                if isinstance(record, str):
+                    record = get_json_codec().decode(record)
+                table_usage = TableUsageCount(**record)
 
                 self.service_name = table_usage.serviceName
                 table_entities = None
@@ -238,7 +241,7 @@ class MetadataUsageBulkSink(BulkSink):
     def handle_query_cost(self) -> None:
         for file_handler in self.iterate_files(usage_files=False):
             for usage_record in file_handler.readlines():
-                record = json.loads(usage_record)
+                record = get_json_codec().decode(usage_record)
                 cost_record = QueryCostWrapper(**record)
                 self.metadata.publish_query_cost(cost_record, self.service_name)
 
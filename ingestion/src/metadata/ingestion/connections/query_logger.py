@@ -14,16 +14,28 @@
 Query tracking implementation using SQLAlchemy event listeners
 """
 from datetime import datetime, timezone
+from time import perf_counter
 from typing import Any, Dict, Optional, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.event import listen
 from sqlalchemy.sql.elements import TextClause
 
+from metadata.utils.execution_time_tracker import ExecutionTimeTracker
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.tracer import Tracer
+from metadata.utils.worker_autoscaler import WorkerFeedback
 
 logger = ingestion_logger()
 
+MAX_TRACED_STATEMENT_LENGTH = 500
+
+
+def _get_statement_name(statement: Union[str, TextClause]) -> str:
+    """Name the trace span of a query by its first keyword, e.g., `SELECT`"""
+    keywords = str(statement).split(None, 1)
+    return keywords[0].upper() if keywords else "SQL"
+
 
 class QueryInfo(BaseModel):
     """Class to store information about a query execution"""
@@ -54,6 +66,10 @@ class QueryLogger:
         executemany: bool,
     ) -> Tuple[Union[str, TextClause], Optional[Dict[str, Any]]]:
         """Event listener for before cursor execute"""
+        # Connections are not shared across threads, so we can keep the start there
+        conn.info.setdefault("query_start_time", []).append(
+            (context, perf_counter(), Tracer().now())
+        )
         self._current_query = QueryInfo(
             statement=statement,
             parameters=parameters,
@@ -71,6 +87,20 @@ class QueryLogger:
         executemany: bool,
     ) -> None:
         """Event listener for after cursor execute"""
+        query_start_time = conn.info.get("query_start_time")
+        if query_start_time:
+            _, start, trace_start = query_start_time.pop()
+            # Time the queries - e.g., the reflection ones - under the running context
+            elapsed = perf_counter() - start
+            ExecutionTimeTracker().record(context="SQL", elapsed=elapsed)
+            WorkerFeedback().record_source_query(elapsed)
+            Tracer().record(
+                name=_get_statement_name(statement),
+                category="sql",
+                start=trace_start,
+                args={"statement": str(statement)[:MAX_TRACED_STATEMENT_LENGTH]},
+            )
+
         if self._current_query:
             query = self._current_query
             query.end_time = datetime.now(timezone.utc)
@@ -89,6 +119,21 @@ class QueryLogger:
 
             self._current_query = None
 
+    def handle_error(self, exception_context: Any) -> None:
+        """
+        Event listener for the failed queries, which don't reach after cursor
+        execute, dropping their start so that it doesn't pile up on the connection
+        """
+        conn = exception_context.connection
+        query_start_time = conn.info.get("query_start_time") if conn else None
+        # Errors raised after the query ran, e.g., fetching its rows, have no start
+        if (
+            query_start_time
+            and query_start_time[-1][0] is exception_context.execution_context
+        ):
+            query_start_time.pop()
+        self._current_query = None
+
 
 def attach_query_tracker(engine: Any):
     """
@@ -113,3 +158,8 @@ def attach_query_tracker(engine: Any):
         "after_cursor_execute",
         tracker.after_cursor_execute,
     )
+    listen(
+        engine,
+        "handle_error",
+        tracker.handle_error,
+    )
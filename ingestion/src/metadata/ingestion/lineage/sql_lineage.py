@@ -247,10 +247,13 @@ def search_table_entities(
                     fetch_multiple_entities=True,
                     skip_es_search=True,
                 )
-                for table_fqn in table_fqns or []:
-                    table_entity: Table = metadata.get_by_name(Table, fqn=table_fqn)
-                    if table_entity:
-                        table_entities.append(table_entity)
+                table_entities = [
+                    table_entity
+                    for table_entity in metadata.get_by_names(
+                        Table, table_fqns or []
+                    ).values()
+                    if table_entity
+                ]
 
             # added the search tuple to the cache
             search_cache.put(search_tuple, table_entities)
@@ -266,6 +269,57 @@ def search_table_entities(
     return None
 
 
+def prefetch_table_entities(
+    metadata: OpenMetadata,
+    service_name: str,
+    database_name: Optional[str],
+    database_schema: Optional[str],
+    table_names: Iterable[str],
+) -> None:
+    """
+    Search the tables of a query in ES at once, filling the cache of
+    search_table_entities with the ones found in the service.
+
+    The tables not found are left out of the cache, so that their lookup still
+    goes through the API and the other services.
+    """
+    try:
+        search_tuples = {}
+        for table_name in table_names:
+            database_query, schema_query, table = get_table_fqn_from_query_name(
+                table_name
+            )
+            normalized_db, normalized_schema = normalize_table_params_by_service(
+                metadata,
+                service_name,
+                database_query if database_query else database_name,
+                schema_query if schema_query else database_schema,
+            )
+            search_tuple = (service_name, normalized_db, normalized_schema, table)
+            if table and search_tuple not in search_cache:
+                search_tuples[
+                    build_es_fqn_search_string(
+                        normalized_db, normalized_schema, service_name, table
+                    )
+                ] = search_tuple
+
+        # A single table is better served by its own search
+        if len(search_tuples) < 2:
+            return
+
+        es_result_entities = metadata.es_search_from_fqns(
+            entity_type=Table, fqn_search_strings=search_tuples
+        )
+        for fqn_search_string, table_entities in es_result_entities.items():
+            if table_entities:
+                search_cache.put(search_tuples[fqn_search_string], table_entities)
+    except Exception as exc:
+        logger.debug(traceback.format_exc())
+        logger.warning(
+            f"Error prefetching the table entities for service [{service_name}]: {exc}"
+        )
+
+
 def get_table_fqn_from_query_name(
     table_name: str,
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -888,6 +942,22 @@ def get_lineage_by_query(
         raw_column_lineage = lineage_parser.column_lineage
         column_lineage.update(populate_column_lineage_map(raw_column_lineage))
 
+        if service_names:
+            prefetch_table_entities(
+                metadata,
+                service_name=service_names[0],
+                database_name=database_name,
+                database_schema=schema_name,
+                table_names=(
+                    str(table)
+                    for table in itertools.chain(
+                        lineage_parser.source_tables,
+                        lineage_parser.intermediate_tables,
+                        lineage_parser.target_tables,
+                    )
+                ),
+            )
+
         for intermediate_table in lineage_parser.intermediate_tables:
             for source_table in lineage_parser.source_tables:
                 for procedure, from_table_name in get_source_table_names(
@@ -0,0 +1,386 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Structural comparison of the entities to patch.
+
+Dumping both entities to JSON and letting `jsonpatch` compare the documents
+serializes and visits every member of them, e.g., each column of a table with
+thousands of them, even when a single description changed. Here we walk the
+Pydantic models field by field instead, only visiting the fields to include,
+and only dump the members that differ.
+
+The members that are equal are left out of both documents, and the equal items
+of arrays are replaced by the same placeholder in both, so that `jsonpatch`
+generates the same operations from these smaller documents as from the full
+ones. That holds as long as `jsonpatch` pairs the items of both arrays by
+position, which we check by matching them by key, e.g., columns by name and
+tags by tagFQN. The arrays whose items can't be told apart that way are
+compared whole.
+"""
+import json
+from enum import Enum
+from functools import cache, partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel, RootModel
+
+# Fields identifying the items of an array, by order of preference
+ITEM_KEY_FIELDS = ("tagFQN", "id", "name")
+
+ALL_ITEMS = "__all__"
+
+Documents = Tuple[Any, Any]
+Dumper = Callable[[], Any]
+
+_ROOT_MODEL, _MODEL, _LIST, _SCALAR, _OTHER = range(1, 6)
+_NO_KEY = object()
+
+
+class _ModelFields(NamedTuple):
+    """The fields of a model to compare, for an include"""
+
+    include: Any
+    fields: List[Tuple[str, Any]]
+    key_field: Optional[str]
+
+
+# Checking the type of every value with isinstance is slow for Pydantic models
+_kinds: Dict[type, int] = {}
+_model_fields: Dict[Tuple[Type[BaseModel], int], _ModelFields] = {}
+
+
+def diff_documents(
+    source: BaseModel, destination: BaseModel, include: Optional[dict] = None
+) -> Optional[Documents]:
+    """
+    Return the JSON documents of the source and destination as dumped to build
+    their patch, i.e., without unset or None fields and only with the fields to
+    `include`, but without the members they have in common.
+
+    Returns None if the documents are equal.
+    """
+    include = include or True
+    return _diff(
+        source,
+        destination,
+        include,
+        partial(_dump, source, include),
+        partial(_dump, destination, include),
+    )
+
+
+def _dump(model: BaseModel, include: Any) -> Any:
+    """Dump the model like the patch documents, masking the secrets"""
+    return model.model_dump(
+        mode="json",
+        include=None if include is True else include,
+        exclude_unset=True,
+        exclude_none=True,
+        context={"mask_secrets": True},
+    )
+
+
+def _dump_member(model: BaseModel, name: str, include: Any) -> Any:
+    """Dump a field of the model, with the serializers of the model"""
+    return _dump(model, {name: include}).get(name)
+
+
+def _dump_item(items_json: Dumper, index: int) -> Any:
+    return items_json()[index]
+
+
+def _get_kind(value: Any) -> int:
+    value_type = type(value)
+    kind = _kinds.get(value_type)
+    if not kind:
+        if issubclass(value_type, RootModel):
+            kind = _ROOT_MODEL
+        elif issubclass(value_type, BaseModel):
+            kind = _MODEL
+        elif issubclass(value_type, list):
+            kind = _LIST
+        # Values of these types that are equal are dumped equally
+        elif value is None or issubclass(value_type, (str, int, Enum, UUID)):
+            kind = _SCALAR
+        else:
+            kind = _OTHER
+        _kinds[value_type] = kind
+    return kind
+
+
+def _unwrap(value: Any) -> Any:
+    while _get_kind(value) == _ROOT_MODEL:
+        value = value.root
+    return value
+
+
+def _is_same_scalar(source: Any, destination: Any) -> bool:
+    """
+    If both values are the same, in a way that is certain to dump them equally.
+    It is called for every field, so it only unwraps a single root model.
+    """
+    if source is destination:
+        return True
+    value_type = type(source)
+    if value_type is not type(destination):
+        return False
+    kind = _kinds.get(value_type) or _get_kind(source)
+    if kind == _ROOT_MODEL:
+        source, destination = source.root, destination.root
+        if source is destination:
+            return True
+        value_type = type(source)
+        if value_type is not type(destination):
+            return False
+        kind = _kinds.get(value_type) or _get_kind(source)
+    return kind == _SCALAR and source == destination
+
+
+def _get_include(include: Any, name: Any) -> Any:
+    """The include of a member, or None if it is excluded"""
+    if include is True:
+        return True
+    if isinstance(include, (set, frozenset)):
+        return True if name in include else None
+    if isinstance(include, dict):
+        value = include.get(name, include.get(ALL_ITEMS))
+        return value or None
+    return None
+
+
+def _get_model_fields(model: Type[BaseModel], include: Any) -> _ModelFields:
+    """The fields of the model to compare, in the order they are dumped"""
+    model_fields = _model_fields.get((model, id(include)))
+    if model_fields is None or model_fields.include is not include:
+        fields = []
+        for name in model.model_fields:
+            field_include = _get_include(include, name)
+            if field_include is not None:
+                fields.append((name, field_include))
+
+        key_field = next(
+            (field for field in ITEM_KEY_FIELDS if field in model.model_fields), None
+        )
+        if _get_include(include, key_field) is not True:
+            key_field = None
+
+        model_fields = _ModelFields(include, fields, key_field)
+        _model_fields[(model, id(include))] = model_fields
+    return model_fields
+
+
+def _diff_json(source: Any, destination: Any) -> Optional[Documents]:
+    """Compare values already dumped to JSON"""
+    if json.dumps(source, sort_keys=True) == json.dumps(destination, sort_keys=True):
+        return None
+    return source, destination
+
+
+def _diff(
+    source: Any,
+    destination: Any,
+    include: Any,
+    source_json: Dumper,
+    destination_json: Dumper,
+) -> Optional[Documents]:
+    """
+    Compare the values, using `source_json` and `destination_json` to
+    dump them whole when they can't be compared structurally.
+    """
+    if source is destination:
+        return None
+
+    kind = _get_kind(source)
+    if type(source) is type(destination):
+        if kind == _ROOT_MODEL and include is True:
+            # They dump as their root does
+            return _diff(
+                source.root, destination.root, include, source_json, destination_json
+            )
+        if kind == _MODEL:
+            return _diff_models(
+                source, destination, include, source_json, destination_json
+            )
+        if kind == _SCALAR and source == destination:
+            return None
+
+    if kind == _LIST and _get_kind(destination) == _LIST:
+        if not source and not destination:
+            return None
+        return _diff_lists(source, destination, include, source_json, destination_json)
+
+    return _diff_json(source_json(), destination_json())
+
+
+def _diff_models(
+    source: BaseModel,
+    destination: BaseModel,
+    include: Any,
+    source_json: Dumper,
+    destination_json: Dumper,
+) -> Optional[Documents]:
+    """Compare the models field by field, in the order they are dumped"""
+    model = type(source)
+    if (
+        model.model_computed_fields
+        or source.__pydantic_extra__
+        or destination.__pydantic_extra__
+    ):
+        return _diff_json(source_json(), destination_json())
+
+    source_set, destination_set = source.model_fields_set, destination.model_fields_set
+    source_values, destination_values = source.__dict__, destination.__dict__
+    source_doc, destination_doc = {}, {}
+    for name, field_include in _get_model_fields(model, include).fields:
+        source_value = source_values[name] if name in source_set else None
+        destination_value = (
+            destination_values[name] if name in destination_set else None
+        )
+        if _is_same_scalar(source_value, destination_value):
+            continue
+
+        if destination_value is None:
+            source_doc[name] = _dump_member(source, name, field_include)
+        elif source_value is None:
+            destination_doc[name] = _dump_member(destination, name, field_include)
+        else:
+            documents = _diff(
+                source_value,
+                destination_value,
+                field_include,
+                partial(_dump_member, source, name, field_include),
+                partial(_dump_member, destination, name, field_include),
+            )
+            if documents is not None:
+                source_doc[name], destination_doc[name] = documents
+
+    if not source_doc and not destination_doc:
+        return None
+    return source_doc, destination_doc
+
+
+def _get_item_key(item: Any, include: Any) -> Any:
+    """
+    A key of the item of an array, which differs for items that are dumped
+    differently, or `_NO_KEY` if the item can't be identified
+    """
+    item = _unwrap(item)
+    kind = _get_kind(item)
+    if kind == _SCALAR:
+        if isinstance(item, Enum):
+            item = item.value
+        if isinstance(item, UUID):
+            return str, str(item)
+        if item is None or type(item) in (str, int, bool):
+            return type(item), item
+
+    elif kind == _MODEL and not item.__pydantic_extra__:
+        key_field = _get_model_fields(type(item), include).key_field
+        if key_field and key_field in item.model_fields_set:
+            key = _get_item_key(getattr(item, key_field), True)
+            if key is not _NO_KEY and key[-1] is not None:
+                return (key_field,) + key
+
+    return _NO_KEY
+
+
+def _is_paired_by_position(source_keys: list, destination_keys: list) -> bool:
+    """
+    If no item is equal to an item of the other array at another index, in
+    which case `jsonpatch` compares the items of both arrays by position.
+    """
+    if _NO_KEY in source_keys or _NO_KEY in destination_keys:
+        return False
+
+    indexes = {}
+    for index, key in enumerate(source_keys):
+        # Items with the same key at several indexes can't be paired
+        indexes[key] = -1 if key in indexes else index
+
+    return all(
+        indexes.get(key, index) == index for index, key in enumerate(destination_keys)
+    )
+
+
+def _diff_lists(
+    source: list,
+    destination: list,
+    include: Any,
+    source_json: Dumper,
+    destination_json: Dumper,
+) -> Optional[Documents]:
+    """
+    Compare the arrays item by item, when their items are paired by position.
+    The items that are equal are replaced by their index in both documents,
+    and the ones that differ keep their key, so that they stay different
+    from the items at other indexes.
+    """
+    item_include = include
+    if isinstance(include, dict):
+        item_include = include.get(ALL_ITEMS) if len(include) == 1 else None
+
+    source_keys = [_get_item_key(item, item_include) for item in source]
+    destination_keys = [_get_item_key(item, item_include) for item in destination]
+    if item_include is None or not _is_paired_by_position(
+        source_keys, destination_keys
+    ):
+        return _diff_json(source_json(), destination_json())
+
+    source_json, destination_json = cache(source_json), cache(destination_json)
+
+    def item_dumper(items: list, items_json: Dumper, index: int) -> Dumper:
+        item = items[index]
+        if item is None:
+            # e.g., the columns that the destination no longer has
+            return lambda: None
+        if _get_kind(item) in (_ROOT_MODEL, _MODEL):
+            return partial(_dump, item, item_include)
+        return partial(_dump_item, items_json, index)
+
+    source_doc, destination_doc = [], []
+    changed = len(source) != len(destination)
+    for index, (source_item, destination_item, key) in enumerate(
+        zip(source, destination, source_keys)
+    ):
+        documents = _diff(
+            source_item,
+            destination_item,
+            item_include,
+            item_dumper(source, source_json, index),
+            item_dumper(destination, destination_json, index),
+        )
+        if documents is None:
+            source_doc.append([index])
+            destination_doc.append([index])
+            continue
+
+        changed = True
+        source_item_doc, destination_item_doc = documents
+        if isinstance(source_item_doc, dict) and isinstance(destination_item_doc, dict):
+            source_item_doc = {key[0]: key[-1], **source_item_doc}
+            destination_item_doc = {key[0]: key[-1], **destination_item_doc}
+        source_doc.append(source_item_doc)
+        destination_doc.append(destination_item_doc)
+
+    if not changed:
+        return None
+
+    paired = len(source_doc)
+    source_doc.extend(
+        item_dumper(source, source_json, index)()
+        for index in range(paired, len(source))
+    )
+    destination_doc.extend(
+        item_dumper(destination, destination_json, index)()
+        for index in range(paired, len(destination))
+    )
+    return source_doc, destination_doc
@@ -11,7 +11,6 @@
 """
 Pydantic definition for storing entities for patching
 """
-import json
 import logging
 import traceback
 from typing import Dict, List, Optional, Tuple
@@ -20,6 +19,7 @@ import jsonpatch
 from pydantic import BaseModel
 
 from metadata.ingestion.api.models import Entity, T
+from metadata.ingestion.models.patch_diff import diff_documents
 from metadata.ingestion.ometa.mixins.patch_mixin_utils import PatchOperation
 from metadata.ingestion.ometa.utils import model_str
 
@@ -379,33 +379,12 @@ def build_patch(
         # special handler for tableConstraints
         _table_constraints_handler(source, destination)
 
-        # Get the difference between source and destination
-        if allowed_fields:
-            patch = jsonpatch.make_patch(
-                json.loads(
-                    source.model_dump_json(
-                        exclude_unset=True,
-                        exclude_none=True,
-                        include=allowed_fields,
-                    )
-                ),
-                json.loads(
-                    destination.model_dump_json(
-                        exclude_unset=True,
-                        exclude_none=True,
-                        include=allowed_fields,
-                    )
-                ),
-            )
-        else:
-            patch: jsonpatch.JsonPatch = jsonpatch.make_patch(
-                json.loads(
-                    source.model_dump_json(exclude_unset=True, exclude_none=True)
-                ),
-                json.loads(
-                    destination.model_dump_json(exclude_unset=True, exclude_none=True)
-                ),
-            )
+        # Get the difference between source and destination, only dumping
+        # the members that differ instead of both entities whole
+        documents = diff_documents(source, destination, include=allowed_fields)
+        if documents is None:
+            return None
+        patch: jsonpatch.JsonPatch = jsonpatch.make_patch(*documents)
         if not patch:
             return None
 
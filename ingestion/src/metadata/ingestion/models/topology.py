@@ -13,10 +13,11 @@ Defines the topology for ingesting sources
 """
 import queue
 import threading
+import zlib
 from functools import cache, singledispatchmethod
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Set, Type, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, create_model
 
 from metadata.generated.schema.api.data.createStoredProcedure import (
     CreateStoredProcedureRequest,
@@ -124,6 +125,74 @@ class TopologyNode(BaseModel):
         False,
         description="Flag that defines if a node is open to MultiThreading processing.",
     )
+    shard: bool = Field(
+        False,
+        description="Flag that defines if the node entities can be split across processes when sharding the workflow.",
+    )
+    checkpoint: bool = Field(
+        False,
+        description="Flag that defines if the node entities are skipped when resuming a run once fully processed.",
+    )
+
+
+class TopologyShard(BaseModel):
+    """
+    Share of the entities of the sharded nodes processed by a Source when
+    the workflow is split across processes.
+
+    The nodes outside the sharded ones and their children - e.g., the service
+    and the databases - are shared: every process runs them to build its
+    context, but only the coordinator sends their records, before the workers
+    start. Workers own the entities of the sharded nodes whose key falls in
+    their index. Once all of them finish, the coordinator runs again: it owns
+    no entities, and runs the post processes that need the results of all the
+    workers, i.e., the ones of the shared nodes and marking the deleted entities.
+    """
+
+    index: Optional[int] = Field(
+        None, description="Index of the worker. Empty for the coordinator."
+    )
+    count: int = Field(..., description="Number of workers")
+    workers_finished: bool = Field(
+        False, description="If the coordinator runs after all the workers finished."
+    )
+
+    @property
+    def is_coordinator(self) -> bool:
+        return self.index is None
+
+    @property
+    def clears_checkpoint(self) -> bool:
+        """The checkpoint is only done once all the workers finished"""
+        return self.is_coordinator and self.workers_finished
+
+    def owns(self, key: str) -> bool:
+        """
+        Check if the entity with the given key belongs to this shard.
+        We can't rely on `hash`, since it is salted differently in each process.
+        """
+        if self.is_coordinator:
+            return False
+        return zlib.crc32(key.encode("utf-8")) % self.count == self.index
+
+    def sends_records(self, shared: bool) -> bool:
+        """The records of the shared nodes are sent once, before the workers need them"""
+        if shared:
+            return self.is_coordinator and not self.workers_finished
+        return not self.is_coordinator
+
+    def runs_post_process(self, process: str, shared: bool) -> bool:
+        """
+        The post processes of the shared nodes, e.g., the table constraints referencing
+        tables of any shard, and marking the deleted entities need the state of all the
+        workers. The workers run the other post processes of their sharded entities.
+        """
+        is_mark_deleted = process.startswith("mark_") and process.endswith(
+            "_as_deleted"
+        )
+        if self.is_coordinator:
+            return self.workers_finished and (shared or is_mark_deleted)
+        return not shared and not is_mark_deleted
 
 
 class ServiceTopology(BaseModel):
@@ -141,6 +210,10 @@ class TopologyContext(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    # Keys whose values are shared with copies of this context, and need to be
+    # copied before being modified in place
+    _shared_keys: Set[str] = PrivateAttr(default_factory=set)
+
     def __repr__(self):
         ctx = {key: value.name.root for key, value in self.__dict__.items()}
         return f"TopologyContext({ctx})"
@@ -173,6 +246,7 @@ class TopologyContext(BaseModel):
         :param value: value to use for the update
         """
         self.__dict__[key] = value
+        self._shared_keys.discard(key)
 
     def append(self, key: str, value: Any) -> None:
         """
@@ -180,10 +254,13 @@ class TopologyContext(BaseModel):
         :param key: element to update from the source context
         :param value: value to use for the update
         """
-        if self.__dict__.get(key):
-            self.__dict__[key].append(value)
-        else:
+        if not self.__dict__.get(key):
             self.__dict__[key] = [value]
+        elif key in self._shared_keys:
+            self.__dict__[key] = [*self.__dict__[key], value]
+        else:
+            self.__dict__[key].append(value)
+        self._shared_keys.discard(key)
 
     def clear_stage(self, stage: NodeStage) -> None:
         """
@@ -191,6 +268,18 @@ class TopologyContext(BaseModel):
         :param stage: Update stage context to the default values
         """
         self.__dict__[stage.context] = None
+        self._shared_keys.discard(stage.context)
+
+    def copy_on_write(self) -> "TopologyContext":
+        """
+        Shallow copy of the context. Both contexts share the values, and only copy
+        the lists they append to, so the copy costs the same whatever the size of
+        the values - e.g., the stored procedures of a schema.
+        """
+        context = self.model_copy()
+        self._shared_keys = set(self.__dict__)
+        context._shared_keys = set(context.__dict__)
+        return context
 
     def fqn_from_stage(self, stage: NodeStage, entity_name: str) -> str:
         """
@@ -301,9 +390,8 @@ class TopologyContextManager:
         thread_id = self.get_current_thread_id()
 
         # If it does not exist yet, copies the Parent Context in order to have all context gathered until this point.
-        self.contexts.setdefault(
-            thread_id, self.contexts[parent_thread_id].model_copy(deep=True)
-        )
+        if thread_id not in self.contexts:
+            self.contexts[thread_id] = self.contexts[parent_thread_id].copy_on_write()
 
 
 class Queue:
@@ -0,0 +1,347 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Asynchronous REST client over httpx, with a pool of HTTP/2 connections.
+
+It shares the configuration, authentication, retries and errors of the sync
+REST client, so that callers can handle both the same way.
+"""
+import asyncio
+import os
+import ssl
+import time
+import traceback
+from json import JSONDecodeError
+from typing import Optional, Union
+
+import httpx
+
+from metadata.ingestion.ometa.client import (
+    APIError,
+    BaseREST,
+    ClientConfig,
+    LimitsException,
+    RetryException,
+    _get_endpoint_context,
+    _parse_retry_after,
+)
+from metadata.ingestion.ometa.credentials import URL
+from metadata.utils.execution_time_tracker import ExecutionTimeTracker
+from metadata.utils.json_codec import get_json_codec
+from metadata.utils.logger import ometa_logger
+from metadata.utils.tracer import Tracer
+from metadata.utils.worker_autoscaler import WorkerFeedback
+
+logger = ometa_logger()
+
+# Concurrent requests per client. The next ones wait for a free connection.
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+def _get_ssl_context(
+    verify: Optional[Union[bool, str]], cert: Optional[Union[str, tuple]]
+) -> ssl.SSLContext:
+    """SSL context from the `requests` verify and cert options"""
+    if isinstance(verify, str):
+        ssl_context = (
+            ssl.create_default_context(capath=verify)
+            if os.path.isdir(verify)
+            else ssl.create_default_context(cafile=verify)
+        )
+    else:
+        ssl_context = httpx.create_ssl_context(verify=verify is not False)
+
+    if cert:
+        if isinstance(cert, str):
+            ssl_context.load_cert_chain(cert)
+        else:
+            ssl_context.load_cert_chain(*cert)
+    return ssl_context
+
+
+class AsyncREST(BaseREST):
+    """
+    Async REST client wrapper to manage requests with
+    retries, auth and error handling.
+
+    Example:
+
+        async with AsyncREST(config) as client:
+            tables = await asyncio.gather(
+                *(client.get(f"/tables/name/{fqn}") for fqn in fqns)
+            )
+    """
+
+    _connection_errors = (httpx.TransportError,)
+
+    def __init__(
+        self,
+        config: ClientConfig,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        super().__init__(config)
+        self._client = httpx.AsyncClient(
+            http2=True,
+            verify=_get_ssl_context(self._verify, self._cert),
+            cookies=self._cookies,
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    async def _request(  # pylint: disable=too-many-arguments
+        self,
+        method,
+        path,
+        data=None,
+        json=None,
+        base_url: URL = None,
+        api_version: str = None,
+        headers: dict = None,
+    ):
+        url, opts = self._prepare_request(
+            method, path, data, json, base_url, api_version, headers
+        )
+
+        # Coroutines of the same thread interleave, so we record the times
+        # instead of nesting them in the thread contexts
+        endpoint = _get_endpoint_context(path)
+        start, trace_start = time.perf_counter(), Tracer().now()
+        response = None
+        try:
+            response = await self._request_with_retries(method, url, path, opts)
+            return response
+        finally:
+            self._notify_write(method, path, response)
+            ExecutionTimeTracker().record(
+                f"{method.upper()}.{endpoint}", time.perf_counter() - start
+            )
+            Tracer().record(
+                f"{method.upper()} {endpoint}",
+                category="http",
+                start=trace_start,
+                args={"path": path},
+            )
+
+    async def _request_with_retries(self, method: str, url: URL, path: str, opts: dict):
+        """
+        Send the request, retrying with backoff if the server is unavailable or
+        throttling us. Requests to an endpoint whose circuit is open fail fast.
+        """
+        endpoint = _get_endpoint_context(path)
+        retry = self._retry if self._retry > 0 else 0
+        retry_wait = self._retry_wait
+        while retry >= 0:
+            self.circuit_breaker.before_request(endpoint)
+            try:
+                async with self.rate_limiter.limit_async(path):
+                    response = await self._one_request(method, url, opts, retry)
+                self.circuit_breaker.record_success(endpoint)
+                return response
+            except RetryException as exc:
+                self._record_outcome(endpoint, exc)
+                retry_wait = self._next_retry_wait(retry_wait, exc.retry_after)
+                logger.warning(
+                    "sleep %.1f seconds and retrying %s %s more time(s)...",
+                    retry_wait,
+                    url,
+                    retry,
+                )
+                await asyncio.sleep(retry_wait)
+                retry -= 1
+                if retry == 0:
+                    logger.error(f"No more retries left for {url}")
+            except Exception as exc:
+                self._record_outcome(endpoint, exc)
+                if isinstance(exc, LimitsException):
+                    logger.error(f"Feature limit exceeded for {url}")
+                    self._limits_reached.add(path)
+                raise
+        return None
+
+    def _build_request(self, method: str, url: URL, opts: dict) -> httpx.Request:
+        """Translate the `requests` options of the request to httpx"""
+        data = opts.get("data")
+        return self._client.build_request(
+            method,
+            str(url),
+            params=opts.get("params"),
+            # httpx sends raw bodies as `content` and form fields as `data`
+            content=data if isinstance(data, (str, bytes)) else None,
+            data=data if isinstance(data, dict) else None,
+            json=opts.get("json"),
+            headers=opts["headers"],
+        )
+
+    async def _one_request(self, method: str, url: URL, opts: dict, retry: int):
+        """
+        Perform one request, possibly raising RetryException in the case
+        the response is 429. Otherwise, if error text contain "code" string,
+        then it decodes to json object and returns APIError.
+        Returns the body json in the 200 status.
+        """
+        request = self._build_request(method, url, opts)
+        follow_redirects = bool(opts.get("allow_redirects"))
+        try:
+            start = time.perf_counter()
+            resp = await self._client.send(request, follow_redirects=follow_redirects)
+            WorkerFeedback().record_api_request(time.perf_counter() - start)
+            # Unlike requests, httpx also raises for the redirects
+            if resp.is_error:
+                resp.raise_for_status()
+
+            if resp.content:
+                try:
+                    return get_json_codec().decode(resp.content)
+                except JSONDecodeError as json_decode_error:
+                    logger.debug(
+                        "Non-JSON response (%s) returned as-is: %s",
+                        resp.status_code,
+                        json_decode_error,
+                    )
+                    return resp
+
+        except httpx.HTTPStatusError as http_error:
+            if resp.status_code in self._retry_codes or (
+                resp.status_code in self._limit_codes
+            ):
+                WorkerFeedback().record_throttled()
+            # retry if we hit Rate Limit
+            if (
+                resp.status_code in self._retry_codes
+                and retry > 0
+                and self._is_retryable(method, resp.status_code)
+            ):
+                raise RetryException(
+                    resp.status_code,
+                    _parse_retry_after(resp.headers.get("Retry-After")),
+                ) from http_error
+            if resp.status_code in self._limit_codes:
+                raise LimitsException() from http_error
+            if "code" in resp.text:
+                error = get_json_codec().decode(resp.content)
+                if "code" in error:
+                    raise APIError(error, http_error) from http_error
+            else:
+                raise
+        except httpx.TransportError as conn:
+            # The server may close idle connections of the pool, retry once
+            try:
+                request = self._build_request(method, url, opts)
+                resp = await self._client.send(
+                    request, follow_redirects=follow_redirects
+                )
+                return get_json_codec().decode(resp.content)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Unexpected error while retrying after a connection error - {exc}"
+                )
+                raise conn
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Unexpected error calling [{url}] with method [{method}]: {exc}"
+            )
+
+        return None
+
+    async def get(self, path, data=None, headers=None):
+        """
+        GET method
+
+        Parameters:
+            path (str):
+            data ():
+            headers (dict): Optional custom headers to override default headers
+
+        Returns:
+            Response
+        """
+        return await self._request("GET", path, data, headers=headers)
+
+    async def post(self, path, data=None, json=None, headers=None):
+        """
+        POST method
+
+        Parameters:
+            path (str):
+            data ():
+            json ():
+            headers (dict): Optional custom headers to override default headers
+
+        Returns:
+            Response
+        """
+        return await self._request("POST", path, data, json, headers=headers)
+
+    async def put(self, path, data=None, json=None, headers=None):
+        """
+        PUT method
+
+        Parameters:
+            path (str):
+            data ():
+            json ():
+            headers (dict): Optional custom headers to override default headers
+
+        Returns:
+            Response
+        """
+        return await self._request("PUT", path, data, json=json, headers=headers)
+
+    async def patch(self, path, data=None):
+        """
+        PATCH method
+
+        Parameters:
+            path (str):
+            data ():
+
+        Returns:
+            Response
+        """
+        return await self._request(
+            method="PATCH",
+            path=path,
+            data=data,
+            headers={"Content-type": "application/json-patch+json"},
+        )
+
+    async def delete(self, path, data=None, headers=None):
+        """
+        DELETE method
+
+        Parameters:
+            path (str):
+            data ():
+            headers (dict): Optional custom headers to override default headers
+
+        Returns:
+            Response
+        """
+        return await self._request("DELETE", path, data, headers=headers)
+
+    async def __aenter__(self):
+        return self
+
+    async def close(self):
+        """
+        Close the connection pool
+        """
+        await self._client.aclose()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,262 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Asynchronous OpenMetadata API
+
+Exposes the methods of OpenMetadata and all its mixins as coroutines. Each call
+runs the sync code of the mixin in a greenlet, and its requests are sent with the
+AsyncREST client and awaited on the event loop - as SQLAlchemy does for its
+asyncio extension. While a call waits for the server, the others keep running,
+so a single event loop can have hundreds of lookups in flight.
+"""
+import functools
+import inspect
+import sys
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+import httpx
+from greenlet import getcurrent, greenlet
+
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.ingestion.ometa.async_client import DEFAULT_MAX_CONNECTIONS, AsyncREST
+from metadata.ingestion.ometa.client import REST, BaseREST, ClientConfig
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.rate_limiter import RateLimiter
+from metadata.ingestion.ometa.singleflight import SingleFlight
+from metadata.utils.execution_time_tracker import ExecutionTimeTracker
+from metadata.utils.tracer import Tracer
+
+
+class _AsyncBridge(greenlet):
+    """Greenlet running sync code, switching to the event loop to await"""
+
+    def __init__(self, fn: Callable, driver: greenlet):
+        super().__init__(fn, driver)
+        self.driver = driver
+
+
+def await_coroutine(coroutine) -> Any:
+    """
+    Await the coroutine from sync code running in `run_sync`, switching back to the
+    event loop until it finishes
+    """
+    current = getcurrent()
+    if not isinstance(current, _AsyncBridge):
+        coroutine.close()
+        raise RuntimeError(
+            "Cannot await outside of run_sync. Are you iterating the result of"
+            " a sync method out of the AsyncOpenMetadata client?"
+        )
+    return current.driver.switch(coroutine)
+
+
+def _run_untracked(fn: Callable, *args, **kwargs) -> Any:
+    """
+    The execution times and the spans are stacked per thread, and the greenlets
+    of the thread interleave, so they would nest into each other. We don't track
+    the sync code, and AsyncREST still records the time of each request.
+    """
+    with ExecutionTimeTracker().suspended(), Tracer().suspended():
+        return fn(*args, **kwargs)
+
+
+async def run_sync(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run the sync function in a greenlet, awaiting the coroutines it passes.
+    Execution time tracking and tracing are off within the greenlet.
+    """
+    context = _AsyncBridge(functools.partial(_run_untracked, fn), getcurrent())
+    result = context.switch(*args, **kwargs)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:  # pylint: disable=broad-except
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+    return result
+
+
+async def _iterate(generator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Advance the sync generator in the bridge"""
+    exhausted = object()
+    while True:
+        element = await run_sync(next, generator, exhausted)
+        if element is exhausted:
+            return
+        yield element
+
+
+class _BridgedREST(REST):
+    """
+    REST client of the sync mixins, awaiting the requests of the async client.
+    It doesn't open a session of its own, and shares the rate limiter of the
+    async client.
+    """
+
+    # The requests session of REST is never used, so we skip its __init__
+    def __init__(  # pylint: disable=super-init-not-called,non-parent-init-called
+        self, async_client: AsyncREST
+    ):
+        self.async_client = async_client
+        BaseREST.__init__(self, async_client.config)
+        # Calls interleave as greenlets of the same thread, which can't wait
+        # for each other
+        self.single_flight = SingleFlight(enabled=False)
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self.async_client.rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, rate_limiter: RateLimiter) -> None:
+        self.async_client.rate_limiter = rate_limiter
+
+    def get(self, path, data=None, headers=None):
+        return await_coroutine(self.async_client.get(path, data, headers=headers))
+
+    def post(self, path, data=None, json=None, headers=None):
+        return await_coroutine(
+            self.async_client.post(path, data, json, headers=headers)
+        )
+
+    def put(self, path, data=None, json=None, headers=None):
+        return await_coroutine(
+            self.async_client.put(path, data, json=json, headers=headers)
+        )
+
+    def patch(self, path, data=None):
+        return await_coroutine(self.async_client.patch(path, data))
+
+    def delete(self, path, data=None, headers=None):
+        return await_coroutine(self.async_client.delete(path, data, headers=headers))
+
+    def add_write_listener(self, listener: Callable[[str, Any], None]) -> None:
+        self.async_client.add_write_listener(listener)
+
+    def close(self):
+        """The async client is closed by AsyncOpenMetadata"""
+
+
+class _BridgedOpenMetadata(OpenMetadata):
+    """OpenMetadata sending its requests with the AsyncREST client"""
+
+    def __init__(
+        self,
+        config: OpenMetadataConnection,
+        raw_data: bool,
+        additional_client_config_arguments: Optional[Dict[str, Any]],
+        max_connections: int,
+        transport: Optional[httpx.AsyncBaseTransport],
+    ):
+        self._max_connections = max_connections
+        self._transport = transport
+        super().__init__(config, raw_data, additional_client_config_arguments)
+        # Pages are fetched by the generators, which run in the caller greenlet
+        self.pagination_read_ahead = 0
+        self.batch_read_workers = 1
+
+    def _get_client(self, client_config: ClientConfig) -> REST:
+        return _BridgedREST(
+            AsyncREST(client_config, self._max_connections, self._transport)
+        )
+
+
+class AsyncOpenMetadata:
+    """
+    Asynchronous interface to the OpenMetadata API. Methods are coroutines, and
+    generators, e.g., `list_all_entities`, are async generators.
+
+    Example:
+
+        async with AsyncOpenMetadata(config) as metadata:
+            tables = await asyncio.gather(
+                *(metadata.get_by_name(entity=Table, fqn=fqn) for fqn in fqns)
+            )
+            async for table in metadata.list_all_entities(entity=Table):
+                ...
+
+    Sync code sending requests, e.g., properties, can be run with `run_sync`.
+    """
+
+    def __init__(
+        self,
+        config: OpenMetadataConnection,
+        raw_data: bool = False,
+        additional_client_config_arguments: Optional[Dict[str, Any]] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.config = config
+        self._raw_data = raw_data
+        self._additional_client_config_arguments = additional_client_config_arguments
+        self._max_connections = max_connections
+        self._transport = transport
+        self._metadata: Optional[OpenMetadata] = None
+
+    async def connect(self) -> "AsyncOpenMetadata":
+        """Authenticate and validate the versions, which already send requests"""
+        self._metadata = await run_sync(
+            _BridgedOpenMetadata,
+            self.config,
+            self._raw_data,
+            self._additional_client_config_arguments,
+            self._max_connections,
+            self._transport,
+        )
+        return self
+
+    @property
+    def metadata(self) -> OpenMetadata:
+        """Sync client, whose requests must run within `run_sync`"""
+        if self._metadata is None:
+            raise RuntimeError("AsyncOpenMetadata is not connected")
+        return self._metadata
+
+    @property
+    def client(self) -> AsyncREST:
+        return self.metadata.client.async_client
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attribute = getattr(self.metadata, name)
+        if not callable(attribute) or inspect.isclass(attribute):
+            return attribute
+
+        if inspect.isgeneratorfunction(attribute):
+
+            @functools.wraps(attribute)
+            def iterate(*args, **kwargs):
+                return _iterate(attribute(*args, **kwargs))
+
+            return iterate
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            return await run_sync(attribute, *args, **kwargs)
+
+        return call
+
+    async def close(self):
+        """
+        Close the connection pool
+        """
+        if self._metadata is not None:
+            await self.client.close()
+
+    async def __aenter__(self) -> "AsyncOpenMetadata":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,104 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Circuit breaker of the endpoints the REST client calls.
+
+After `failure_threshold` consecutive server failures of an endpoint - 502,
+503 or 504 responses, or connection errors - the circuit of the endpoint
+opens, and its requests fail fast instead of piling up on a server that can't
+serve them.
+After `reset_timeout` seconds a single request goes through: if it succeeds,
+the circuit closes again, otherwise it stays open for another `reset_timeout`.
+
+Each endpoint has its own circuit, so a failing endpoint doesn't stall the
+requests of the others.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+
+class CircuitOpenException(Exception):
+    """
+    The endpoint is failing, and we skip the request until it recovers
+    """
+
+
+class _Circuit:
+    """Consecutive failures of an endpoint, and since when it is open"""
+
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Keep a circuit per endpoint. A `failure_threshold` of 0 disables it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._rejected = 0
+
+    @property
+    def rejected(self) -> int:
+        """Number of requests skipped while the circuits were open"""
+        return self._rejected
+
+    def is_open(self, endpoint: str) -> bool:
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return bool(circuit and circuit.opened_at is not None)
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Raise CircuitOpenException if the circuit of the endpoint is open,
+        letting a single probe through once the reset timeout passed.
+        """
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return
+            if (
+                not circuit.probing
+                and time.monotonic() - circuit.opened_at >= self.reset_timeout
+            ):
+                circuit.probing = True
+                return
+            self._rejected += 1
+        raise CircuitOpenException(
+            f"Skipping request - [{endpoint}] is failing, retrying in up to"
+            f" {self.reset_timeout}s"
+        )
+
+    def record_success(self, endpoint: str) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._circuits.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            if circuit.probing or circuit.failures >= self.failure_threshold:
+                # (Re)open the circuit: a failed probe waits for another timeout
+                circuit.opened_at = time.monotonic()
+                circuit.probing = False
@@ -11,20 +11,35 @@
 """
 Python API REST wrapper and helpers
 """
+import copy
+import random
 import time
 import traceback
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from json import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import requests
 from requests.exceptions import HTTPError
 
 from metadata.config.common import ConfigModel
+from metadata.ingestion.ometa.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenException,
+)
 from metadata.ingestion.ometa.credentials import URL, get_api_version
+from metadata.ingestion.ometa.rate_limiter import RateLimiter
+from metadata.ingestion.ometa.singleflight import SingleFlight
 from metadata.ingestion.ometa.ttl_cache import TTLCache
-from metadata.utils.execution_time_tracker import calculate_execution_time
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeTracker,
+    calculate_execution_time,
+)
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.logger import ometa_logger
+from metadata.utils.tracer import Tracer
+from metadata.utils.worker_autoscaler import WorkerFeedback
 
 logger = ometa_logger()
 
@@ -34,6 +49,13 @@ class RetryException(Exception):
     API Client retry exception
     """
 
+    def __init__(
+        self, status_code: Optional[int] = None, retry_after: Optional[float] = None
+    ):
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
 
 class LimitsException(Exception):
     """
@@ -95,6 +117,40 @@ class APIError(Exception):
         return None
 
 
+# Methods we can send again without changing the result, if the first attempt
+# reached the server anyway
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+# Responses telling the request was not processed, safe to retry for any method
+REFUSED_CODES = frozenset((429, 503))
+# Responses telling the server, or the proxies in front of it, is failing
+UNAVAILABLE_CODES = frozenset((502, 503, 504))
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header, in seconds or as an HTTP date"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _get_endpoint_context(path: str) -> str:
+    """
+    Name the execution time context of a request by its endpoint collection,
+    e.g., `/tables/name/svc.db.schema.t?fields=...` -> `tables`
+    """
+    return path.split("?", 1)[0].strip("/").split("/", 1)[0] or "root"
+
+
 class ClientConfig(ConfigModel):
     """
     :param raw_data: should we return api response raw or wrap it with
@@ -105,8 +161,12 @@ class ClientConfig(ConfigModel):
     api_version: Optional[str] = "v1"
     retry: Optional[int] = 3
     retry_wait: Optional[int] = 30
+    retry_max_wait: Optional[int] = 300
+    retry_non_idempotent: Optional[bool] = False
     limit_codes: List[int] = [429]
-    retry_codes: List[int] = [504]
+    retry_codes: List[int] = [503, 504]
+    circuit_breaker_threshold: Optional[int] = 5
+    circuit_breaker_reset: Optional[int] = 30
     auth_token: Optional[Callable] = None
     access_token: Optional[str] = None
     expires_in: Optional[int] = None
@@ -123,20 +183,24 @@ class ClientConfig(ConfigModel):
 
 
 # pylint: disable=too-many-instance-attributes
-class REST:
+class BaseREST:
     """
-    REST client wrapper to manage requests with
-    retries, auth and error handling.
+    Configuration, authentication and headers shared by the
+    sync and async REST clients.
     """
 
+    # Errors of the HTTP library telling the server could not be reached
+    _connection_errors: Tuple[Type[Exception], ...] = ()
+
     def __init__(self, config: ClientConfig):
         self.config = config
         self._base_url: URL = URL(self.config.base_url)
         self._api_version = get_api_version(self.config.api_version)
-        self._session = requests.Session()
         self._use_raw_data = self.config.raw_data
         self._retry = self.config.retry
         self._retry_wait = self.config.retry_wait
+        self._retry_max_wait = self.config.retry_max_wait
+        self._retry_non_idempotent = self.config.retry_non_idempotent
         self._retry_codes = self.config.retry_codes
         self._limit_codes = self.config.limit_codes
         self._auth_token = self.config.auth_token
@@ -147,8 +211,81 @@ class REST:
         self._timeout = self.config.timeout
 
         self._limits_reached = TTLCache(config.ttl_cache)
+        self._write_listeners: List[Callable[[str, Any], None]] = []
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=self.config.circuit_breaker_threshold or 0,
+            reset_timeout=self.config.circuit_breaker_reset or 0,
+        )
+        # Shared by the threads and coroutines of the client. Without limits,
+        # requests go straight through
+        self.rate_limiter = RateLimiter()
 
-    def _request(  # pylint: disable=too-many-arguments,too-many-branches
+    def add_write_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """
+        Call the listener with the path and the response of each PUT, POST,
+        PATCH and DELETE request, once it finishes - or fails.
+        """
+        self._write_listeners.append(listener)
+
+    def _notify_write(self, method: str, path: str, response: Any) -> None:
+        if method.upper() == "GET":
+            return
+        for listener in self._write_listeners:
+            try:
+                listener(path, response)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(f"Error notifying the write of [{path}]: {exc}")
+
+    def _is_retryable(self, method: str, status_code: int) -> bool:
+        """
+        Requests which may have been processed are only sent again if that's safe,
+        e.g., a POST timing out at the gateway may have created the entity.
+        """
+        return (
+            status_code in REFUSED_CODES
+            or method.upper() in IDEMPOTENT_METHODS
+            or self._retry_non_idempotent
+        )
+
+    def _next_retry_wait(
+        self, previous_wait: float, retry_after: Optional[float] = None
+    ) -> float:
+        """
+        Exponential backoff with decorrelated jitter, so that the clients failing
+        together don't retry in lockstep. We wait at least what the server asks for
+        with `Retry-After`. Both are capped by `retry_max_wait`.
+        """
+        max_wait = self._retry_max_wait or float("inf")
+        if retry_after is not None:
+            return min(max_wait, retry_after * random.uniform(1, 1.1))
+        return min(
+            max_wait, random.uniform(self._retry_wait, max(previous_wait, 0) * 3)
+        )
+
+    def _is_server_failure(self, exc: Exception) -> bool:
+        """
+        Whether the error counts as a failure of the endpoint for its circuit,
+        i.e., the server is unavailable or can't be reached. Errors of a request,
+        e.g., a 500 for a bad payload, don't tell the server is down.
+        """
+        if isinstance(exc, (CircuitOpenException, LimitsException)):
+            return False
+        status_code = getattr(exc, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(exc, "response", None), "status_code", None)
+        if isinstance(status_code, int):
+            return status_code in UNAVAILABLE_CODES
+        return isinstance(exc, self._connection_errors)
+
+    def _record_outcome(self, endpoint: str, exc: Exception) -> None:
+        """Record a failed request in the circuit of its endpoint"""
+        if self._is_server_failure(exc):
+            self.circuit_breaker.record_failure(endpoint)
+        else:
+            self.circuit_breaker.record_success(endpoint)
+
+    def _prepare_request(  # pylint: disable=too-many-arguments,too-many-branches
         self,
         method,
         path,
@@ -157,8 +294,8 @@ class REST:
         base_url: URL = None,
         api_version: str = None,
         headers: dict = None,
-    ):
-        # pylint: disable=too-many-locals
+    ) -> Tuple[URL, dict]:
+        """Build the URL and the `requests` options of the request"""
         if path in self._limits_reached:
             raise LimitsException(f"Skipping request - limits reached for {path}")
 
@@ -214,7 +351,12 @@ class REST:
 
         method_key = "params" if method.upper() == "GET" else "data"
         opts[method_key] = data
-        if json:
+        if json and method_key == "data" and data is None:
+            # Encode the body with our codec instead of the stdlib one of `requests`
+            opts["data"] = get_json_codec().encode(json)
+            if not any(key.lower() == "content-type" for key in headers):
+                opts["headers"] = {**headers, "Content-Type": "application/json"}
+        elif json:
             opts["json"] = json
 
         if self._cert:
@@ -223,19 +365,78 @@ class REST:
         if self._timeout:
             opts["timeout"] = self._timeout
 
-        total_retries = self._retry if self._retry > 0 else 0
-        retry = total_retries
+        return url, opts
+
+
+class REST(BaseREST):
+    """
+    REST client wrapper to manage requests with
+    retries, auth and error handling.
+    """
+
+    _connection_errors = (requests.ConnectionError,)
+
+    def __init__(self, config: ClientConfig):
+        super().__init__(config)
+        self._session = requests.Session()
+        # Identical GETs sent at the same time by different threads share a request
+        self.single_flight = SingleFlight()
+        self._write_listeners.append(self._forget_flights)
+
+    def _forget_flights(self, path: str, _) -> None:
+        """GETs of the written collection should not join the ones sent before"""
+        endpoint = _get_endpoint_context(path)
+        self.single_flight.forget(
+            lambda key: key[0] == "GET" and _get_endpoint_context(key[1]) == endpoint
+        )
+
+    def _request(  # pylint: disable=too-many-arguments
+        self,
+        method,
+        path,
+        data=None,
+        json=None,
+        base_url: URL = None,
+        api_version: str = None,
+        headers: dict = None,
+    ):
+        url, opts = self._prepare_request(
+            method, path, data, json, base_url, api_version, headers
+        )
+
+        # Time each endpoint collection, e.g., `tables`, under the method context
+        endpoint = _get_endpoint_context(path)
+        with ExecutionTimeTracker()(context=endpoint, store=True):
+            with Tracer().span(
+                f"{method.upper()} {endpoint}", category="http", args={"path": path}
+            ):
+                response = None
+                try:
+                    response = self._request_with_retries(method, url, path, opts)
+                    return response
+                finally:
+                    self._notify_write(method, path, response)
+
+    def _request_with_retries(self, method: str, url: URL, path: str, opts: dict):
+        """
+        Send the request, retrying with backoff if the server is unavailable or
+        throttling us. Requests to an endpoint whose circuit is open fail fast.
+        """
+        endpoint = _get_endpoint_context(path)
+        retry = self._retry if self._retry > 0 else 0
+        retry_wait = self._retry_wait
         while retry >= 0:
+            self.circuit_breaker.before_request(endpoint)
             try:
-                return self._one_request(method, url, opts, retry)
-            except LimitsException as exc:
-                logger.error(f"Feature limit exceeded for {url}")
-                self._limits_reached.add(path)
-                raise exc
-            except RetryException:
-                retry_wait = self._retry_wait * (total_retries - retry + 1)
+                with self.rate_limiter.limit(path):
+                    response = self._one_request(method, url, opts, retry)
+                self.circuit_breaker.record_success(endpoint)
+                return response
+            except RetryException as exc:
+                self._record_outcome(endpoint, exc)
+                retry_wait = self._next_retry_wait(retry_wait, exc.retry_after)
                 logger.warning(
-                    "sleep %s seconds and retrying %s %s more time(s)...",
+                    "sleep %.1f seconds and retrying %s %s more time(s)...",
                     retry_wait,
                     url,
                     retry,
@@ -244,7 +445,12 @@ class REST:
                 retry -= 1
                 if retry == 0:
                     logger.error(f"No more retries left for {url}")
-                    traceback.format_exc()
+            except Exception as exc:
+                self._record_outcome(endpoint, exc)
+                if isinstance(exc, LimitsException):
+                    logger.error(f"Feature limit exceeded for {url}")
+                    self._limits_reached.add(path)
+                raise
         return None
 
     def _one_request(self, method: str, url: URL, opts: dict, retry: int):
@@ -257,12 +463,16 @@ class REST:
         retry_codes = self._retry_codes
         limit_codes = self._limit_codes
         try:
+            start = time.perf_counter()
             resp = self._session.request(method, url, **opts)
+            WorkerFeedback().record_api_request(time.perf_counter() - start)
             resp.raise_for_status()
 
-            if resp.text != "":
+            # Decode the bytes, the codecs don't need them as a string
+            content = resp.content
+            if content:
                 try:
-                    return resp.json()
+                    return get_json_codec().decode(content)
                 except JSONDecodeError as json_decode_error:
                     logger.debug(
                         "Non-JSON response (%s) returned as-is: %s",
@@ -277,13 +487,22 @@ class REST:
                     )
 
         except HTTPError as http_error:
+            if resp.status_code in retry_codes or resp.status_code in limit_codes:
+                WorkerFeedback().record_throttled()
             # retry if we hit Rate Limit
-            if resp.status_code in retry_codes and retry > 0:
-                raise RetryException() from http_error
+            if (
+                resp.status_code in retry_codes
+                and retry > 0
+                and self._is_retryable(method, resp.status_code)
+            ):
+                raise RetryException(
+                    resp.status_code,
+                    _parse_retry_after(resp.headers.get("Retry-After")),
+                ) from http_error
             if resp.status_code in limit_codes:
                 raise LimitsException() from http_error
-            if "code" in resp.text:
-                error = resp.json()
+            if b"code" in resp.content:
+                error = get_json_codec().decode(resp.content)
                 if "code" in error:
                     raise APIError(error, http_error) from http_error
             else:
@@ -291,7 +510,9 @@ class REST:
         except requests.ConnectionError as conn:
             # Trying to solve https://github.com/psf/requests/issues/4664
             try:
-                return self._session.request(method, url, **opts).json()
+                return get_json_codec().decode(
+                    self._session.request(method, url, **opts).content
+                )
             except Exception as exc:
                 logger.debug(traceback.format_exc())
                 logger.warning(
@@ -319,7 +540,15 @@ class REST:
         Returns:
             Response
         """
-        return self._request("GET", path, data, headers=headers)
+        if not isinstance(data, (str, bytes, type(None))):
+            return self._request("GET", path, data, headers=headers)
+
+        key = ("GET", path, data, tuple(sorted((headers or {}).items())))
+        response, shared = self.single_flight.do(
+            key, lambda: self._request("GET", path, data, headers=headers)
+        )
+        # Callers may modify the response, so each waiter gets its own copy
+        return copy.deepcopy(response) if shared else response
 
     @calculate_execution_time(context="POST")
     def post(self, path, data=None, json=None, headers=None):
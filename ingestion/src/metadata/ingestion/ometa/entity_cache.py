@@ -0,0 +1,191 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Read-through cache of the entities fetched by name or id.
+
+Entries expire after `ttl_seconds`, and the least recently used ones are evicted
+past `max_size`. The writes of the client - PUT, POST, PATCH, DELETE - invalidate
+the entries of the written entity, or of its whole collection if we can't tell
+which entity it was, e.g., bulk requests.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from pydantic import BaseModel
+
+from metadata.utils.logger import ometa_logger
+
+logger = ometa_logger()
+
+# Entity collection, path by name or id, fields and include
+CacheKey = Tuple[str, str, Tuple[str, ...], Optional[str]]
+
+
+class EntityCacheStats(NamedTuple):
+    """Counters of the cache since it was created"""
+
+    hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class EntityCache:
+    """
+    Thread-safe LRU cache of entities with a TTL.
+
+    Entries are indexed by the id and FQN of their entity, so that a write through
+    any path invalidates them all, whatever the fields they were fetched with.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, BaseModel]]" = OrderedDict()
+        # (collection, id or FQN) -> keys of the entity
+        self._index: Dict[Tuple[str, str], Set[CacheKey]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(
+        suffix: str, path: str, fields: Optional[List[str]], include: Optional[str]
+    ) -> CacheKey:
+        return suffix, path, tuple(sorted(fields or ())), include
+
+    @staticmethod
+    def _identifiers(entity: BaseModel) -> Set[str]:
+        identifiers = set()
+        for attribute in ("id", "fullyQualifiedName"):
+            value = getattr(entity, attribute, None)
+            if value is not None:
+                identifiers.add(str(getattr(value, "root", value)))
+        return identifiers
+
+    def get(self, key: CacheKey) -> Optional[BaseModel]:
+        """
+        Copy of the cached entity, or None. Callers often modify the entities
+        they get, e.g., to build a patch, so they can't share them.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return entry[1].model_copy(deep=True)
+
+    def put(self, key: CacheKey, entity: BaseModel) -> None:
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, entity)
+            for identifier in self._identifiers(entity):
+                self._index.setdefault((key[0], identifier), set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: CacheKey) -> bool:
+        """Drop the entry and its index. Requires the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for identifier in self._identifiers(entry[1]):
+            keys = self._index.get((key[0], identifier))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[(key[0], identifier)]
+        return True
+
+    def invalidate(self, suffix: str, identifiers: Set[str]) -> None:
+        """Drop the entries of the entity with any of the ids or FQNs"""
+        with self._lock:
+            for identifier in identifiers:
+                for key in list(self._index.get((suffix, identifier), ())):
+                    if self._remove(key):
+                        self._invalidations += 1
+
+    def invalidate_collection(self, suffix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == suffix]:
+                self._remove(key)
+                self._invalidations += 1
+
+    def invalidate_write(self, path: str, response: Any) -> None:
+        """
+        Write listener of the REST client. The written entity is the one returned
+        by the server, if any, or the one of the path.
+        """
+        with self._lock:
+            suffixes = {key[0] for key in self._entries}
+        if not suffixes:
+            return
+        path = path.split("?", 1)[0]
+        suffix = next(
+            (
+                suffix
+                for suffix in suffixes
+                if path == suffix or path.startswith(f"{suffix}/")
+            ),
+            None,
+        )
+        if suffix is None:
+            return
+
+        identifiers = set()
+        if isinstance(response, dict):
+            identifiers.update(
+                str(response[attribute])
+                for attribute in ("id", "fullyQualifiedName")
+                if response.get(attribute)
+            )
+        segments = path[len(suffix) :].strip("/").split("/")
+        if segments[0] == "name" and len(segments) > 1:
+            identifiers.add(unquote(segments[1]))
+        elif segments[0] and segments[0] != "bulk":
+            identifiers.add(unquote(segments[0]))
+
+        if identifiers:
+            self.invalidate(suffix, identifiers)
+        else:
+            self.invalidate_collection(suffix)
+
+    def stats(self) -> EntityCacheStats:
+        with self._lock:
+            return EntityCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
@@ -15,8 +15,10 @@ To be used by OpenMetadata class
 """
 import functools
 import json
+import re
 import traceback
 from typing import (
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -43,11 +45,36 @@ from metadata.utils import fqn
 from metadata.utils.elasticsearch import ES_INDEX_MAP, get_entity_from_es_result
 from metadata.utils.execution_time_tracker import calculate_execution_time_generator
 from metadata.utils.logger import ometa_logger
+from metadata.utils.prefetch import prefetch
 
 logger = ometa_logger()
 
 T = TypeVar("T", bound=BaseModel)
 
+# ES refuses to return more hits than its max result window in a single page
+MAX_RESULT_WINDOW = 10000
+
+
+def _wildcard_regex(pattern: str) -> re.Pattern:
+    """
+    Regex matching the same values as the ES wildcard query of the pattern,
+    case-insensitive as the FQNs are indexed lowercased
+    """
+    regex, escaped = [], False
+    for char in pattern:
+        if escaped:
+            regex.append(re.escape(char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "*":
+            regex.append(".*")
+        elif char == "?":
+            regex.append(".")
+        else:
+            regex.append(re.escape(char))
+    return re.compile("".join(regex), re.IGNORECASE | re.DOTALL)
+
 
 class TotalModel(BaseModel):
     """Elasticsearch total model"""
@@ -122,9 +149,17 @@ class ESMixin(Generic[T]):
         "&size={size}&index={index}&deleted=false"
     )
 
+    fqdn_batch_search = (
+        "/search/query?q=&from=0&size={size}&deleted=false&index={index}"
+        "&include_source_fields=fullyQualifiedName&query_filter={query_filter}"
+    )
+
+    # FQN search strings matched by each search request of es_search_from_fqns
+    fqn_search_batch_size = 100
+
     # sort_field needs to be unique for the pagination to work, so we can use the FQN
     paginate_query = (
-        "/search/query?q=&size={size}&deleted=false{filter}&index={index}{include_fields}"
+        "/search/query?q=&size={size}&deleted={deleted}{filter}&index={index}{include_fields}"
         "&sort_field={sort_field}&sort_order={sort_order}{after}"
     )
 
@@ -142,6 +177,21 @@ class ESMixin(Generic[T]):
         :param query_string: Query to run
         :return: List of Entities or None
         """
+        # The cache is only filled once the search finishes, so the threads
+        # running the same search at the same time share its entities instead
+        entities, _ = self.client.single_flight.do(
+            ("ES", entity_type, query_string, fields),
+            lambda: self._run_es_entity_search(entity_type, query_string, fields),
+        )
+        return entities
+
+    def _run_es_entity_search(
+        self,
+        entity_type: Type[T],
+        query_string: str,
+        fields: Optional[str] = None,
+    ) -> Optional[List[T]]:
+        """Run the ES query, fetching the entities it found from the OM API"""
         response = self.client.get(query_string)
 
         if response:
@@ -229,6 +279,103 @@ class ESMixin(Generic[T]):
             fields=fields,
         )
 
+    def es_search_from_fqns(
+        self,
+        entity_type: Type[T],
+        fqn_search_strings: Iterable[str],
+        size: int = 10,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Optional[List[T]]]:
+        """
+        Run es_search_from_fqn for many FQN search strings with a request per
+        `fqn_search_batch_size` strings, and fetch the entities found with
+        get_by_names.
+
+        Args:
+            entity_type (Type[T]): The type of entity to look for.
+            fqn_search_strings (Iterable[str]): The strings used to search by fully qualified name (FQN).
+                Example: "service.*.schema.table".
+            size (int): The maximum number of records to return per search string.
+            fields (Optional[str]): Comma-separated list of fields to be returned.
+
+        Returns:
+            Dict[str, Optional[List[T]]]: The entities matching each search string, or None if
+                no entities are found.
+        """
+        search_strings = list(dict.fromkeys(fqn_search_strings))
+        try:
+            index = ES_INDEX_MAP[entity_type.__name__]
+        except KeyError as err:
+            logger.warning(
+                f"Cannot find the index in ES_INDEX_MAP for {entity_type.__name__}: {err}"
+            )
+            return {search_string: None for search_string in search_strings}
+
+        matches: Dict[str, List[str]] = {}
+        # Search strings we could not resolve with the batched queries
+        remaining: List[str] = []
+        for start in range(0, len(search_strings), self.fqn_search_batch_size):
+            batch = search_strings[start : start + self.fqn_search_batch_size]
+            query_filter = {
+                "query": {
+                    "bool": {
+                        "should": [
+                            {"wildcard": {"fullyQualifiedName": {"value": value}}}
+                            for value in batch
+                        ],
+                        "minimum_should_match": 1,
+                    }
+                }
+            }
+            response = self._get_es_response(
+                self.fqdn_batch_search.format(
+                    size=min(len(batch) * size, MAX_RESULT_WINDOW),
+                    index=index,
+                    query_filter=quote_plus(json.dumps(query_filter)),
+                )
+            )
+            if response is None:
+                remaining.extend(batch)
+                continue
+
+            # The hits come in a single list, so we assign them back to the
+            # search strings they match
+            patterns = {value: _wildcard_regex(value) for value in batch}
+            for value in batch:
+                matches[value] = []
+            for hit in response.hits.hits:
+                hit_fqn = hit.source.get("fullyQualifiedName")
+                for value, pattern in patterns.items():
+                    if len(matches[value]) < size and pattern.fullmatch(hit_fqn or ""):
+                        matches[value].append(hit_fqn)
+
+            # Strings matching many entities can fill the page: the ones that
+            # may have lost hits to them are searched on their own
+            if response.hits.total.value > len(response.hits.hits):
+                for value in batch:
+                    if len(matches[value]) < size:
+                        del matches[value]
+                        remaining.append(value)
+
+        entities = self.get_by_names(
+            entity_type,
+            (hit_fqn for hit_fqns in matches.values() for hit_fqn in hit_fqns),
+            fields=fields.split(",") if fields else None,
+        )
+        results: Dict[str, Optional[List[T]]] = {
+            value: [entities[hit_fqn] for hit_fqn in hit_fqns if entities[hit_fqn]]
+            or None
+            for value, hit_fqns in matches.items()
+        }
+        for value in remaining:
+            results[value] = self.es_search_from_fqn(
+                entity_type=entity_type,
+                fqn_search_string=value,
+                size=size,
+                fields=fields,
+            )
+        return {value: results.get(value) for value in search_strings}
+
     def es_search_container_by_path(
         self,
         full_path: str,
@@ -355,6 +502,7 @@ class ESMixin(Generic[T]):
         include_fields: Optional[List[str]] = None,
         sort_field: str = "fullyQualifiedName",
         sort_order: str = "desc",
+        deleted: bool = False,
     ) -> Iterator[ESResponse]:
         """
         Paginate through the ES results, ignoring individual errors.
@@ -367,6 +515,7 @@ class ESMixin(Generic[T]):
             sort_field: Field to sort by (default: "fullyQualifiedName").
                        Special field "_score" is supported for relevance sorting.
             sort_order: Sort order, either "asc" or "desc" (default: "desc")
+            deleted: Paginate over the deleted entities instead (default: False)
 
         Yields:
             ESResponse objects containing paginated results
@@ -387,6 +536,7 @@ class ESMixin(Generic[T]):
             include_fields=self._get_include_fields_query(include_fields),
             sort_field=sort_field,
             sort_order=sort_order,
+            deleted=str(deleted).lower(),
         )
         while True:
             query_string = query(
@@ -436,13 +586,48 @@ class ESMixin(Generic[T]):
         Yields:
             Full entity objects fetched from the OpenMetadata API
         """
-        for response in self._paginate_es_internal(
-            entity, query_filter, size, sort_order=sort_order, sort_field=sort_field
+        # The next pages are requested while the entities of this one are fetched
+        for response in prefetch(
+            self._paginate_es_internal(
+                entity, query_filter, size, sort_order=sort_order, sort_field=sort_field
+            ),
+            read_ahead=self.pagination_read_ahead,
         ):
             yield from self._yield_hits_from_api(
                 response=response, entity=entity, fields=fields
             )
 
+    def paginate_es_sources(
+        self,
+        entity: Type[T],
+        fields: List[str],
+        query_filter: Optional[str] = None,
+        size: int = 100,
+        deleted: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Paginate through Elasticsearch results and yield the indexed documents with
+        only the given fields, without fetching the entities from the API.
+
+        Args:
+            entity: The entity type to paginate
+            fields: Fields of the indexed documents to return
+            query_filter: Optional ES query filter in JSON format
+            size: Number of results per page (default: 100)
+            deleted: Paginate over the deleted entities instead (default: False)
+
+        Yields:
+            The `_source` of each hit
+        """
+        for response in prefetch(
+            self._paginate_es_internal(
+                entity, query_filter, size, include_fields=fields, deleted=deleted
+            ),
+            read_ahead=self.pagination_read_ahead,
+        ):
+            for hit in response.hits.hits:
+                yield hit.source
+
     def _get_es_response(self, query_string: str) -> Optional[ESResponse]:
         """Get the Elasticsearch response"""
         try:
@@ -31,6 +31,7 @@ from metadata.ingestion.lineage.parser import LINEAGE_PARSING_TIMEOUT
 from metadata.ingestion.models.patch_request import build_patch
 from metadata.ingestion.ometa.client import REST, APIError
 from metadata.ingestion.ometa.utils import get_entity_type, model_str, quote
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.logger import ometa_logger
 from metadata.utils.lru_cache import LRU_CACHE_SIZE, LRUCache
 
@@ -245,7 +246,7 @@ class OMetaLineageMixin(Generic[T]):
                     f"{self.get_suffix(AddLineageRequest)}/{original.edge.fromEntity.type}/"
                     f"{original.edge.fromEntity.id.root}/{original.edge.toEntity.type}"
                     f"/{original.edge.toEntity.id.root}",
-                    data=str(patch),
+                    data=get_json_codec().encode(patch.patch),
                 )
             return True
         except APIError as err:
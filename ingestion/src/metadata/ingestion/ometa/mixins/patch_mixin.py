@@ -53,6 +53,7 @@ from metadata.ingestion.ometa.mixins.patch_mixin_utils import (
 )
 from metadata.ingestion.ometa.utils import model_str
 from metadata.utils.deprecation import deprecated
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.logger import get_log_name, ometa_logger
 
 logger = ometa_logger()
@@ -182,7 +183,7 @@ class OMetaPatchMixin(OMetaPatchMixinBase):
 
             res = self.client.patch(
                 path=f"{self.get_suffix(entity)}/{model_str(source.id)}",
-                data=str(patch),
+                data=get_json_codec().encode(patch.patch),
             )
             return entity(**res)
 
@@ -59,6 +59,7 @@ from metadata.ingestion.models.custom_pydantic import BaseModel
 from metadata.ingestion.models.topology import get_entity_hierarchy_depth
 from metadata.ingestion.ometa.auth_provider import OpenMetadataAuthenticationProvider
 from metadata.ingestion.ometa.client import REST, APIError, ClientConfig
+from metadata.ingestion.ometa.entity_cache import EntityCache
 from metadata.ingestion.ometa.mixins.csv_mixin import CSVMixin
 from metadata.ingestion.ometa.mixins.custom_property_mixin import (
     OMetaCustomPropertyMixin,
@@ -90,15 +91,18 @@ from metadata.ingestion.ometa.mixins.topic_mixin import OMetaTopicMixin
 from metadata.ingestion.ometa.mixins.user_mixin import OMetaUserMixin
 from metadata.ingestion.ometa.mixins.version_mixin import OMetaVersionMixin
 from metadata.ingestion.ometa.models import EntityList
+from metadata.ingestion.ometa.rate_limiter import RateLimit, RateLimiter
 from metadata.ingestion.ometa.routes import ROUTES
 from metadata.ingestion.ometa.sse_client import SSEClient
 from metadata.ingestion.ometa.utils import (
     decode_jwt_token,
+    dump_bulk_payload,
     get_entity_type,
     model_str,
     quote,
 )
 from metadata.utils.logger import ometa_logger
+from metadata.utils.prefetch import prefetch, prefetch_parallel
 from metadata.utils.secrets.secrets_manager_factory import SecretsManagerFactory
 from metadata.utils.ssl_registry import get_verify_ssl_fn
 
@@ -108,6 +112,12 @@ logger = ometa_logger()
 T = TypeVar("T", bound=BaseModel)
 C = TypeVar("C", bound=BaseModel)
 
+# Pages fetched in the background while the current one is consumed
+DEFAULT_PAGINATION_READ_AHEAD = 1
+
+# Entities fetched at the same time when resolving a batch of FQNs
+DEFAULT_BATCH_READ_WORKERS = 8
+
 
 class MissingEntityTypeException(Exception):
     """
@@ -339,12 +349,40 @@ class OpenMetadata(
             **(additional_client_config_arguments or {}),
         )
 
-        self.client = REST(client_config)
+        self.client = self._get_client(client_config)
         self.sse_client = SSEClient(client_config)
         self._use_raw_data = raw_data
+        self.entity_cache: Optional[EntityCache] = None
+        self.pagination_read_ahead = DEFAULT_PAGINATION_READ_AHEAD
+        self.batch_read_workers = DEFAULT_BATCH_READ_WORKERS
         if self.config.enableVersionValidation:
             self.validate_versions()
 
+    def _get_client(self, client_config: ClientConfig) -> REST:
+        """REST client sending the requests of the mixins"""
+        return REST(client_config)
+
+    def enable_entity_cache(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Cache the entities fetched by name or id. The writes of this client
+        invalidate the entities they change.
+        """
+        self.entity_cache = EntityCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.client.add_write_listener(self.entity_cache.invalidate_write)
+
+    def enable_rate_limit(
+        self,
+        limit: Optional[RateLimit] = None,
+        endpoint_limits: Optional[Dict[str, RateLimit]] = None,
+    ) -> None:
+        """
+        Limit the requests per second and in flight of all the threads using
+        this client, overall and per class of endpoints - search, bulk or crud.
+        """
+        self.client.rate_limiter = RateLimiter(
+            limit=limit, endpoint_limits=endpoint_limits
+        )
+
     def log_user_name_from_jwt_token(self) -> None:
         """
         Log user name from JWT token.
@@ -546,6 +584,36 @@ class OpenMetadata(
             include=include,
         )
 
+    def get_by_names(
+        self,
+        entity: Type[T],
+        fqns: Iterable[Union[str, FullyQualifiedEntityName]],
+        fields: Optional[List[str]] = None,
+        include: Optional[str] = None,
+    ) -> Dict[str, Optional[T]]:
+        """
+        Return the entities of the FQNs keyed by FQN, with None for the ones
+        not found.
+
+        The API can't list entities by FQN, so we GET them by name with up to
+        `batch_read_workers` requests in flight, skipping the cached ones.
+        """
+        unique_fqns = list(dict.fromkeys(model_str(fqn) for fqn in fqns))
+        workers = max(1, min(self.batch_read_workers, len(unique_fqns)))
+        lookups = [
+            (
+                (fqn, self.get_by_name(entity, fqn, fields=fields, include=include))
+                for fqn in unique_fqns[idx::workers]
+            )
+            for idx in range(workers)
+        ]
+        found = dict(
+            prefetch_parallel(
+                lookups, read_ahead=1 if workers > 1 else 0, max_workers=workers
+            )
+        )
+        return {fqn: found.get(fqn) for fqn in unique_fqns}
+
     def get_by_id(
         self,
         entity: Type[T],
@@ -577,6 +645,13 @@ class OpenMetadata(
         :param path: URL suffix by FQN or ID
         :param fields: List of fields to return
         """
+        cache_key = None
+        if self.entity_cache is not None:
+            cache_key = EntityCache.key(self.get_suffix(entity), path, fields, include)
+            cached = self.entity_cache.get(cache_key)
+            if isinstance(cached, entity):
+                return cached
+
         fields_str = "?fields=" + ",".join(fields) if fields else ""
         include = f"&include={include}" if include else ""
         try:
@@ -587,7 +662,10 @@ class OpenMetadata(
                 raise EmptyPayloadException(
                     f"Got an empty response when trying to GET from {self.get_suffix(entity)}/{path}{fields_str}"
                 )
-            return entity(**resp)
+            instance = entity(**resp)
+            if cache_key is not None:
+                self.entity_cache.put(cache_key, instance)
+            return instance
         except APIError as err:
             # We can expect some GET calls to return us a None and manage it in following steps.
             # No need to pollute the logs in these cases.
@@ -627,8 +705,8 @@ class OpenMetadata(
         logger.debug("Cannot find the Entity %s", fqn)
         return None
 
-    # pylint: disable=too-many-locals, too-many-arguments
-    def list_entities(
+    # pylint: disable=too-many-arguments
+    def _list_entities_response(
         self,
         entity: Type[T],
         fields: Optional[List[str]] = None,
@@ -636,24 +714,45 @@ class OpenMetadata(
         before: Optional[str] = None,
         limit: int = 100,
         params: Optional[Dict[str, str]] = None,
-        skip_on_failure: bool = False,
         include: Optional[str] = None,
-    ) -> EntityList[T]:
-        """
-        Helps us paginate over the collection
-        """
-
+    ) -> Dict[str, Any]:
+        """Page of the collection, as returned by the API"""
         suffix = self.get_suffix(entity)
         url_limit = f"?limit={limit}"
         url_after = f"&after={after}" if after else ""
         url_before = f"&before={before}" if before else ""
         url_fields = f"&fields={','.join(fields)}" if fields else ""
         url_include = f"&include={include}" if include else ""
-        resp = self.client.get(
+        return self.client.get(
             path=f"{suffix}{url_limit}{url_after}{url_before}{url_fields}{url_include}",
             data=params,
         )
 
+    # pylint: disable=too-many-locals, too-many-arguments
+    def list_entities(
+        self,
+        entity: Type[T],
+        fields: Optional[List[str]] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: int = 100,
+        params: Optional[Dict[str, str]] = None,
+        skip_on_failure: bool = False,
+        include: Optional[str] = None,
+    ) -> EntityList[T]:
+        """
+        Helps us paginate over the collection
+        """
+        resp = self._list_entities_response(
+            entity=entity,
+            fields=fields,
+            after=after,
+            before=before,
+            limit=limit,
+            params=params,
+            include=include,
+        )
+
         if self._use_raw_data:
             return resp
 
@@ -678,6 +777,48 @@ class OpenMetadata(
         before = resp["paging"]["before"] if "before" in resp["paging"] else None
         return EntityList(entities=entities, total=total, after=after, before=before)
 
+    def _list_entity_pages(
+        self,
+        entity: Type[T],
+        fields: Optional[List[str]] = None,
+        limit: int = 100,
+        params: Optional[Dict[str, str]] = None,
+        skip_on_failure: bool = False,
+        include: Optional[str] = None,
+        raw: bool = False,
+    ) -> Iterable[Union[List[T], List[Dict[str, Any]]]]:
+        """
+        Follow the `after` cursors of the collection, yielding the entities of
+        each page, or their responses if `raw`
+        """
+        after = None
+        while True:
+            if raw:
+                resp = self._list_entities_response(
+                    entity=entity,
+                    fields=fields,
+                    after=after,
+                    limit=limit,
+                    params=params,
+                    include=include,
+                )
+                yield resp["data"]
+                after = resp["paging"].get("after")
+            else:
+                entity_list = self.list_entities(
+                    entity=entity,
+                    fields=fields,
+                    limit=limit,
+                    params=params,
+                    after=after,
+                    skip_on_failure=skip_on_failure,
+                    include=include,
+                )
+                yield entity_list.entities
+                after = entity_list.after
+            if not after:
+                break
+
     def list_all_entities(
         self,
         entity: Type[T],
@@ -686,6 +827,7 @@ class OpenMetadata(
         params: Optional[Dict[str, str]] = None,
         skip_on_failure: bool = False,
         include: Optional[str] = None,
+        read_ahead: Optional[int] = None,
     ) -> Iterable[T]:
         """
         Utility method that paginates over all EntityLists
@@ -694,11 +836,11 @@ class OpenMetadata(
         :param fields: Extra fields to return
         :param limit: Number of entities in each pagination
         :param params: Extra parameters, e.g., {"service": "serviceName"} to filter
+        :param read_ahead: Pages to fetch in the background while the current one
+            is consumed. Defaults to `pagination_read_ahead`, 0 to fetch them on demand
         :return: Generator that will be yielding all Entities
         """
-
-        # First batch of Entities
-        entity_list = self.list_entities(
+        pages = self._list_entity_pages(
             entity=entity,
             fields=fields,
             limit=limit,
@@ -706,21 +848,78 @@ class OpenMetadata(
             skip_on_failure=skip_on_failure,
             include=include,
         )
-        yield from entity_list.entities
+        for entities in prefetch(
+            pages,
+            read_ahead=(
+                self.pagination_read_ahead if read_ahead is None else read_ahead
+            ),
+        ):
+            yield from entities
 
-        after = entity_list.after
-        while after:
-            entity_list = self.list_entities(
+    def list_all_entity_dicts(
+        self,
+        entity: Type[T],
+        fields: Optional[List[str]] = None,
+        limit: int = 100,
+        params: Optional[Dict[str, str]] = None,
+        include: Optional[str] = None,
+        read_ahead: Optional[int] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Paginate over the entities as list_all_entities does, yielding them as the
+        API returns them instead of building their models. Validating large
+        models is costly, and callers only reading a few fields, e.g.,
+        `fullyQualifiedName` and `sourceHash`, don't need them.
+        """
+        pages = self._list_entity_pages(
+            entity=entity,
+            fields=fields,
+            limit=limit,
+            params=params,
+            include=include,
+            raw=True,
+        )
+        for entities in prefetch(
+            pages,
+            read_ahead=(
+                self.pagination_read_ahead if read_ahead is None else read_ahead
+            ),
+        ):
+            yield from entities
+
+    def list_all_entities_by_partition(
+        self,
+        entity: Type[T],
+        partitions: List[Dict[str, str]],
+        fields: Optional[List[str]] = None,
+        limit: int = 100,
+        skip_on_failure: bool = False,
+        include: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> Iterable[T]:
+        """
+        Paginate over the entities of each partition, e.g., the params
+        `{"database": fqn}` of each database of a service, fetching up to
+        `max_workers` partitions in parallel.
+        The entities are yielded as they come, only sorted within each partition.
+        With `pagination_read_ahead` set to 0, partitions are fetched one by one.
+        :param partitions: Extra parameters of each partition
+        """
+        pages = [
+            self._list_entity_pages(
                 entity=entity,
                 fields=fields,
                 limit=limit,
                 params=params,
-                after=after,
                 skip_on_failure=skip_on_failure,
                 include=include,
             )
-            yield from entity_list.entities
-            after = entity_list.after
+            for params in partitions
+        ]
+        for entities in prefetch_parallel(
+            pages, read_ahead=self.pagination_read_ahead, max_workers=max_workers
+        ):
+            yield from entities
 
     def list_versions(
         self, entity_id: Union[str, basic.Uuid], entity: Type[T]
@@ -859,29 +1058,33 @@ class OpenMetadata(
         return sorted_grouped
 
     def _execute_bulk_operation(
-        self, entities: List[Type[T]], use_async: bool = False
+        self,
+        entities: List[Type[T]],
+        use_async: bool = False,
+        payloads: Optional[List[bytes]] = None,
     ) -> BulkOperationResult:
         """Execute a bulk operation for a list of entities.
 
         Args:
             entities (List[Type[T]]): List of entities to execute the bulk operation for
             use_async (bool, optional): Use backend async processing (default: False)
+            payloads (List[bytes], optional): The entities already dumped with
+                `dump_bulk_payload`, to avoid dumping them again
 
         Returns:
             BulkOperationResult: Result containing success/failure details
         """
         type_ = type(entities[0])
-        data: list[str] = [
-            entity.model_dump(mode="json", exclude_unset=True, exclude_none=True)
-            for entity in entities
-        ]
+        if payloads is None:
+            payloads = [dump_bulk_payload(entity) for entity in entities]
         url = f"{self.get_suffix(type_)}/bulk"
         url += f"?async={str(use_async).lower()}"
         try:
-            resp = self.client.put(url, json=data)
+            resp = self.client.put(url, data=b"[" + b",".join(payloads) + b"]")
         except Exception as exc:
             logger.debug("Failed to execute bulk operation for %s: %s", type_, exc)
             logger.debug(traceback.format_exc())
+            status = getattr(exc, "status_code", None)
             return BulkOperationResult(
                 numberOfRowsProcessed=0,
                 numberOfRowsFailed=len(entities),
@@ -890,20 +1093,26 @@ class OpenMetadata(
                     Response(
                         request=None,
                         message=str(exc),
-                        status=500,
+                        # Tell the payloads the server rejected from its failures
+                        status=status if isinstance(status, int) else 500,
                     )
                 ],
             )
         return BulkOperationResult(**resp)
 
     def bulk_create_or_update(
-        self, entities: List[Type[T]], use_async: bool = False
+        self,
+        entities: List[Type[T]],
+        use_async: bool = False,
+        payloads: Optional[List[bytes]] = None,
     ) -> BulkOperationResult:
         """Bulk create or update (PUT) multiple entities in a single API call.
 
         Args:
             entities (List[Type[T]]): List of entities to create or update
             async (bool, optional): Use backend async processing (default: False)
+            payloads (List[bytes], optional): The entities already dumped with
+                `dump_bulk_payload`, in the same order
 
         Returns:
             BulkOperationResult: Result containing success/failure details
@@ -919,17 +1128,28 @@ class OpenMetadata(
 
         type_idx = OrderedDict.fromkeys(map(type, entities))
         if len(type_idx) > 1:
+            payload_by_entity = (
+                dict(zip(map(id, entities), payloads)) if payloads else None
+            )
             grouped = self._group_entities_by_type(entities)
             for _, entities in grouped.items():
                 try:
                     bulk_ops_results.append(
-                        self._execute_bulk_operation(entities, use_async)
+                        self._execute_bulk_operation(
+                            entities,
+                            use_async,
+                            [payload_by_entity[id(entity)] for entity in entities]
+                            if payload_by_entity
+                            else None,
+                        )
                     )
                 except Exception as exc:
                     logger.debug("Failed to execute bulk operation: %s", exc)
                     logger.debug(traceback.format_exc())
         else:
-            bulk_ops_results.append(self._execute_bulk_operation(entities, use_async))
+            bulk_ops_results.append(
+                self._execute_bulk_operation(entities, use_async, payloads)
+            )
 
         failed_rows = sum(result.numberOfRowsFailed.root for result in bulk_ops_results)
         return BulkOperationResult(
@@ -0,0 +1,226 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Client side rate limiting of the requests sent to the server.
+
+All the threads of a client share its limiter. Each limit caps the requests
+per second with a token bucket, and the requests in flight at the same time
+with a semaphore. Besides the limit of all the requests, the search, bulk and
+CRUD endpoints can have their own.
+"""
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, NamedTuple, Optional
+
+SEARCH_ENDPOINTS = "search"
+BULK_ENDPOINTS = "bulk"
+CRUD_ENDPOINTS = "crud"
+
+# Coroutines waiting for a slot in flight check it again after this many seconds
+ASYNC_POLL_SECONDS = 0.01
+
+
+def get_endpoint_class(path: str) -> str:
+    """
+    Class of endpoints of the request path, e.g., `/search/query?...` -> `search`,
+    `/tables/bulk` -> `bulk`, and `crud` for the rest
+    """
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    if segments[0] == SEARCH_ENDPOINTS:
+        return SEARCH_ENDPOINTS
+    if BULK_ENDPOINTS in segments:
+        return BULK_ENDPOINTS
+    return CRUD_ENDPOINTS
+
+
+class RateLimit(NamedTuple):
+    """Requests per second, with bursts up to `burst` requests, and requests in flight"""
+
+    requests_per_second: Optional[float] = None
+    burst: Optional[int] = None
+    max_in_flight: Optional[int] = None
+
+
+class RateLimiterStats(NamedTuple):
+    """Requests sent through the limiter, and how long they waited for it"""
+
+    requests: int
+    delayed: int
+    wait_seconds: float
+
+
+class TokenBucket:
+    """
+    Refill `rate` tokens per second, up to `capacity`. Each request takes a
+    token, waiting for it if the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.rate = rate
+        self.capacity = max(1, capacity or int(rate) or 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token, and return the seconds to wait before using it. Reserving
+        tokens ahead keeps the waiting threads in order instead of racing for
+        the next token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class _Limit:
+    """Token bucket and semaphore of a rate limit, when they are set"""
+
+    def __init__(self, limit: RateLimit):
+        self.bucket = (
+            TokenBucket(limit.requests_per_second, limit.burst)
+            if limit.requests_per_second
+            else None
+        )
+        self.in_flight = (
+            threading.BoundedSemaphore(limit.max_in_flight)
+            if limit.max_in_flight
+            else None
+        )
+
+
+class RateLimiter:
+    """
+    Limit all the requests with `limit`, and the ones of each class of
+    endpoints with `endpoint_limits`. Without limits, requests go straight
+    through.
+
+    Waiting in `limit` blocks the calling thread. Coroutines wait in
+    `limit_async` instead.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[RateLimit] = None,
+        endpoint_limits: Optional[Dict[str, RateLimit]] = None,
+    ):
+        self._limit = _Limit(limit) if limit else None
+        self._endpoint_limits = {
+            endpoint_class: _Limit(endpoint_limit)
+            for endpoint_class, endpoint_limit in (endpoint_limits or {}).items()
+            if endpoint_limit
+        }
+        self._lock = threading.Lock()
+        self._requests = self._delayed = 0
+        self._wait_seconds = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._limit is not None or bool(self._endpoint_limits)
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(
+                requests=self._requests,
+                delayed=self._delayed,
+                wait_seconds=self._wait_seconds,
+            )
+
+    def _limits(self, path: str) -> List[_Limit]:
+        """
+        Take the slot of the endpoint class first, so that requests waiting
+        for a busy class don't keep the global slots from the others
+        """
+        return [
+            limit
+            for limit in (
+                self._endpoint_limits.get(get_endpoint_class(path)),
+                self._limit,
+            )
+            if limit is not None
+        ]
+
+    @staticmethod
+    def _reserve(limits: List[_Limit]) -> float:
+        """Seconds to wait for the tokens of all the limits"""
+        return max(
+            (limit.bucket.reserve() for limit in limits if limit.bucket), default=0.0
+        )
+
+    def _record(self, wait: float, start: float) -> None:
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._requests += 1
+            if wait > 0 or waited > 0.001:
+                self._delayed += 1
+                self._wait_seconds += waited
+
+    @contextmanager
+    def limit(self, path: str) -> Iterator[None]:
+        """Hold a slot for the request to the path while it is in flight"""
+        if not self.enabled:
+            yield
+            return
+
+        limits = self._limits(path)
+        start = time.perf_counter()
+        wait = self._reserve(limits)
+        if wait > 0:
+            time.sleep(wait)
+
+        acquired = []
+        try:
+            for limit in limits:
+                if limit.in_flight:
+                    limit.in_flight.acquire()
+                    acquired.append(limit.in_flight)
+            self._record(wait, start)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    @asynccontextmanager
+    async def limit_async(self, path: str) -> AsyncIterator[None]:
+        """
+        Same as `limit`, awaiting instead of blocking the thread, so that the
+        other coroutines keep running while the request waits
+        """
+        if not self.enabled:
+            yield
+            return
+
+        limits = self._limits(path)
+        start = time.perf_counter()
+        wait = self._reserve(limits)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        acquired = []
+        try:
+            for limit in limits:
+                if limit.in_flight:
+                    # The semaphores are shared with the threads, so we poll them
+                    while not limit.in_flight.acquire(blocking=False):
+                        await asyncio.sleep(ASYNC_POLL_SECONDS)
+                    acquired.append(limit.in_flight)
+            self._record(wait, start)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
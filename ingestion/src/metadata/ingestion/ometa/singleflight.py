@@ -0,0 +1,94 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Coalesce the identical calls running at the same time in different threads.
+
+The first thread asking for a key runs the call, and the ones asking for the same
+key before it finishes wait for its result - or its exception - instead of running
+their own.
+"""
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """Call in flight, and the result its waiters get"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run a single call per key at a time, sharing its result with the threads
+    asking for the same key meanwhile.
+
+    Waiting relies on threads: callers switching in the same thread, e.g.,
+    greenlets, should disable it, as the waiter would block the caller.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """Number of calls served by the call of another thread"""
+        return self._shared
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Result of `fn`, run by this thread or by another one asking for the same
+        key, and whether it was shared
+        """
+        if not self.enabled:
+            return fn(), False
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def forget(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Let the next callers of the keys start a new call instead of joining the
+        one in flight, e.g., after a write changed what it would return
+        """
+        with self._lock:
+            for key in [key for key in self._calls if predicate(key)]:
+                del self._calls[key]
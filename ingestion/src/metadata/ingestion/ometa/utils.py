@@ -24,6 +24,7 @@ from requests.utils import quote as url_quote
 from metadata.generated.schema.type.basic import FullyQualifiedEntityName
 from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.utils.constants import ENTITY_REFERENCE_TYPE_MAP
+from metadata.utils.json_codec import get_json_codec
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -74,6 +75,13 @@ def model_str(arg: Any) -> str:
     return str(arg)
 
 
+def dump_bulk_payload(entity: BaseModel) -> bytes:
+    """JSON of the entity as sent to the bulk endpoints"""
+    return get_json_codec().encode(
+        entity.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+    )
+
+
 def quote(fqn: Union[FullyQualifiedEntityName, str]) -> str:
     """
     Quote the FQN so that it's safe to pass to the API.
@@ -0,0 +1,66 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Size of the batches sent to the bulk endpoints.
+
+The time a bulk request takes grows with its entities, and a batch of large
+entities, e.g., tables with thousands of columns, can time out where the same
+number of small ones is fast. The batch size follows the latency of the bulk
+requests to keep them around a target.
+"""
+import threading
+
+
+class AdaptiveBatchSize:
+    """
+    Number of entities of the next batches, between `min_size` and `max_size`.
+
+    The size grows by a tenth after each full batch answered in less than half
+    of `target_latency` seconds, shrinks in proportion to the batches answered
+    slower than it, and halves when a batch fails. A `target_latency` of 0
+    keeps it fixed.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_size: int,
+        target_latency: float,
+        min_size: int = 1,
+    ):
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size, size)
+        self.target_latency = target_latency
+        self._size = min(max(self.min_size, size), self.max_size)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record_latency(self, entities: int, seconds: float) -> None:
+        """Adjust the size after a batch of `entities` took `seconds` to flush"""
+        if self.target_latency <= 0 or entities <= 0:
+            return
+        with self._lock:
+            if seconds > self.target_latency:
+                # Assuming the latency is linear with the entities, aim at the target
+                scaled = int(entities * self.target_latency / seconds)
+                self._size = max(self.min_size, min(self._size, scaled))
+            elif entities >= self._size and seconds < self.target_latency / 2:
+                self._size = min(self.max_size, self._size + max(1, self._size // 10))
+
+    def record_failure(self) -> None:
+        """Halve the size after a batch failed, e.g., it timed out"""
+        if self.target_latency <= 0:
+            return
+        with self._lock:
+            self._size = max(self.min_size, self._size // 2)
@@ -13,9 +13,25 @@ This is the main used sink for all OM Workflows.
 It picks up the generated Entities and send them
 to the OM API.
 """
+import threading
+import time
 import traceback
-from functools import singledispatchmethod
-from typing import Any, Dict, Optional, TypeVar, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial, singledispatchmethod
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
 from requests.exceptions import HTTPError
@@ -71,7 +87,11 @@ from metadata.generated.schema.tests.testCaseResolutionStatus import (
     TestCaseResolutionStatus,
 )
 from metadata.generated.schema.tests.testSuite import TestSuite
-from metadata.generated.schema.type import basic
+from metadata.generated.schema.type.bulkOperationResult import (
+    BulkOperationResult,
+    Response,
+)
+from metadata.generated.schema.type.entityLineage import ColumnLineage
 from metadata.generated.schema.type.entityLineage import Source as LineageSource
 from metadata.generated.schema.type.schema import Topic
 from metadata.ingestion.api.models import Either, Entity, StackTraceError
@@ -106,6 +126,8 @@ from metadata.ingestion.models.tests_data import (
 from metadata.ingestion.models.user import OMetaUserProfile
 from metadata.ingestion.ometa.client import APIError, LimitsException
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.utils import dump_bulk_payload, model_str
+from metadata.ingestion.sink.adaptive_batch import AdaptiveBatchSize
 from metadata.ingestion.source.dashboard.dashboard_service import DashboardUsage
 from metadata.ingestion.source.database.database_service import DataModelLink
 from metadata.ingestion.source.pipeline.pipeline_service import (
@@ -114,7 +136,10 @@ from metadata.ingestion.source.pipeline.pipeline_service import (
 )
 from metadata.profiler.api.models import ProfilerResponse
 from metadata.sampler.models import SamplerResponse
-from metadata.utils.execution_time_tracker import calculate_execution_time
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeTrackerContextMap,
+    calculate_execution_time,
+)
 from metadata.utils.logger import get_log_name, ingestion_logger
 
 logger = ingestion_logger()
@@ -123,11 +148,43 @@ logger = ingestion_logger()
 T = TypeVar("T", bound=BaseModel)
 
 
+@dataclass
+class BufferedLineage:
+    """
+    Lineage edge waiting in the sink buffer, merged from `count` requests, with
+    the `lineageProcessed` flags to patch once it is added
+    """
+
+    request: AddLineageRequest
+    count: int = 1
+    processed: Dict[str, Type[BaseModel]] = field(default_factory=dict)
+    added: bool = False
+
+
 class MetadataRestSinkConfig(ConfigModel):
     api_endpoint: Optional[str] = None
     bulk_sink_batch_size: int = 100
+    # The batch size adapts to keep the bulk requests under the target latency,
+    # growing up to the max size. A target of 0 keeps bulk_sink_batch_size
+    bulk_sink_max_batch_size: int = 1000
+    bulk_sink_target_latency_seconds: float = 10.0
+    # Batches are flushed before their entities serialize to more bytes than this
+    bulk_sink_max_batch_bytes: int = 5 * 1024 * 1024
+    # The API has no bulk PATCH endpoint: with a batch size above 1, PatchRequests
+    # are buffered and sent with up to bulk_patch_workers requests in flight. Sources
+    # reading back an entity they patched during the run see it without the patch
+    bulk_patch_batch_size: int = 1
+    bulk_patch_workers: int = 8
+    # With a batch size above 1, lineage edges are buffered, the ones between the
+    # same entities merged into one, and sent with up to bulk_lineage_workers
+    # requests in flight. Their failures are reported once they are sent
+    bulk_lineage_batch_size: int = 1
+    bulk_lineage_workers: int = 8
     enable_async_pipeline: bool = True
     async_pipeline_workers: int = 2
+    # Full buffers handed to the flush workers and not flushed yet. Writers wait
+    # for one of them to finish beyond it, bounding the memory of the batches
+    async_pipeline_max_pending: int = 4
 
 
 class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
@@ -138,24 +195,48 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
 
     config: MetadataRestSinkConfig
 
-    # We want to catch any errors that might happen during the sink
-    # pylint: disable=broad-except
-
     def __init__(self, config: MetadataRestSinkConfig, metadata: OpenMetadata):
         super().__init__()
         self.config = config
         self.wrote_something = False
         self.charts_dict = {}
         self.metadata = metadata
+        # Written by the workers of the pipelined execution without the buffer
+        # lock, which is fine as long as they only set single keys
         self.role_entities = {}
         self.team_entities = {}
         self.limit_reached = set()
         self.buffer: list[BaseModel] = []
+        # The buffered entities dumped for the bulk API, sent as they are
+        self.buffer_payloads: list[bytes] = []
+        self.buffer_bytes = 0
+        self.batch_size = AdaptiveBatchSize(
+            size=self.config.bulk_sink_batch_size,
+            max_size=self.config.bulk_sink_max_batch_size,
+            target_latency=self.config.bulk_sink_target_latency_seconds,
+        )
+        # The sink can be run by multiple workers in the pipelined workflow execution
+        self.buffer_lock = threading.RLock()
+        # Only appended to by the workers, and read once they are done, on close
         self.deferred_lifecycle_records: list[OMetaLifeCycleData] = []
         self.deferred_lifecycle_processed = False
         # Track entity names in buffer for O(1) duplicate checking
         # Key: (entity_type, name), Value: True
         self.buffered_entity_names: Dict[tuple, bool] = {}
+        # Full buffers are flushed by background workers while the next one fills up
+        self._flush_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_flushes = threading.BoundedSemaphore(
+            max(1, self.config.async_pipeline_max_pending)
+        )
+        self._flush_futures: List[Future] = []
+        self._flushing_type: Optional[Type[BaseModel]] = None
+        # Without flush workers, the full buffers are sent in order by the
+        # worker flushing them, once it released the buffer lock
+        self._pending_sends: Deque[Callable[[], None]] = deque()
+        self._send_lock = threading.Lock()
+        self.patch_buffer: List[PatchRequest] = []
+        self.lineage_buffer: Dict[Tuple[str, str], BufferedLineage] = {}
+        self._request_executors: Dict[str, ThreadPoolExecutor] = {}
 
     @classmethod
     def create(
@@ -231,6 +312,13 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
         ):
             return self.write_create_single_request(entity_request)
 
+        with self.buffer_lock:
+            result = self._buffer_create_request(entity_request)
+        self._send_pending()
+        return result
+
+    def _buffer_create_request(self, entity_request) -> Either[Entity]:
+        """Add the request to the bulk buffer, caller must hold the buffer lock"""
         # Deduplicate entities by name to avoid duplicate FQN hash errors
         # These are CreateRequest types that may have duplicate names from source systems
         if isinstance(
@@ -248,9 +336,18 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
             # Track this entity for future duplicate checks (only for types that need deduplication)
             self._track_entity_in_buffer(entity_request)
 
-        self.buffer.append(entity_request)
+        payload = dump_bulk_payload(entity_request)
         try:
-            if len(self.buffer) >= self.config.bulk_sink_batch_size:
+            if (
+                self.buffer
+                and self.buffer_bytes + len(payload)
+                > self.config.bulk_sink_max_batch_bytes
+            ):
+                self._flush_buffer()
+            self.buffer.append(entity_request)
+            self.buffer_payloads.append(payload)
+            self.buffer_bytes += len(payload)
+            if len(self.buffer) >= self.batch_size.size:
                 return self._flush_buffer()
             return Either(right=None)
         except LimitsException as _:
@@ -322,6 +419,12 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
                 )
             )
 
+    @property
+    def _async_flush(self) -> bool:
+        return (
+            self.config.enable_async_pipeline and self.config.async_pipeline_workers > 0
+        )
+
     def _flush_buffer(self) -> Either[Entity]:
         """Flush buffered to the bulk API worker queue, caller must hold the buffer lock"""
         if not self.buffer:
@@ -334,53 +437,273 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
                 ),
             )
 
+        batch, payloads = self.buffer, self.buffer_payloads
+        # Clear buffer and tracking set
+        self.buffer = []
+        self.buffer_payloads = []
+        self.buffer_bytes = 0
+        self.buffered_entity_names.clear()
+
+        if self._async_flush:
+            self._submit_flush(
+                batch,
+                partial(self._send_batch, payloads=payloads),
+                self._get_concurrent_type(batch),
+            )
+        else:
+            self._pending_sends.append(partial(self._send_batch, batch, payloads))
+        return Either(right=None)
+
+    @staticmethod
+    def _get_concurrent_type(batch: List[BaseModel]) -> Optional[Type[BaseModel]]:
+        """
+        Type of the entities of the batch if it can be flushed together with the
+        other batches of that type. Batches mixing types can't, nor the types
+        with a `parent`, e.g., glossary terms, since they hold their own parents.
+        """
+        batch_types = {type(entity) for entity in batch}
+        if len(batch_types) != 1:
+            return None
+        batch_type = batch_types.pop()
+        return None if "parent" in batch_type.model_fields else batch_type
+
+    def _send_batch(
+        self, batch: List[BaseModel], payloads: List[bytes], split: bool = False
+    ) -> None:
+        """
+        Send a batch to the bulk API, adapting the size of the next ones to its
+        latency. When the whole request fails, e.g., it timed out or the server
+        rejected the payload, the halves of the batch are sent again down to the
+        single entities, so that only the bad ones are reported as failed.
+
+        Only the failures of the server, not the rejected payloads, shrink the
+        next batches, and only once per batch, not for each of its halves.
+        """
+        start = time.perf_counter()
+        error, overloaded = None, False
         try:
             result = self.metadata.bulk_create_or_update(
-                entities=self.buffer, use_async=False
+                entities=batch, use_async=False, payloads=payloads
             )
+            failure = next(
+                (err for err in result.failedRequest or [] if err.request is None),
+                None,
+            )
+            if failure is not None:
+                error = failure.message
+                overloaded = failure.status is None or failure.status >= 500
+        except LimitsException:
+            for entity in batch:
+                self.limit_reached.add(type(entity).__name__)
+            self.status.failed(
+                StackTraceError(
+                    name=type(batch[0]).__name__,
+                    error=f"Limit reached for {type(batch[0]).__name__}",
+                    stackTrace=None,
+                )
+            )
+            return
         except Exception as exc:
-            logger.error(f"Failed to flush entities to bulk API: {exc}")
             logger.debug(traceback.format_exc())
-            return Either(
-                left=StackTraceError(
-                    name="Entity Buffer",
-                    error=f"Failed to flush entities to bulk API: {exc}",
-                    stackTrace=traceback.format_exc(),
-                ),
-                right=None,
+            error = str(exc)
+            overloaded = not (
+                isinstance(exc, APIError)
+                and exc.status_code is not None
+                and exc.status_code < 500
             )
 
-        # Clear buffer and tracking set
-        self.buffer = []
-        self.buffered_entity_names.clear()
+        if error is None:
+            self.batch_size.record_latency(len(batch), time.perf_counter() - start)
+            self._record_bulk_result(result)
+            return
 
-        if result and result.status == basic.Status.success:
-            self.status.scanned_all(result.successRequest)
-            return Either(right=result, left=None)
+        if overloaded and not split:
+            self.batch_size.record_failure()
+        if len(batch) > 1:
+            logger.debug(
+                f"Failed to flush {len(batch)} entities to bulk API, splitting the batch: {error}"
+            )
+            middle = len(batch) // 2
+            self._send_batch(batch[:middle], payloads[:middle], split=True)
+            self._send_batch(batch[middle:], payloads[middle:], split=True)
+            return
 
-        self.status.scanned_all(result.successRequest)
-        for err in result.failedRequest:
+        self.status.failed(
+            StackTraceError(
+                name=get_log_name(batch[0]),
+                error=f"Failed to flush entities to bulk API: {error}",
+                stackTrace=None,
+            )
+        )
+
+    def _record_bulk_result(self, result: BulkOperationResult) -> None:
+        """Add the flushed entities and the failed requests to the status"""
+        self.status.scanned_all(result.successRequest or [])
+        for err in result.failedRequest or []:
             self.status.failed(
                 StackTraceError(
-                    name="Entity Buffer",
-                    error=f"Failed to flush entities to bulk API: {err}",
+                    name=self._get_bulk_request_name(err),
+                    error=f"Failed to flush entities to bulk API: {err.message}",
                     stackTrace=None,
                 )
             )
-        return Either(
-            right=None,
-            left=StackTraceError(
-                name="Entity Buffer",
-                error=f"Failed to flush entities to bulk API: {result.failedRequest}",
-                stackTrace=None,
-            ),
+
+    @staticmethod
+    def _get_bulk_request_name(response: Response) -> str:
+        """The server answers the FQN or the payload of each request"""
+        request = response.request
+        if isinstance(request, dict):
+            request = request.get("fullyQualifiedName") or request.get("name")
+        return str(request) if request else "Entity Buffer"
+
+    def _submit_flush(
+        self,
+        batch: List[Any],
+        send: Callable[[List[Any]], None],
+        batch_type: Optional[type] = None,
+    ) -> None:
+        """
+        Hand a full buffer to the flush workers, which `send` it, caller must
+        hold the buffer lock.
+
+        Batches of the same `batch_type` are flushed concurrently. Any other
+        batch may hold the parents of the next ones, e.g., the schemas of the
+        next tables, so it waits for the batches before it, and the ones after it
+        wait for it. So do the batches without type, e.g., the patches or the
+        lineage edges, since those of an entity can span several batches.
+        """
+        if self._flush_executor is None:
+            self._flush_executor = ThreadPoolExecutor(
+                max_workers=self.config.async_pipeline_workers,
+                thread_name_prefix="SinkFlush",
+            )
+
+        if batch_type is None or batch_type is not self._flushing_type:
+            self._wait_for_flushes()
+        self._flushing_type = batch_type
+
+        self._flush_futures = [
+            future for future in self._flush_futures if not future.done()
+        ]
+        # Released by the worker once the flush is done, so it can't be a with
+        # block, and pylint still asks for one
+        self._pending_flushes.acquire()  # pylint: disable=consider-using-with
+        future = self._flush_executor.submit(
+            self._run_in_worker, send, batch, threading.get_ident()
         )
+        future.add_done_callback(lambda _: self._pending_flushes.release())
+        self._flush_futures.append(future)
+
+    @staticmethod
+    def _run_in_worker(
+        func: Callable[[Any], None], item: Any, parent_thread_id: int
+    ) -> None:
+        """Call `func` from a worker thread, tracking its time with its parent's"""
+        ExecutionTimeTrackerContextMap().copy_from_parent(parent_thread_id)
+        func(item)
+
+    def _map_concurrently(
+        self, name: str, max_workers: int, func: Callable[[Any], None], items: List
+    ) -> None:
+        """
+        Call `func` on the items with up to `max_workers` of them in flight, and
+        wait for all of them. The workers of each `name` are kept until closing.
+        """
+        executor = self._request_executors.get(name)
+        if executor is None:
+            executor = self._request_executors[name] = ThreadPoolExecutor(
+                max_workers=max(1, max_workers), thread_name_prefix=f"Sink{name}"
+            )
+        parent_thread_id = threading.get_ident()
+        futures = [
+            executor.submit(self._run_in_worker, func, item, parent_thread_id)
+            for item in items
+        ]
+        for future in futures:
+            future.result()
+
+    def _wait_for_flushes(self) -> None:
+        """Block until the batches handed to the flush workers are flushed"""
+        for future in self._flush_futures:
+            future.result()
+        self._flush_futures = []
+
+    def _send_pending(self) -> None:
+        """
+        Send the batches flushed without the flush workers, in the order they were
+        flushed. The caller must not hold the buffer lock, so that the other
+        workers keep buffering their records while we wait for the API.
+        """
+        with self._send_lock:
+            while True:
+                with self.buffer_lock:
+                    if not self._pending_sends:
+                        return
+                    send = self._pending_sends.popleft()
+                send()
 
     @_run_dispatch.register
     def patch_entity(self, record: PatchRequest) -> Either[Entity]:
         """
         Patch the records
         """
+        if self.config.bulk_patch_batch_size > 1:
+            with self.buffer_lock:
+                self.patch_buffer.append(record)
+                if len(self.patch_buffer) >= self.config.bulk_patch_batch_size:
+                    self._flush_patch_buffer()
+            self._send_pending()
+            return Either(right=None)
+
+        return Either(right=self._patch(record))
+
+    def _flush_patch_buffer(self) -> None:
+        """Flush the buffered patches, caller must hold the buffer lock"""
+        batch = self.patch_buffer
+        self.patch_buffer = []
+        if self._async_flush:
+            self._submit_flush(batch, self._send_patches)
+        else:
+            self._pending_sends.append(partial(self._send_patches, batch))
+
+    def _send_patches(self, batch: List[PatchRequest]) -> None:
+        """
+        Send the patches with up to `bulk_patch_workers` requests in flight. The
+        patches of an entity are sent in order by the same worker, since each of
+        them is computed from the entity before the previous ones.
+        """
+        patches_by_entity: Dict[str, List[PatchRequest]] = {}
+        for record in batch:
+            patches_by_entity.setdefault(
+                model_str(record.original_entity.id), []
+            ).append(record)
+
+        self._map_concurrently(
+            "Patch",
+            self.config.bulk_patch_workers,
+            self._send_entity_patches,
+            list(patches_by_entity.values()),
+        )
+
+    def _send_entity_patches(self, patches: List[PatchRequest]) -> None:
+        """Send the patches of an entity from a patch worker"""
+        for record in patches:
+            try:
+                patched_entity = self._patch(record)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                self.status.failed(
+                    StackTraceError(
+                        name=get_log_name(record.original_entity),
+                        error=f"Failed to patch {get_log_name(record.original_entity)}: {exc}",
+                        stackTrace=traceback.format_exc(),
+                    )
+                )
+                continue
+            if patched_entity:
+                self.status.scanned(patched_entity)
+
+    def _patch(self, record: PatchRequest) -> Optional[PatchedEntity]:
         entity = self.metadata.patch(
             entity=type(record.original_entity),
             source=record.original_entity,
@@ -390,8 +713,7 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
             array_entity_fields=ARRAY_ENTITY_FIELDS,
             override_metadata=record.override_metadata,
         )
-        patched_entity = PatchedEntity(new_entity=entity) if entity else None
-        return Either(right=patched_entity)
+        return PatchedEntity(new_entity=entity) if entity else None
 
     @_run_dispatch.register
     def write_custom_properties(self, record: OMetaCustomProperties) -> Either[Dict]:
@@ -461,6 +783,14 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
 
     @_run_dispatch.register
     def write_lineage(self, add_lineage: AddLineageRequest) -> Either[Dict[str, Any]]:
+        if self.config.bulk_lineage_batch_size > 1:
+            with self.buffer_lock:
+                self._buffer_lineage(add_lineage)
+            self._send_pending()
+            return Either(right=None)
+        return self._add_lineage(add_lineage)
+
+    def _add_lineage(self, add_lineage: AddLineageRequest) -> Either[Dict[str, Any]]:
         created_lineage = self.metadata.add_lineage(add_lineage, check_patch=True)
         if created_lineage.get("error"):
             return Either(
@@ -471,6 +801,122 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
 
         return Either(right=created_lineage["entity"]["fullyQualifiedName"])
 
+    def _buffer_lineage(
+        self,
+        add_lineage: AddLineageRequest,
+        processed: Optional[Dict[str, Type[BaseModel]]] = None,
+    ) -> None:
+        """Add the edge to the lineage buffer, caller must hold the buffer lock"""
+        key = (
+            model_str(add_lineage.edge.fromEntity.id),
+            model_str(add_lineage.edge.toEntity.id),
+        )
+        buffered = self.lineage_buffer.get(key)
+        if buffered is not None and not (
+            buffered.request.edge.lineageDetails and add_lineage.edge.lineageDetails
+        ):
+            # Adding a request without details replaces the details of the edge,
+            # so the buffered one has to be added before this one
+            self._flush_lineage_buffer()
+            buffered = None
+
+        if buffered is None:
+            self.lineage_buffer[key] = BufferedLineage(
+                request=add_lineage, processed=dict(processed or {})
+            )
+        else:
+            buffered.request = self._merge_lineage(buffered.request, add_lineage)
+            buffered.count += 1
+            buffered.processed.update(processed or {})
+
+        if len(self.lineage_buffer) >= self.config.bulk_lineage_batch_size:
+            self._flush_lineage_buffer()
+
+    def _merge_lineage(
+        self, previous: AddLineageRequest, latest: AddLineageRequest
+    ) -> AddLineageRequest:
+        """
+        Merge two requests of an edge with details the way adding them one after
+        the other does: the details of the latest, with the column lineage of
+        both, and the pipeline of the previous one if the latest has none
+        """
+        merged = latest.model_copy(deep=True)
+        details = merged.edge.lineageDetails
+        columns = (
+            self.metadata._merge_column_lineage(  # pylint: disable=protected-access
+                [
+                    column.model_dump(exclude_none=True)
+                    for column in previous.edge.lineageDetails.columnsLineage or []
+                ],
+                [
+                    column.model_dump(exclude_none=True)
+                    for column in details.columnsLineage or []
+                ],
+            )
+        )
+        if columns:
+            details.columnsLineage = [ColumnLineage(**column) for column in columns]
+        if not details.pipeline:
+            details.pipeline = previous.edge.lineageDetails.pipeline
+        return merged
+
+    def _flush_lineage_buffer(self) -> None:
+        """Flush the buffered lineage edges, caller must hold the buffer lock"""
+        batch = list(self.lineage_buffer.values())
+        self.lineage_buffer = {}
+        if not batch:
+            return
+        if self._async_flush:
+            self._submit_flush(batch, self._send_lineage)
+        else:
+            self._pending_sends.append(partial(self._send_lineage, batch))
+
+    def _send_lineage(self, batch: List[BufferedLineage]) -> None:
+        """
+        Add the edges with up to `bulk_lineage_workers` requests in flight, then
+        flag the entities they were processed for
+        """
+        self._map_concurrently(
+            "Lineage",
+            self.config.bulk_lineage_workers,
+            self._send_buffered_lineage,
+            batch,
+        )
+        processed = {
+            fqn: entity
+            for buffered in batch
+            if buffered.added
+            for fqn, entity in buffered.processed.items()
+        }
+        for fqn, entity in processed.items():
+            try:
+                self.metadata.patch_lineage_processed_flag(entity=entity, fqn=fqn)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Failed to flag the lineage of {fqn} as processed: {exc}"
+                )
+
+    def _send_buffered_lineage(self, buffered: BufferedLineage) -> None:
+        """Add a buffered edge from a lineage worker"""
+        try:
+            lineage = self._add_lineage(buffered.request)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            lineage = Either(
+                left=StackTraceError(
+                    name="AddLineageRequestError",
+                    error=f"Failed to add lineage: {exc}",
+                    stackTrace=traceback.format_exc(),
+                )
+            )
+        if lineage.left is not None:
+            self.status.failed(lineage.left)
+            return
+        buffered.added = True
+        for _ in range(buffered.count):
+            self.status.scanned(lineage.right)
+
     @_run_dispatch.register
     def write_override_lineage(
         self, add_lineage: OMetaLineageRequest
@@ -489,6 +935,12 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
             and add_lineage.lineage_request.edge.lineageDetails
             and add_lineage.lineage_request.edge.lineageDetails.source
         ):
+            # The buffered edges were requested before the deletion
+            with self.buffer_lock:
+                self._flush_lineage_buffer()
+            self._send_pending()
+            with self.buffer_lock:
+                self._wait_for_flushes()
             if (
                 add_lineage.lineage_request.edge.lineageDetails.pipeline
                 and add_lineage.lineage_request.edge.lineageDetails.source
@@ -507,7 +959,19 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
                     entity_id=str(add_lineage.lineage_request.edge.toEntity.id.root),
                     source=add_lineage.lineage_request.edge.lineageDetails.source.value,
                 )
-        lineage_response = self._run_dispatch(add_lineage.lineage_request)
+        elif self.config.bulk_lineage_batch_size > 1:
+            with self.buffer_lock:
+                self._buffer_lineage(
+                    add_lineage.lineage_request,
+                    processed=(
+                        {add_lineage.entity_fqn: add_lineage.entity}
+                        if add_lineage.entity_fqn and add_lineage.entity
+                        else None
+                    ),
+                )
+            self._send_pending()
+            return Either(right=None)
+        lineage_response = self._add_lineage(add_lineage.lineage_request)
         if (
             lineage_response
             and lineage_response.right is not None
@@ -1054,14 +1518,41 @@ class MetadataRestSink(Sink):  # pylint: disable=too-many-public-methods
 
         self.deferred_lifecycle_processed = True
 
+    def flush(self) -> None:
+        """
+        Send the buffered entities, patches and lineage edges, and wait until
+        every batch handed to the flush workers is flushed
+        """
+        with self.buffer_lock:
+            if self.buffer:
+                logger.debug(f"Flushing {len(self.buffer)} buffered entities")
+                self._flush_buffer()
+            if self.patch_buffer:
+                logger.debug(f"Flushing {len(self.patch_buffer)} buffered patches")
+                self._flush_patch_buffer()
+            if self.lineage_buffer:
+                logger.debug(
+                    f"Flushing {len(self.lineage_buffer)} buffered lineage edges"
+                )
+                self._flush_lineage_buffer()
+        self._send_pending()
+        with self.buffer_lock:
+            self._wait_for_flushes()
+
     def close(self):
         """
         Flush any remaining buffered tables and stop worker threads
         """
-        # Flush all thread-local buffers
-        if self.buffer:
-            logger.info(f"Flushing {len(self.buffer)} remaining entities on close")
-            self._flush_buffer()
+        self.flush()
+        with self.buffer_lock:
+            for executor in (
+                self._flush_executor,
+                *self._request_executors.values(),
+            ):
+                if executor is not None:
+                    executor.shutdown(wait=True)
+            self._flush_executor = None
+            self._request_executors = {}
 
         # Process deferred lifecycle data now that all tables exist
         self._process_deferred_lifecycle_data()
@@ -13,7 +13,7 @@ Base class for ingesting dashboard services
 """
 import traceback
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, Field
 from typing_extensions import Annotated
@@ -312,28 +312,67 @@ class DashboardServiceSource(TopologyRunnerMixin, Source, ABC):
         Returns:
             Lineage request between Data Models and Dashboards
         """
+        yield from self._yield_datamodel_dashboard_lineage()
+
+    def _yield_datamodel_dashboard_lineage(
+        self,
+        skip_datamodel: Optional[Callable[[DashboardDataModel], bool]] = None,
+    ) -> Iterable[Either[AddLineageRequest]]:
+        """
+        Lineage between the Data Models of the context and its Dashboard. The Data
+        Models are fetched in a single request, and the ones matching
+        `skip_datamodel` are left out.
+        """
         if hasattr(self.context.get(), "dataModels") and self.context.get().dataModels:
+            datamodel_fqns = {}
             for datamodel in self.context.get().dataModels:
                 try:
-                    datamodel_fqn = fqn.build(
+                    datamodel_fqns[datamodel] = fqn.build(
                         metadata=self.metadata,
                         entity_type=DashboardDataModel,
                         service_name=self.context.get().dashboard_service,
                         data_model_name=datamodel,
                     )
-                    datamodel_entity = self.metadata.get_by_name(
-                        entity=DashboardDataModel, fqn=datamodel_fqn
+                except Exception as err:
+                    logger.debug(traceback.format_exc())
+                    logger.error(
+                        f"Error to yield dashboard lineage details for data model name [{str(datamodel)}]: {err}"
                     )
+            if not datamodel_fqns:
+                return
 
-                    dashboard_fqn = fqn.build(
-                        self.metadata,
-                        entity_type=Dashboard,
-                        service_name=self.context.get().dashboard_service,
-                        dashboard_name=self.context.get().dashboard,
-                    )
-                    dashboard_entity = self.metadata.get_by_name(
-                        entity=Dashboard, fqn=dashboard_fqn
-                    )
+            try:
+                datamodel_entities = self.metadata.get_by_names(
+                    entity=DashboardDataModel, fqns=datamodel_fqns.values()
+                )
+
+                dashboard_fqn = fqn.build(
+                    self.metadata,
+                    entity_type=Dashboard,
+                    service_name=self.context.get().dashboard_service,
+                    dashboard_name=self.context.get().dashboard,
+                )
+                dashboard_entity = self.metadata.get_by_name(
+                    entity=Dashboard, fqn=dashboard_fqn
+                )
+            except Exception as err:
+                logger.debug(traceback.format_exc())
+                logger.error(
+                    "Error to yield dashboard lineage details for data models"
+                    f" [{list(datamodel_fqns)}]: {err}"
+                )
+                return
+
+            for datamodel, datamodel_fqn in datamodel_fqns.items():
+                try:
+                    datamodel_entity = datamodel_entities.get(datamodel_fqn)
+                    if not datamodel_entity:
+                        logger.debug(
+                            f"Datamodel entity not found for lineage: {str(datamodel)}"
+                        )
+                        continue
+                    if skip_datamodel and skip_datamodel(datamodel_entity):
+                        continue
                     yield self._get_add_lineage_request(
                         to_entity=dashboard_entity, from_entity=datamodel_entity
                     )
@@ -425,47 +425,11 @@ class TableauSource(DashboardServiceSource):
         Returns:
             Lineage request between Data Models and Dashboards
         """
-        if hasattr(self.context.get(), "dataModels") and self.context.get().dataModels:
-            for datamodel in self.context.get().dataModels:
-                try:
-                    datamodel_fqn = fqn.build(
-                        metadata=self.metadata,
-                        entity_type=DashboardDataModel,
-                        service_name=self.context.get().dashboard_service,
-                        data_model_name=datamodel,
-                    )
-                    datamodel_entity = self.metadata.get_by_name(
-                        entity=DashboardDataModel, fqn=datamodel_fqn
-                    )
-                    if not datamodel_entity:
-                        logger.debug(
-                            f"Datamodel entity not found for lineage: {str(datamodel)}"
-                        )
-                        continue
-                    # TableauPublishedDatasource will be skipped here and their lineage will be processed later
-                    if (
-                        datamodel_entity.dataModelType
-                        == DataModelType.TableauPublishedDatasource
-                    ):
-                        continue
-
-                    dashboard_fqn = fqn.build(
-                        self.metadata,
-                        entity_type=Dashboard,
-                        service_name=self.context.get().dashboard_service,
-                        dashboard_name=self.context.get().dashboard,
-                    )
-                    dashboard_entity = self.metadata.get_by_name(
-                        entity=Dashboard, fqn=dashboard_fqn
-                    )
-                    yield self._get_add_lineage_request(
-                        to_entity=dashboard_entity, from_entity=datamodel_entity
-                    )
-                except Exception as err:
-                    logger.debug(traceback.format_exc())
-                    logger.error(
-                        f"Error to yield dashboard lineage details for data model name [{str(datamodel)}]: {err}"
-                    )
+        # TableauPublishedDatasource will be skipped here and their lineage will be processed later
+        yield from self._yield_datamodel_dashboard_lineage(
+            skip_datamodel=lambda datamodel_entity: datamodel_entity.dataModelType
+            == DataModelType.TableauPublishedDatasource
+        )
 
     def _get_table_datamodel_lineage(
         self,
@@ -14,7 +14,7 @@ Bigquery source module
 """
 import os
 import traceback
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from google import auth
 from google.cloud.datacatalog_v1 import PolicyTagManagerClient
@@ -1169,6 +1169,13 @@ class BigquerySource(LifeCycleQueryMixin, CommonDbSourceService, MultiDBSource):
                 )
             )
 
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """The tables dropped since the last run are marked as deleted by `mark_tables_as_deleted`"""
+        return {
+            **super().get_post_process_state(),
+            "deleted_tables": self.context.get_global().deleted_tables,
+        }
+
     def mark_tables_as_deleted(self):
         """
         Use the current inspector to mark tables as deleted
@@ -77,6 +77,7 @@ from metadata.utils.filters import filter_by_table
 from metadata.utils.helpers import retry_with_docker_host
 from metadata.utils.logger import ingestion_logger
 from metadata.utils.ssl_manager import SSLManager, check_ssl_and_init
+from metadata.utils.tracer import TracedProxy, Tracer
 
 logger = ingestion_logger()
 
@@ -767,7 +768,13 @@ class CommonDbSourceService(
         thread_id = self.context.get_current_thread_id()
 
         if not self._inspector_map.get(thread_id):
-            self._inspector_map[thread_id] = inspect(self.connection)
+            inspector = inspect(self.connection)
+            if Tracer().enabled:
+                # Trace the reflection calls, e.g., `get_columns`
+                inspector = TracedProxy(
+                    inspector, category="inspector", prefixes=("get_", "has_")
+                )
+            self._inspector_map[thread_id] = inspector
 
         return self._inspector_map[thread_id]
 
@@ -812,6 +819,13 @@ class CommonDbSourceService(
         By default the source url is not supported for
         """
 
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """The foreign keys to tables not found yet are processed by `yield_table_constraints`"""
+        return {
+            **super().get_post_process_state(),
+            "foreign_tables": self.context.get_global().foreign_tables,
+        }
+
     def yield_table_constraints(self) -> Iterable[Either[PatchedEntity]]:
         """
         Process remaining table constraints by patching the table
@@ -137,6 +137,7 @@ class DatabaseServiceTopology(ServiceTopology):
         ],
         children=["databaseSchema"],
         post_process=["mark_databases_as_deleted"],
+        checkpoint=True,
     )
     databaseSchema: Annotated[
         TopologyNode, Field(description="Database Schema Node")
@@ -166,6 +167,8 @@ class DatabaseServiceTopology(ServiceTopology):
             "mark_stored_procedures_as_deleted",
         ],
         threads=True,
+        shard=True,
+        checkpoint=True,
     )
     table: Annotated[
         TopologyNode, Field(description="Main table processing logic")
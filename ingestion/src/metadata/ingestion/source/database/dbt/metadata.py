@@ -135,6 +135,10 @@ class DbtSource(DbtServiceSource):
         self.omd_custom_properties = {}
         self.extracted_custom_properties = {}
         self.extracted_domains = {}
+        # Tables of the manifest found in ES, by FQN search string
+        self._table_entities: Dict[str, Optional[List[Table]]] = {}
+        # Prefetched tables, by the FQN _build_table_fqn returned for them
+        self._tables_by_fqn: Dict[str, Table] = {}
         self._load_omd_custom_properties()
 
     @classmethod
@@ -718,13 +722,90 @@ class DbtSource(DbtServiceSource):
                 DbtCommonEnum.RESULTS.value
             ] = freshness_test_result
 
+    def _prefetch_table_entities(self, manifest_entities: Dict[str, Any]) -> None:
+        """
+        Search the tables of the materialized nodes at once, instead of a search
+        per model and per upstream node
+        """
+        fqn_search_strings = set()
+        for key, manifest_node in manifest_entities.items():
+            try:
+                resource_type = getattr(
+                    manifest_node.resource_type, "value", manifest_node.resource_type
+                )
+                if (
+                    resource_type == DbtCommonEnum.EXPOSURE.value
+                    or resource_type in [item.value for item in SkipResourceTypeEnum]
+                    or check_ephemeral_node(manifest_node)
+                ):
+                    continue
+                fqn_search_strings.add(
+                    fqn.build_es_fqn_search_string(
+                        database_name=get_corrected_name(manifest_node.database),
+                        schema_name=get_corrected_name(manifest_node.schema_),
+                        service_name=self.config.serviceName,
+                        table_name=get_dbt_model_name(manifest_node),
+                    )
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.debug(f"Not prefetching the table of DBT node {key}: {exc}")
+
+        self._tables_by_fqn = {}
+        try:
+            self._table_entities = self.metadata.es_search_from_fqns(
+                entity_type=Table,
+                fqn_search_strings=fqn_search_strings,
+                fields="sourceHash",
+            )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(
+                f"Failed to prefetch the DBT tables from OpenMetadata: {exc}"
+            )
+            self._table_entities = {}
+
+    def _build_table_fqn(
+        self, database_name: Optional[str], schema_name: Optional[str], table_name: str
+    ) -> Optional[str]:
+        """Table FQN of a node, from the prefetched tables if we have it"""
+        fqn_search_string = fqn.build_es_fqn_search_string(
+            database_name=database_name,
+            schema_name=schema_name,
+            service_name=self.config.serviceName,
+            table_name=table_name,
+        )
+        table_entity = get_entity_from_es_result(
+            entity_list=self._table_entities.get(fqn_search_string)
+        )
+        if table_entity:
+            table_fqn = table_entity.fullyQualifiedName.root
+            # _get_table_entity looks the table up by the FQN we return
+            self._tables_by_fqn[table_fqn] = table_entity
+            return table_fqn
+        return fqn.build(
+            self.metadata,
+            entity_type=Table,
+            service_name=self.config.serviceName,
+            database_name=database_name,
+            schema_name=schema_name,
+            table_name=table_name,
+            # ES already told us it doesn't have it
+            skip_es_search=fqn_search_string in self._table_entities,
+        )
+
     def _get_table_entity(self, table_fqn) -> Optional[Table]:
         def search_table(fqn_search_string: str) -> Optional[Table]:
+            if fqn_search_string in self._tables_by_fqn:
+                return self._tables_by_fqn[fqn_search_string]
             table_entities = get_entity_from_es_result(
-                entity_list=self.metadata.es_search_from_fqn(
-                    entity_type=Table,
-                    fqn_search_string=fqn_search_string,
-                    fields="sourceHash",
+                entity_list=(
+                    self._table_entities[fqn_search_string]
+                    if fqn_search_string in self._table_entities
+                    else self.metadata.es_search_from_fqn(
+                        entity_type=Table,
+                        fqn_search_string=fqn_search_string,
+                        fields="sourceHash",
+                    )
                 ),
                 fetch_multiple_entities=True,
             )
@@ -821,6 +902,7 @@ class DbtSource(DbtServiceSource):
             dbt_project_name = getattr(
                 dbt_objects.dbt_manifest.metadata, "project_name", None
             )
+            self._prefetch_table_entities(manifest_entities)
             for key, manifest_node in manifest_entities.items():
                 try:
                     resource_type = getattr(
@@ -898,10 +980,7 @@ class DbtSource(DbtServiceSource):
                             or []
                         )
 
-                    table_fqn = fqn.build(
-                        self.metadata,
-                        entity_type=Table,
-                        service_name=self.config.serviceName,
+                    table_fqn = self._build_table_fqn(
                         database_name=get_corrected_name(manifest_node.database),
                         schema_name=get_corrected_name(manifest_node.schema_),
                         table_name=model_name,
@@ -998,10 +1077,7 @@ class DbtSource(DbtServiceSource):
                             self.parse_upstream_nodes(manifest_entities, parent_node)
                         )
                     else:
-                        parent_fqn = fqn.build(
-                            self.metadata,
-                            entity_type=Table,
-                            service_name=self.config.serviceName,
+                        parent_fqn = self._build_table_fqn(
                             database_name=get_corrected_name(parent_node.database),
                             schema_name=get_corrected_name(parent_node.schema_),
                             table_name=table_name,
@@ -14,7 +14,7 @@ External Table Lineage Mixin
 
 import traceback
 from abc import ABC
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
 from metadata.generated.schema.entity.data.container import ContainerDataModel
@@ -39,6 +39,13 @@ class ExternalTableLineageMixin(ABC):
     This mixin class is for deriving lineage between external table and container source/
     """
 
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """The locations of the external tables are processed by `yield_external_table_lineage`"""
+        return {
+            **super().get_post_process_state(),  # pylint: disable=no-member
+            "external_location_map": self.external_location_map,
+        }
+
     def yield_external_table_lineage(self) -> Iterable[AddLineageRequest]:
         """
         Yield external table lineage
@@ -13,7 +13,7 @@ Redshift source ingestion
 """
 import re
 import traceback
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy import sql
 from sqlalchemy.dialects.postgresql.base import PGDialect
@@ -442,6 +442,13 @@ class RedshiftSource(
                 )
             )
 
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """The tables dropped since the last run are marked as deleted by `mark_tables_as_deleted`"""
+        return {
+            **super().get_post_process_state(),
+            "deleted_tables": self.context.get_global().deleted_tables,
+        }
+
     def mark_tables_as_deleted(self):
         """
         Use the current inspector to mark tables as deleted
@@ -14,7 +14,7 @@ Snowflake source module
 import json
 import traceback
 from datetime import datetime
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import sqlalchemy.types as sqltypes
 import sqlparse
@@ -880,6 +880,13 @@ class SnowflakeSource(
                 )
             )
 
+    def get_post_process_state(self) -> Dict[str, Any]:
+        """The tables dropped since the last run are marked as deleted by `mark_tables_as_deleted`"""
+        return {
+            **super().get_post_process_state(),
+            "deleted_tables": self.context.get_global().deleted_tables,
+        }
+
     def mark_tables_as_deleted(self):
         """
         Use the current inspector to mark tables as deleted
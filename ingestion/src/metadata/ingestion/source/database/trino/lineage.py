@@ -140,38 +140,38 @@ class TrinoLineageSource(TrinoQueryParserSource, LineageSource):
             trino_databases = self.metadata.list_all_entities(
                 entity=Database, params={"service": self.config.serviceName}
             )
-            for trino_database in trino_databases:
-                trino_database_fqn = trino_database.fullyQualifiedName.root
-
-                # Get all tables for the specified Trino database schema
-                trino_tables = self.metadata.list_all_entities(
-                    entity=Table, params={"database": trino_database_fqn}
-                )
-                # NOTE: Currently, tables in system-defined schemas will also be checked for lineage.
-                for trino_table in trino_tables:
-                    trino_table_fqn = trino_table.fullyQualifiedName.root
-                    for cross_database_fqn in all_cross_database_fqns:
-                        # Construct the FQN for cross-database tables
-                        cross_database_table_fqn = trino_table_fqn.replace(
-                            trino_database_fqn, cross_database_fqn
-                        )
-                        # Cache cross-database table against its FQN to avoid repeated API calls
-                        cross_database_table = cross_database_table_fqn_mapping[
-                            cross_database_table_fqn
-                        ] = cross_database_table_fqn_mapping.get(
-                            cross_database_table_fqn,
-                            self.metadata.get_by_name(
-                                Table, fqn=cross_database_table_fqn
-                            ),
+            # Get all tables of the Trino databases, listing several databases at once
+            trino_tables = self.metadata.list_all_entities_by_partition(
+                entity=Table,
+                partitions=[
+                    {"database": trino_database.fullyQualifiedName.root}
+                    for trino_database in trino_databases
+                ],
+            )
+            # NOTE: Currently, tables in system-defined schemas will also be checked for lineage.
+            for trino_table in trino_tables:
+                trino_database_fqn = trino_table.database.fullyQualifiedName
+                trino_table_fqn = trino_table.fullyQualifiedName.root
+                for cross_database_fqn in all_cross_database_fqns:
+                    # Construct the FQN for cross-database tables
+                    cross_database_table_fqn = trino_table_fqn.replace(
+                        trino_database_fqn, cross_database_fqn
+                    )
+                    # Cache cross-database table against its FQN to avoid repeated API calls
+                    cross_database_table = cross_database_table_fqn_mapping[
+                        cross_database_table_fqn
+                    ] = cross_database_table_fqn_mapping.get(
+                        cross_database_table_fqn,
+                        self.metadata.get_by_name(Table, fqn=cross_database_table_fqn),
+                    )
+                    # Create cross database lineage request if both tables are same
+                    if cross_database_table and self.check_same_table(
+                        trino_table, cross_database_table
+                    ):
+                        yield self.get_cross_database_lineage(
+                            cross_database_table, trino_table
                         )
-                        # Create cross database lineage request if both tables are same
-                        if cross_database_table and self.check_same_table(
-                            trino_table, cross_database_table
-                        ):
-                            yield self.get_cross_database_lineage(
-                                cross_database_table, trino_table
-                            )
-                            break
+                        break
         except Exception as exc:
             yield Either(
                 left=StackTraceError(
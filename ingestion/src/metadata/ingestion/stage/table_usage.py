@@ -13,7 +13,6 @@ Given query data about tables, store the results
 in a temporary file (i.e., the stage)
 to be further processed by the BulkSink.
 """
-import json
 import os
 import shutil
 import traceback
@@ -33,6 +32,7 @@ from metadata.ingestion.api.steps import Stage
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils.constants import UTF_8
 from metadata.utils.helpers import get_query_hash, init_staging_dir
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.logger import ingestion_logger
 
 logger = ingestion_logger()
@@ -224,13 +224,12 @@ class TableUsageStage(Stage):
         for key, value in self.table_usage.items():
             if value:
                 value.sqlQueries = self.table_queries.get(key, [])
-                data = value.model_dump_json()
                 with open(
                     os.path.join(self.config.filename, f"{value.serviceName}_{key[1]}"),
                     "a+",
                     encoding=UTF_8,
                 ) as file:
-                    file.write(json.dumps(data))
+                    file.write(value.model_dump_json())
                     file.write("\n")
 
         for key, value in self.query_cost.items():
@@ -251,7 +250,7 @@ class TableUsageStage(Stage):
                     "a+",
                     encoding=UTF_8,
                 ) as file:
-                    file.write(json.dumps(data))
+                    file.write(get_json_codec().dumps(data))
                     file.write("\n")
 
     def close(self) -> None:
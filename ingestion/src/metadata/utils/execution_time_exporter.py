@@ -0,0 +1,145 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Export the ExecutionTimeTracker metrics - count, total and latency percentiles
+per context - as OpenMetrics text or JSON, to a file or a Prometheus Pushgateway.
+"""
+import json
+import os
+import traceback
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import quote
+
+import requests
+
+from metadata.generated.schema.metadataIngestion.workflow import (
+    LatencyMetrics,
+    LatencyMetricsFormat,
+)
+from metadata.timer.repeated_timer import RepeatedTimer
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeMetrics,
+    ExecutionTimeTrackerState,
+)
+from metadata.utils.logger import utils_logger
+
+logger = utils_logger()
+
+METRIC_NAME = "openmetadata_ingestion_execution_seconds"
+PUSHGATEWAY_JOB = "openmetadata_ingestion"
+EXPORTED_PERCENTILES = (50, 95, 99)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_openmetrics(metrics: Dict[str, ExecutionTimeMetrics]) -> str:
+    """Render the metrics as an OpenMetrics summary, labeled by context"""
+    lines = [
+        f"# TYPE {METRIC_NAME} summary",
+        f"# UNIT {METRIC_NAME} seconds",
+        f"# HELP {METRIC_NAME} Execution time of the workflow contexts.",
+    ]
+    for name in sorted(metrics):
+        context_metrics = metrics[name]
+        label = f'context="{_escape_label(name)}"'
+        for percentile in EXPORTED_PERCENTILES:
+            value = context_metrics.percentile(percentile)
+            if value is not None:
+                lines.append(
+                    f'{METRIC_NAME}{{{label},quantile="{percentile / 100}"}} {value}'
+                )
+        lines.append(f"{METRIC_NAME}_sum{{{label}}} {context_metrics.total_time}")
+        lines.append(f"{METRIC_NAME}_count{{{label}}} {context_metrics.call_count}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def to_json(metrics: Dict[str, ExecutionTimeMetrics]) -> str:
+    """Render the metrics as a JSON object keyed by context"""
+    return json.dumps(
+        {
+            name: {
+                "count": context_metrics.call_count,
+                "total": context_metrics.total_time,
+                "min": context_metrics.min_time,
+                "max": context_metrics.max_time,
+                **{
+                    f"p{percentile}": context_metrics.percentile(percentile)
+                    for percentile in EXPORTED_PERCENTILES
+                },
+            }
+            for name, context_metrics in sorted(metrics.items())
+        },
+        indent=2,
+    )
+
+
+class ExecutionTimeExporter:
+    """Periodically export a snapshot of the metrics of all the threads"""
+
+    def __init__(self, config: LatencyMetrics, grouping_key: str):
+        self.config = config
+        self.grouping_key = grouping_key
+        self._timer: Optional[RepeatedTimer] = None
+
+    def start(self) -> None:
+        self._timer = RepeatedTimer(self.config.intervalSeconds, self.export)
+        self._timer.trigger()
+
+    def stop(self) -> None:
+        """Stop the timer and export the final metrics, if it was started"""
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+            self.export()
+
+    def export(self) -> None:
+        """Write and push the current metrics. Errors are logged, never raised."""
+        metrics = ExecutionTimeTrackerState().snapshot()
+        try:
+            if self.config.path:
+                self._write(metrics)
+            if self.config.pushgatewayUrl:
+                self._push(metrics)
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error exporting the latency metrics: {exc}")
+
+    def _write(self, metrics: Dict[str, ExecutionTimeMetrics]) -> None:
+        """Replace the file atomically, so readers never see a partial snapshot"""
+        path = Path(self.config.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = (
+            to_json(metrics)
+            if self.config.format == LatencyMetricsFormat.json
+            else to_openmetrics(metrics)
+        )
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _push(self, metrics: Dict[str, ExecutionTimeMetrics]) -> None:
+        """PUT replaces the metrics of the grouping key in the Pushgateway"""
+        url = (
+            f"{self.config.pushgatewayUrl.rstrip('/')}/metrics/job/{PUSHGATEWAY_JOB}"
+            f"/pipeline/{quote(self.grouping_key, safe='')}"
+        )
+        response = requests.put(
+            url,
+            data=to_openmetrics(metrics).encode("utf-8"),
+            headers={"Content-Type": "text/plain; version=0.0.4"},
+            timeout=10,
+        )
+        response.raise_for_status()
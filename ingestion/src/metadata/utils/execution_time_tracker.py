@@ -13,13 +13,15 @@
 ExecutionTimeTracker implementation to help track the execution time of different parts
 of the code.
 """
+import math
 import threading
-from copy import deepcopy
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from time import perf_counter
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from metadata.utils.helpers import pretty_print_time_duration
 from metadata.utils.logger import utils_logger
@@ -27,6 +29,59 @@ from metadata.utils.singleton import Singleton
 
 logger = utils_logger()
 
+# Contexts are stacked per thread, so code interleaving within a thread, e.g., the
+# greenlets of the async client, suspends the tracking
+_suspended: ContextVar[bool] = ContextVar("execution_time_suspended", default=False)
+
+
+# Each power of 2 of microseconds is split in this many buckets, so that the
+# percentiles have a relative error below 1 / (2 * HISTOGRAM_SUB_BUCKETS)
+HISTOGRAM_SUB_BUCKETS = 16
+
+
+class LatencyHistogram(BaseModel):
+    """
+    Log-linear histogram of the elapsed times, HDR style: each power of 2 of
+    microseconds is split in linear sub buckets. Buckets are only created for
+    the values we see.
+    """
+
+    counts: Dict[int, int] = Field(default_factory=dict)
+
+    def record(self, elapsed: float) -> None:
+        """Add an elapsed time, in seconds"""
+        mantissa, exponent = math.frexp(max(elapsed * 1_000_000, 1.0))
+        index = (exponent - 1) * HISTOGRAM_SUB_BUCKETS + int(
+            (mantissa - 0.5) * 2 * HISTOGRAM_SUB_BUCKETS
+        )
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram"""
+        for index, count in list(other.counts.items()):
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        """Middle of the bucket, in seconds"""
+        exponent, sub_bucket = divmod(index, HISTOGRAM_SUB_BUCKETS)
+        bucket_width = 2**exponent / HISTOGRAM_SUB_BUCKETS
+        return (2**exponent + (sub_bucket + 0.5) * bucket_width) / 1_000_000
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Elapsed time, in seconds, below which `percentile` % of the values fall"""
+        total = sum(self.counts.values())
+        if not total:
+            return None
+
+        rank = max(math.ceil(total * percentile / 100), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return self._bucket_value(index)
+        return self._bucket_value(max(self.counts))
+
 
 class ExecutionTimeMetrics(BaseModel):
     """Execution time statistics."""
@@ -35,6 +90,7 @@ class ExecutionTimeMetrics(BaseModel):
     call_count: int = 0
     min_time: Optional[float] = None
     max_time: Optional[float] = None
+    histogram: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
     @property
     def average_time(self) -> float:
@@ -52,6 +108,32 @@ class ExecutionTimeMetrics(BaseModel):
         if self.max_time is None or elapsed > self.max_time:
             self.max_time = elapsed
 
+        self.histogram.record(elapsed)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Approximate percentile of the elapsed times, bounded by the min and max"""
+        value = self.histogram.percentile(percentile)
+        if value is None:
+            return None
+        return min(max(value, self.min_time), self.max_time)
+
+    def merge(self, other: "ExecutionTimeMetrics"):
+        """Add the measurements of another tracker."""
+        self.total_time += other.total_time
+        self.call_count += other.call_count
+
+        if other.min_time is not None and (
+            self.min_time is None or other.min_time < self.min_time
+        ):
+            self.min_time = other.min_time
+
+        if other.max_time is not None and (
+            self.max_time is None or other.max_time > self.max_time
+        ):
+            self.max_time = other.max_time
+
+        self.histogram.merge(other.histogram)
+
 
 class ExecutionTimeTrackerContext(BaseModel):
     """Small Model to hold the ExecutionTimeTracker context."""
@@ -69,10 +151,13 @@ class ExecutionTimeTrackerContextMap(metaclass=Singleton):
         self.map: dict[int, List[ExecutionTimeTrackerContext]] = {}
 
     def copy_from_parent(self, parent_thread_id: int, thread_id: Optional[int] = None):
-        """Copy the ExecutionTimeTrackerContext from Parent."""
+        """
+        Copy the ExecutionTimeTrackerContext from Parent. The contexts are never
+        modified once appended, so the threads can share them.
+        """
         thread_id = thread_id or threading.get_ident()
 
-        self.map[thread_id] = deepcopy(self.map.get(parent_thread_id, []))
+        self.map[thread_id] = list(self.map.get(parent_thread_id, []))
 
     def get_last_stored_context_level(
         self, thread_id: Optional[int] = None
@@ -102,23 +187,75 @@ class ExecutionTimeTrackerContextMap(metaclass=Singleton):
 
 
 class ExecutionTimeTrackerState(metaclass=Singleton):
-    """Tracks the ExecutionTime State across multiple threads."""
+    """
+    Tracks the ExecutionTime State across multiple threads.
+
+    Each thread records in its own metrics without locking. They are merged when
+    reading the state, and folded into `state` once the thread finishes.
+    """
 
     def __init__(self):
         """Initializes the state and the lock."""
         self.state: Dict[str, ExecutionTimeMetrics] = {}
         self.lock = threading.Lock()
+        self._local = threading.local()
+        self._thread_states: List[
+            Tuple[threading.Thread, Dict[str, ExecutionTimeMetrics]]
+        ] = []
+
+    def _get_thread_state(self) -> Dict[str, ExecutionTimeMetrics]:
+        """Metrics recorded by the current thread"""
+        thread_state = getattr(self._local, "state", None)
+        if thread_state is None:
+            thread_state = self._local.state = {}
+            with self.lock:
+                self._thread_states.append((threading.current_thread(), thread_state))
+        return thread_state
 
     def add(self, context: ExecutionTimeTrackerContext, elapsed: float):
         """Update metrics with elapsed time."""
+        thread_state = self._get_thread_state()
+        metrics = thread_state.get(context.name)
+        if metrics is None:
+            metrics = thread_state[context.name] = ExecutionTimeMetrics()
+        metrics.update(elapsed)
+
+    def merge(self, state: Dict[str, ExecutionTimeMetrics]):
+        """Merge the state of the tracker from another process."""
+        with self.lock:
+            for name, metrics in state.items():
+                self.state.setdefault(name, ExecutionTimeMetrics()).merge(metrics)
+
+    def snapshot(self) -> Dict[str, ExecutionTimeMetrics]:
+        """Metrics of all the threads, merged by context"""
+        with self.lock:
+            live_states = []
+            for thread, thread_state in self._thread_states:
+                if thread.is_alive():
+                    live_states.append((thread, thread_state))
+                else:
+                    for name, metrics in thread_state.items():
+                        self.state.setdefault(name, ExecutionTimeMetrics()).merge(
+                            metrics
+                        )
+            self._thread_states = live_states
+
+            snapshot: Dict[str, ExecutionTimeMetrics] = {}
+            for state in [self.state, *(state for _, state in live_states)]:
+                for name, metrics in list(state.items()):
+                    snapshot.setdefault(name, ExecutionTimeMetrics()).merge(metrics)
+        return snapshot
+
+    def reset(self) -> None:
+        """Remove all the metrics"""
         with self.lock:
-            if context.name not in self.state:
-                self.state[context.name] = ExecutionTimeMetrics()
-            self.state[context.name].update(elapsed)
+            self.state.clear()
+            for _, thread_state in self._thread_states:
+                thread_state.clear()
 
     def get_metrics(self, context_name: str) -> Optional[ExecutionTimeMetrics]:
         """Get metrics by name."""
-        return self.state.get(context_name)
+        return self.snapshot().get(context_name)
 
 
 class ExecutionTimeTrackerMeta(Singleton):
@@ -165,7 +302,7 @@ class ExecutionTimeTracker(metaclass=ExecutionTimeTrackerMeta):
             context: Keeps track of the context levels and their state.
             state: Keeps track of the global state for the Execution Time Tracker.
         """
-        self.enabled: bool = enabled
+        self._enabled: bool = enabled
 
         self.context_map = ExecutionTimeTrackerContextMap()
         self.state = ExecutionTimeTrackerState()
@@ -175,6 +312,23 @@ class ExecutionTimeTracker(metaclass=ExecutionTimeTrackerMeta):
         self._pending_context: Dict[int, str] = {}
         self._pending_store: Dict[int, bool] = {}
 
+    @property
+    def enabled(self) -> bool:
+        return self._enabled and not _suspended.get()
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Don't track the code run within, in the current thread or greenlet"""
+        token = _suspended.set(True)
+        try:
+            yield
+        finally:
+            _suspended.reset(token)
+
     def __call__(self, context: str, store: bool = True):
         """At every point we open a new Context Manager we can pass the current 'context' and
         if we want to 'store' it.
@@ -182,6 +336,9 @@ class ExecutionTimeTracker(metaclass=ExecutionTimeTrackerMeta):
         Uses thread-local storage for pending context to avoid race conditions
         in multi-threaded environments.
         """
+        if not self.enabled:
+            return self
+
         thread_id = threading.get_ident()
         new_context = ".".join(
             [
@@ -231,9 +388,24 @@ class ExecutionTimeTracker(metaclass=ExecutionTimeTrackerMeta):
             if context.stored:
                 self.state.add(context, elapsed)
 
+    def record(self, context: str, elapsed: float) -> None:
+        """
+        Store an elapsed time measured outside the context manager, e.g., in event
+        listeners, as a child of the current context.
+        """
+        if self.enabled:
+            name = ".".join(
+                part
+                for part in [self.context_map.get_last_stored_context_level(), context]
+                if part
+            )
+            self.state.add(
+                ExecutionTimeTrackerContext(name=name, start=0, stored=True), elapsed
+            )
+
     def get_summary(self) -> Dict[str, ExecutionTimeMetrics]:
         """Get all metrics."""
-        return dict(self.state.state)
+        return self.state.snapshot()
 
     def get_context_metrics(self, context_name: str) -> Optional[ExecutionTimeMetrics]:
         """Get metrics by name."""
@@ -241,8 +413,7 @@ class ExecutionTimeTracker(metaclass=ExecutionTimeTrackerMeta):
 
     def reset(self) -> None:
         """Reset all metrics."""
-        with self.state.lock:
-            self.state.state.clear()
+        self.state.reset()
 
 
 def calculate_execution_time(context: Optional[str] = None, store: bool = True):
@@ -261,6 +432,8 @@ def calculate_execution_time(context: Optional[str] = None, store: bool = True):
         @wraps(func)
         def inner(*args, **kwargs):
             execution_time = ExecutionTimeTracker()
+            if not execution_time.enabled:
+                return func(*args, **kwargs)
 
             with execution_time(context or func.__name__, store):
                 result = func(*args, **kwargs)
@@ -296,6 +469,9 @@ def calculate_execution_time_generator(
             execution_time = ExecutionTimeTracker()
 
             generator = func(*args, **kwargs)
+            if not execution_time.enabled:
+                yield from generator
+                return
 
             while True:
                 with execution_time(context or func.__name__, store):
@@ -0,0 +1,229 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+JSON codec shared by the REST clients, the patches and the staging files.
+
+We use `orjson` or `msgspec` when they are installed, falling back to the
+standard library otherwise. Every codec keeps track of the bytes and the time
+spent encoding and decoding, shown in the workflow summary.
+"""
+import json
+import re
+import threading
+import time
+from json import JSONDecodeError
+from typing import Any, Dict, NamedTuple, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+AUTO_JSON_CODEC = "auto"
+
+# Numbers with as many digits as the 64 bits integers, or more
+_WIDE_INTEGER = re.compile(r"\d{19}")
+_WIDE_INTEGER_BYTES = re.compile(rb"\d{19}")
+
+
+class JsonCodecStats(NamedTuple):
+    """Work done by the JSON codec since the start, or the last reset"""
+
+    codec: str
+    encoded: int
+    encoded_bytes: int
+    encode_seconds: float
+    decoded: int
+    decoded_bytes: int
+    decode_seconds: float
+
+
+class JsonCodec:
+    """
+    Encode to and decode from JSON bytes, counting the work done.
+    Subclasses implement `_encode` and `_decode` with their library.
+    """
+
+    name = "stdlib"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encoded = self._encoded_bytes = 0
+        self._decoded = self._decoded_bytes = 0
+        self._encode_seconds = self._decode_seconds = 0.0
+
+    def _encode(self, obj: Any, sort_keys: bool) -> bytes:
+        return json.dumps(
+            obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+    def _decode(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def encode(self, obj: Any, sort_keys: bool = False) -> bytes:
+        """Compact JSON bytes of the object"""
+        start = time.perf_counter()
+        payload = self._encode(obj, sort_keys)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._encoded += 1
+            self._encoded_bytes += len(payload)
+            self._encode_seconds += elapsed
+        return payload
+
+    def dumps(self, obj: Any, sort_keys: bool = False) -> str:
+        """Compact JSON string of the object"""
+        return self.encode(obj, sort_keys=sort_keys).decode("utf-8")
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """
+        Object of the JSON bytes or string.
+        Raises `json.JSONDecodeError` for invalid JSON, whatever the codec.
+        """
+        start = time.perf_counter()
+        obj = self._decode(data)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._decoded += 1
+            self._decoded_bytes += len(data)
+            self._decode_seconds += elapsed
+        return obj
+
+    def stats(self) -> JsonCodecStats:
+        with self._lock:
+            return JsonCodecStats(
+                codec=self.name,
+                encoded=self._encoded,
+                encoded_bytes=self._encoded_bytes,
+                encode_seconds=self._encode_seconds,
+                decoded=self._decoded,
+                decoded_bytes=self._decoded_bytes,
+                decode_seconds=self._decode_seconds,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._encoded = self._encoded_bytes = 0
+            self._decoded = self._decoded_bytes = 0
+            self._encode_seconds = self._decode_seconds = 0.0
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by `orjson`"""
+
+    name = "orjson"
+
+    def _encode(self, obj: Any, sort_keys: bool) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            # e.g., integers beyond 64 bits or types only `json` knows about
+            return super()._encode(obj, sort_keys)
+
+    def _decode(self, data: Union[bytes, str]) -> Any:
+        wide_integer = _WIDE_INTEGER_BYTES if isinstance(data, bytes) else _WIDE_INTEGER
+        if wide_integer.search(data):
+            # orjson turns the integers beyond 64 bits into floats
+            return super()._decode(data)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by `msgspec`"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        super().__init__()
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def _encode(self, obj: Any, sort_keys: bool) -> bytes:
+        if sort_keys:
+            return super()._encode(obj, sort_keys)
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return super()._encode(obj, sort_keys)
+
+    def _decode(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise JSONDecodeError(str(exc), str(data), 0) from exc
+
+
+JSON_CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+}
+
+_AVAILABLE = {
+    JsonCodec.name: True,
+    OrjsonCodec.name: orjson is not None,
+    MsgspecCodec.name: msgspec is not None,
+}
+
+_codec: Optional[JsonCodec] = None
+_codec_lock = threading.Lock()
+
+
+def _fastest_codec_name() -> str:
+    for name in (OrjsonCodec.name, MsgspecCodec.name):
+        if _AVAILABLE[name]:
+            return name
+    return JsonCodec.name
+
+
+def set_json_codec(name: str = AUTO_JSON_CODEC) -> JsonCodec:
+    """
+    Use the given codec from now on. With `auto`, or if the library of the codec
+    is not installed, we pick the fastest one available.
+    """
+    global _codec  # pylint: disable=global-statement
+
+    if name != AUTO_JSON_CODEC and name not in JSON_CODECS:
+        raise ValueError(
+            f"Unknown JSON codec [{name}]. Use one of {[AUTO_JSON_CODEC, *JSON_CODECS]}"
+        )
+    if name != AUTO_JSON_CODEC and not _AVAILABLE[name]:
+        # The logger module imports the patches, which use the codec
+        from metadata.utils.logger import (  # pylint: disable=import-outside-toplevel
+            utils_logger,
+        )
+
+        utils_logger().warning(
+            f"The `{name}` package is not installed. Falling back to the fastest JSON codec available."
+        )
+    if name == AUTO_JSON_CODEC or not _AVAILABLE[name]:
+        name = _fastest_codec_name()
+
+    with _codec_lock:
+        _codec = JSON_CODECS[name]()
+    return _codec
+
+
+def get_json_codec() -> JsonCodec:
+    """Codec in use, the fastest one available unless set otherwise"""
+    global _codec  # pylint: disable=global-statement
+
+    if _codec is None:
+        with _codec_lock:
+            if _codec is None:
+                _codec = JSON_CODECS[_fastest_codec_name()]()
+    return _codec
@@ -0,0 +1,106 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Prefetch the elements of iterables in background threads.
+
+Paginated reads otherwise only ask for the next page once the consumer has
+processed the current one. Prefetching keeps up to `read_ahead` elements of each
+iterable ready, so the requests of the next pages overlap with the processing.
+"""
+import queue
+import threading
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+from metadata.utils.execution_time_tracker import ExecutionTimeTrackerContextMap
+from metadata.utils.logger import utils_logger
+
+logger = utils_logger()
+
+T = TypeVar("T")
+
+# Seconds producers wait for room in the buffer before checking if we stopped
+_PUT_TIMEOUT = 0.1
+
+_ELEMENT, _DONE, _ERROR = range(3)
+
+
+def prefetch(iterable: Iterable[T], read_ahead: int = 1) -> Iterator[T]:
+    """
+    Iterate in a background thread, keeping up to `read_ahead` elements ready.
+    With `read_ahead <= 0`, we just iterate in the calling thread.
+    """
+    return prefetch_parallel([iterable], read_ahead=read_ahead, max_workers=1)
+
+
+def prefetch_parallel(
+    iterables: Sequence[Iterable[T]], read_ahead: int = 1, max_workers: int = 4
+) -> Iterator[T]:
+    """
+    Iterate up to `max_workers` of the iterables at the same time, e.g., the
+    pages of different partitions, yielding their elements as they come.
+    The order is only kept within each iterable.
+    """
+    if read_ahead <= 0 or not iterables:
+        for iterable in iterables:
+            yield from iterable
+        return
+
+    workers = max(1, min(max_workers, len(iterables)))
+    buffer: queue.Queue = queue.Queue(maxsize=read_ahead * workers)
+    stop = threading.Event()
+    pending = iter(iterables)
+    pending_lock = threading.Lock()
+    parent_thread_id = threading.get_ident()
+
+    def put(message) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(message, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def work() -> None:
+        ExecutionTimeTrackerContextMap().copy_from_parent(parent_thread_id)
+        try:
+            while not stop.is_set():
+                with pending_lock:
+                    iterable = next(pending, None)
+                if iterable is None:
+                    break
+                for element in iterable:
+                    if not put((_ELEMENT, element)):
+                        return
+            put((_DONE, None))
+        except BaseException as exc:  # pylint: disable=broad-except
+            put((_ERROR, exc))
+
+    threads = [
+        threading.Thread(target=work, name=f"prefetch-{idx}", daemon=True)
+        for idx in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        running = workers
+        while running:
+            kind, value = buffer.get()
+            if kind == _ELEMENT:
+                yield value
+            elif kind == _DONE:
+                running -= 1
+            else:
+                raise value
+    finally:
+        # Producers blocked on a full buffer give up once the consumer is gone
+        stop.set()
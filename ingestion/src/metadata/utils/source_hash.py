@@ -26,11 +26,16 @@ import hashlib
 import json
 import re
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 from metadata.ingestion.ometa.ometa_api import C
 from metadata.utils.logger import utils_logger
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 logger = utils_logger()
 
 
@@ -40,6 +45,18 @@ SOURCE_HASH_EXCLUDE_FIELDS = {
 
 VOLATILE_ENTITY_REFERENCE_FIELDS = {"href", "deleted", "inherited"}
 
+# MD5 of the canonical JSON. Fingerprints without a version are from this one.
+LEGACY_SOURCE_HASH_VERSION = 1
+# BLAKE2b of the compact canonical JSON
+BLAKE2B_SOURCE_HASH_VERSION = 2
+# XXH3 (non-cryptographic) of the compact canonical JSON. Requires `xxhash`.
+XXH3_SOURCE_HASH_VERSION = 3
+SOURCE_HASH_VERSION_SEPARATOR = ":"
+
+# Values we don't need to walk when canonicalizing. bool is an int subclass,
+# but we check the exact types.
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 def _normalize_whitespace(text: Optional[str]) -> Optional[str]:
     """
@@ -85,81 +102,161 @@ def _get_entity_reference_sort_key(ref: Dict[str, Any]) -> str:
     return str(ref.get("fullyQualifiedName") or ref.get("name") or ref.get("id") or "")
 
 
-def _remove_volatile_fields(obj: Union[Dict, List, Any]) -> Union[Dict, List, Any]:
+def _canonicalize_value(value: Any) -> Any:
     """
-    Recursively remove volatile fields from entity references and normalize data.
-    This ensures that fields like href, deleted, inherited don't affect the hash.
+    Walk the dumped model once, in place: drop the volatile fields and stringify
+    the values JSON can't serialize (e.g., Enums or UUIDs), as `default=str` would.
     """
-    if isinstance(obj, dict):  # pylint: disable=no-else-return
-        result = {}
-        for key, value in obj.items():
-            if key in VOLATILE_ENTITY_REFERENCE_FIELDS:
-                continue
-            result[key] = _remove_volatile_fields(value)
-        return result
-    elif isinstance(obj, list):
-        return [_remove_volatile_fields(item) for item in obj]
-    return obj
+    if isinstance(value, dict):
+        for key in VOLATILE_ENTITY_REFERENCE_FIELDS:
+            value.pop(key, None)
+        for key, item in value.items():
+            if type(item) not in _JSON_SCALAR_TYPES:
+                value[key] = _canonicalize_value(item)
+    elif isinstance(value, list):
+        for idx, item in enumerate(value):
+            if type(item) not in _JSON_SCALAR_TYPES:
+                value[idx] = _canonicalize_value(item)
+    elif not isinstance(value, (str, int, float, tuple)):
+        return str(value)
+    return value
+
+
+def _canonicalize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize the dumped create request in place, so that the hash is
+    deterministic:
+    1. Sorts columns by ordinalPosition/name, and their children and tags
+    2. Sorts tags by tagFQN
+    3. Sorts tableConstraints by type and columns
+    4. Sorts owners by FQN/name/id
+    5. Removes volatile EntityReference fields (href, deleted, inherited)
+    6. Normalizes schemaDefinition whitespace
+    """
+    _canonicalize_value(data)
+
+    columns = data.get("columns")
+    if isinstance(columns, list):
+        _sort_columns_in_place(columns)
+
+    for key, sort_key in (
+        ("tags", _get_tag_sort_key),
+        ("tableConstraints", _get_constraint_sort_key),
+        ("owners", _get_entity_reference_sort_key),
+    ):
+        if isinstance(data.get(key), list):
+            data[key].sort(key=sort_key)
+
+    if data.get("schemaDefinition"):
+        data["schemaDefinition"] = _normalize_whitespace(data["schemaDefinition"])
 
+    return data
 
-def _sort_columns(columns: List[Any]) -> List[Any]:
+
+def _sort_columns_in_place(columns: List[Any]) -> None:
     """
-    Sort columns by ordinalPosition (if present) then by name.
-    Also recursively sorts nested children columns.
+    Sort columns by ordinalPosition (if present) then by name, recursively
+    sorting the children columns and the tags.
 
     Handles both Column dict structures and simple string lists for backward compatibility.
     """
     if not columns:
-        return columns
+        return
 
     if not isinstance(columns[0], dict):
-        return sorted(columns, key=str)
+        columns.sort(key=str)
+        return
 
-    sorted_columns = sorted(columns, key=_get_column_sort_key)
-    for col in sorted_columns:
+    columns.sort(key=_get_column_sort_key)
+    for col in columns:
         if col.get("children"):
-            col["children"] = _sort_columns(col["children"])
+            _sort_columns_in_place(col["children"])
         if col.get("tags"):
-            col["tags"] = sorted(col["tags"], key=_get_tag_sort_key)
-    return sorted_columns
+            col["tags"].sort(key=_get_tag_sort_key)
 
 
-def _normalize_for_hash(data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Normalize a create request dict to ensure deterministic hashing.
+def _legacy_payload(create_request: C, exclude: Dict) -> bytes:
+    """Canonical JSON of the version 1, kept byte by byte to match the existing fingerprints"""
+    return json.dumps(
+        _canonicalize(create_request.model_dump(exclude=exclude)),
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8")
 
-    This function:
-    1. Sorts columns by ordinalPosition/name
-    2. Sorts tags by tagFQN
-    3. Sorts tableConstraints by type and columns
-    4. Sorts owners by FQN/name/id
-    5. Removes volatile EntityReference fields (href, deleted, inherited)
-    6. Normalizes schemaDefinition whitespace
-    """
-    result = _remove_volatile_fields(data)
 
-    if "columns" in result and isinstance(result["columns"], list):
-        result["columns"] = _sort_columns(result["columns"])
+def _compact_payload(create_request: C, exclude: Dict) -> bytes:
+    """
+    Compact canonical JSON: the JSON dump of the model already gives us
+    plain values, and empty fields don't need to be hashed.
+    """
+    return json.dumps(
+        _canonicalize(
+            create_request.model_dump(mode="json", exclude=exclude, exclude_none=True)
+        ),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _xxh3_128(payload: bytes) -> str:
+    if xxhash is None:
+        raise ImportError(
+            "The `xxhash` package is required for the source hash version"
+            f" [{XXH3_SOURCE_HASH_VERSION}]"
+        )
+    return xxhash.xxh3_128_hexdigest(payload)
+
+
+class SourceHashFormat(NamedTuple):
+    """How each version of the source hash is computed"""
+
+    payload: Callable[[C, Dict], bytes]
+    digest: Callable[[bytes], str]
+
+
+# The sourceHash fields are limited to 32 characters. The version 1 is the plain MD5 hex digest,
+# newer versions are prefixed by `<version>:` followed by the first 30 characters of the digest.
+SOURCE_HASH_FORMATS: Dict[int, SourceHashFormat] = {
+    LEGACY_SOURCE_HASH_VERSION: SourceHashFormat(
+        payload=_legacy_payload,
+        digest=lambda payload: hashlib.md5(payload).hexdigest(),
+    ),
+    BLAKE2B_SOURCE_HASH_VERSION: SourceHashFormat(
+        payload=_compact_payload,
+        digest=lambda payload: hashlib.blake2b(payload, digest_size=15).hexdigest(),
+    ),
+    XXH3_SOURCE_HASH_VERSION: SourceHashFormat(
+        payload=_compact_payload,
+        digest=_xxh3_128,
+    ),
+}
 
-    if "tags" in result and isinstance(result["tags"], list):
-        result["tags"] = sorted(result["tags"], key=_get_tag_sort_key)
 
-    if "tableConstraints" in result and isinstance(result["tableConstraints"], list):
-        result["tableConstraints"] = sorted(
-            result["tableConstraints"], key=_get_constraint_sort_key
+def get_supported_source_hash_version(version: int) -> int:
+    """
+    XXH3 hashes need the optional `xxhash` package. Without it, we fall back to
+    BLAKE2b instead of failing to hash every entity.
+    """
+    if version == XXH3_SOURCE_HASH_VERSION and xxhash is None:
+        logger.warning(
+            f"The source hash version [{XXH3_SOURCE_HASH_VERSION}] requires the `xxhash` package."
+            f" Using the version [{BLAKE2B_SOURCE_HASH_VERSION}] instead."
         )
+        return BLAKE2B_SOURCE_HASH_VERSION
+    return version
 
-    if "owners" in result and isinstance(result["owners"], list):
-        result["owners"] = sorted(result["owners"], key=_get_entity_reference_sort_key)
 
-    if "schemaDefinition" in result and result["schemaDefinition"]:
-        result["schemaDefinition"] = _normalize_whitespace(result["schemaDefinition"])
-
-    return result
+def get_source_hash_version(source_hash: str) -> int:
+    """Get the version of a stored source hash"""
+    version, separator, _ = source_hash.partition(SOURCE_HASH_VERSION_SEPARATOR)
+    return int(version) if separator else LEGACY_SOURCE_HASH_VERSION
 
 
 def generate_source_hash(
-    create_request: C, exclude_fields: Optional[Dict] = None
+    create_request: C,
+    exclude_fields: Optional[Dict] = None,
+    version: int = LEGACY_SOURCE_HASH_VERSION,
 ) -> Optional[str]:
     """
     Given a create_request model convert it to a normalized json string
@@ -169,20 +266,21 @@ def generate_source_hash(
     - Sorting lists (columns, tags, constraints, owners) by deterministic keys
     - Removing volatile fields (href, deleted, inherited) from entity references
     - Normalizing whitespace in DDL/SQL definitions
+
+    The `version` picks the format of the hash. See `SOURCE_HASH_FORMATS`.
     """
     try:
         final_exclude = dict(SOURCE_HASH_EXCLUDE_FIELDS)
         if exclude_fields:
             final_exclude.update(exclude_fields)
 
-        request_dict = create_request.model_dump(exclude=final_exclude)
-
-        normalized_dict = _normalize_for_hash(request_dict)
-
-        normalized_json = json.dumps(normalized_dict, sort_keys=True, default=str)
-
-        json_bytes = normalized_json.encode("utf-8")
-        return hashlib.md5(json_bytes).hexdigest()
+        source_hash_format = SOURCE_HASH_FORMATS[version]
+        digest = source_hash_format.digest(
+            source_hash_format.payload(create_request, final_exclude)
+        )
+        if version == LEGACY_SOURCE_HASH_VERSION:
+            return digest
+        return f"{version}{SOURCE_HASH_VERSION_SEPARATOR}{digest[:30]}"
 
     except Exception as exc:
         logger.warning(f"Failed to generate source hash due to - {exc}")
@@ -0,0 +1,309 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Source hash snapshot module
+
+Keeps the FQN -> sourceHash of the ingested entities in a local SQLite file
+per service, so that later runs don't need to list all the entities from the
+API to compare the fingerprints.
+
+The entities are listed per parent, e.g., the tables of a schema. The first
+time - or when the snapshot is missing, stale or from a different format or
+server - we list all of them from the API. Afterwards, we only fetch from
+Elasticsearch the entities updated since the previous refresh, and validate
+the result against the number of entities in the API.
+"""
+import json
+import re
+import time
+import traceback
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Type
+
+from metadata.ingestion.ometa.ometa_api import OpenMetadata, T
+from metadata.utils.logger import utils_logger
+from metadata.utils.sqlite_utils import sqlite_connection
+
+logger = utils_logger()
+
+# Increase it when changing the tables or how the fingerprints are computed,
+# so that snapshots from previous versions are discarded
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Margin for the clocks of the ingestion and the server, and the indexing delay
+SNAPSHOT_REFRESH_MARGIN = timedelta(minutes=10)
+
+SNAPSHOT_DDL = (
+    "CREATE TABLE IF NOT EXISTS snapshot_metadata (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE IF NOT EXISTS source_hash ("
+    " entity_type TEXT NOT NULL, parent_fqn TEXT NOT NULL, fqn TEXT NOT NULL,"
+    " source_hash TEXT, deleted INTEGER NOT NULL,"
+    " PRIMARY KEY (entity_type, parent_fqn, fqn))",
+    "CREATE TABLE IF NOT EXISTS refresh ("
+    " entity_type TEXT NOT NULL, parent_fqn TEXT NOT NULL, refreshed_at INTEGER NOT NULL,"
+    " PRIMARY KEY (entity_type, parent_fqn))",
+)
+
+
+class SourceHashRecord(NamedTuple):
+    """Fingerprint of an entity"""
+
+    fqn: str
+    source_hash: Optional[str]
+    deleted: bool
+
+
+class SourceHashSnapshot:
+    """
+    Local store of the fingerprints of a service.
+
+    We open a new connection for each operation, so that the snapshot can be
+    shared by the threads and processes of the workflow.
+    """
+
+    def __init__(self, path: Path, server: str, max_age: timedelta):
+        self.path = path
+        self.server = server
+        self.max_age = max_age
+        self._init_snapshot()
+
+    @classmethod
+    def create(
+        cls, directory: str, service_name: str, server: str, max_age_hours: int
+    ) -> "SourceHashSnapshot":
+        """Build the snapshot of the service in the given directory"""
+        file_name = re.sub(r"[^\w.-]", "_", service_name)
+        return cls(
+            path=Path(directory) / f"{file_name}.sqlite",
+            server=server,
+            max_age=timedelta(hours=max_age_hours),
+        )
+
+    def _init_snapshot(self) -> None:
+        """Create the snapshot, discarding it if it was built for another format or server"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        expected_metadata = {
+            "format_version": str(SNAPSHOT_FORMAT_VERSION),
+            "server": self.server,
+        }
+        with sqlite_connection(self.path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in SNAPSHOT_DDL:
+                conn.execute(statement)
+            snapshot_metadata = dict(
+                conn.execute("SELECT key, value FROM snapshot_metadata").fetchall()
+            )
+            if snapshot_metadata != expected_metadata:
+                if snapshot_metadata:
+                    logger.info(
+                        f"Discarding the source hash snapshot [{self.path}] built for {snapshot_metadata}"
+                    )
+                for table in ("snapshot_metadata", "source_hash", "refresh"):
+                    conn.execute(f"DELETE FROM {table}")
+                conn.executemany(
+                    "INSERT INTO snapshot_metadata (key, value) VALUES (?, ?)",
+                    expected_metadata.items(),
+                )
+
+    def refresh(
+        self,
+        metadata: OpenMetadata,
+        entity: Type[T],
+        parent_fqn: str,
+        params: Dict[str, str],
+    ) -> List[SourceHashRecord]:
+        """
+        Get the fingerprints of the `entity` children of `parent_fqn`, only fetching
+        the changes since the previous refresh when possible.
+
+        :param metadata: OpenMetadata client
+        :param entity: Type of the children, e.g., Table
+        :param parent_fqn: FQN of the parent, e.g., the schema
+        :param params: API params listing the children of the parent
+        """
+        started_at = int(time.time() * 1000)
+        refreshed_at = self._get_refreshed_at(entity, parent_fqn)
+
+        if refreshed_at is not None:
+            try:
+                self._upsert(
+                    entity=entity,
+                    parent_fqn=parent_fqn,
+                    records=self._list_changes(
+                        metadata=metadata,
+                        entity=entity,
+                        parent_fqn=parent_fqn,
+                        since=refreshed_at
+                        - int(SNAPSHOT_REFRESH_MARGIN.total_seconds() * 1000),
+                    ),
+                )
+                if self._matches_api(metadata, entity, parent_fqn, params):
+                    self._set_refreshed_at(entity, parent_fqn, started_at)
+                    return self._load(entity, parent_fqn)
+                logger.debug(
+                    f"Source hash snapshot of [{entity.__name__}] in [{parent_fqn}] is out of sync"
+                )
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                logger.warning(
+                    f"Error refreshing the source hash snapshot of [{entity.__name__}]"
+                    f" in [{parent_fqn}]: {exc}"
+                )
+
+        records = [
+            SourceHashRecord(
+                fqn=child["fullyQualifiedName"],
+                source_hash=child.get("sourceHash"),
+                deleted=bool(child.get("deleted")),
+            )
+            for child in metadata.list_all_entity_dicts(
+                entity=entity, params=params, fields=["sourceHash"], include="all"
+            )
+        ]
+        self._replace(entity, parent_fqn, records, started_at)
+        return records
+
+    @staticmethod
+    def _list_changes(
+        metadata: OpenMetadata, entity: Type[T], parent_fqn: str, since: int
+    ) -> Iterable[SourceHashRecord]:
+        """Get the children of the parent updated since the given timestamp from ES"""
+        query_filter = json.dumps(
+            {
+                "query": {
+                    "bool": {
+                        "must": [
+                            {"prefix": {"fullyQualifiedName": f"{parent_fqn}."}},
+                            {"range": {"updatedAt": {"gte": since}}},
+                        ]
+                    }
+                }
+            }
+        )
+        for deleted in (False, True):
+            for source in metadata.paginate_es_sources(
+                entity=entity,
+                fields=["fullyQualifiedName", "sourceHash"],
+                query_filter=query_filter,
+                deleted=deleted,
+            ):
+                yield SourceHashRecord(
+                    fqn=source["fullyQualifiedName"],
+                    source_hash=source.get("sourceHash"),
+                    deleted=deleted,
+                )
+
+    def _matches_api(
+        self,
+        metadata: OpenMetadata,
+        entity: Type[T],
+        parent_fqn: str,
+        params: Dict[str, str],
+    ) -> bool:
+        """
+        Changes can't tell us about hard deleted entities, so we validate the
+        number of entities and deleted entities against the API.
+        """
+        with sqlite_connection(self.path) as conn:
+            total, deleted = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(deleted), 0) FROM source_hash"
+                " WHERE entity_type = ? AND parent_fqn = ?",
+                (entity.__name__, parent_fqn),
+            ).fetchone()
+
+        api_total = metadata.list_entities(
+            entity=entity, limit=1, params=params, include="all"
+        ).total
+        if api_total != total:
+            return False
+
+        api_deleted = metadata.list_entities(
+            entity=entity, limit=1, params=params, include="deleted"
+        ).total
+        return api_deleted == deleted
+
+    def _get_refreshed_at(self, entity: Type[T], parent_fqn: str) -> Optional[int]:
+        """Timestamp of the previous refresh, if the snapshot is not stale"""
+        with sqlite_connection(self.path) as conn:
+            row = conn.execute(
+                "SELECT refreshed_at FROM refresh WHERE entity_type = ? AND parent_fqn = ?",
+                (entity.__name__, parent_fqn),
+            ).fetchone()
+
+        if not row:
+            return None
+        if time.time() * 1000 - row[0] > self.max_age.total_seconds() * 1000:
+            logger.debug(
+                f"Source hash snapshot of [{entity.__name__}] in [{parent_fqn}] is stale"
+            )
+            return None
+        return row[0]
+
+    def _set_refreshed_at(
+        self, entity: Type[T], parent_fqn: str, refreshed_at: int
+    ) -> None:
+        with sqlite_connection(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO refresh (entity_type, parent_fqn, refreshed_at)"
+                " VALUES (?, ?, ?)",
+                (entity.__name__, parent_fqn, refreshed_at),
+            )
+
+    def _upsert(
+        self, entity: Type[T], parent_fqn: str, records: Iterable[SourceHashRecord]
+    ) -> None:
+        with sqlite_connection(self.path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO source_hash"
+                " (entity_type, parent_fqn, fqn, source_hash, deleted)"
+                " VALUES (?, ?, ?, ?, ?)",
+                ((entity.__name__, parent_fqn, *record) for record in records),
+            )
+
+    def _replace(
+        self,
+        entity: Type[T],
+        parent_fqn: str,
+        records: List[SourceHashRecord],
+        refreshed_at: int,
+    ) -> None:
+        """Replace all the fingerprints of the parent after a full listing"""
+        with sqlite_connection(self.path) as conn:
+            conn.execute(
+                "DELETE FROM source_hash WHERE entity_type = ? AND parent_fqn = ?",
+                (entity.__name__, parent_fqn),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO source_hash"
+                " (entity_type, parent_fqn, fqn, source_hash, deleted)"
+                " VALUES (?, ?, ?, ?, ?)",
+                ((entity.__name__, parent_fqn, *record) for record in records),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO refresh (entity_type, parent_fqn, refreshed_at)"
+                " VALUES (?, ?, ?)",
+                (entity.__name__, parent_fqn, refreshed_at),
+            )
+
+    def _load(self, entity: Type[T], parent_fqn: str) -> List[SourceHashRecord]:
+        with sqlite_connection(self.path) as conn:
+            return [
+                SourceHashRecord(
+                    fqn=fqn, source_hash=source_hash, deleted=bool(deleted)
+                )
+                for fqn, source_hash, deleted in conn.execute(
+                    "SELECT fqn, source_hash, deleted FROM source_hash"
+                    " WHERE entity_type = ? AND parent_fqn = ?",
+                    (entity.__name__, parent_fqn),
+                )
+            ]
@@ -0,0 +1,32 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Helpers for the local SQLite files of the ingestion
+"""
+import sqlite3
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Iterator
+
+# Seconds to wait for the lock of a file written by another process
+SQLITE_TIMEOUT = 60
+
+
+@contextmanager
+def sqlite_connection(path: Path) -> Iterator[sqlite3.Connection]:
+    """
+    Connection to the SQLite file, committing its changes if the block succeeds
+    - rolling them back otherwise - and closed afterwards.
+    """
+    with closing(sqlite3.connect(path, timeout=SQLITE_TIMEOUT)) as conn:
+        with conn:
+            yield conn
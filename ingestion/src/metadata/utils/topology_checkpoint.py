@@ -0,0 +1,179 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Topology checkpoint module
+
+Keeps track of the topology node entities - e.g., databases and schemas - fully
+processed by a metadata run in a local SQLite file per service, together with
+the source state used to mark the deleted entities.
+
+If the run dies, the next one resumes from the checkpoint: it skips the completed
+entities, and restores their source state so that the mark deleted post processes
+still see the whole service. The checkpoint is cleared once a run finishes.
+"""
+import re
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Set
+
+from metadata.utils.logger import utils_logger
+from metadata.utils.sqlite_utils import sqlite_connection
+
+logger = utils_logger()
+
+# Increase it when changing the tables, so that checkpoints from previous versions are discarded
+CHECKPOINT_FORMAT_VERSION = 1
+
+CHECKPOINT_DDL = (
+    "CREATE TABLE IF NOT EXISTS checkpoint_metadata (key TEXT PRIMARY KEY, value TEXT)",
+    "CREATE TABLE IF NOT EXISTS completed (fqn TEXT PRIMARY KEY)",
+    "CREATE TABLE IF NOT EXISTS source_state ("
+    " name TEXT NOT NULL, fqn TEXT NOT NULL, PRIMARY KEY (name, fqn))",
+)
+
+
+class TopologyCheckpoint:
+    """
+    Checkpoint of a metadata run.
+
+    Entities are first flagged as completed in memory, and only committed to the file
+    once the workflow confirms that everything they yielded has been processed.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, max_age: timedelta):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._pending: List[str] = []
+        self.completed: Set[str] = set()
+        self.source_state: Dict[str, Set[str]] = {}
+        self._init_checkpoint()
+
+    @classmethod
+    def create(
+        cls, directory: str, service_name: str, fingerprint: str, max_age_hours: int
+    ) -> "TopologyCheckpoint":
+        """Build the checkpoint of the service in the given directory"""
+        file_name = re.sub(r"[^\w.-]", "_", service_name)
+        return cls(
+            path=Path(directory) / f"{file_name}.sqlite",
+            fingerprint=fingerprint,
+            max_age=timedelta(hours=max_age_hours),
+        )
+
+    def _init_checkpoint(self) -> None:
+        """
+        Load the checkpoint, discarding it if it is stale or was built for another
+        format or workflow configuration.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        expected_metadata = {
+            "format_version": str(CHECKPOINT_FORMAT_VERSION),
+            "fingerprint": self.fingerprint,
+        }
+        with sqlite_connection(self.path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in CHECKPOINT_DDL:
+                conn.execute(statement)
+            checkpoint_metadata = dict(
+                conn.execute("SELECT key, value FROM checkpoint_metadata").fetchall()
+            )
+            created_at = int(checkpoint_metadata.pop("created_at", 0))
+            is_stale = (
+                time.time() * 1000 - created_at > self.max_age.total_seconds() * 1000
+            )
+
+            if checkpoint_metadata != expected_metadata or is_stale:
+                if checkpoint_metadata:
+                    logger.info(
+                        f"Discarding the checkpoint [{self.path}]"
+                        f" {'for being stale' if is_stale else 'built for another workflow'}"
+                    )
+                self._reset(conn, expected_metadata)
+                return
+
+            self.completed = {
+                fqn for (fqn,) in conn.execute("SELECT fqn FROM completed")
+            }
+            for name, fqn in conn.execute("SELECT name, fqn FROM source_state"):
+                self.source_state.setdefault(name, set()).add(fqn)
+
+        if self.completed:
+            logger.info(
+                f"Resuming from the checkpoint [{self.path}]"
+                f" with [{len(self.completed)}] completed entities"
+            )
+
+    @staticmethod
+    def _reset(conn: sqlite3.Connection, checkpoint_metadata: Dict[str, str]) -> None:
+        """Start a new checkpoint"""
+        for table in ("checkpoint_metadata", "completed", "source_state"):
+            conn.execute(f"DELETE FROM {table}")
+        created_at = str(int(time.time() * 1000))
+        conn.executemany(
+            "INSERT INTO checkpoint_metadata (key, value) VALUES (?, ?)",
+            [*checkpoint_metadata.items(), ("created_at", created_at)],
+        )
+
+    def is_completed(self, fqn: str) -> bool:
+        """Check if the entity was completed by a previous run"""
+        return fqn in self.completed
+
+    def complete(self, fqn: str) -> None:
+        """Flag an entity as completed, waiting for its records to be processed"""
+        with self._lock:
+            self._pending.append(fqn)
+
+    def take_completed(self) -> List[str]:
+        """Get the entities flagged as completed since the last call"""
+        with self._lock:
+            completed, self._pending = self._pending, []
+        return completed
+
+    def commit(self, completed: List[str], source_state: Dict[str, Set[str]]) -> None:
+        """
+        Persist the completed entities, together with the source state collected
+        so far. We only write the FQNs not stored yet.
+        """
+        new_source_state = [
+            (name, fqn)
+            for name, fqns in source_state.items()
+            for fqn in fqns - self.source_state.get(name, set())
+        ]
+        with sqlite_connection(self.path) as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO source_state (name, fqn) VALUES (?, ?)",
+                new_source_state,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO completed (fqn) VALUES (?)",
+                ((fqn,) for fqn in completed),
+            )
+
+        for name, fqn in new_source_state:
+            self.source_state.setdefault(name, set()).add(fqn)
+        logger.debug(f"Checkpoint [{self.path}] committed {completed}")
+
+    def clear(self) -> None:
+        """
+        Remove the checkpoint once the run is finished. The next run starts a new one.
+        """
+        with sqlite_connection(self.path) as conn:
+            for table in ("checkpoint_metadata", "completed", "source_state"):
+                conn.execute(f"DELETE FROM {table}")
+        self.completed = set()
+        self.source_state = {}
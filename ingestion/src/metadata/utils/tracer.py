@@ -0,0 +1,368 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Tracer implementation to record the spans of a workflow run - topology stages,
+REST requests, SQL queries, sink writes,... - and export them as a Chrome trace
+(to open with Perfetto or chrome://tracing) or as OTLP JSON.
+
+Spans keep the thread they ran in, so each thread shows up as its own lane.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from metadata.generated.schema.metadataIngestion.workflow import TraceFormat
+from metadata.utils.logger import utils_logger
+from metadata.utils.singleton import Singleton
+
+logger = utils_logger()
+
+TRACER_SCOPE = "openmetadata-ingestion"
+
+# Spans talking to other systems are exported as OTLP client spans
+CLIENT_CATEGORIES = {"http", "sql", "inspector"}
+
+# Spans are stacked per thread, so code interleaving within a thread, e.g., the
+# greenlets of the async client, suspends the tracing
+_suspended: ContextVar[bool] = ContextVar("tracer_suspended", default=False)
+
+
+class TraceSpan(NamedTuple):
+    """Finished span. Timestamps are nanoseconds since the epoch."""
+
+    name: str
+    category: str
+    start: int
+    duration: int
+    pid: int
+    thread_id: int
+    thread_name: str
+    span_id: str
+    parent_id: Optional[str]
+    args: Optional[Dict[str, Any]]
+
+
+class Tracer(metaclass=Singleton):
+    """
+    Tracer is a Singleton collecting the spans of all the threads. It is disabled by
+    default, and spans are then a no-op.
+
+    Example:
+
+        with Tracer().span("yield_table", category="topology"):
+            ...
+    """
+
+    def __init__(self):
+        self._enabled: bool = False
+        self.max_spans: Optional[int] = None
+        self.spans: List[TraceSpan] = []
+
+        self._local = threading.local()
+        self._span_ids = itertools.count(1)
+        self._dropped = False
+        # perf_counter is more precise than the wall clock, so we only read the
+        # latter once, and move it forward with the former
+        self._epoch_ns = time.time_ns()
+        self._perf_epoch_ns = time.perf_counter_ns()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled and not _suspended.get()
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    def enable(self, max_spans: Optional[int] = None) -> None:
+        """Start recording spans"""
+        self._enabled = True
+        self.max_spans = max_spans
+
+    @contextmanager
+    def suspended(self) -> Iterator[None]:
+        """Don't record the spans of the code run within, in the current thread or greenlet"""
+        token = _suspended.set(True)
+        try:
+            yield
+        finally:
+            _suspended.reset(token)
+
+    def now(self) -> int:
+        """Nanoseconds since the epoch"""
+        return self._epoch_ns + time.perf_counter_ns() - self._perf_epoch_ns
+
+    def _new_span_id(self) -> str:
+        """16 hex chars, unique across the processes of the run"""
+        return f"{os.getpid() & 0xFFFFFFFF:08x}{next(self._span_ids) & 0xFFFFFFFF:08x}"
+
+    def _stack(self) -> List[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def _span(
+        self, name: str, category: str, args: Optional[Dict[str, Any]]
+    ) -> Iterator[None]:
+        stack = self._stack()
+        span_id = self._new_span_id()
+        parent_id = stack[-1] if stack else None
+        stack.append(span_id)
+        start = self.now()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self._add(self._build_span(name, category, start, span_id, parent_id, args))
+
+    def _build_span(
+        self,
+        name: str,
+        category: str,
+        start: int,
+        span_id: str,
+        parent_id: Optional[str],
+        args: Optional[Dict[str, Any]],
+    ) -> TraceSpan:
+        return TraceSpan(
+            name=name,
+            category=category,
+            start=start,
+            duration=self.now() - start,
+            pid=os.getpid(),
+            thread_id=threading.get_ident(),
+            thread_name=threading.current_thread().name,
+            span_id=span_id,
+            parent_id=parent_id,
+            args=args,
+        )
+
+    def _add(self, span: TraceSpan) -> None:
+        """list.append is atomic, so the threads don't need to lock"""
+        if self.max_spans is not None and len(self.spans) >= self.max_spans:
+            if not self._dropped:
+                self._dropped = True
+                logger.warning(
+                    f"Reached the limit of [{self.max_spans}] trace spans. Dropping the next ones."
+                )
+            return
+        self.spans.append(span)
+
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        """Context manager recording a span, if enabled"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return self._span(name, category, args)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start: int,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record a span started at `start` - from `now()` - and finishing now, for
+        operations we can't wrap in a context manager, e.g., event listeners.
+        """
+        if self.enabled:
+            stack = self._stack()
+            self._add(
+                self._build_span(
+                    name,
+                    category,
+                    start,
+                    self._new_span_id(),
+                    stack[-1] if stack else None,
+                    args,
+                )
+            )
+
+    def trace_generator(
+        self,
+        generator: Iterable[Any],
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> Iterable[Any]:
+        """
+        Record a span for each element produced by the generator. We don't measure the
+        time the consumer spends in between, which is traced on its own.
+        """
+        if not self.enabled:
+            yield from generator
+            return
+
+        iterator = iter(generator)
+        while True:
+            with self.span(name, category, args):
+                try:
+                    element = next(iterator)
+                except StopIteration:
+                    return
+            yield element
+
+    def take_spans(self) -> List[TraceSpan]:
+        """Get and remove the spans recorded so far"""
+        spans, self.spans = self.spans, []
+        return spans
+
+    def merge(self, spans: List[TraceSpan]) -> None:
+        """Add the spans recorded by another process"""
+        self.spans.extend(spans)
+
+    def export(self, path: str, trace_format: TraceFormat, service_name: str) -> None:
+        """Write the spans, replacing the file atomically"""
+        content = (
+            to_otlp(self.spans, service_name=service_name)
+            if trace_format == TraceFormat.otlp
+            else to_chrome_trace(self.spans)
+        )
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        tmp_path.write_text(json.dumps(content), encoding="utf-8")
+        os.replace(tmp_path, file_path)
+        logger.info(f"Trace with [{len(self.spans)}] spans written to [{file_path}]")
+
+
+class _NoopSpan:
+    """Shared context manager used when the tracer is disabled"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class TracedProxy:
+    """
+    Proxy recording a span for each call to the methods of the wrapped object whose
+    name starts with any of the prefixes, e.g., the `get_*` methods of an Inspector.
+    Everything else is forwarded as is.
+    """
+
+    def __init__(self, wrapped: Any, category: str, prefixes: Iterable[str]):
+        self._wrapped = wrapped
+        self._category = category
+        self._prefixes = tuple(prefixes)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._wrapped, name)
+        if not callable(attribute) or not name.startswith(self._prefixes):
+            return attribute
+
+        def traced(*args, **kwargs):
+            with Tracer().span(name, self._category):
+                return attribute(*args, **kwargs)
+
+        return traced
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+def to_chrome_trace(spans: List[TraceSpan]) -> Dict[str, Any]:
+    """Chrome trace event format, with a complete event per span"""
+    events: List[Dict[str, Any]] = []
+    thread_names: Dict[tuple, str] = {}
+    for span in spans:
+        thread_names[(span.pid, span.thread_id)] = span.thread_name
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.start / 1000,
+            "dur": span.duration / 1000,
+            "pid": span.pid,
+            "tid": span.thread_id,
+        }
+        if span.args:
+            event["args"] = span.args
+        events.append(event)
+
+    for (pid, thread_id), thread_name in thread_names.items():
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def to_otlp(spans: List[TraceSpan], service_name: str) -> Dict[str, Any]:
+    """OTLP JSON export request, with all the spans of the run in a single trace"""
+    trace_id = uuid.uuid4().hex
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            # SPAN_KIND_CLIENT or SPAN_KIND_INTERNAL
+            "kind": 3 if span.category in CLIENT_CATEGORIES else 1,
+            "startTimeUnixNano": str(span.start),
+            "endTimeUnixNano": str(span.start + span.duration),
+            "attributes": _otlp_attributes(
+                {
+                    "category": span.category,
+                    "process.pid": span.pid,
+                    "thread.id": span.thread_id,
+                    "thread.name": span.thread_name,
+                    **(span.args or {}),
+                }
+            ),
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [{"scope": {"name": TRACER_SCOPE}, "spans": otlp_spans}],
+            }
+        ]
+    }
@@ -0,0 +1,253 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Worker autoscaler module
+
+Adapts the number of topology workers processing entities concurrently with an
+AIMD (additive increase, multiplicative decrease) controller, as TCP does with
+its congestion window:
+- If the process is short on CPU or memory, the source queries or the API
+  requests got slower than their baseline, or the API throttled us, we divide
+  the workers by `decreaseFactor`.
+- Otherwise, if the workers were all busy and more entities were waiting, we
+  add one worker.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional
+
+from metadata.timer.repeated_timer import RepeatedTimer
+from metadata.utils.logger import utils_logger
+from metadata.utils.singleton import Singleton
+from metadata.workflow.workflow_resource_metrics import WorkflowResourceMetrics
+
+logger = utils_logger()
+
+# How much the latency baselines can increase per interval, so that they follow
+# lasting changes - e.g., a busier warehouse - instead of shrinking forever
+BASELINE_DRIFT = 1.1
+
+# Seconds between the checks of the cancellation while waiting for a free worker
+SLOT_WAIT_SECONDS = 0.5
+
+
+class FeedbackWindow(NamedTuple):
+    """Feedback recorded since the previous adjustment"""
+
+    source_latency: Optional[float]
+    api_latency: Optional[float]
+    throttled: int
+
+
+class WorkerFeedback(metaclass=Singleton):
+    """
+    Collects the latency of the source queries and the API requests, and the API
+    throttling, while the autoscaler is running. Otherwise recording is a no-op.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self._source_time = 0.0
+        self._source_count = 0
+        self._api_time = 0.0
+        self._api_count = 0
+        self._throttled = 0
+
+    def record_source_query(self, elapsed: float) -> None:
+        if self.enabled:
+            with self.lock:
+                self._source_time += elapsed
+                self._source_count += 1
+
+    def record_api_request(self, elapsed: float) -> None:
+        if self.enabled:
+            with self.lock:
+                self._api_time += elapsed
+                self._api_count += 1
+
+    def record_throttled(self) -> None:
+        if self.enabled:
+            with self.lock:
+                self._throttled += 1
+
+    def take(self) -> FeedbackWindow:
+        """Average latencies and throttled requests since the previous call"""
+        with self.lock:
+            window = FeedbackWindow(
+                source_latency=(
+                    self._source_time / self._source_count
+                    if self._source_count
+                    else None
+                ),
+                api_latency=(
+                    self._api_time / self._api_count if self._api_count else None
+                ),
+                throttled=self._throttled,
+            )
+            self._source_time, self._source_count = 0.0, 0
+            self._api_time, self._api_count = 0.0, 0
+            self._throttled = 0
+        return window
+
+
+class LatencyBaseline:
+    """Lowest latency seen, slowly drifting up to follow lasting changes"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.baseline: Optional[float] = None
+
+    def exceeds(self, latency: Optional[float], tolerance: float) -> bool:
+        """Check the latency against the baseline, and update the latter"""
+        if latency is None:
+            return False
+        exceeded = self.baseline is not None and latency > self.baseline * tolerance
+        self.baseline = (
+            latency
+            if self.baseline is None
+            else min(latency, self.baseline * BASELINE_DRIFT)
+        )
+        return exceeded
+
+
+class WorkerAutoscaler:
+    """
+    Limits how many workers process entities at the same time, and adjusts the
+    limit every `interval_seconds` while running.
+
+    The thread pools are sized with `max_workers`, and each worker takes a slot
+    before processing an entity.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        min_workers: int,
+        max_workers: int,
+        workers: int,
+        interval_seconds: int,
+        max_cpu_percent: float,
+        max_memory_percent: float,
+        latency_tolerance: float,
+        decrease_factor: float,
+    ):
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers)
+        self.workers = min(max(workers, self.min_workers), self.max_workers)
+        self.interval_seconds = interval_seconds
+        self.max_cpu_percent = max_cpu_percent
+        self.max_memory_percent = max_memory_percent
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+
+        self._condition = threading.Condition()
+        self._active = 0
+        self._saturated = False
+        self._source_baseline = LatencyBaseline("source query")
+        self._api_baseline = LatencyBaseline("API request")
+        self._timer: Optional[RepeatedTimer] = None
+
+    def start(self) -> None:
+        """Start collecting feedback and adjusting the workers"""
+        logger.info(
+            f"Autoscaling the workers between [{self.min_workers}] and"
+            f" [{self.max_workers}], starting with [{self.workers}]"
+        )
+        WorkerFeedback().take()
+        WorkerFeedback().enabled = True
+        self._timer = RepeatedTimer(self.interval_seconds, self.adjust)
+        self._timer.trigger()
+
+    def stop(self) -> None:
+        if self._timer:
+            self._timer.stop()
+            self._timer = None
+        WorkerFeedback().enabled = False
+
+    @contextmanager
+    def slot(self, cancelled: threading.Event) -> Iterator[None]:
+        """Wait until less than `workers` entities are being processed"""
+        with self._condition:
+            while self._active >= self.workers and not cancelled.is_set():
+                # There is more work than workers
+                self._saturated = True
+                self._condition.wait(SLOT_WAIT_SECONDS)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify()
+
+    def adjust(self) -> None:
+        """Apply the AIMD rules to the feedback since the previous adjustment"""
+        try:
+            metrics = WorkflowResourceMetrics()
+            feedback = WorkerFeedback().take()
+            reasons = self._get_decrease_reasons(metrics, feedback)
+
+            with self._condition:
+                previous = self.workers
+                if reasons:
+                    self.workers = max(
+                        self.min_workers, int(self.workers * self.decrease_factor)
+                    )
+                elif self._saturated:
+                    self.workers = min(self.max_workers, self.workers + 1)
+                saturated, self._saturated = self._saturated, False
+                self._condition.notify_all()
+
+            signals = (
+                f"CPU {self._get_cpu_percent(metrics):.1f}%,"
+                f" memory {metrics.memory_usage_percent:.1f}%,"
+                f" source latency {_format_latency(feedback.source_latency)},"
+                f" API latency {_format_latency(feedback.api_latency)},"
+                f" throttled {feedback.throttled}, saturated {saturated}"
+            )
+            if self.workers != previous:
+                logger.info(
+                    f"Autoscaling the workers from [{previous}] to [{self.workers}]"
+                    f" due to [{', '.join(reasons) or 'all the workers being busy'}]"
+                    f" ({signals})"
+                )
+            else:
+                logger.debug(f"Keeping [{self.workers}] workers ({signals})")
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Error autoscaling the workers: {exc}")
+
+    @staticmethod
+    def _get_cpu_percent(metrics: WorkflowResourceMetrics) -> float:
+        """CPU usage of the process tree over the whole machine"""
+        return metrics.cpu_usage_percent / metrics.system_cpu_threads
+
+    def _get_decrease_reasons(
+        self, metrics: WorkflowResourceMetrics, feedback: FeedbackWindow
+    ) -> List[str]:
+        reasons = []
+        if feedback.throttled:
+            reasons.append(f"{feedback.throttled} throttled API requests")
+        if self._get_cpu_percent(metrics) > self.max_cpu_percent:
+            reasons.append("high CPU usage")
+        if metrics.memory_usage_percent > self.max_memory_percent:
+            reasons.append("high memory usage")
+        for baseline, latency in (
+            (self._source_baseline, feedback.source_latency),
+            (self._api_baseline, feedback.api_latency),
+        ):
+            if baseline.exceeds(latency, self.latency_tolerance):
+                reasons.append(f"slow {baseline.name}s")
+        return reasons
+
+
+def _format_latency(latency: Optional[float]) -> str:
+    return "-" if latency is None else f"{latency:.3f}s"
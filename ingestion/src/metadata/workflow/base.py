@@ -36,6 +36,7 @@ from metadata.generated.schema.entity.services.ingestionPipelines.status import
 )
 from metadata.generated.schema.metadataIngestion.workflow import (
     LogLevels,
+    RateLimitRule,
     WorkflowConfig,
 )
 from metadata.generated.schema.tests.testSuite import ServiceType
@@ -43,6 +44,12 @@ from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.api.step import Step, Summary
 from metadata.ingestion.ometa.client_utils import create_ometa_client
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.ometa.rate_limiter import (
+    BULK_ENDPOINTS,
+    CRUD_ENDPOINTS,
+    SEARCH_ENDPOINTS,
+    RateLimit,
+)
 from metadata.timer.repeated_timer import RepeatedTimer
 from metadata.utils import fqn
 from metadata.utils.class_helper import (
@@ -50,13 +57,16 @@ from metadata.utils.class_helper import (
     get_reference_type_from_service_type,
     get_service_class_from_service_type,
 )
+from metadata.utils.execution_time_exporter import ExecutionTimeExporter
 from metadata.utils.execution_time_tracker import ExecutionTimeTracker
 from metadata.utils.helpers import datetime_to_ts
+from metadata.utils.json_codec import AUTO_JSON_CODEC, set_json_codec
 from metadata.utils.logger import ingestion_logger, set_loggers_level
 from metadata.utils.streamable_logger import (
     cleanup_streamable_logging,
     setup_streamable_logging_for_workflow,
 )
+from metadata.utils.tracer import Tracer
 from metadata.workflow.workflow_output_handler import WorkflowOutputHandler
 from metadata.workflow.workflow_resource_metrics import WorkflowResourceMetrics
 from metadata.workflow.workflow_status_mixin import WorkflowStatusMixin
@@ -106,13 +116,33 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
 
         # Execution time tracking is always enabled for workflows regardless of the log level
         self._execution_time_tracker = ExecutionTimeTracker(enabled=True)
+        self._execution_time_exporter = self._get_execution_time_exporter()
+        if self.workflow_config.tracing and self.workflow_config.tracing.enabled:
+            Tracer().enable(max_spans=self.workflow_config.tracing.maxSpans)
 
         set_loggers_level(self.workflow_config.loggerLevel.value)
+        json_codec = self.workflow_config.jsonCodec
+        set_json_codec(json_codec.value if json_codec else AUTO_JSON_CODEC)
 
         # We create the ometa client at the workflow level and pass it to the steps
         self.metadata = create_ometa_client(
             self.workflow_config.openMetadataServerConfig
         )
+        entity_cache = self.workflow_config.entityCache
+        if entity_cache and entity_cache.enabled:
+            self.metadata.enable_entity_cache(
+                max_size=entity_cache.maxSize, ttl_seconds=entity_cache.ttlSeconds
+            )
+        rate_limit = self.workflow_config.rateLimit
+        if rate_limit and rate_limit.enabled:
+            self.metadata.enable_rate_limit(
+                limit=self._get_rate_limit(rate_limit.all),
+                endpoint_limits={
+                    SEARCH_ENDPOINTS: self._get_rate_limit(rate_limit.search),
+                    BULK_ENDPOINTS: self._get_rate_limit(rate_limit.bulk),
+                    CRUD_ENDPOINTS: self._get_rate_limit(rate_limit.crud),
+                },
+            )
 
         # Setup streamable logging if configured
         if (
@@ -132,6 +162,42 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
 
         self.post_init()
 
+    def _get_execution_time_exporter(self) -> Optional[ExecutionTimeExporter]:
+        """Export the latency metrics if a destination is configured"""
+        latency_metrics = self.workflow_config.latencyMetrics
+        if not latency_metrics or not (
+            latency_metrics.path or latency_metrics.pushgatewayUrl
+        ):
+            return None
+
+        return ExecutionTimeExporter(
+            config=latency_metrics, grouping_key=self._get_pipeline_key()
+        )
+
+    def _get_pipeline_key(self) -> str:
+        """Identify the pipeline in the exported metrics and traces"""
+        source = getattr(self.config, "source", None)
+        return (
+            self.config.ingestionPipelineFQN
+            or getattr(source, "serviceName", None)
+            or self.__class__.__name__
+        )
+
+    def _export_trace(self) -> None:
+        """Write the trace of the run, if enabled. Errors are logged, never raised."""
+        tracing = self.workflow_config.tracing
+        if not tracing or not tracing.enabled:
+            return
+        try:
+            Tracer().export(
+                path=tracing.path,
+                trace_format=tracing.format,
+                service_name=self._get_pipeline_key(),
+            )
+        except Exception as exc:
+            logger.debug(traceback.format_exc())
+            logger.warning(f"Error exporting the trace: {exc}")
+
     @property
     def ingestion_pipeline(self) -> Optional[IngestionPipeline]:
         """Get or create the Ingestion Pipeline from the configuration"""
@@ -147,6 +213,8 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
         # Stop the timer first. This runs in a separate thread and if not properly closed
         # it can hung the workflow
         self.timer.stop()
+        if self._execution_time_exporter:
+            self._execution_time_exporter.stop()
 
         # Cleanup streamable logging if it was configured
         cleanup_streamable_logging()
@@ -236,6 +304,8 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
         """
         pipeline_state = PipelineState.success
         self.timer.trigger()
+        if self._execution_time_exporter:
+            self._execution_time_exporter.start()
         try:
             self.execute_internal()
 
@@ -259,6 +329,7 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
             ingestion_status = self.build_ingestion_status()
             self.set_ingestion_pipeline_status(pipeline_state, ingestion_status)
             self.stop()
+            self._export_trace()
             self.print_status()
 
     @property
@@ -381,6 +452,16 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
             logger.debug(traceback.format_exc())
             logger.error(f"Wild exception reporting status - {exc}")
 
+    @staticmethod
+    def _get_rate_limit(rule: Optional[RateLimitRule]) -> Optional[RateLimit]:
+        if not rule:
+            return None
+        return RateLimit(
+            requests_per_second=rule.requestsPerSecond,
+            burst=rule.burst,
+            max_in_flight=rule.maxInFlight,
+        )
+
     def _is_debug_enabled(self) -> bool:
         return (
             hasattr(self, "config")
@@ -397,4 +478,14 @@ class BaseWorkflow(ABC, WorkflowStatusMixin):
             self.workflow_steps(),
             start_time,
             self._is_debug_enabled(),
+            entity_cache_stats=(
+                self.metadata.entity_cache.stats()
+                if self.metadata.entity_cache
+                else None
+            ),
+            rate_limiter_stats=(
+                self.metadata.client.rate_limiter.stats()
+                if self.metadata.client.rate_limiter.enabled
+                else None
+            ),
         )
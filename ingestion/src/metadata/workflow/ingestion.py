@@ -57,6 +57,7 @@ from metadata.utils.importer import (
 from metadata.utils.logger import ingestion_logger
 from metadata.utils.service_spec.service_spec import import_source_class
 from metadata.workflow.base import BaseWorkflow, InvalidWorkflowJSONException
+from metadata.workflow.pipelined_execution import PipelinedExecution
 
 logger = ingestion_logger()
 
@@ -118,15 +119,35 @@ class IngestionWorkflow(BaseWorkflow, ABC):
 
         Note how the Source class needs to be an Iterator. Specifically,
         we are defining Sources as Generators.
+
+        If the `pipelinedExecution` is enabled, each step runs in its own
+        threads instead, joined by bounded queues.
         """
-        for record in self.source.run():
-            processed_record = record
-            for step in self.steps:
-                # We only process the records for these Step types
-                if processed_record is not None and isinstance(
-                    step, (Processor, Stage, Sink)
-                ):
-                    processed_record = step.run(processed_record)
+        pipelined_execution = self.workflow_config.pipelinedExecution
+        if pipelined_execution and pipelined_execution.enabled:
+            logger.info(
+                f"Running the workflow steps pipelined with"
+                f" [{pipelined_execution.sinkWorkers}] sink workers"
+            )
+            PipelinedExecution(
+                source=self.source,
+                steps=[
+                    step
+                    for step in self.steps
+                    if isinstance(step, (Processor, Stage, Sink))
+                ],
+                sink_workers=pipelined_execution.sinkWorkers,
+                queue_size=pipelined_execution.queueSize,
+            ).run()
+        else:
+            for record in self.source.run():
+                processed_record = record
+                for step in self.steps:
+                    # We only process the records for these Step types
+                    if processed_record is not None and isinstance(
+                        step, (Processor, Stage, Sink)
+                    ):
+                        processed_record = step.run(processed_record)
 
         # Try to pick up the BulkSink and execute it, if needed
         bulk_sink = next(
@@ -141,6 +162,12 @@ class IngestionWorkflow(BaseWorkflow, ABC):
     def workflow_steps(self) -> List[Step]:
         return [self.source] + list(self.steps)
 
+    def flush_steps(self) -> None:
+        """Persist the records the sinks hold back, e.g., before checkpointing"""
+        for step in self.steps:
+            if isinstance(step, Sink):
+                step.flush()
+
     def _retrieve_service_connection_if_needed(self, service_type: ServiceType) -> None:
         """
         We override the current `serviceConnection` source config object if source workflow service already exists
@@ -11,12 +11,20 @@
 """
 Workflow definition for metadata related ingestions: metadata and lineage.
 """
+import hashlib
 
 from metadata.config.common import WorkflowExecutionError
 from metadata.ingestion.api.steps import Sink, Source
+from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
+from metadata.utils.helpers import can_spawn_child_process
 from metadata.utils.importer import import_sink_class
 from metadata.utils.logger import ingestion_logger
+from metadata.utils.source_hash import get_supported_source_hash_version
+from metadata.utils.source_hash_snapshot import SourceHashSnapshot
+from metadata.utils.topology_checkpoint import TopologyCheckpoint
+from metadata.utils.worker_autoscaler import WorkerAutoscaler
 from metadata.workflow.ingestion import IngestionWorkflow
+from metadata.workflow.sharded_execution import ShardedExecution
 
 logger = ingestion_logger()
 
@@ -31,8 +39,102 @@ class MetadataWorkflow(IngestionWorkflow):
         self.source = self._get_source()
         sink = self._get_sink()
 
+        if isinstance(self.source, TopologyRunnerMixin):
+            self._set_topology_options(self.source)
+
         self.steps = (sink,)
 
+    def _set_topology_options(self, source: TopologyRunnerMixin) -> None:
+        """Pass the workflow options handled by the topology to the source"""
+        source.source_hash_version = get_supported_source_hash_version(
+            self.workflow_config.sourceHashVersion
+        )
+
+        source_hash_snapshot = self.workflow_config.sourceHashSnapshot
+        if source_hash_snapshot and source_hash_snapshot.enabled:
+            source.source_hash_snapshot = SourceHashSnapshot.create(
+                directory=source_hash_snapshot.directory,
+                service_name=self.config.source.serviceName,
+                server=self.workflow_config.openMetadataServerConfig.hostPort,
+                max_age_hours=source_hash_snapshot.maxAgeHours,
+            )
+
+        checkpoint = self.workflow_config.checkpoint
+        if checkpoint and checkpoint.enabled:
+            # Resuming with a different source configuration could skip entities it now handles
+            fingerprint = hashlib.sha256(
+                self.config.source.model_dump_json().encode("utf-8")
+            ).hexdigest()
+            source.checkpoint = TopologyCheckpoint.create(
+                directory=checkpoint.directory,
+                service_name=self.config.source.serviceName,
+                fingerprint=fingerprint,
+                max_age_hours=checkpoint.maxAgeHours,
+            )
+            # The records of the completed entities must be persisted before committing them
+            source.flush_steps = self.flush_steps
+
+        worker_autoscaling = self.workflow_config.workerAutoscaling
+        if worker_autoscaling and worker_autoscaling.enabled:
+            source.worker_autoscaler = WorkerAutoscaler(
+                min_workers=worker_autoscaling.minWorkers,
+                max_workers=worker_autoscaling.maxWorkers,
+                workers=source.context.threads or 1,
+                interval_seconds=worker_autoscaling.intervalSeconds,
+                max_cpu_percent=worker_autoscaling.maxCpuPercent,
+                max_memory_percent=worker_autoscaling.maxMemoryPercent,
+                latency_tolerance=worker_autoscaling.latencyTolerance,
+                decrease_factor=worker_autoscaling.decreaseFactor,
+            )
+
+    def execute_internal(self):
+        """
+        If the `shardedExecution` is configured, split the topology across processes.
+        Otherwise - or in the sharded workers themselves - run the steps as usual.
+        """
+        if self._should_shard():
+            processes = self.workflow_config.shardedExecution.processes
+            logger.info(f"Running the workflow sharded across [{processes}] processes")
+            ShardedExecution(workflow=self, processes=processes).run()
+            return
+
+        worker_autoscaler = getattr(self.source, "worker_autoscaler", None)
+        if worker_autoscaler:
+            worker_autoscaler.start()
+        try:
+            super().execute_internal()
+        finally:
+            if worker_autoscaler:
+                worker_autoscaler.stop()
+
+    def _should_shard(self) -> bool:
+        """Check if the workflow is configured and able to run sharded"""
+        sharded_execution = self.workflow_config.shardedExecution
+        if not sharded_execution or sharded_execution.processes <= 1:
+            return False
+
+        if (
+            not isinstance(self.source, TopologyRunnerMixin)
+            or self.source.shard is not None
+        ):
+            return False
+
+        if not self.source.is_shardable():
+            logger.warning(
+                f"The source [{self.config.source.type}] does not support sharded execution."
+                " Running the workflow in a single process."
+            )
+            return False
+
+        if not can_spawn_child_process():
+            logger.warning(
+                "Current process cannot spawn child processes."
+                " Running the workflow in a single process."
+            )
+            return False
+
+        return True
+
     def _get_source(self) -> Source:
         # Source that we are ingesting, e.g., mysql, looker or kafka
         source_type = self.config.source.type.lower()
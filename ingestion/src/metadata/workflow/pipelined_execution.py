@@ -0,0 +1,195 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Pipelined execution of the Ingestion Workflow steps.
+
+Instead of passing each record from the Source through all the steps in the
+same thread, each step runs in its own worker threads, joined to the previous
+step by bounded queues:
+
+    Source -> [queue] -> Processor -> [queue] -> Sink (N workers)
+
+The Source keeps running in the calling thread, since its context is bound to it.
+
+Records flagged with the same ordering key by the Source are always sent to the same
+worker, so their relative order is kept. A record without a key is a barrier: we wait
+for all the in-flight records to be processed before sending it, and we don't ask the
+Source for the next record until it has gone through all the steps.
+"""
+import queue
+import threading
+import traceback
+from typing import Hashable, List, Optional, Sequence
+
+from metadata.ingestion.api.models import Entity
+from metadata.ingestion.api.step import Step
+from metadata.ingestion.api.steps import Sink, Source
+from metadata.utils.execution_time_tracker import ExecutionTimeTrackerContextMap
+from metadata.utils.logger import ingestion_logger
+
+logger = ingestion_logger()
+
+_STOP = object()
+
+
+class PipelinedStage:
+    """
+    Runs a workflow step in `workers` threads. Each worker drains its own bounded queue
+    and passes the processed records to the next stage, if any.
+    """
+
+    def __init__(
+        self,
+        step: Step,
+        workers: int,
+        queue_size: int,
+        next_stage: Optional["PipelinedStage"],
+        failures: List[BaseException],
+    ):
+        self.step = step
+        self.next_stage = next_stage
+        self.failures = failures
+        self.queues: List[queue.Queue] = [
+            queue.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self.threads: List[threading.Thread] = []
+
+    def start(self, parent_thread_id: int) -> None:
+        """Start the worker threads"""
+        for idx, worker_queue in enumerate(self.queues):
+            thread = threading.Thread(
+                target=self._work,
+                args=(worker_queue, parent_thread_id),
+                name=f"{self.step.name}-{idx}",
+                daemon=True,
+            )
+            thread.start()
+            self.threads.append(thread)
+
+    def put(self, key: Optional[Hashable], record: Entity) -> None:
+        """Send the record to the worker owning its ordering key"""
+        worker_queue = (
+            self.queues[hash(key) % len(self.queues)]
+            if key is not None
+            else self.queues[0]
+        )
+        worker_queue.put((key, record))
+
+    def join(self) -> None:
+        """Wait until all the records sent to this stage have been processed"""
+        for worker_queue in self.queues:
+            worker_queue.join()
+
+    def stop(self) -> None:
+        """Let the workers finish once they have drained their queues"""
+        for worker_queue in self.queues:
+            worker_queue.put(_STOP)
+        for thread in self.threads:
+            thread.join()
+
+    def _work(self, worker_queue: queue.Queue, parent_thread_id: int) -> None:
+        """Process the records of the queue until we get the stop signal"""
+        ExecutionTimeTrackerContextMap().copy_from_parent(parent_thread_id)
+
+        while True:
+            item = worker_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                # After a failure we just drain the queues to let the workflow stop
+                if not self.failures:
+                    key, record = item
+                    processed_record = self.step.run(record)
+                    if processed_record is not None and self.next_stage:
+                        self.next_stage.put(key, processed_record)
+            except BaseException as exc:  # pylint: disable=broad-except
+                logger.debug(traceback.format_exc())
+                logger.error(f"Error running step [{self.step.name}]: {exc}")
+                self.failures.append(exc)
+            finally:
+                worker_queue.task_done()
+
+
+class PipelinedExecution:
+    """
+    Runs the Source in the calling thread and every other step in its own stage.
+
+    Only the Sink gets `sink_workers` threads. Processors and Stages might keep state
+    between records, so they get a single worker each.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        steps: Sequence[Step],
+        sink_workers: int,
+        queue_size: int,
+    ):
+        self.source = source
+        self.failures: List[BaseException] = []
+
+        self.stages: List[PipelinedStage] = []
+        next_stage = None
+        for step in reversed(steps):
+            next_stage = PipelinedStage(
+                step=step,
+                workers=sink_workers if isinstance(step, Sink) else 1,
+                queue_size=queue_size,
+                next_stage=next_stage,
+                failures=self.failures,
+            )
+            self.stages.insert(0, next_stage)
+
+    def run(self) -> None:
+        """Feed the Source records to the pipeline until the Source is exhausted"""
+        if not self.stages:
+            for _ in self.source.run():
+                pass
+            return
+
+        parent_thread_id = threading.get_ident()
+        for stage in self.stages:
+            stage.start(parent_thread_id)
+
+        try:
+            for record in self.source.run():
+                if record is None:
+                    continue
+
+                key = self.source.get_record_ordering_key(record)
+                if key is None:
+                    self.wait_until_idle()
+                    self.stages[0].put(key, record)
+                    self.wait_until_idle()
+                else:
+                    self.stages[0].put(key, record)
+                    self._raise_on_failure()
+
+            self.wait_until_idle()
+        finally:
+            # Stages are stopped in order, so no worker sends records to a stopped stage
+            for stage in self.stages:
+                stage.stop()
+
+    def wait_until_idle(self) -> None:
+        """
+        Wait until every record sent to the pipeline has gone through all the steps.
+        Stages are joined in order, so once a stage is idle, nothing else will reach
+        the next ones.
+        """
+        for stage in self.stages:
+            stage.join()
+        self._raise_on_failure()
+
+    def _raise_on_failure(self) -> None:
+        """Propagate to the workflow any exception escaping a step"""
+        if self.failures:
+            raise self.failures[0]
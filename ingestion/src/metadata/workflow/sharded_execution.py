@@ -0,0 +1,148 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Sharded execution of the Metadata Workflow.
+
+The entities of the sharded topology nodes, e.g., the database schemas, are split
+across worker processes. The main process first runs the topology as the coordinator,
+sending the entities of the shared nodes above them, e.g., the service and databases,
+so that they exist before the workers need them.
+
+Each worker builds its own workflow from the configuration, with its own Source
+connection and OpenMetadata client, and processes the entities of its shard. Workers
+go through the shared nodes to build their context, without sending them again.
+
+Once all the workers finish, the main process merges their status, execution times,
+source state, post process state and trace spans, and runs the coordinator again: it
+owns none of the sharded entities and only runs the post processes that need the
+results of all the workers, e.g., the table constraints and marking the deleted entities.
+"""
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Type
+
+from pydantic import BaseModel
+
+from metadata.generated.schema.metadataIngestion.workflow import (
+    OpenMetadataWorkflowConfig,
+)
+from metadata.ingestion.api.status import Status
+from metadata.ingestion.models.topology import TopologyShard
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeMetrics,
+    ExecutionTimeTrackerState,
+)
+from metadata.utils.logger import ingestion_logger
+from metadata.utils.tracer import Tracer, TraceSpan
+
+if TYPE_CHECKING:
+    from metadata.workflow.ingestion import IngestionWorkflow
+
+logger = ingestion_logger()
+
+
+class ShardResult(BaseModel):
+    """Results of a worker process sent back to the main one"""
+
+    statuses: List[Status]
+    execution_times: Dict[str, ExecutionTimeMetrics]
+    source_state: Dict[str, Set[str]]
+    post_process_state: Dict[str, Any] = {}
+    spans: List[TraceSpan] = []
+
+
+def run_shard(
+    workflow_class: Type["IngestionWorkflow"],
+    config: OpenMetadataWorkflowConfig,
+    shard: TopologyShard,
+) -> ShardResult:
+    """Entrypoint of the worker processes"""
+    workflow = workflow_class(config)
+    try:
+        workflow.source.shard = shard
+        workflow.execute_internal()
+
+        return ShardResult(
+            statuses=[step.get_status() for step in workflow.workflow_steps()],
+            execution_times=ExecutionTimeTrackerState().snapshot(),
+            source_state=workflow.source.get_source_state(),
+            post_process_state=workflow.source.get_post_process_state(),
+            spans=Tracer().take_spans(),
+        )
+    finally:
+        workflow.stop()
+
+
+def _deduplicate(entries: List[Any]) -> List[Any]:
+    """Keep the first of the equal entries, in order"""
+    unique = {}
+    for entry in entries:
+        unique.setdefault(repr(entry), entry)
+    return list(unique.values())
+
+
+class ShardedExecution:
+    """
+    Runs the workflow in `processes` worker processes and then the coordinator in
+    the calling one, using the workflow Source and steps.
+    """
+
+    def __init__(self, workflow: "IngestionWorkflow", processes: int):
+        self.workflow = workflow
+        self.processes = processes
+
+    def run(self) -> None:
+        """Run the coordinator, the shards and the coordinator again"""
+        logger.info("Processing the entities shared by all the shards.")
+        self.workflow.source.shard = TopologyShard(count=self.processes)
+        self.workflow.execute_internal()
+        # The workers need the shared entities to be created
+        self.workflow.flush_steps()
+
+        # Forking a process with running threads - e.g., the status timer - is not safe.
+        # Each worker handles a single shard, so singletons don't leak between shards.
+        with multiprocessing.get_context("spawn").Pool(
+            processes=self.processes, maxtasksperchild=1
+        ) as pool:
+            results = [
+                pool.apply_async(
+                    run_shard,
+                    (
+                        type(self.workflow),
+                        self.workflow.config,
+                        TopologyShard(index=index, count=self.processes),
+                    ),
+                )
+                for index in range(self.processes)
+            ]
+            for result in results:
+                self.merge(result.get())
+
+        logger.info("All the shards finished. Running the post processes.")
+        self.workflow.source.shard = TopologyShard(
+            count=self.processes, workers_finished=True
+        )
+        self.workflow.execute_internal()
+
+        # All the processes go through the shared nodes, reporting the same entities
+        for step in self.workflow.workflow_steps():
+            status = step.get_status()
+            status.filtered = _deduplicate(status.filtered)
+            status.warnings = _deduplicate(status.warnings)
+            status.failures = _deduplicate(status.failures)
+
+    def merge(self, result: ShardResult) -> None:
+        """Add the results of a worker to the workflow"""
+        for step, status in zip(self.workflow.workflow_steps(), result.statuses):
+            step.get_status().merge(status)
+        ExecutionTimeTrackerState().merge(result.execution_times)
+        self.workflow.source.merge_source_state(result.source_state)
+        self.workflow.source.merge_post_process_state(result.post_process_state)
+        Tracer().merge(result.spans)
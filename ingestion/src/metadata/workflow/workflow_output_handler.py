@@ -23,9 +23,12 @@ from tabulate import tabulate
 from metadata.ingestion.api.status import TruncatedStackTraceError
 from metadata.ingestion.api.step import Step, Summary
 from metadata.ingestion.lineage.models import QueryParsingFailures
+from metadata.ingestion.ometa.entity_cache import EntityCacheStats
+from metadata.ingestion.ometa.rate_limiter import RateLimiterStats
 from metadata.utils.deprecation import deprecated
 from metadata.utils.execution_time_tracker import ExecutionTimeTracker
 from metadata.utils.helpers import pretty_print_time_duration
+from metadata.utils.json_codec import get_json_codec
 from metadata.utils.logger import ANSI, log_ansi_encoded_string
 from metadata.workflow.output_handler import (
     WorkflowType,
@@ -85,11 +88,13 @@ class WorkflowOutputHandler:
         steps: List[Step],
         start_time: Optional[Any] = None,
         debug: bool = False,
+        entity_cache_stats: Optional[EntityCacheStats] = None,
+        rate_limiter_stats: Optional[RateLimiterStats] = None,
     ):
         """
         Print the workflow results
         """
-        self.print_summary(steps, debug)
+        self.print_summary(steps, debug, entity_cache_stats, rate_limiter_stats)
 
         if start_time:
             log_ansi_encoded_string(
@@ -106,12 +111,21 @@ class WorkflowOutputHandler:
                 message=WORKFLOW_FAILURE_MESSAGE,
             )
 
-    def print_summary(self, steps: List[Step], debug: bool = False):
+    def print_summary(
+        self,
+        steps: List[Step],
+        debug: bool = False,
+        entity_cache_stats: Optional[EntityCacheStats] = None,
+        rate_limiter_stats: Optional[RateLimiterStats] = None,
+    ):
         """Prints the summary information for a Workflow Execution."""
         if debug:
             self._print_debug_summary(steps)
 
         self._print_execution_time_summary()
+        self._print_entity_cache_summary(entity_cache_stats)
+        self._print_json_codec_summary()
+        self._print_rate_limiter_summary(rate_limiter_stats)
 
         # In case of large query parsing error summary, this creates
         # issue of ingestion getting stuck and eventually killed.
@@ -179,12 +193,16 @@ class WorkflowOutputHandler:
             "Total Time": [],
             "Call Count": [],
             "Avg Time": [],
+            "P50 Time": [],
+            "P95 Time": [],
+            "P99 Time": [],
             "Min Time": [],
             "Max Time": [],
         }
 
-        for key in sorted(tracker.state.state.keys()):
-            metrics = tracker.state.state[key]
+        summary = tracker.get_summary()
+        for key in sorted(summary.keys()):
+            metrics = summary[key]
             summary_table["Context"].append(key)
             summary_table["Total Time"].append(
                 pretty_print_time_duration(metrics.total_time)
@@ -193,6 +211,11 @@ class WorkflowOutputHandler:
             summary_table["Avg Time"].append(
                 pretty_print_time_duration(metrics.average_time)
             )
+            for percentile in (50, 95, 99):
+                value = metrics.percentile(percentile)
+                summary_table[f"P{percentile} Time"].append(
+                    pretty_print_time_duration(value) if value is not None else "N/A"
+                )
             summary_table["Min Time"].append(
                 pretty_print_time_duration(metrics.min_time)
                 if metrics.min_time is not None
@@ -215,6 +238,59 @@ class WorkflowOutputHandler:
             message=f"\n{tabulate(summary_table, headers='keys', tablefmt='grid', colalign=col_align)}"
         )
 
+    def _print_entity_cache_summary(self, stats: Optional[EntityCacheStats]):
+        """Log the hits and misses of the entity cache."""
+        if not isinstance(stats, EntityCacheStats) or not stats.hits + stats.misses:
+            return
+
+        summary_table = {
+            "Hits": [stats.hits],
+            "Misses": [stats.misses],
+            "Hit Rate": [f"{stats.hit_rate:.1%}"],
+            "Invalidations": [stats.invalidations],
+            "Evictions": [stats.evictions],
+            "Size": [stats.size],
+        }
+        log_ansi_encoded_string(bold=True, message="Entity Cache Summary")
+        log_ansi_encoded_string(
+            message=f"\n{tabulate(summary_table, headers='keys', tablefmt='grid')}"
+        )
+
+    def _print_json_codec_summary(self):
+        """Log the payloads encoded and decoded by the JSON codec, and the time it took."""
+        stats = get_json_codec().stats()
+        if not stats.encoded + stats.decoded:
+            return
+
+        summary_table = {
+            "Codec": [stats.codec],
+            "Encoded": [stats.encoded],
+            "Encoded MB": [f"{stats.encoded_bytes / 1024**2:.2f}"],
+            "Encode Time": [pretty_print_time_duration(stats.encode_seconds)],
+            "Decoded": [stats.decoded],
+            "Decoded MB": [f"{stats.decoded_bytes / 1024**2:.2f}"],
+            "Decode Time": [pretty_print_time_duration(stats.decode_seconds)],
+        }
+        log_ansi_encoded_string(bold=True, message="JSON Codec Summary")
+        log_ansi_encoded_string(
+            message=f"\n{tabulate(summary_table, headers='keys', tablefmt='grid')}"
+        )
+
+    def _print_rate_limiter_summary(self, stats: Optional[RateLimiterStats]):
+        """Log the requests the rate limiter delayed, and for how long."""
+        if not isinstance(stats, RateLimiterStats) or not stats.requests:
+            return
+
+        summary_table = {
+            "Requests": [stats.requests],
+            "Delayed": [stats.delayed],
+            "Wait Time": [pretty_print_time_duration(stats.wait_seconds)],
+        }
+        log_ansi_encoded_string(bold=True, message="Rate Limiter Summary")
+        log_ansi_encoded_string(
+            message=f"\n{tabulate(summary_table, headers='keys', tablefmt='grid')}"
+        )
+
     def _print_query_parsing_issues(self):
         """Log the QueryParsingFailures Summary."""
         query_failures = QueryParsingFailures()
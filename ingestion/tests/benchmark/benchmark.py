@@ -0,0 +1,232 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Run the MetadataWorkflow over a synthetic service against the fake OpenMetadata
+server, and report its throughput and resource usage.
+
+    python -m ingestion.tests.benchmark.benchmark --databases 2 --schemas 4 --tables 250
+"""
+import argparse
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Type
+
+import psutil
+from pydantic import BaseModel
+
+from ingestion.tests.benchmark.fake_server import FakeOpenMetadataServer
+from ingestion.tests.benchmark.synthetic_source import (
+    BenchmarkScale,
+    SyntheticSqliteSource,
+    build_synthetic_service,
+)
+from metadata.ingestion.api.steps import Source
+from metadata.workflow.metadata import MetadataWorkflow
+
+# Seconds between the samples of the memory usage
+RSS_SAMPLE_SECONDS = 0.05
+
+
+class BenchmarkWorkflow(MetadataWorkflow):
+    """MetadataWorkflow ingesting the synthetic service"""
+
+    def import_source_class(self) -> Type[Source]:
+        return SyntheticSqliteSource
+
+
+class BenchmarkReport(BaseModel):
+    """
+    Results of a benchmark run. The CPU time and the peak RSS are the ones of the
+    whole process, including the fake server.
+    """
+
+    scale: BenchmarkScale
+    latency: float
+    entities: int
+    seconds: float
+    entities_per_second: float
+    cpu_seconds: float
+    peak_rss_mb: float
+    rest_calls: int
+    rest_calls_per_entity: float
+    rest_calls_by_endpoint: Dict[str, int]
+    failures: int
+
+
+class PeakRssSampler:
+    """Sample the RSS of the process in the background, keeping the highest one"""
+
+    def __init__(self):
+        self.process = psutil.Process()
+        self.peak = self.process.memory_info().rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(RSS_SAMPLE_SECONDS):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def __enter__(self) -> "PeakRssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def build_workflow_config(
+    server_url: str,
+    database_mode: Path,
+    threads: int,
+    workflow_config: Optional[dict] = None,
+) -> dict:
+    return {
+        "source": {
+            "type": "sqlite",
+            "serviceName": "benchmark",
+            "serviceConnection": {
+                "config": {
+                    "type": "SQLite",
+                    "databaseMode": str(database_mode),
+                    # The topology workers open connections closed by the main thread
+                    "connectionArguments": {"check_same_thread": False},
+                }
+            },
+            "sourceConfig": {
+                "config": {
+                    "type": "DatabaseMetadata",
+                    "threads": threads,
+                    "includeStoredProcedures": False,
+                }
+            },
+        },
+        "sink": {"type": "metadata-rest", "config": {}},
+        "workflowConfig": {
+            "loggerLevel": "ERROR",
+            "openMetadataServerConfig": {
+                "hostPort": server_url,
+                "authProvider": "openmetadata",
+                "securityConfig": {"jwtToken": "benchmark"},
+            },
+            **(workflow_config or {}),
+        },
+    }
+
+
+def run_benchmark(
+    scale: BenchmarkScale,
+    latency: float = 0.0,
+    threads: int = 1,
+    workflow_config: Optional[dict] = None,
+) -> BenchmarkReport:
+    """Ingest the synthetic service and measure the workflow run"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_mode = build_synthetic_service(Path(tmp_dir), scale)
+        with FakeOpenMetadataServer(latency=latency) as server:
+            workflow = BenchmarkWorkflow.create(
+                build_workflow_config(
+                    server.url, database_mode, threads, workflow_config
+                )
+            )
+            process = psutil.Process()
+            cpu_start = process.cpu_times()
+            start = time.perf_counter()
+            with PeakRssSampler() as sampler:
+                workflow.execute()
+            seconds = time.perf_counter() - start
+            cpu_end = process.cpu_times()
+            workflow.stop()
+
+            failures = sum(
+                len(step.get_status().failures) for step in workflow.workflow_steps()
+            ) + len(workflow.source.get_status().failures)
+            # Databases, schemas and tables, without the service
+            entities = server.entity_count - len(
+                server.entities["services/databaseServices"]
+            )
+            rest_calls = server.request_count
+
+    return BenchmarkReport(
+        scale=scale,
+        latency=latency,
+        entities=entities,
+        seconds=seconds,
+        entities_per_second=entities / seconds,
+        cpu_seconds=(cpu_end.user - cpu_start.user)
+        + (cpu_end.system - cpu_start.system),
+        peak_rss_mb=sampler.peak / 1024 / 1024,
+        rest_calls=rest_calls,
+        rest_calls_per_entity=rest_calls / max(entities, 1),
+        rest_calls_by_endpoint={
+            f"{method} {collection}": count
+            for (method, collection), count in sorted(server.requests.items())
+        },
+        failures=failures,
+    )
+
+
+def print_report(report: BenchmarkReport) -> None:
+    scale = report.scale
+    print(
+        f"Scale: {scale.databases} databases x {scale.schemas} schemas x"
+        f" {scale.tables} tables x {scale.columns} columns,"
+        f" {report.latency * 1000:.1f}ms of API latency"
+    )
+    print(f"Entities:              {report.entities} ({report.failures} failures)")
+    print(f"Wall time:             {report.seconds:.2f}s")
+    print(f"Entities/sec:          {report.entities_per_second:.1f}")
+    print(f"CPU time:              {report.cpu_seconds:.2f}s")
+    print(f"Peak RSS:              {report.peak_rss_mb:.1f}MB")
+    print(
+        f"REST calls per entity: {report.rest_calls_per_entity:.2f}"
+        f" ({report.rest_calls} calls)"
+    )
+    for endpoint, count in report.rest_calls_by_endpoint.items():
+        print(f"    {endpoint}: {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--databases", type=int, default=2)
+    parser.add_argument("--schemas", type=int, default=2)
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to each API request"
+    )
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(
+        scale=BenchmarkScale(
+            databases=args.databases,
+            schemas=args.schemas,
+            tables=args.tables,
+            columns=args.columns,
+        ),
+        latency=args.latency,
+        threads=args.threads,
+    )
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(report.model_dump(), indent=2), encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    main()
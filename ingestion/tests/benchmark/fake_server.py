@@ -0,0 +1,294 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+In-process stand-in for the OpenMetadata server, keeping the entities in memory.
+
+It implements what the metadata ingestion needs - create or update, bulk, get by
+name or id, list and patch - with an injectable latency per request, and counts
+the requests per method and collection.
+"""
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+import jsonpatch
+
+from metadata.__version__ import get_client_version
+from metadata.utils import fqn
+
+API_PREFIX = "/api/v1/"
+
+# Entity type of the collections, and the reference fields of their create requests
+ENTITY_TYPES = {
+    "services/databaseServices": "databaseService",
+    "databases": "database",
+    "databaseSchemas": "databaseSchema",
+    "tables": "table",
+    "storedProcedures": "storedProcedure",
+}
+PARENT_FIELDS = {
+    "service": "databaseService",
+    "database": "database",
+    "databaseSchema": "databaseSchema",
+}
+
+
+class FakeOpenMetadataServer:
+    """
+    Serve the OpenMetadata API from a background thread.
+
+    Example:
+
+        with FakeOpenMetadataServer(latency=0.005) as server:
+            OpenMetadataConnection(hostPort=server.url, ...)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests: Counter = Counter()
+        self.entities: Dict[str, Dict[str, Dict[str, Any]]] = {
+            collection: {} for collection in ENTITY_TYPES
+        }
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}/api"
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.requests.values())
+
+    @property
+    def entity_count(self) -> int:
+        return sum(len(entities) for entities in self.entities.values())
+
+    def start(self) -> "FakeOpenMetadataServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="FakeOpenMetadataServer",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeOpenMetadataServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(_Handler):
+            fake_server = server
+
+        return Handler
+
+    def get_collection(self, path: str) -> Tuple[Optional[str], str]:
+        """Split the path in the collection and the rest, e.g., `name/{fqn}`"""
+        for collection in ENTITY_TYPES:
+            if path == collection or path.startswith(f"{collection}/"):
+                return collection, path[len(collection) + 1 :]
+        return None, path
+
+    def create_or_update(
+        self, collection: str, request: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Build the entity from its create request, keeping the id of existing ones"""
+        entity = dict(request)
+        parents = []
+        for field, entity_type in PARENT_FIELDS.items():
+            if isinstance(entity.get(field), str):
+                parent_fqn = entity[field]
+                entity[field] = self.get_reference(entity_type, parent_fqn)
+                parents = fqn.split(parent_fqn)
+        entity_fqn = fqn._build(
+            *parents, entity["name"]
+        )  # pylint: disable=protected-access
+
+        with self.lock:
+            existing = self.entities[collection].get(entity_fqn)
+            entity.update(
+                id=existing["id"] if existing else str(uuid.uuid4()),
+                fullyQualifiedName=entity_fqn,
+                version=existing["version"] + 0.1 if existing else 0.1,
+            )
+            self.entities[collection][entity_fqn] = entity
+        return (HTTPStatus.OK if existing else HTTPStatus.CREATED), entity
+
+    def get_reference(self, entity_type: str, entity_fqn: str) -> Dict[str, Any]:
+        collection = next(
+            key for key, value in ENTITY_TYPES.items() if value == entity_type
+        )
+        entity = self.entities[collection].get(entity_fqn, {})
+        return {
+            "id": entity.get("id", str(uuid.uuid4())),
+            "type": entity_type,
+            "name": fqn.split(entity_fqn)[-1],
+            "fullyQualifiedName": entity_fqn,
+        }
+
+    def find(self, collection: str, key: str) -> Optional[Dict[str, Any]]:
+        """Find the entity by `name/{fqn}` or `{id}`"""
+        if key.startswith("name/"):
+            return self.entities[collection].get(unquote(key[len("name/") :]))
+        return next(
+            (
+                entity
+                for entity in self.entities[collection].values()
+                if entity["id"] == key
+            ),
+            None,
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Route the requests to the entities of the fake server"""
+
+    fake_server: FakeOpenMetadataServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the benchmark output clean"""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._handle("GET")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        self._handle("PUT")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self._handle("POST")
+
+    def do_PATCH(self):  # pylint: disable=invalid-name
+        self._handle("PATCH")
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        self._handle("DELETE")
+
+    def _handle(self, method: str) -> None:
+        url = urlparse(self.path)
+        path = (
+            url.path[len(API_PREFIX) :] if url.path.startswith(API_PREFIX) else url.path
+        )
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        server = self.fake_server
+        collection, rest = server.get_collection(path)
+        with server.lock:
+            server.requests[(method, collection or path.split("/")[0])] += 1
+        if server.latency:
+            time.sleep(server.latency)
+
+        status, response = self._route(method, collection, rest, path, params, body)
+        content = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _route(  # pylint: disable=too-many-arguments,too-many-return-statements
+        self,
+        method: str,
+        collection: Optional[str],
+        rest: str,
+        path: str,
+        params: Dict[str, str],
+        body: Any,
+    ) -> Tuple[int, Any]:
+        server = self.fake_server
+        if path == "system/version":
+            return HTTPStatus.OK, {"version": get_client_version()}
+        if path == "search/query":
+            return HTTPStatus.OK, {"hits": {"total": {"value": 0}, "hits": []}}
+        if collection is None:
+            return _not_found(path)
+
+        if method in ("PUT", "POST") and rest == "bulk":
+            for request in body:
+                server.create_or_update(collection, request)
+            return HTTPStatus.OK, {
+                "status": "success",
+                "numberOfRowsProcessed": len(body),
+                "numberOfRowsPassed": len(body),
+                "numberOfRowsFailed": 0,
+                "successRequest": [
+                    {"request": request["name"], "message": "Success", "status": 200}
+                    for request in body
+                ],
+            }
+        if method in ("PUT", "POST") and not rest:
+            return server.create_or_update(collection, body)
+
+        if method == "GET" and not rest:
+            return HTTPStatus.OK, self._list(collection, params)
+
+        entity = server.find(collection, rest)
+        if entity is None:
+            return _not_found(path)
+        if method == "GET":
+            return HTTPStatus.OK, entity
+        if method == "PATCH":
+            with server.lock:
+                patched = jsonpatch.apply_patch(entity, body)
+                server.entities[collection][patched["fullyQualifiedName"]] = patched
+            return HTTPStatus.OK, patched
+        if method == "DELETE":
+            with server.lock:
+                server.entities[collection].pop(entity["fullyQualifiedName"], None)
+            return HTTPStatus.OK, entity
+        return _not_found(path)
+
+    def _list(self, collection: str, params: Dict[str, str]) -> Dict[str, Any]:
+        """List the children of the `service`, `database` or `databaseSchema` param"""
+        entities = [
+            entity
+            for entity in self.fake_server.entities[collection].values()
+            if all(
+                (entity.get(field) or {}).get("fullyQualifiedName") == params[field]
+                for field in PARENT_FIELDS
+                if field in params
+            )
+        ]
+        offset = int(params.get("after") or 0)
+        limit = int(params.get("limit") or 10)
+        page = entities[offset : offset + limit]
+        paging = {"total": len(entities)}
+        if offset + limit < len(entities):
+            paging["after"] = str(offset + limit)
+        return {"data": page, "paging": paging}
+
+
+def _not_found(path: str) -> Tuple[int, Dict[str, Any]]:
+    return HTTPStatus.NOT_FOUND, {
+        "code": HTTPStatus.NOT_FOUND,
+        "message": f"Entity not found for [{path}]",
+    }
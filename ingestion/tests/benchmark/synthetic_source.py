@@ -0,0 +1,117 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Synthetic database source for the ingestion benchmarks.
+
+Each database is a directory with an SQLite file per schema, attached to the
+connection of the database. Schemas hold `tables` tables with `columns` columns.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from pydantic import BaseModel, Field
+from sqlalchemy.event import listen
+
+from metadata.ingestion.source.connections import get_connection
+from metadata.ingestion.source.database.sqlite.metadata import SqliteSource
+
+# File of each database the connection is opened with. Schemas are attached to it.
+MAIN_DATABASE_FILE = "main.sqlite"
+
+# SQLite can only attach 10 databases to a connection by default
+MAX_SCHEMAS = 10
+
+COLUMN_TYPES = ("INTEGER", "VARCHAR(255)", "NUMERIC(10, 2)", "TIMESTAMP", "TEXT")
+
+
+class BenchmarkScale(BaseModel):
+    """Size of the synthetic service"""
+
+    databases: int = Field(2, ge=1)
+    schemas: int = Field(2, ge=1, le=MAX_SCHEMAS)
+    tables: int = Field(10, ge=1)
+    columns: int = Field(10, ge=1)
+
+    @property
+    def entities(self) -> int:
+        """Databases, schemas and tables to ingest"""
+        return self.databases * (1 + self.schemas * (1 + self.tables))
+
+
+def build_synthetic_service(directory: Path, scale: BenchmarkScale) -> Path:
+    """
+    Create the SQLite files of the service. Returns the main file to use as the
+    `databaseMode` of the SQLite connection.
+    """
+    sqlite3.connect(directory / MAIN_DATABASE_FILE).close()
+    for database in range(scale.databases):
+        database_directory = directory / f"database_{database}"
+        database_directory.mkdir(parents=True, exist_ok=True)
+        sqlite3.connect(database_directory / MAIN_DATABASE_FILE).close()
+
+        for schema in range(scale.schemas):
+            with sqlite3.connect(
+                database_directory / f"schema_{schema}.sqlite"
+            ) as conn:
+                for table in range(scale.tables):
+                    columns = ", ".join(
+                        f"column_{column} {COLUMN_TYPES[column % len(COLUMN_TYPES)]}"
+                        + (" PRIMARY KEY" if column == 0 else "")
+                        for column in range(scale.columns)
+                    )
+                    conn.execute(f"CREATE TABLE table_{table} ({columns})")
+    return directory / MAIN_DATABASE_FILE
+
+
+def _attach_schemas(database_directory: Path, dbapi_connection, _) -> None:
+    """Attach the schema files to each new connection of the database"""
+    for schema_file in sorted(database_directory.glob("schema_*.sqlite")):
+        dbapi_connection.execute(
+            f"ATTACH DATABASE '{schema_file}' AS \"{schema_file.stem}\""
+        )
+
+
+class SyntheticSqliteSource(SqliteSource):
+    """SQLite source listing the databases and schemas of the synthetic service"""
+
+    @property
+    def service_directory(self) -> Path:
+        return Path(self.service_connection.databaseMode).parent
+
+    def test_connection(self) -> None:
+        """The fake server has no test connection definitions"""
+
+    def get_database_names(self) -> Iterable[str]:
+        for database_directory in sorted(self.service_directory.glob("database_*")):
+            self.set_inspector(database_directory.name)
+            yield database_directory.name
+
+    def set_inspector(self, database_name: str) -> None:
+        database_directory = self.service_directory / database_name
+        self.engine.dispose()
+        self.engine = get_connection(
+            self.service_connection.model_copy(
+                update={"databaseMode": str(database_directory / MAIN_DATABASE_FILE)}
+            )
+        )
+        listen(
+            self.engine,
+            "connect",
+            lambda *args: _attach_schemas(database_directory, *args),
+        )
+        self._connection_map = {}
+        self._inspector_map = {}
+
+    def get_raw_database_schema_names(self) -> Iterable[str]:
+        for schema_name in self.inspector.get_schema_names():
+            if schema_name != "main":
+                yield schema_name
@@ -0,0 +1,42 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Run the ingestion benchmark scenarios and check them against the manifest"""
+from pathlib import Path
+from unittest import TestCase
+
+import yaml
+
+from ingestion.tests.benchmark.benchmark import print_report, run_benchmark
+from ingestion.tests.benchmark.synthetic_source import BenchmarkScale
+
+
+class TestIngestionBenchmark(TestCase):
+    """Ingest each scenario of the manifest against the fake server"""
+
+    def test_scenarios(self):
+        """All the entities are ingested within the thresholds"""
+        manifest_file = Path(__file__).parent.joinpath("manifest.yaml")
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = yaml.safe_load(f)
+
+        for name, scenario in manifest.items():
+            with self.subTest(scenario=name):
+                scale = BenchmarkScale(**scenario["scale"])
+                report = run_benchmark(scale=scale, threads=scenario["threads"])
+                print_report(report)
+
+                self.assertEqual(report.failures, 0)
+                self.assertEqual(report.entities, scale.entities)
+                self.assertLessEqual(
+                    report.rest_calls_per_entity,
+                    scenario["rest_calls_per_entity"],
+                    msg=f"REST calls per entity for {name} are greater than threshold",
+                )
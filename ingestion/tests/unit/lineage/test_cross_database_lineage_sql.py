@@ -28,9 +28,11 @@ from metadata.generated.schema.metadataIngestion.parserconfig.queryParserConfig
 from metadata.generated.schema.type.entityReference import EntityReference
 from metadata.ingestion.lineage.models import Dialect
 from metadata.ingestion.lineage.sql_lineage import (
+    database_service_type_cache,
     get_lineage_by_query,
     get_lineage_via_table_entity,
     get_table_entities_from_query,
+    search_cache,
     search_table_entities,
 )
 from metadata.ingestion.source.database.lineage_processors import (
@@ -52,6 +54,9 @@ class CrossDatabaseLineageSQLTest(TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_metadata = MagicMock()
+        # The lookups of other tests must not leak into the mocked ones
+        search_cache.clear()
+        database_service_type_cache.clear()
 
         # Create mock tables
         self.mock_table1 = Table(
@@ -0,0 +1,200 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Check the structural diff generates the same patches as comparing the whole JSON
+"""
+import json
+import uuid
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+import jsonpatch
+
+from metadata.generated.schema.entity.data.table import (
+    Column,
+    ConstraintType,
+    DataType,
+    Table,
+    TableConstraint,
+)
+from metadata.generated.schema.type.basic import Markdown
+from metadata.generated.schema.type.entityLineage import ColumnLineage, LineageDetails
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.generated.schema.type.tagLabel import (
+    LabelType,
+    State,
+    TagLabel,
+    TagSource,
+)
+from metadata.ingestion.models.patch_diff import diff_documents
+from metadata.ingestion.models.patch_request import (
+    ALLOWED_COMMON_PATCH_FIELDS,
+    ARRAY_ENTITY_FIELDS,
+    _sort_array_entity_fields,
+    build_patch,
+)
+
+
+def _tag(fqn: str) -> TagLabel:
+    return TagLabel(
+        tagFQN=fqn,
+        labelType=LabelType.Automated,
+        state=State.Suggested,
+        source=TagSource.Classification,
+    )
+
+
+def _columns(count: int) -> List[Column]:
+    return [
+        Column(
+            name=f"col{idx}",
+            dataType=DataType.INT,
+            description=f"Column {idx}",
+            tags=[_tag("PII.Sensitive")] if idx % 3 == 0 else [],
+        )
+        for idx in range(count)
+    ]
+
+
+def _table(columns: List[Column], **kwargs) -> Table:
+    table = Table(
+        id=uuid.UUID(int=1),
+        name="table",
+        fullyQualifiedName="service.db.schema.table",
+        columns=columns,
+        **kwargs,
+    )
+    # Like the tables we get from the server
+    return Table.model_validate_json(table.model_dump_json())
+
+
+class PatchDiffTest(TestCase):
+    """The operations match the ones of the JSON documents"""
+
+    def assert_same_patch(self, source, destination, include=None):
+        _sort_array_entity_fields(source, destination, ARRAY_ENTITY_FIELDS)
+        expected = jsonpatch.make_patch(
+            json.loads(source.model_dump_json(include=include)),
+            json.loads(destination.model_dump_json(include=include)),
+        )
+        documents = diff_documents(source, destination, include=include)
+
+        self.assertTrue(expected.patch)
+        self.assertEqual(jsonpatch.make_patch(*documents).patch, expected.patch)
+        return documents
+
+    def test_equal_entities(self):
+        source = _table(_columns(10))
+        destination = source.model_copy(update={"columns": _columns(10)})
+        _sort_array_entity_fields(source, destination, ARRAY_ENTITY_FIELDS)
+
+        self.assertIsNone(
+            diff_documents(source, destination, include=ALLOWED_COMMON_PATCH_FIELDS)
+        )
+
+    def test_only_changed_columns_are_dumped(self):
+        source = _table(_columns(10), description="Table")
+        columns = _columns(10)
+        columns[4] = columns[4].model_copy(
+            update={"dataType": DataType.STRING, "description": Markdown("New")}
+        )
+        destination = source.model_copy(update={"columns": columns})
+
+        source_doc, destination_doc = self.assert_same_patch(
+            source, destination, ALLOWED_COMMON_PATCH_FIELDS
+        )
+        self.assertEqual(list(source_doc), ["columns"])
+        self.assertEqual(source_doc["columns"][3], [3])
+        self.assertEqual(
+            destination_doc["columns"][4],
+            {"name": "col4", "dataType": "STRING", "description": "New"},
+        )
+
+    def test_added_and_removed_columns(self):
+        source = _table(_columns(6))
+        columns = _columns(6)
+        del columns[2]
+        columns.append(Column(name="new", dataType=DataType.BOOLEAN))
+        destination = source.model_copy(update={"columns": columns})
+
+        self.assert_same_patch(source, destination, ALLOWED_COMMON_PATCH_FIELDS)
+
+    def test_tags_moved_between_columns(self):
+        source = _table(_columns(6), tags=[_tag("Tier.Tier1")])
+        columns = _columns(6)
+        columns[0] = columns[0].model_copy(update={"tags": []})
+        columns[4] = columns[4].model_copy(
+            update={"tags": [_tag("Tier.Tier1"), _tag("PII.Sensitive")]}
+        )
+        destination = source.model_copy(update={"columns": columns, "tags": []})
+
+        self.assert_same_patch(source, destination)
+
+    def test_arrays_without_keys(self):
+        source = _table(
+            _columns(3),
+            tableConstraints=[
+                TableConstraint(
+                    constraintType=ConstraintType.PRIMARY_KEY, columns=["col0"]
+                )
+            ],
+        )
+        destination = source.model_copy(
+            update={
+                "tableConstraints": [
+                    TableConstraint(
+                        constraintType=ConstraintType.UNIQUE, columns=["col1"]
+                    ),
+                    TableConstraint(
+                        constraintType=ConstraintType.PRIMARY_KEY, columns=["col0"]
+                    ),
+                ]
+            }
+        )
+
+        self.assert_same_patch(source, destination, ALLOWED_COMMON_PATCH_FIELDS)
+
+    def test_lineage_details(self):
+        source = LineageDetails(
+            columnsLineage=[
+                ColumnLineage(fromColumns=["a.b.c.t.x"], toColumn="a.b.c.v.x")
+            ]
+        )
+        destination = LineageDetails(
+            columnsLineage=[
+                ColumnLineage(fromColumns=["a.b.c.t.x"], toColumn="a.b.c.v.x"),
+                ColumnLineage(fromColumns=["a.b.c.t.y"], toColumn="a.b.c.v.y"),
+            ],
+            pipeline=EntityReference(id=uuid.UUID(int=2), type="pipeline"),
+        )
+
+        self.assert_same_patch(
+            source, destination, {"columnsLineage": True, "pipeline": True}
+        )
+
+    def test_build_patch_skips_equal_entities(self):
+        source = _table(_columns(3))
+        destination = source.model_copy(update={"columns": _columns(3)})
+
+        with patch(
+            "metadata.ingestion.models.patch_request.jsonpatch.make_patch"
+        ) as mock_make_patch:
+            self.assertIsNone(
+                build_patch(
+                    source,
+                    destination,
+                    allowed_fields=ALLOWED_COMMON_PATCH_FIELDS,
+                    array_entity_fields=ARRAY_ENTITY_FIELDS,
+                )
+            )
+            mock_make_patch.assert_not_called()
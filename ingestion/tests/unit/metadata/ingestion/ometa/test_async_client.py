@@ -0,0 +1,244 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the async REST client and the AsyncOpenMetadata bridge"""
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+import pytest
+
+from metadata.__version__ import get_client_version
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.security.client.openMetadataJWTClientConfig import (
+    OpenMetadataJWTClientConfig,
+)
+from metadata.ingestion.ometa.async_client import AsyncREST
+from metadata.ingestion.ometa.async_ometa_api import (
+    AsyncOpenMetadata,
+    await_coroutine,
+    run_sync,
+)
+from metadata.ingestion.ometa.client import APIError, ClientConfig
+from metadata.ingestion.ometa.rate_limiter import RateLimit, RateLimiter
+from metadata.utils.execution_time_tracker import ExecutionTimeTracker
+from metadata.utils.tracer import Tracer
+
+
+def _table(name: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "name": name,
+        "fullyQualifiedName": f"svc.db.schema.{name}",
+        "columns": [],
+    }
+
+
+async def _handler(request: httpx.Request) -> httpx.Response:
+    """Stand-in for the server, answering after a delay"""
+    await asyncio.sleep(0.1)
+    path = request.url.path
+    if path == "/api/v1/system/version":
+        return httpx.Response(200, json={"version": get_client_version()})
+    if path.startswith("/api/v1/tables/name/"):
+        name = path.split(".")[-1]
+        if name == "missing":
+            return httpx.Response(404, json={"code": 404, "message": "not found"})
+        return httpx.Response(200, json=_table(name))
+    if path == "/api/v1/tables":
+        after = int(request.url.params.get("after", "0"))
+        paging = {"total": 5}
+        if after + 2 < 5:
+            paging["after"] = str(after + 2)
+        tables = [_table(f"t{i}") for i in range(after, min(after + 2, 5))]
+        return httpx.Response(200, json={"data": tables, "paging": paging})
+    if request.method == "PUT":
+        return httpx.Response(200, json=json.loads(request.content))
+    return httpx.Response(404, json={"code": 404, "message": "not found"})
+
+
+@pytest.fixture
+def client_config():
+    return ClientConfig(
+        base_url="http://localhost:8585/api",
+        api_version="v1",
+        auth_token=lambda: ("test_token", 3600),
+        auth_header="Authorization",
+        retry_wait=0,
+    )
+
+
+@pytest.fixture
+def metadata_config():
+    return OpenMetadataConnection(
+        hostPort="http://localhost:8585/api",
+        authProvider="openmetadata",
+        securityConfig=OpenMetadataJWTClientConfig(jwtToken="token"),
+    )
+
+
+def test_requests_run_concurrently(client_config):
+    """Requests share the event loop instead of waiting for each other"""
+
+    async def run():
+        async with AsyncREST(
+            client_config, transport=httpx.MockTransport(_handler)
+        ) as client:
+            start = time.perf_counter()
+            tables = await asyncio.gather(
+                *(client.get(f"/tables/name/svc.db.schema.t{i}") for i in range(20))
+            )
+            return tables, time.perf_counter() - start
+
+    tables, elapsed = asyncio.run(run())
+
+    assert [table["name"] for table in tables] == [f"t{i}" for i in range(20)]
+    assert elapsed < 1
+
+
+def test_headers_and_body(client_config):
+    """The request is prepared as in the sync client"""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "123"})
+
+    async def run():
+        async with AsyncREST(
+            client_config, transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.put("/tables", data='{"name": "t"}')
+
+    assert asyncio.run(run()) == {"id": "123"}
+    assert requests[0].headers["Authorization"] == "Bearer test_token"
+    assert requests[0].headers["Content-type"] == "application/json"
+    assert requests[0].content == b'{"name": "t"}'
+
+
+def test_errors(client_config):
+    """API errors keep their status code, and retry codes are retried"""
+    attempts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v1/retry":
+            attempts.append(request)
+            return httpx.Response(504 if len(attempts) == 1 else 200, json={})
+        return await _handler(request)
+
+    async def run():
+        async with AsyncREST(
+            client_config, transport=httpx.MockTransport(handler)
+        ) as client:
+            with pytest.raises(APIError) as error:
+                await client.get("/tables/name/svc.db.schema.missing")
+            assert error.value.status_code == 404
+            assert await client.get("/retry") == {}
+
+    asyncio.run(run())
+    assert len(attempts) == 2
+
+
+def test_requests_are_rate_limited(client_config):
+    """Requests wait for the limiter without blocking the event loop"""
+
+    async def run():
+        async with AsyncREST(
+            client_config, transport=httpx.MockTransport(_handler)
+        ) as client:
+            client.rate_limiter = RateLimiter(limit=RateLimit(max_in_flight=2))
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(client.get(f"/tables/name/svc.db.schema.t{i}") for i in range(6))
+            )
+            return client.rate_limiter.stats(), time.perf_counter() - start
+
+    stats, elapsed = asyncio.run(run())
+
+    assert elapsed >= 0.3
+    assert (stats.requests, stats.delayed) == (6, 4)
+
+
+def test_run_sync():
+    """Sync code awaits through the bridge, and raises outside of it"""
+
+    def sync_code(value):
+        return await_coroutine(asyncio.sleep(0.01, result=value))
+
+    async def run():
+        return await asyncio.gather(*(run_sync(sync_code, i) for i in range(3)))
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+    with pytest.raises(RuntimeError):
+        sync_code(0)
+
+
+def test_run_sync_is_not_tracked():
+    """The greenlets interleave, so their execution times and spans would nest"""
+
+    def sync_code():
+        return ExecutionTimeTracker().enabled, Tracer().enabled
+
+    ExecutionTimeTracker(enabled=True)
+    Tracer().enable()
+    try:
+        assert asyncio.run(run_sync(sync_code)) == (False, False)
+        assert ExecutionTimeTracker().enabled and Tracer().enabled
+    finally:
+        ExecutionTimeTracker(enabled=False)
+        Tracer().enabled = False
+
+
+def test_async_open_metadata(metadata_config):
+    """The mixin methods are coroutines, and the generators async generators"""
+
+    async def run():
+        async with AsyncOpenMetadata(
+            metadata_config, transport=httpx.MockTransport(_handler)
+        ) as metadata:
+            tables = await asyncio.gather(
+                *(
+                    metadata.get_by_name(entity=Table, fqn=f"svc.db.schema.t{i}")
+                    for i in range(10)
+                ),
+                metadata.get_by_name(entity=Table, fqn="svc.db.schema.missing"),
+            )
+            listed = [table async for table in metadata.list_all_entities(entity=Table)]
+            return tables, listed
+
+    tables, listed = asyncio.run(run())
+
+    assert [table.name.root for table in tables[:-1]] == [f"t{i}" for i in range(10)]
+    assert tables[-1] is None
+    assert [table.name.root for table in listed] == [f"t{i}" for i in range(5)]
+
+
+def test_bridged_client_shares_the_rate_limiter(metadata_config):
+    """The sync mixins send their requests with the async client and its limiter"""
+
+    async def run():
+        async with AsyncOpenMetadata(
+            metadata_config, transport=httpx.MockTransport(_handler)
+        ) as metadata:
+            await metadata.enable_rate_limit(RateLimit(requests_per_second=1000))
+            await metadata.get_by_name(entity=Table, fqn="svc.db.schema.t0")
+            return metadata
+
+    metadata = asyncio.run(run())
+
+    assert not hasattr(metadata.metadata.client, "_session")
+    assert metadata.client.rate_limiter is metadata.metadata.client.rate_limiter
+    assert metadata.client.rate_limiter.stats().requests == 1
@@ -0,0 +1,129 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the read-through entity cache"""
+import json
+import time
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.security.client.openMetadataJWTClientConfig import (
+    OpenMetadataJWTClientConfig,
+)
+from metadata.ingestion.ometa.entity_cache import EntityCache
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+
+TABLE_ID = str(uuid.uuid4())
+TABLE_FQN = "svc.db.schema.table"
+TABLE = Table(id=TABLE_ID, name="table", fullyQualifiedName=TABLE_FQN, columns=[])
+
+
+def _response(body) -> Mock:
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(body).encode()
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def metadata():
+    metadata = OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api",
+            authProvider="openmetadata",
+            securityConfig=OpenMetadataJWTClientConfig(jwtToken="token"),
+            enableVersionValidation=False,
+        )
+    )
+    metadata.enable_entity_cache(max_size=10, ttl_seconds=60)
+    return metadata
+
+
+def test_lru_and_ttl():
+    """Least recently used entries are evicted first, and expired ones are misses"""
+    cache = EntityCache(max_size=2, ttl_seconds=60)
+    keys = [EntityCache.key("/tables", f"name/{i}", None, None) for i in range(3)]
+    for key in keys[:2]:
+        cache.put(key, TABLE)
+    cache.get(keys[0])
+    cache.put(keys[2], TABLE)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == TABLE
+    assert cache.stats().evictions == 1
+
+    cache = EntityCache(max_size=2, ttl_seconds=0.01)
+    cache.put(keys[0], TABLE)
+    time.sleep(0.02)
+    assert cache.get(keys[0]) is None
+
+
+def test_fields_are_sorted():
+    """The order of the fields does not matter"""
+    assert EntityCache.key("/tables", "x", ["tags", "owners"], None) == (
+        EntityCache.key("/tables", "x", ["owners", "tags"], None)
+    )
+
+
+def test_invalidate_write():
+    """Writes invalidate the entity by id or FQN, and bulk writes the collection"""
+    cache = EntityCache(max_size=10, ttl_seconds=60)
+    by_name = EntityCache.key("/tables", f"name/{TABLE_FQN}", ["tags"], None)
+    by_id = EntityCache.key("/tables", TABLE_ID, None, None)
+
+    for path, response in (
+        (f"/tables/{TABLE_ID}", None),
+        ("/tables", {"id": TABLE_ID, "fullyQualifiedName": TABLE_FQN}),
+        (f"/tables/name/{TABLE_FQN}/followers", None),
+        ("/tables/bulk?async=false", {"status": "success"}),
+    ):
+        cache.put(by_name, TABLE)
+        cache.put(by_id, TABLE)
+        cache.invalidate_write(path, response)
+        assert cache.stats().size == 0, path
+
+    cache.put(by_id, TABLE)
+    cache.invalidate_write("/databases/name/other", None)
+    assert cache.stats().size == 1
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_get_is_cached(mock_request, metadata):
+    """The second lookup is a hit, returning a copy of the cached entity"""
+    mock_request.return_value = _response(TABLE.model_dump(mode="json"))
+
+    first = metadata.get_by_name(entity=Table, fqn=TABLE_FQN, fields=["tags"])
+    second = metadata.get_by_name(entity=Table, fqn=TABLE_FQN, fields=["tags"])
+
+    assert mock_request.call_count == 1
+    assert first == second
+    assert first is not second
+    stats = metadata.entity_cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_write_invalidates(mock_request, metadata):
+    """Patching the entity through the client drops it from the cache"""
+    mock_request.return_value = _response(TABLE.model_dump(mode="json"))
+    metadata.get_by_id(entity=Table, entity_id=TABLE_ID)
+
+    metadata.client.patch(f"/tables/{TABLE_ID}", data="[]")
+    metadata.get_by_id(entity=Table, entity_id=TABLE_ID)
+
+    assert mock_request.call_count == 3
+    assert metadata.entity_cache.stats().invalidations == 1
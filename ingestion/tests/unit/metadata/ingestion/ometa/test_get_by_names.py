@@ -0,0 +1,139 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the batched FQN resolution"""
+import json
+import uuid
+from unittest.mock import patch
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+import requests
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.security.client.openMetadataJWTClientConfig import (
+    OpenMetadataJWTClientConfig,
+)
+from metadata.ingestion.ometa.mixins.es_mixin import _wildcard_regex
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+
+TABLES = [f"svc.db.schema.t{idx}" for idx in range(5)] + ["svc.db.other.t1"]
+
+
+def _response(status_code: int, body: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    content = json.dumps(body).encode("utf-8")
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def _server(_, url, **__) -> requests.Response:
+    """Tables by name, and a search index of their FQNs"""
+    parsed = urlparse(url)
+    if parsed.path.endswith("/search/query"):
+        query_filter = json.loads(parse_qs(parsed.query)["query_filter"][0])
+        patterns = [
+            _wildcard_regex(clause["wildcard"]["fullyQualifiedName"]["value"])
+            for clause in query_filter["query"]["bool"]["should"]
+        ]
+        hits = [
+            {
+                "_index": "table_search_index",
+                "_id": fqn,
+                "_source": {"fullyQualifiedName": fqn},
+            }
+            for fqn in TABLES
+            if any(pattern.fullmatch(fqn) for pattern in patterns)
+        ]
+        return _response(
+            200,
+            {"hits": {"total": {"relation": "eq", "value": len(hits)}, "hits": hits}},
+        )
+
+    fqn = unquote(parsed.path.split("/tables/name/", 1)[1])
+    if fqn not in TABLES:
+        return _response(404, {"code": 404, "message": f"{fqn} not found"})
+    return _response(
+        200,
+        {
+            "id": str(uuid.uuid4()),
+            "name": fqn.rsplit(".", 1)[1],
+            "fullyQualifiedName": fqn,
+            "columns": [],
+        },
+    )
+
+
+@pytest.fixture
+def metadata():
+    return OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api",
+            authProvider="openmetadata",
+            securityConfig=OpenMetadataJWTClientConfig(jwtToken="token"),
+            enableVersionValidation=False,
+        )
+    )
+
+
+def test_wildcard_regex():
+    assert _wildcard_regex("svc.*.schema.t?").fullmatch("svc.DB.Schema.T1")
+    assert not _wildcard_regex("svc.*.schema.t?").fullmatch("svc.db.schema.t10")
+    assert _wildcard_regex(r"svc.db.schema.t\*").fullmatch("svc.db.schema.t*")
+    assert not _wildcard_regex(r"svc.db.schema.t\*").fullmatch("svc.db.schema.t1")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_get_by_names(mock_request, metadata, workers):
+    """Each FQN is fetched once, and the missing ones are None"""
+    mock_request.side_effect = _server
+    metadata.batch_read_workers = workers
+    fqns = ["svc.db.schema.t3", "svc.db.schema.missing", "svc.db.schema.t0"] * 2
+
+    tables = metadata.get_by_names(entity=Table, fqns=fqns)
+
+    assert list(tables) == fqns[:3]
+    assert tables["svc.db.schema.t3"].fullyQualifiedName.root == "svc.db.schema.t3"
+    assert tables["svc.db.schema.t0"].fullyQualifiedName.root == "svc.db.schema.t0"
+    assert tables["svc.db.schema.missing"] is None
+    assert mock_request.call_count == 3
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_es_search_from_fqns(mock_request, metadata):
+    """The search strings share the search requests"""
+    mock_request.side_effect = _server
+    metadata.fqn_search_batch_size = 2
+
+    tables = metadata.es_search_from_fqns(
+        entity_type=Table,
+        fqn_search_strings=["svc.*.*.t1", "svc.db.schema.t2", "svc.db.*.missing"],
+    )
+
+    assert {
+        search_string: [table.fullyQualifiedName.root for table in found or []]
+        for search_string, found in tables.items()
+    } == {
+        "svc.*.*.t1": ["svc.db.schema.t1", "svc.db.other.t1"],
+        "svc.db.schema.t2": ["svc.db.schema.t2"],
+        "svc.db.*.missing": [],
+    }
+    assert tables["svc.db.*.missing"] is None
+    searches = [
+        call for call in mock_request.call_args_list if "/search/" in call.args[1]
+    ]
+    assert len(searches) == 2
+    # One request per table found
+    assert mock_request.call_count == 2 + 3
@@ -0,0 +1,112 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the prefetched pagination of the entities"""
+import json
+import uuid
+from unittest.mock import Mock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
+    OpenMetadataConnection,
+)
+from metadata.generated.schema.security.client.openMetadataJWTClientConfig import (
+    OpenMetadataJWTClientConfig,
+)
+from metadata.ingestion.ometa.ometa_api import OpenMetadata
+
+PAGES = 4
+
+
+def _list_tables(_, url, params=None, **__) -> Mock:
+    """Pages of 2 tables of the database given in the params"""
+    query = parse_qs(urlparse(url).query)
+    after = int(query.get("after", ["0"])[0])
+    database = (params or {}).get("database", "db")
+    body = {
+        "data": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"t{idx}",
+                "fullyQualifiedName": f"svc.{database}.schema.t{idx}",
+                "columns": [],
+            }
+            for idx in (2 * after, 2 * after + 1)
+        ],
+        "paging": {"total": 2 * PAGES},
+    }
+    if after + 1 < PAGES:
+        body["paging"]["after"] = str(after + 1)
+
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(body).encode()
+    response.json.return_value = body
+    return response
+
+
+@pytest.fixture
+def metadata():
+    return OpenMetadata(
+        OpenMetadataConnection(
+            hostPort="http://localhost:8585/api",
+            authProvider="openmetadata",
+            securityConfig=OpenMetadataJWTClientConfig(jwtToken="token"),
+            enableVersionValidation=False,
+        )
+    )
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1, 3])
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_list_all_entities(mock_request, metadata, read_ahead):
+    """All the pages are listed in order, whatever the read ahead"""
+    mock_request.side_effect = _list_tables
+
+    tables = list(metadata.list_all_entities(entity=Table, read_ahead=read_ahead))
+
+    assert [table.name.root for table in tables] == [f"t{i}" for i in range(2 * PAGES)]
+    assert mock_request.call_count == PAGES
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_list_all_entities_by_partition(mock_request, metadata):
+    """The entities of each partition are listed, in order within the partition"""
+    mock_request.side_effect = _list_tables
+
+    tables = list(
+        metadata.list_all_entities_by_partition(
+            entity=Table,
+            partitions=[{"database": f"db{idx}"} for idx in range(3)],
+        )
+    )
+
+    assert len(tables) == 3 * 2 * PAGES
+    for idx in range(3):
+        assert [
+            table.name.root
+            for table in tables
+            if table.fullyQualifiedName.root.startswith(f"svc.db{idx}.")
+        ] == [f"t{i}" for i in range(2 * PAGES)]
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_list_all_entity_dicts(mock_request, metadata):
+    """The entities are yielded as the API returns them"""
+    mock_request.side_effect = _list_tables
+
+    tables = list(metadata.list_all_entity_dicts(entity=Table, fields=["sourceHash"]))
+
+    assert [table["name"] for table in tables] == [f"t{i}" for i in range(2 * PAGES)]
+    assert all(isinstance(table, dict) for table in tables)
+    assert "fields=sourceHash" in mock_request.call_args.args[1]
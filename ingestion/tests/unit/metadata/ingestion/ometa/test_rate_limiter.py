@@ -0,0 +1,114 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the client side rate limiting"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from metadata.ingestion.ometa.client import REST, ClientConfig
+from metadata.ingestion.ometa.rate_limiter import (
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    get_endpoint_class,
+)
+
+
+@pytest.mark.parametrize(
+    "path,endpoint_class",
+    [
+        ("/search/query?q=&index=table_search_index", "search"),
+        ("/tables/bulk", "bulk"),
+        ("/tables/name/svc.db.schema.bulk", "crud"),
+        ("/tables/name/svc.db.schema.t?fields=columns", "crud"),
+    ],
+)
+def test_get_endpoint_class(path, endpoint_class):
+    assert get_endpoint_class(path) == endpoint_class
+
+
+def test_token_bucket():
+    """Bursts go through, then requests are spread at the rate"""
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_requests_per_second():
+    limiter = RateLimiter(limit=RateLimit(requests_per_second=20, burst=1))
+    start = time.perf_counter()
+    for _ in range(6):
+        with limiter.limit("/tables"):
+            pass
+    assert time.perf_counter() - start >= 0.24
+    stats = limiter.stats()
+    assert (stats.requests, stats.delayed) == (6, 5)
+    assert stats.wait_seconds >= 0.24
+
+
+def test_max_in_flight_per_endpoint_class():
+    """Busy search slots don't hold the CRUD requests"""
+    limiter = RateLimiter(endpoint_limits={"search": RateLimit(max_in_flight=2)})
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    def search(_):
+        with limiter.limit("/search/query"):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+
+    with ThreadPoolExecutor(6) as executor:
+        futures = [executor.submit(search, idx) for idx in range(6)]
+        time.sleep(0.01)
+        start = time.perf_counter()
+        with limiter.limit("/tables/name/t"):
+            assert time.perf_counter() - start < 0.02
+        for future in futures:
+            future.result()
+    assert peak[0] == 2
+
+
+def test_disabled():
+    limiter = RateLimiter()
+    assert not limiter.enabled
+    with limiter.limit("/tables"):
+        pass
+    assert limiter.stats().requests == 0
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_rest_client_is_limited(mock_request):
+    response = Mock()
+    response.status_code = 200
+    response.content = b'{"name": "t"}'
+    mock_request.return_value = response
+    client = REST(
+        ClientConfig(
+            base_url="http://localhost:8585/api",
+            api_version="v1",
+            auth_token=lambda: ("token", 3600),
+        )
+    )
+    client.rate_limiter = RateLimiter(limit=RateLimit(requests_per_second=1000))
+
+    client.get("/tables/name/t")
+    client.put("/tables", data="{}")
+
+    assert client.rate_limiter.stats().requests == 2
@@ -35,7 +35,7 @@ class TestRESTClientHeaders:
     def test_get_with_custom_headers(self, mock_request, rest_client):
         """Test GET method with custom headers"""
         mock_response = Mock()
-        mock_response.text = '{"status": "success"}'
+        mock_response.content = b'{"status": "success"}'
         mock_response.json.return_value = {"status": "success"}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -57,7 +57,7 @@ class TestRESTClientHeaders:
     def test_post_with_custom_headers(self, mock_request, rest_client):
         """Test POST method with custom headers"""
         mock_response = Mock()
-        mock_response.text = '{"id": "123"}'
+        mock_response.content = b'{"id": "123"}'
         mock_response.json.return_value = {"id": "123"}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -79,7 +79,7 @@ class TestRESTClientHeaders:
     def test_put_with_custom_headers(self, mock_request, rest_client):
         """Test PUT method with custom headers"""
         mock_response = Mock()
-        mock_response.text = '{"updated": true}'
+        mock_response.content = b'{"updated": true}'
         mock_response.json.return_value = {"updated": True}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -101,7 +101,7 @@ class TestRESTClientHeaders:
     def test_delete_with_custom_headers(self, mock_request, rest_client):
         """Test DELETE method with custom headers"""
         mock_response = Mock()
-        mock_response.text = '{"deleted": true}'
+        mock_response.content = b'{"deleted": true}'
         mock_response.json.return_value = {"deleted": True}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -123,7 +123,7 @@ class TestRESTClientHeaders:
     def test_get_without_custom_headers(self, mock_request, rest_client):
         """Test GET method without custom headers uses default"""
         mock_response = Mock()
-        mock_response.text = '{"status": "success"}'
+        mock_response.content = b'{"status": "success"}'
         mock_response.json.return_value = {"status": "success"}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
@@ -144,7 +144,7 @@ class TestRESTClientHeaders:
     def test_headers_override_default(self, mock_request, rest_client):
         """Test that custom headers override default Content-type"""
         mock_response = Mock()
-        mock_response.text = '{"status": "success"}'
+        mock_response.content = b'{"status": "success"}'
         mock_response.json.return_value = {"status": "success"}
         mock_response.status_code = 200
         mock_request.return_value = mock_response
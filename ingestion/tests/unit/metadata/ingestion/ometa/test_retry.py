@@ -0,0 +1,171 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the retries and the circuit breaker of the REST client"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from metadata.ingestion.ometa.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenException,
+)
+from metadata.ingestion.ometa.client import REST, ClientConfig, _parse_retry_after
+
+
+def _response(status_code: int, body: str = '{"name": "t"}', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")  # pylint: disable=protected-access
+    response.headers.update(headers or {})
+    return response
+
+
+def _client(**kwargs) -> REST:
+    return REST(
+        ClientConfig(
+            base_url="http://localhost:8585/api",
+            api_version="v1",
+            auth_token=lambda: ("token", 3600),
+            retry_wait=1,
+            **kwargs,
+        )
+    )
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after("120") == 120
+    assert _parse_retry_after("-1") == 0
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+    in_a_minute = format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True
+    )
+    assert 55 < _parse_retry_after(in_a_minute) <= 60
+
+
+def test_backoff_is_jittered_and_capped():
+    """Waits grow exponentially from the retry wait, up to the max wait"""
+    client = _client(retry_max_wait=20)
+    waits = [client._next_retry_wait(1) for _ in range(100)]
+    assert all(1 <= wait <= 3 for wait in waits)
+    assert len(set(waits)) > 1
+    assert all(1 <= client._next_retry_wait(15) <= 20 for _ in range(100))
+    assert all(client._next_retry_wait(100) <= 20 for _ in range(100))
+    # The server tells us when to come back
+    assert 10 <= client._next_retry_wait(1, retry_after=10) <= 11
+    assert client._next_retry_wait(1, retry_after=1000) == 20
+
+
+@patch("metadata.ingestion.ometa.client.time.sleep")
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_retry_after_is_honored(mock_request, mock_sleep):
+    mock_request.side_effect = [
+        _response(503, '{"code": 503, "message": "busy"}', {"Retry-After": "7"}),
+        _response(200),
+    ]
+
+    assert _client().get("/tables/name/t") == {"name": "t"}
+    assert mock_request.call_count == 2
+    assert 7 <= mock_sleep.call_args.args[0] <= 7.7
+
+
+@pytest.mark.parametrize(
+    "method,status_code,retried",
+    [
+        ("put", 504, True),
+        ("post", 504, False),
+        ("post", 503, True),
+    ],
+)
+@patch("metadata.ingestion.ometa.client.time.sleep")
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_only_safe_requests_are_retried(mock_request, _, method, status_code, retried):
+    """A POST timing out may have been processed, but a refused one was not"""
+    mock_request.side_effect = [
+        _response(status_code, '{"code": 1, "message": "error"}'),
+        _response(200),
+    ]
+    client = _client()
+
+    if retried:
+        assert getattr(client, method)("/tables", data="{}") == {"name": "t"}
+    else:
+        with pytest.raises(Exception):
+            getattr(client, method)("/tables", data="{}")
+    assert mock_request.call_count == (2 if retried else 1)
+
+
+@patch("metadata.ingestion.ometa.client.time.sleep")
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_circuit_opens_per_endpoint(mock_request, _):
+    """A failing endpoint fails fast, the others keep going"""
+
+    def respond(_, url, **__):
+        if "/tables" in url:
+            raise requests.ConnectionError("refused")
+        return _response(200)
+
+    mock_request.side_effect = respond
+    client = _client(retry=0, circuit_breaker_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            client.get("/tables/name/t")
+    with pytest.raises(CircuitOpenException):
+        client.get("/tables/name/t")
+    assert client.get("/databases/name/db") == {"name": "t"}
+    # Requests failing to connect are sent again once
+    assert mock_request.call_count == 5
+    assert client.circuit_breaker.rejected == 1
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_request_errors_keep_the_circuit_closed(mock_request):
+    """A 500 answering a bad request doesn't tell the server is down"""
+    mock_request.return_value = _response(500, '{"code": 500, "message": "boom"}')
+    client = _client(retry=0, circuit_breaker_threshold=2)
+
+    for _ in range(3):
+        with pytest.raises(Exception) as exc_info:
+            client.get("/tables/name/t")
+        assert not isinstance(exc_info.value, CircuitOpenException)
+    assert mock_request.call_count == 3
+    assert client.circuit_breaker.rejected == 0
+
+
+def test_circuit_half_open():
+    """After the reset timeout, a single probe decides if the circuit closes"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    with patch("metadata.ingestion.ometa.circuit_breaker.time.monotonic") as now:
+        now.return_value = 0
+        breaker.record_failure("tables")
+        with pytest.raises(CircuitOpenException):
+            breaker.before_request("tables")
+
+        now.return_value = 10
+        breaker.before_request("tables")
+        # Only the probe goes through
+        with pytest.raises(CircuitOpenException):
+            breaker.before_request("tables")
+        breaker.record_failure("tables")
+
+        now.return_value = 15
+        with pytest.raises(CircuitOpenException):
+            breaker.before_request("tables")
+
+        now.return_value = 20
+        breaker.before_request("tables")
+        breaker.record_success("tables")
+        breaker.before_request("tables")
+        assert not breaker.is_open("tables")
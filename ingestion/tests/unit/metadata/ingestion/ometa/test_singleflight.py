@@ -0,0 +1,118 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the coalescing of identical concurrent calls"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from metadata.ingestion.ometa.client import REST, ClientConfig
+from metadata.ingestion.ometa.singleflight import SingleFlight
+
+
+def _slow(result, delay: float = 0.2):
+    calls = []
+
+    def fn(*_, **__):
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return fn, calls
+
+
+def _response(method, url, **_) -> Mock:
+    time.sleep(0.2)
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps({"method": method, "url": url}).encode()
+    response.json.return_value = {"method": method, "url": url}
+    return response
+
+
+@pytest.fixture
+def client():
+    return REST(
+        ClientConfig(
+            base_url="http://localhost:8585/api",
+            api_version="v1",
+            auth_token=lambda: ("token", 3600),
+        )
+    )
+
+
+def test_calls_are_shared():
+    """Concurrent calls of the same key run once and all get its result"""
+    single_flight = SingleFlight()
+    fn, calls = _slow({"name": "t"})
+
+    with ThreadPoolExecutor(5) as executor:
+        results = list(executor.map(lambda _: single_flight.do("key", fn), range(5)))
+
+    assert len(calls) == 1
+    assert [result for result, _ in results] == [{"name": "t"}] * 5
+    assert sum(shared for _, shared in results) == 4
+    assert single_flight.shared == 4
+
+    # The next call, once the first finished, runs again
+    assert single_flight.do("key", fn) == ({"name": "t"}, False)
+    assert len(calls) == 2
+
+
+def test_errors_are_shared():
+    """The waiters get the exception of the call"""
+    single_flight = SingleFlight()
+    fn, calls = _slow(ValueError("boom"))
+
+    def run(_):
+        with pytest.raises(ValueError):
+            single_flight.do("key", fn)
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(run, range(3)))
+    assert len(calls) == 1
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_get_is_coalesced(mock_request, client):
+    """Identical GETs share the request, and each one gets its own copy"""
+    mock_request.side_effect = _response
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(lambda _: client.get("/tables/name/svc.db.s.t"), range(4))
+        )
+        client.get("/tables/name/svc.db.s.other")
+
+    assert mock_request.call_count == 2
+    assert all(result == results[0] for result in results)
+    assert len({id(result) for result in results}) == 4
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_write_forgets_flights(mock_request, client):
+    """GETs sent after a write of the collection don't join the ones before it"""
+    mock_request.side_effect = _response
+
+    with ThreadPoolExecutor(2) as executor:
+        before = executor.submit(client.get, "/tables/name/svc.db.s.t")
+        time.sleep(0.05)
+        client.put("/tables", data="{}")
+        after = executor.submit(client.get, "/tables/name/svc.db.s.t")
+        before.result(), after.result()
+
+    methods = [call.args[0] for call in mock_request.call_args_list]
+    assert methods.count("GET") == 2
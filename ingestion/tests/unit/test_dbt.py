@@ -999,9 +999,11 @@ class DbtUnitTest(TestCase):
     def execute_test(self, mock_manifest, expected_records, expected_data_models):
         dbt_files, dbt_objects = self.get_dbt_object_files(mock_manifest)
         self.check_dbt_validate(dbt_files=dbt_files, expected_records=expected_records)
-        self.check_yield_datamodel(
-            dbt_objects=dbt_objects, expected_data_models=expected_data_models
-        )
+        # Nothing prefetched: the tables are searched one by one
+        with patch.object(OpenMetadata, "es_search_from_fqns", return_value={}):
+            self.check_yield_datamodel(
+                dbt_objects=dbt_objects, expected_data_models=expected_data_models
+            )
 
     def get_dbt_object_files(self, mock_manifest):
         mock_file_path = Path(__file__).parent / mock_manifest
@@ -1053,6 +1055,32 @@ class DbtUnitTest(TestCase):
             entity_owner = entity.right.new_entity.owners
             self.assertEqual(entity_owner, MOCK_OWNER)
 
+    @patch("metadata.ingestion.source.database.dbt.metadata.DbtSource.get_dbt_owner")
+    @patch("metadata.ingestion.ometa.mixins.es_mixin.ESMixin.es_search_from_fqns")
+    @patch("metadata.ingestion.ometa.mixins.es_mixin.ESMixin.es_search_from_fqn")
+    def test_prefetched_table_entities(
+        self, es_search_from_fqn, es_search_from_fqns, get_dbt_owner
+    ):
+        """The tables of the manifest are searched at once"""
+        get_dbt_owner.return_value = MOCK_OWNER
+        es_search_from_fqns.side_effect = lambda fqn_search_strings, **_: {
+            fqn_search_string: MOCK_TABLE_ENTITIES
+            for fqn_search_string in fqn_search_strings
+        }
+        _, dbt_objects = self.get_dbt_object_files(MOCK_SAMPLE_MANIFEST_V7)
+
+        data_model_links = [
+            data_model_link.right
+            for data_model_link in self.dbt_source_obj.yield_data_models(
+                dbt_objects=dbt_objects
+            )
+            if data_model_link.right
+        ]
+
+        self.assertTrue(data_model_links)
+        es_search_from_fqns.assert_called_once()
+        es_search_from_fqn.assert_not_called()
+
     @patch("metadata.ingestion.ometa.mixins.es_mixin.ESMixin.es_search_from_fqn")
     def test_upstream_nodes_for_lineage(self, es_search_from_fqn):
         expected_upstream_nodes = [
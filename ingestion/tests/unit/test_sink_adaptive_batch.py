@@ -0,0 +1,149 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+
+"""
+Unit tests of the adaptive sizing of the sink bulk batches
+"""
+import json
+from unittest import TestCase
+from unittest.mock import Mock
+
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.entity.data.table import Column, DataType
+from metadata.generated.schema.type.bulkOperationResult import (
+    BulkOperationResult,
+    Response,
+)
+from metadata.ingestion.ometa.utils import dump_bulk_payload
+from metadata.ingestion.sink.adaptive_batch import AdaptiveBatchSize
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+
+
+def _table(name: str, columns: int = 1) -> CreateTableRequest:
+    return CreateTableRequest(
+        name=name,
+        databaseSchema="svc.db.schema",
+        columns=[
+            Column(name=f"c{idx}", dataType=DataType.INT) for idx in range(columns)
+        ],
+    )
+
+
+class TestAdaptiveBatchSize(TestCase):
+    """The size follows the latency of the batches"""
+
+    def test_grows_while_fast(self):
+        batch_size = AdaptiveBatchSize(size=100, max_size=115, target_latency=10)
+        batch_size.record_latency(entities=100, seconds=1)
+        self.assertEqual(batch_size.size, 110)
+        # Batches smaller than the size, e.g., capped by bytes, don't grow it
+        batch_size.record_latency(entities=50, seconds=1)
+        self.assertEqual(batch_size.size, 110)
+        batch_size.record_latency(entities=110, seconds=1)
+        self.assertEqual(batch_size.size, 115)
+
+    def test_shrinks_when_slow_or_failing(self):
+        batch_size = AdaptiveBatchSize(size=100, max_size=1000, target_latency=10)
+        batch_size.record_latency(entities=100, seconds=40)
+        self.assertEqual(batch_size.size, 25)
+        batch_size.record_failure()
+        self.assertEqual(batch_size.size, 12)
+        for _ in range(10):
+            batch_size.record_failure()
+        self.assertEqual(batch_size.size, 1)
+
+    def test_fixed(self):
+        batch_size = AdaptiveBatchSize(size=100, max_size=1000, target_latency=0)
+        batch_size.record_latency(entities=100, seconds=40)
+        batch_size.record_latency(entities=100, seconds=0.1)
+        batch_size.record_failure()
+        self.assertEqual(batch_size.size, 100)
+
+
+class TestSinkAdaptiveBatch(TestCase):
+    """Batches are capped by bytes, and failed batches are split"""
+
+    def setUp(self):
+        self.mock_metadata = Mock()
+        self.batches = []
+
+    def _sink(self, **config) -> MetadataRestSink:
+        return MetadataRestSink(
+            MetadataRestSinkConfig(enable_async_pipeline=False, **config),
+            self.mock_metadata,
+        )
+
+    def _bulk(self, status: int):
+        def bulk_create_or_update(entities, use_async, payloads):
+            names = [entity.name.root for entity in entities]
+            self.assertEqual(
+                [json.loads(payload)["name"] for payload in payloads], names
+            )
+            self.batches.append(names)
+            if "bad" in names:
+                return BulkOperationResult(
+                    numberOfRowsProcessed=0,
+                    numberOfRowsFailed=len(entities),
+                    successRequest=[],
+                    failedRequest=[
+                        Response(request=None, message="Bad payload", status=status)
+                    ],
+                )
+            return BulkOperationResult(
+                numberOfRowsProcessed=len(entities),
+                numberOfRowsFailed=0,
+                successRequest=[Response(request=name, status=200) for name in names],
+                failedRequest=[],
+            )
+
+        return bulk_create_or_update
+
+    def test_bad_entities_are_isolated(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk(500)
+        sink = self._sink(bulk_sink_batch_size=4)
+
+        for name in ("t0", "t1", "bad", "t3"):
+            sink.run(_table(name))
+
+        self.assertEqual(
+            self.batches,
+            [["t0", "t1", "bad", "t3"], ["t0", "t1"], ["bad", "t3"], ["bad"], ["t3"]],
+        )
+        self.assertEqual(len(sink.status.failures), 1)
+        self.assertIn("[bad]", sink.status.failures[0].name)
+        self.assertIn("Bad payload", sink.status.failures[0].error)
+        self.assertEqual(len(sink.status.records), 3)
+        # Halved once for the whole batch, not for its halves, then grown by
+        # the halves answered quickly
+        self.assertEqual(sink.batch_size.size, 3)
+
+    def test_rejected_payloads_keep_the_size(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk(400)
+        sink = self._sink(bulk_sink_batch_size=4)
+
+        for name in ("t0", "t1", "bad", "t3"):
+            sink.run(_table(name))
+
+        self.assertEqual(len(sink.status.failures), 1)
+        self.assertEqual(len(sink.status.records), 3)
+        self.assertEqual(sink.batch_size.size, 4)
+
+    def test_batches_are_capped_by_bytes(self):
+        def bulk_create_or_update(entities, use_async, payloads):
+            self.batches.append([entity.name.root for entity in entities])
+            return BulkOperationResult(successRequest=[], failedRequest=[])
+
+        self.mock_metadata.bulk_create_or_update.side_effect = bulk_create_or_update
+        table_bytes = len(dump_bulk_payload(_table("t0", columns=50)))
+        sink = self._sink(
+            bulk_sink_batch_size=100, bulk_sink_max_batch_bytes=table_bytes * 2
+        )
+
+        for idx in range(5):
+            sink.run(_table(f"t{idx}", columns=50))
+        sink.close()
+
+        self.assertEqual(self.batches, [["t0", "t1"], ["t2", "t3"], ["t4"]])
@@ -0,0 +1,192 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+
+"""
+Unit tests of the background flushing of the sink bulk buffer
+"""
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock
+
+from metadata.generated.schema.api.data.createDatabaseSchema import (
+    CreateDatabaseSchemaRequest,
+)
+from metadata.generated.schema.api.data.createTable import CreateTableRequest
+from metadata.generated.schema.entity.data.table import Column, DataType
+from metadata.generated.schema.type import basic
+from metadata.generated.schema.type.bulkOperationResult import (
+    BulkOperationResult,
+    Response,
+)
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+
+
+def _table(idx: int) -> CreateTableRequest:
+    return CreateTableRequest(
+        name=f"t{idx}",
+        databaseSchema="svc.db.schema",
+        columns=[Column(name="id", dataType=DataType.INT)],
+    )
+
+
+def _result(entities, failed=()) -> BulkOperationResult:
+    names = [entity.name.root for entity in entities]
+    failed = [name for name in failed if name in names]
+    return BulkOperationResult(
+        status=basic.Status.failure if failed else basic.Status.success,
+        numberOfRowsProcessed=len(entities),
+        numberOfRowsFailed=len(failed),
+        successRequest=[
+            Response(request=f"svc.db.schema.{name}", status=200)
+            for name in names
+            if name not in failed
+        ],
+        failedRequest=[
+            Response(request=f"svc.db.schema.{name}", message="Invalid", status=400)
+            for name in failed
+        ],
+    )
+
+
+class TestSinkAsyncFlush(TestCase):
+    """Full buffers are flushed by the sink workers"""
+
+    def setUp(self):
+        self.mock_metadata = Mock()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _sink(self, **config) -> MetadataRestSink:
+        return MetadataRestSink(MetadataRestSinkConfig(**config), self.mock_metadata)
+
+    def _bulk(self, delay: float = 0.0, failed=()):
+        def bulk_create_or_update(entities, use_async, payloads):
+            with self.lock:
+                self.calls.append(("start", [entity.name.root for entity in entities]))
+            time.sleep(delay)
+            with self.lock:
+                self.calls.append(("end", [entity.name.root for entity in entities]))
+            return _result(entities, failed)
+
+        return bulk_create_or_update
+
+    def test_failed_requests_are_reported_per_entity(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk(
+            failed=("t1",)
+        )
+        sink = self._sink(bulk_sink_batch_size=2)
+
+        for idx in range(3):
+            self.assertIsNone(sink.run(_table(idx)))
+        sink.close()
+
+        self.assertEqual(self.mock_metadata.bulk_create_or_update.call_count, 2)
+        self.assertEqual(
+            [failure.name for failure in sink.status.failures], ["svc.db.schema.t1"]
+        )
+        self.assertIn("Invalid", sink.status.failures[0].error)
+        self.assertEqual(len(sink.status.records), 2)
+
+    def test_bounded_pending_batches(self):
+        release = threading.Event()
+
+        def bulk_create_or_update(entities, use_async, payloads):
+            release.wait(timeout=5)
+            return _result(entities)
+
+        self.mock_metadata.bulk_create_or_update.side_effect = bulk_create_or_update
+        sink = self._sink(
+            bulk_sink_batch_size=1,
+            async_pipeline_workers=2,
+            async_pipeline_max_pending=2,
+        )
+        writes = []
+
+        def write():
+            for idx in range(3):
+                sink.run(_table(idx))
+                writes.append(idx)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.2)
+        # The third batch waits for a flush to finish
+        self.assertEqual(writes, [0, 1])
+        release.set()
+        writer.join(timeout=5)
+        sink.close()
+
+        self.assertEqual(writes, [0, 1, 2])
+        self.assertEqual(len(sink.status.records), 3)
+
+    def test_batches_of_other_types_wait_for_the_previous_ones(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk(delay=0.1)
+        sink = self._sink(bulk_sink_batch_size=1, async_pipeline_workers=4)
+
+        sink.run(CreateDatabaseSchemaRequest(name="schema", database="svc.db"))
+        sink.run(_table(0))
+        sink.run(_table(1))
+        sink.close()
+
+        self.assertEqual(self.calls[:2], [("start", ["schema"]), ("end", ["schema"])])
+        # Tables flush concurrently
+        self.assertEqual(
+            [event for event, _ in self.calls[2:]], ["start", "start", "end", "end"]
+        )
+
+    def test_sync_flush(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk()
+        sink = self._sink(bulk_sink_batch_size=2, enable_async_pipeline=False)
+
+        sink.run(_table(0))
+        sink.run(_table(1))
+
+        self.assertEqual(self.calls, [("start", ["t0", "t1"]), ("end", ["t0", "t1"])])
+        self.assertIsNone(sink._flush_executor)  # pylint: disable=protected-access
+
+    def test_sync_flush_does_not_hold_the_buffer(self):
+        """The other workers keep buffering while a batch is sent"""
+        sink = self._sink(bulk_sink_batch_size=2, enable_async_pipeline=False)
+        buffered = threading.Event()
+
+        def bulk_create_or_update(entities, use_async, payloads):
+            if entities[0].name.root == "t0":
+                threading.Thread(target=lambda: sink.run(_table(2))).start()
+                self.assertTrue(buffered.wait(timeout=5))
+            return _result(entities)
+
+        def buffer_create_request(entity_request):
+            result = original(entity_request)
+            buffered.set()
+            return result
+
+        original = sink._buffer_create_request  # pylint: disable=protected-access
+        sink._buffer_create_request = buffer_create_request
+        self.mock_metadata.bulk_create_or_update.side_effect = bulk_create_or_update
+
+        sink.run(_table(0))
+        sink.run(_table(1))
+        sink.flush()
+
+        self.assertEqual(len(sink.status.records), 3)
+
+    def test_flush_persists_the_buffered_records(self):
+        self.mock_metadata.bulk_create_or_update.side_effect = self._bulk(delay=0.1)
+        sink = self._sink(bulk_sink_batch_size=2)
+
+        for idx in range(3):
+            sink.run(_table(idx))
+        sink.flush()
+
+        # The full batch sent in the background and the partial one are done
+        self.assertEqual(
+            [names for event, names in self.calls if event == "end"],
+            [["t0", "t1"], ["t2"]],
+        )
+        self.assertEqual(sink.buffer, [])
+        self.assertEqual(len(sink.status.records), 3)
+        sink.close()
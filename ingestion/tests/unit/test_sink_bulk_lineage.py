@@ -0,0 +1,144 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+
+"""
+Unit tests of the buffered lineage of the sink
+"""
+
+import uuid
+from functools import partial
+from unittest import TestCase
+from unittest.mock import Mock
+
+from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.type.entityLineage import (
+    ColumnLineage,
+    EntitiesEdge,
+    LineageDetails,
+)
+from metadata.generated.schema.type.entityLineage import Source as LineageSource
+from metadata.generated.schema.type.entityReference import EntityReference
+from metadata.ingestion.models.ometa_lineage import OMetaLineageRequest
+from metadata.ingestion.ometa.mixins.lineage_mixin import OMetaLineageMixin
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+
+
+def _ref(name: str) -> EntityReference:
+    return EntityReference(id=uuid.uuid5(uuid.NAMESPACE_DNS, name), type="table")
+
+
+def _lineage(from_table: str, to_table: str, *columns: str) -> AddLineageRequest:
+    return AddLineageRequest(
+        edge=EntitiesEdge(
+            fromEntity=_ref(from_table),
+            toEntity=_ref(to_table),
+            lineageDetails=LineageDetails(
+                columnsLineage=[
+                    ColumnLineage(
+                        fromColumns=[f"svc.db.schema.{from_table}.{column}"],
+                        toColumn=f"svc.db.schema.{to_table}.{column}",
+                    )
+                    for column in columns
+                ],
+                source=LineageSource.QueryLineage,
+            ),
+        )
+    )
+
+
+class TestSinkBulkLineage(TestCase):
+    """Edges are buffered and merged by pair of entities"""
+
+    def setUp(self):
+        self.mock_metadata = Mock()
+        self.mock_metadata._merge_column_lineage.side_effect = partial(
+            OMetaLineageMixin._merge_column_lineage, None
+        )
+        self.mock_metadata.add_lineage.side_effect = lambda data, check_patch: {
+            "entity": {"fullyQualifiedName": str(data.edge.fromEntity.id.root)}
+        }
+        self.sink = MetadataRestSink(
+            MetadataRestSinkConfig(bulk_lineage_batch_size=10), self.mock_metadata
+        )
+
+    def _added(self):
+        return [call.args[0] for call in self.mock_metadata.add_lineage.call_args_list]
+
+    def test_edges_are_merged(self):
+        for record in (
+            _lineage("a", "b", "id"),
+            _lineage("a", "c", "id"),
+            _lineage("a", "b", "name"),
+            _lineage("a", "b", "id"),
+        ):
+            self.assertIsNone(self.sink.run(record))
+        self.mock_metadata.add_lineage.assert_not_called()
+        self.sink.close()
+
+        added = self._added()
+        self.assertEqual(len(added), 2)
+        (to_b,) = [lineage for lineage in added if lineage.edge.toEntity == _ref("b")]
+        self.assertEqual(
+            sorted(
+                column.toColumn.root
+                for column in to_b.edge.lineageDetails.columnsLineage
+            ),
+            ["svc.db.schema.b.id", "svc.db.schema.b.name"],
+        )
+        self.assertEqual(len(self.sink.status.records), 4)
+
+    def test_edges_without_details_are_not_merged(self):
+        without_details = AddLineageRequest(
+            edge=EntitiesEdge(fromEntity=_ref("a"), toEntity=_ref("b"))
+        )
+        for record in (
+            _lineage("a", "b", "id"),
+            without_details,
+            _lineage("a", "b", "name"),
+        ):
+            self.assertIsNone(self.sink.run(record))
+        self.sink.close()
+
+        # Added in order, as if they were sent one after the other
+        self.assertEqual(
+            self._added(),
+            [_lineage("a", "b", "id"), without_details, _lineage("a", "b", "name")],
+        )
+        self.assertEqual(len(self.sink.status.records), 3)
+
+    def test_processed_flags(self):
+        for table in ("b", "c"):
+            self.sink.run(
+                OMetaLineageRequest(
+                    lineage_request=_lineage("a", table, "id"),
+                    entity=Table,
+                    entity_fqn="svc.db.schema.view",
+                )
+            )
+        self.sink.close()
+
+        self.assertEqual(len(self._added()), 2)
+        self.mock_metadata.patch_lineage_processed_flag.assert_called_once_with(
+            entity=Table, fqn="svc.db.schema.view"
+        )
+
+    def test_override_lineage_flushes_the_buffer(self):
+        self.sink.run(_lineage("a", "b", "id"))
+        self.sink.run(
+            OMetaLineageRequest(
+                lineage_request=_lineage("c", "b", "id"), override_lineage=True
+            )
+        )
+
+        self.assertEqual(
+            [
+                name
+                for name, *_ in self.mock_metadata.method_calls
+                if name in ("add_lineage", "delete_lineage_by_source")
+            ],
+            ["add_lineage", "delete_lineage_by_source", "add_lineage"],
+        )
@@ -0,0 +1,98 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+
+"""
+Unit tests of the batched patches of the sink
+"""
+import threading
+import time
+import uuid
+from unittest import TestCase
+from unittest.mock import Mock
+
+from metadata.generated.schema.entity.data.table import Table
+from metadata.generated.schema.type.basic import Markdown
+from metadata.ingestion.models.patch_request import PatchedEntity, PatchRequest
+from metadata.ingestion.sink.metadata_rest import (
+    MetadataRestSink,
+    MetadataRestSinkConfig,
+)
+
+
+def _table(name: str) -> Table:
+    return Table(
+        id=uuid.uuid5(uuid.NAMESPACE_DNS, name),
+        name=name,
+        fullyQualifiedName=f"svc.db.schema.{name}",
+        columns=[],
+    )
+
+
+def _patch(name: str, description: str) -> PatchRequest:
+    original = _table(name)
+    return PatchRequest(
+        original_entity=original,
+        new_entity=original.model_copy(update={"description": Markdown(description)}),
+    )
+
+
+class TestSinkBulkPatch(TestCase):
+    """PatchRequests are buffered and sent concurrently"""
+
+    def setUp(self):
+        self.mock_metadata = Mock()
+        self.patched = []
+        self.in_flight = [0, 0]
+        self.lock = threading.Lock()
+
+        def patch(entity, source, destination, **_):
+            with self.lock:
+                self.in_flight[0] += 1
+                self.in_flight[1] = max(self.in_flight)
+            time.sleep(0.05)
+            with self.lock:
+                self.in_flight[0] -= 1
+                self.patched.append((source.name.root, destination.description.root))
+            if destination.description.root == "bad":
+                raise ValueError("Invalid patch")
+            return destination
+
+        self.mock_metadata.patch.side_effect = patch
+
+    def _sink(self, **config) -> MetadataRestSink:
+        return MetadataRestSink(MetadataRestSinkConfig(**config), self.mock_metadata)
+
+    def test_patches_are_sent_concurrently(self):
+        sink = self._sink(bulk_patch_batch_size=4, bulk_patch_workers=4)
+        records = [
+            _patch("t0", "first"),
+            _patch("t1", "d1"),
+            _patch("t0", "second"),
+            _patch("t2", "bad"),
+            _patch("t3", "d3"),
+        ]
+
+        for record in records:
+            self.assertIsNone(sink.run(record))
+        self.assertEqual(len(sink.patch_buffer), 1)
+        sink.close()
+
+        self.assertEqual(len(self.patched), 5)
+        self.assertEqual(self.in_flight[1], 3)
+        # The patches of an entity keep their order
+        self.assertEqual(
+            [description for name, description in self.patched if name == "t0"],
+            ["first", "second"],
+        )
+        self.assertEqual(len(sink.status.updated_records), 4)
+        self.assertEqual(len(sink.status.failures), 1)
+        self.assertIn("Invalid patch", sink.status.failures[0].error)
+
+    def test_inline_patches(self):
+        sink = self._sink()
+
+        patched = sink._run(_patch("t0", "d0"))  # pylint: disable=protected-access
+
+        self.assertIsInstance(patched.right, PatchedEntity)
+        self.assertEqual(patched.right.new_entity.description.root, "d0")
+        self.assertEqual(sink.patch_buffer, [])
@@ -79,3 +79,32 @@ class TopologyContextManagerTest(TestCase):
         self.manager.pop(OTHER_THREAD)
 
         self.assertEqual(list(self.manager.contexts.keys()), [MAIN_THREAD])
+
+    def test_copy_on_write(self):
+        """Threads share the parent values, but don't see each other appends"""
+
+        with patch("threading.get_ident", return_value=MAIN_THREAD):
+            self.manager.get().append("stored_procedures", "sp1")
+            parent_procedures = self.manager.get().stored_procedures
+
+        with patch("threading.get_ident", return_value=OTHER_THREAD):
+            self.manager.copy_from(MAIN_THREAD)
+
+            # The values are not copied until modified
+            self.assertIs(self.manager.get().stored_procedures, parent_procedures)
+
+            self.manager.get().append("stored_procedures", "sp2")
+            self.manager.get().append("stored_procedures", "sp3")
+            self.assertEqual(
+                self.manager.get().stored_procedures, ["sp1", "sp2", "sp3"]
+            )
+
+        with patch("threading.get_ident", return_value=MAIN_THREAD):
+            self.assertEqual(self.manager.get().stored_procedures, ["sp1"])
+
+            self.manager.get().append("stored_procedures", "sp4")
+            self.assertEqual(self.manager.get().stored_procedures, ["sp1", "sp4"])
+
+        self.assertEqual(
+            self.manager.get(OTHER_THREAD).stored_procedures, ["sp1", "sp2", "sp3"]
+        )
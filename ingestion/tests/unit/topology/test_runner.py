@@ -12,6 +12,9 @@
 """
 Check that we are properly running nodes and stages
 """
+import tempfile
+from datetime import timedelta
+from pathlib import Path
 from typing import List, Optional
 from unittest import TestCase
 from unittest.mock import patch
@@ -26,9 +29,13 @@ from metadata.ingestion.models.topology import (
     ServiceTopology,
     TopologyContextManager,
     TopologyNode,
+    TopologyShard,
 )
 from metadata.ingestion.ometa.ometa_api import OpenMetadata
 from metadata.utils.source_hash import generate_source_hash
+from metadata.utils.topology_checkpoint import TopologyCheckpoint
+from metadata.utils.tracer import Tracer
+from metadata.utils.worker_autoscaler import WorkerAutoscaler
 
 
 class MockSchema(BaseModel):
@@ -253,23 +260,25 @@ class TopologyRunnerTest(TestCase):
         # clear cache before test
         local_source.cache.clear()
 
-        mock_list_all_entities = [
-            MockTable(
-                name="table1",
-                fullyQualifiedName="schema1.table1",
-                sourceHash="c238b14e87fe6d54e35dbca4a97e1e83",
-                columns=["c1", "c2"],
-            ),
-            MockTable(
-                name="table2",
-                fullyQualifiedName="schema1.table2",
-                sourceHash="acd38ff1a662adc0c88225f2666ff423",
-                columns=["c1", "c2"],
-            ),
+        mock_list_all_entity_dicts = [
+            {
+                "name": "table1",
+                "fullyQualifiedName": "schema1.table1",
+                "sourceHash": "c238b14e87fe6d54e35dbca4a97e1e83",
+                "columns": ["c1", "c2"],
+            },
+            {
+                "name": "table2",
+                "fullyQualifiedName": "schema1.table2",
+                "sourceHash": "acd38ff1a662adc0c88225f2666ff423",
+                "columns": ["c1", "c2"],
+            },
         ]
 
         with patch.object(
-            OpenMetadata, "list_all_entities", return_value=mock_list_all_entities
+            OpenMetadata,
+            "list_all_entity_dicts",
+            return_value=mock_list_all_entity_dicts,
         ):
             local_source.metadata = OpenMetadata
 
@@ -286,3 +295,276 @@ class TopologyRunnerTest(TestCase):
                 }
             },
         )
+
+    def test_multithread_streams_producer(self):
+        """The producer is consumed lazily, bounded by the in-flight entities"""
+
+        class StreamingSource(MockSource):
+            produced = 0
+
+            def get_tables(self):
+                for idx in range(100):
+                    self.produced += 1
+                    yield f"table{idx}"
+
+        local_source = StreamingSource()
+        local_source.context = TopologyContextManager(local_source.topology)
+        local_source.context.set_threads(2)
+        local_source.context.get().schemas = "schema1"
+        local_source.work_prefetch_per_thread = 1
+
+        results = local_source._multithread_process_node(
+            local_source.topology.tables, threads=2
+        )
+        first = next(results)
+
+        self.assertIsInstance(first.right, MockTable)
+        # We only pulled the entities the workers are handling
+        self.assertLess(local_source.produced, 10)
+
+        remaining = list(results)
+        self.assertEqual(len(remaining) + 1, 100)
+        self.assertEqual(local_source.produced, 100)
+        self.assertCountEqual(
+            [either.right.name for either in [first, *remaining]],
+            [f"table{idx}" for idx in range(100)],
+        )
+
+    def test_multithread_worker_failure(self):
+        """Errors in the workers reach the consumer"""
+
+        class FailingSource(MockSource):
+            @staticmethod
+            def yield_tables(name: str):
+                if name == "table2":
+                    raise RuntimeError("boom")
+                yield Either(right=MockTable(name=name, columns=["c1", "c2"]))
+
+            def _process_stage(self, stage, node_entity, child_nodes):
+                # Skip the stage error handling to let the worker fail
+                yield from getattr(self, stage.processor)(node_entity)
+
+        local_source = FailingSource()
+        local_source.context = TopologyContextManager(local_source.topology)
+        local_source.context.set_threads(2)
+
+        with self.assertRaises(RuntimeError):
+            list(
+                local_source._multithread_process_node(
+                    local_source.topology.tables, threads=2
+                )
+            )
+
+    def test_record_ordering_keys(self):
+        """Leaf node records share a key per entity, the rest are barriers"""
+        local_source = MockSource()
+        local_source.context = TopologyContextManager(local_source.topology)
+        local_source.context.set_threads(0)
+
+        keys = {}
+        for either in local_source._iter():
+            record = either.right if hasattr(either, "right") else either
+            keys[
+                f"{getattr(record, 'name', record)}-{len(keys)}"
+            ] = local_source.get_record_ordering_key(record)
+
+        self.assertIsNone(keys["schema1-0"])
+        self.assertIsNone(keys["schema2-3"])
+        self.assertIsNone(keys["hello-6"])
+        table_keys = [
+            keys[name] for name in ("table1-1", "table2-2", "table1-4", "table2-5")
+        ]
+        self.assertTrue(all(key is not None for key in table_keys))
+        self.assertEqual(len(set(table_keys)), 4)
+
+    def test_sharded_nodes(self):
+        """Shards split the sharded node entities and the coordinator marks the deleted"""
+
+        class ShardedSource(MockSource):
+            topology = MockTopology(
+                root=MockTopology().root.model_copy(
+                    update={"post_process": ["yield_hello", "mark_tables_as_deleted"]}
+                ),
+                tables=MockTopology().tables.model_copy(update={"shard": True}),
+            )
+
+            def __init__(self, shard: Optional[TopologyShard]):
+                self.shard = shard
+                self.table_source_state = set()
+                self.context = TopologyContextManager(self.topology)
+                self.context.set_threads(0)
+
+            @staticmethod
+            def get_tables():
+                yield from (f"table{idx}" for idx in range(20))
+
+            def yield_tables(self, name: str):
+                self.table_source_state.add(f"{self.context.get().schemas}.{name}")
+                yield Either(right=MockTable(name=name, columns=["c1", "c2"]))
+
+            def mark_tables_as_deleted(self):
+                yield f"deleted {len(self.table_source_state)}"
+
+        def records(source: ShardedSource) -> List:
+            return [
+                either.right if isinstance(either, Either) else either
+                for either in source._iter()
+            ]
+
+        self.assertTrue(ShardedSource(shard=None).is_shardable())
+        self.assertFalse(MockSource().is_shardable())
+
+        # The coordinator first sends the shared nodes, without post processes
+        coordinator = ShardedSource(shard=TopologyShard(count=3))
+        processed = records(coordinator)
+        self.assertEqual([record.name for record in processed], ["schema1", "schema2"])
+        self.assertTrue(all(isinstance(record, MockSchema) for record in processed))
+
+        sharded_tables = []
+        for index in range(3):
+            worker = ShardedSource(shard=TopologyShard(index=index, count=3))
+            processed = records(worker)
+
+            # Workers only send their sharded entities, with the shared context
+            self.assertTrue(all(isinstance(record, MockTable) for record in processed))
+            self.assertEqual(len(processed), len(worker.table_source_state))
+            sharded_tables.extend(worker.table_source_state)
+
+            coordinator.merge_source_state(worker.get_source_state())
+
+        # Each table is processed by a single worker
+        self.assertEqual(len(sharded_tables), 40)
+        self.assertEqual(len(set(sharded_tables)), 40)
+
+        # Then the coordinator only runs the post processes, with the state of all workers
+        coordinator.shard = TopologyShard(count=3, workers_finished=True)
+        self.assertEqual(records(coordinator), ["hello", "deleted 40"])
+
+    def test_checkpoint_resume(self):
+        """Resumed runs skip the completed entities but keep their source state"""
+
+        class CheckpointSource(MockSource):
+            topology = MockTopology(
+                root=MockTopology().root.model_copy(
+                    update={
+                        "post_process": ["mark_tables_as_deleted"],
+                        "checkpoint": True,
+                    }
+                ),
+            )
+
+            def __init__(self, checkpoint: TopologyCheckpoint):
+                self.checkpoint = checkpoint
+                self.table_source_state = set()
+                self.context = TopologyContextManager(self.topology)
+                self.context.set_threads(0)
+
+            def yield_tables(self, name: str):
+                self.table_source_state.add(f"{self.context.get().schemas}.{name}")
+                yield Either(right=MockTable(name=name, columns=["c1", "c2"]))
+
+            def mark_tables_as_deleted(self):
+                yield f"deleted {len(self.table_source_state)}"
+
+        def records(source: CheckpointSource) -> List:
+            return [
+                either.right if isinstance(either, Either) else either
+                for either in source._iter()
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            def checkpoint() -> TopologyCheckpoint:
+                return TopologyCheckpoint(
+                    path=Path(tmp_dir) / "checkpoint.sqlite",
+                    fingerprint="config",
+                    max_age=timedelta(hours=1),
+                )
+
+            # The first run dies while processing the tables of schema2
+            first_run = CheckpointSource(checkpoint())
+            # The sink is flushed before committing the completed entities
+            committed_on_flush = []
+            first_run.flush_steps = lambda: committed_on_flush.append(
+                checkpoint().completed
+            )
+            for record in first_run._iter():
+                if (
+                    isinstance(record.right, MockTable)
+                    and first_run.context.get().schemas == "schema2"
+                ):
+                    break
+
+            self.assertEqual(committed_on_flush, [set()])
+
+            second_run = CheckpointSource(checkpoint())
+            self.assertEqual(second_run.checkpoint.completed, {"schema1"})
+            processed = records(second_run)
+
+            self.assertEqual(
+                [record.name for record in processed if isinstance(record, MockSchema)],
+                ["schema2"],
+            )
+            # The deleted tables are computed with the state of the whole service
+            self.assertEqual(processed[-1], "deleted 4")
+
+            # Finished runs clear the checkpoint
+            self.assertEqual(checkpoint().completed, set())
+
+    def test_tracing(self):
+        """Producers, stages and post processes are traced in the thread they ran in"""
+        self.source.context = TopologyContextManager(self.source.topology)
+        self.source.context.set_threads(2)
+
+        tracer = Tracer()
+        tracer.enable()
+        try:
+            list(self.source._iter())
+            spans = tracer.take_spans()
+        finally:
+            tracer.enabled = False
+
+        names = {span.name for span in spans}
+        self.assertTrue(
+            {"get_schemas", "yield_schemas", "get_tables", "yield_tables"} <= names
+        )
+        self.assertIn("yield_hello", names)
+        # Tables are processed by the worker threads
+        self.assertTrue(
+            {span.thread_id for span in spans if span.name == "yield_tables"}
+            - {span.thread_id for span in spans if span.name == "yield_schemas"}
+        )
+
+    def test_worker_autoscaling(self):
+        """The pool is sized with the max workers, and the autoscaler limits them"""
+        self.source.context = TopologyContextManager(self.source.topology)
+        self.source.context.set_threads(0)
+        self.source.worker_autoscaler = WorkerAutoscaler(
+            min_workers=1,
+            max_workers=4,
+            workers=1,
+            interval_seconds=10,
+            max_cpu_percent=80,
+            max_memory_percent=80,
+            latency_tolerance=2,
+            decrease_factor=0.5,
+        )
+        try:
+            with patch.object(
+                self.source,
+                "_multithread_process_node",
+                wraps=self.source._multithread_process_node,
+            ) as multithread_process_node:
+                processed = [
+                    either.right
+                    for either in self.source._iter()
+                    if isinstance(either, Either)
+                ]
+        finally:
+            self.source.worker_autoscaler = None
+
+        multithread_process_node.assert_called_with(self.source.topology.tables, 4)
+        self.assertEqual(
+            [record.name for record in processed if isinstance(record, MockTable)],
+            ["table1", "table2", "table1", "table2"],
+        )
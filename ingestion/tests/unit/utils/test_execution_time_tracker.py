@@ -0,0 +1,189 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the execution time histograms and their export
+"""
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+
+from sqlalchemy import create_engine, text
+
+from metadata.generated.schema.metadataIngestion.workflow import (
+    LatencyMetrics,
+    LatencyMetricsFormat,
+)
+from metadata.ingestion.connections.query_logger import attach_query_tracker
+from metadata.ingestion.ometa.client import _get_endpoint_context
+from metadata.utils.execution_time_exporter import (
+    METRIC_NAME,
+    ExecutionTimeExporter,
+    to_json,
+    to_openmetrics,
+)
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeMetrics,
+    ExecutionTimeTracker,
+    LatencyHistogram,
+)
+
+
+class LatencyHistogramTest(TestCase):
+    """Validate the percentiles"""
+
+    def test_percentiles(self):
+        """Percentiles are within the bucket precision"""
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        for percentile in (50, 95, 99):
+            self.assertAlmostEqual(
+                histogram.percentile(percentile),
+                percentile / 100,
+                delta=percentile / 100 / 16,
+            )
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+    def test_merge(self):
+        """Merged metrics keep the counts and bounds of both"""
+        metrics, other = ExecutionTimeMetrics(), ExecutionTimeMetrics()
+        metrics.update(0.01)
+        other.update(1.0)
+        other.update(1.0)
+
+        metrics.merge(other)
+
+        self.assertEqual(metrics.call_count, 3)
+        self.assertEqual(metrics.min_time, 0.01)
+        self.assertAlmostEqual(metrics.percentile(99), 1.0, delta=1.0 / 16)
+        self.assertAlmostEqual(metrics.percentile(10), 0.01, delta=0.01 / 16)
+
+
+class ExecutionTimeTrackerTest(TestCase):
+    """Validate the recording of the threads"""
+
+    def setUp(self):
+        self.tracker = ExecutionTimeTracker(enabled=True)
+        self.tracker.reset()
+
+    def tearDown(self):
+        self.tracker.reset()
+        ExecutionTimeTracker(enabled=False)
+
+    def test_threads_are_merged(self):
+        """Each thread records on its own, and the summary merges them all"""
+
+        def work():
+            for _ in range(10):
+                with self.tracker(context="Work", store=True):
+                    pass
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        work()
+
+        self.assertEqual(self.tracker.get_summary()["Work"].call_count, 50)
+        # Finished threads are folded into the state, and still counted
+        self.assertEqual(self.tracker.get_context_metrics("Work").call_count, 50)
+
+    def test_record(self):
+        """Times measured outside the context manager are stored under it"""
+        with self.tracker(context="Source", store=True):
+            self.tracker.record("SQL", 0.5)
+
+        self.assertEqual(self.tracker.get_summary()["Source.SQL"].total_time, 0.5)
+
+    def test_disabled(self):
+        """Nothing is recorded when disabled"""
+        ExecutionTimeTracker(enabled=False)
+        with self.tracker(context="Source", store=True):
+            self.tracker.record("SQL", 0.5)
+
+        self.assertEqual(self.tracker.get_summary(), {})
+
+    def test_endpoint_context(self):
+        """Requests are timed by endpoint collection"""
+        self.assertEqual(
+            _get_endpoint_context("/tables/name/svc.db.schema.t?fields=tags"), "tables"
+        )
+        self.assertEqual(_get_endpoint_context("/"), "root")
+
+    def test_failed_queries(self):
+        """The start of the failed queries is not left on the connection"""
+        engine = create_engine("sqlite://")
+        attach_query_tracker(engine)
+
+        with self.tracker(context="Source", store=True), engine.connect() as conn:
+            for _ in range(3):
+                with self.assertRaises(Exception):
+                    conn.execute(text("SELECT * FROM missing"))
+            conn.execute(text("SELECT 1")).fetchall()
+
+            self.assertEqual(conn.info["query_start_time"], [])
+        self.assertEqual(self.tracker.get_summary()["Source.SQL"].call_count, 1)
+
+
+class ExecutionTimeExporterTest(TestCase):
+    """Validate the exported formats"""
+
+    def setUp(self):
+        metrics = ExecutionTimeMetrics()
+        metrics.update(0.25)
+        self.metrics = {'Source.GET."tables"': metrics}
+
+    def test_openmetrics(self):
+        """Render a summary per context"""
+        content = to_openmetrics(self.metrics)
+
+        self.assertIn(f"# TYPE {METRIC_NAME} summary", content)
+        self.assertIn(
+            f'{METRIC_NAME}{{context="Source.GET.\\"tables\\"",quantile="0.5"}} 0.25',
+            content,
+        )
+        self.assertIn(
+            f'{METRIC_NAME}_count{{context="Source.GET.\\"tables\\""}} 1', content
+        )
+        self.assertTrue(content.endswith("# EOF\n"))
+
+    def test_json(self):
+        """Render the percentiles per context"""
+        content = json.loads(to_json(self.metrics))
+
+        self.assertEqual(content['Source.GET."tables"']["count"], 1)
+        self.assertEqual(content['Source.GET."tables"']["p99"], 0.25)
+
+    def test_write(self):
+        """The file is replaced with the latest snapshot"""
+        tracker = ExecutionTimeTracker(enabled=True)
+        tracker.reset()
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = Path(tmp_dir) / "metrics" / "latency.json"
+                exporter = ExecutionTimeExporter(
+                    config=LatencyMetrics(
+                        path=str(path), format=LatencyMetricsFormat.json
+                    ),
+                    grouping_key="pipeline",
+                )
+                tracker.record("Sink", 0.1)
+                exporter.export()
+
+                self.assertEqual(json.loads(path.read_text())["Sink"]["count"], 1)
+                self.assertEqual(list(path.parent.iterdir()), [path])
+        finally:
+            tracker.reset()
+            ExecutionTimeTracker(enabled=False)
@@ -0,0 +1,116 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the JSON codecs"""
+import json
+from json import JSONDecodeError
+from unittest.mock import Mock, patch
+
+import pytest
+
+from metadata.ingestion.ometa.client import REST, ClientConfig
+from metadata.utils import json_codec
+from metadata.utils.json_codec import (
+    JSON_CODECS,
+    JsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
+
+AVAILABLE_CODECS = [
+    codec for name, codec in JSON_CODECS.items() if json_codec._AVAILABLE[name]
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    yield
+    set_json_codec()
+
+
+@pytest.mark.parametrize("codec_class", AVAILABLE_CODECS)
+def test_round_trip(codec_class):
+    """All the codecs give the same compact JSON"""
+    codec = codec_class()
+    obj = {"name": "tablé", "columns": [{"b": 1, "a": 0.5}], "deleted": None}
+
+    payload = codec.encode(obj)
+    assert payload == JsonCodec().encode(obj)
+    assert codec.decode(payload) == obj
+    assert codec.decode(payload.decode("utf-8")) == obj
+    assert codec.encode({"b": 1, "a": 2}, sort_keys=True) == b'{"a":2,"b":1}'
+    assert codec.dumps([1, "a"]) == '[1,"a"]'
+
+
+@pytest.mark.parametrize("codec_class", AVAILABLE_CODECS)
+def test_errors(codec_class):
+    """Invalid JSON raises the stdlib error, and what the codec can't encode falls back to it"""
+    codec = codec_class()
+    with pytest.raises(JSONDecodeError):
+        codec.decode(b"<html>Bad Gateway</html>")
+
+    assert codec.decode(codec.encode({"big": 2**70})) == {"big": 2**70}
+    for data in (b'{"big": 123456789012345678901234567890}', f"[{-(2**64)}]"):
+        assert codec.decode(data) == json.loads(data)
+
+
+def test_stats():
+    """Encoded and decoded payloads are counted"""
+    codec = get_json_codec()
+    codec.reset_stats()
+
+    payload = codec.encode({"name": "t"})
+    codec.decode(payload)
+    codec.decode(payload)
+
+    stats = codec.stats()
+    assert stats.codec == codec.name
+    assert (stats.encoded, stats.encoded_bytes) == (1, len(payload))
+    assert (stats.decoded, stats.decoded_bytes) == (2, 2 * len(payload))
+    assert stats.encode_seconds > 0 and stats.decode_seconds > 0
+
+
+def test_set_json_codec():
+    """We pick the requested codec, or the fastest one available"""
+    assert isinstance(set_json_codec("stdlib"), JsonCodec)
+    assert get_json_codec().name == "stdlib"
+
+    with patch.dict(json_codec._AVAILABLE, {"orjson": False, "msgspec": False}):
+        assert set_json_codec("orjson").name == "stdlib"
+        assert set_json_codec("auto").name == "stdlib"
+
+    with pytest.raises(ValueError):
+        set_json_codec("simplejson")
+
+
+@patch("metadata.ingestion.ometa.client.requests.Session.request")
+def test_rest_client_uses_codec(mock_request):
+    """JSON bodies are encoded, and responses decoded, by the codec"""
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps({"name": "t"}).encode()
+    mock_request.return_value = response
+    client = REST(
+        ClientConfig(
+            base_url="http://localhost:8585/api",
+            api_version="v1",
+            auth_token=lambda: ("token", 3600),
+        )
+    )
+    codec = get_json_codec()
+    codec.reset_stats()
+
+    assert client.put("/tables/bulk", json=[{"name": "t"}]) == {"name": "t"}
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["data"] == b'[{"name":"t"}]'
+    assert "json" not in kwargs
+    assert kwargs["headers"]["Content-type"] == "application/json"
+    assert (codec.stats().encoded, codec.stats().decoded) == (1, 1)
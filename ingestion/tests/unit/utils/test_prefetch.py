@@ -0,0 +1,100 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""Unit tests for the background prefetching of iterables"""
+import threading
+import time
+
+import pytest
+
+from metadata.utils.prefetch import prefetch, prefetch_parallel
+
+
+def _pages(count: int, produced: list, delay: float = 0.0):
+    for page in range(count):
+        time.sleep(delay)
+        produced.append(threading.get_ident())
+        yield page
+
+
+def _named_pages(name: str):
+    for page in _pages(3, [], delay=0.1):
+        yield f"{name}{page}"
+
+
+def test_prefetch_reads_ahead():
+    """Pages are fetched in the background, up to the read ahead"""
+    produced = []
+    iterator = prefetch(_pages(10, produced), read_ahead=2)
+
+    assert next(iterator) == 0
+    time.sleep(0.1)
+    # The one consumed, the ones in the buffer and the one waiting for room
+    assert len(produced) == 4
+    assert threading.get_ident() not in produced
+    assert list(iterator) == list(range(1, 10))
+
+
+def test_prefetch_overlaps_consumer():
+    """The next page is fetched while the consumer processes the current one"""
+    start = time.perf_counter()
+    for _ in prefetch(_pages(5, [], delay=0.05), read_ahead=1):
+        time.sleep(0.05)
+    assert time.perf_counter() - start < 0.45
+
+
+def test_prefetch_disabled():
+    """Without read ahead, we iterate in the calling thread"""
+    produced = []
+    assert list(prefetch(_pages(3, produced), read_ahead=0)) == [0, 1, 2]
+    assert set(produced) == {threading.get_ident()}
+
+
+def test_prefetch_error():
+    """The exception of the iterable is raised to the consumer"""
+
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    iterator = prefetch(failing())
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
+
+
+def test_prefetch_stops_with_consumer():
+    """The producer gives up once the consumer stops iterating"""
+    produced = []
+    iterator = prefetch(_pages(1000, produced), read_ahead=1)
+    next(iterator)
+    iterator.close()
+    time.sleep(0.3)
+    assert len(produced) < 10
+
+
+def test_prefetch_parallel():
+    """Iterables are fetched in parallel, keeping their own order"""
+    start = time.perf_counter()
+    elements = list(
+        prefetch_parallel(
+            [_named_pages(name) for name in "abcd"],
+            max_workers=4,
+        )
+    )
+
+    assert time.perf_counter() - start < 0.6
+    assert sorted(elements) == sorted(
+        f"{name}{idx}" for name in "abcd" for idx in range(3)
+    )
+    for name in "abcd":
+        assert [e for e in elements if e[0] == name] == [
+            f"{name}{idx}" for idx in range(3)
+        ]
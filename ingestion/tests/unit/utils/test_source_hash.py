@@ -12,6 +12,7 @@
 Test source hash stability and normalization
 """
 import uuid
+from unittest.mock import patch
 
 from metadata.generated.schema.api.data.createTable import CreateTableRequest
 from metadata.generated.schema.entity.data.table import (
@@ -28,15 +29,18 @@ from metadata.generated.schema.type.tagLabel import (
     TagSource,
 )
 from metadata.utils.source_hash import (
+    BLAKE2B_SOURCE_HASH_VERSION,
+    LEGACY_SOURCE_HASH_VERSION,
+    XXH3_SOURCE_HASH_VERSION,
+    _canonicalize,
     _get_column_sort_key,
     _get_constraint_sort_key,
     _get_entity_reference_sort_key,
     _get_tag_sort_key,
-    _normalize_for_hash,
     _normalize_whitespace,
-    _remove_volatile_fields,
-    _sort_columns,
     generate_source_hash,
+    get_source_hash_version,
+    get_supported_source_hash_version,
 )
 
 
@@ -117,20 +121,20 @@ class TestGetEntityReferenceSortKey:
         assert _get_entity_reference_sort_key(ref) == "789"
 
 
-class TestRemoveVolatileFields:
+class TestCanonicalizeVolatileFields:
     def test_remove_href(self):
         data = {"name": "test", "href": "http://example.com"}
-        result = _remove_volatile_fields(data)
+        result = _canonicalize(data)
         assert result == {"name": "test"}
 
     def test_remove_deleted(self):
         data = {"id": "123", "deleted": True}
-        result = _remove_volatile_fields(data)
+        result = _canonicalize(data)
         assert result == {"id": "123"}
 
     def test_remove_inherited(self):
         data = {"name": "owner", "inherited": False}
-        result = _remove_volatile_fields(data)
+        result = _canonicalize(data)
         assert result == {"name": "owner"}
 
     def test_remove_nested_volatile(self):
@@ -139,23 +143,23 @@ class TestRemoveVolatileFields:
                 {"name": "user1", "href": "http://example.com/user1", "deleted": False}
             ]
         }
-        result = _remove_volatile_fields(data)
+        result = _canonicalize(data)
         assert result == {"owners": [{"name": "user1"}]}
 
     def test_preserve_non_volatile(self):
         data = {"name": "test", "description": "desc", "type": "user"}
-        result = _remove_volatile_fields(data)
+        result = _canonicalize(data)
         assert result == data
 
 
-class TestSortColumns:
+class TestCanonicalizeColumns:
     def test_sort_by_ordinal(self):
         columns = [
             {"name": "col_c", "ordinalPosition": 3},
             {"name": "col_a", "ordinalPosition": 1},
             {"name": "col_b", "ordinalPosition": 2},
         ]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert [c["name"] for c in sorted_cols] == ["col_a", "col_b", "col_c"]
 
     def test_sort_by_name_when_no_ordinal(self):
@@ -164,7 +168,7 @@ class TestSortColumns:
             {"name": "alpha"},
             {"name": "beta"},
         ]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert [c["name"] for c in sorted_cols] == ["alpha", "beta", "zebra"]
 
     def test_sort_mixed_ordinal_and_name(self):
@@ -173,7 +177,7 @@ class TestSortColumns:
             {"name": "with_ordinal", "ordinalPosition": 1},
             {"name": "no_ordinal_a"},
         ]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert sorted_cols[0]["name"] == "with_ordinal"
         assert sorted_cols[1]["name"] == "no_ordinal_a"
         assert sorted_cols[2]["name"] == "no_ordinal_b"
@@ -189,7 +193,7 @@ class TestSortColumns:
                 ],
             }
         ]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert [c["name"] for c in sorted_cols[0]["children"]] == ["child_a", "child_b"]
 
     def test_sort_column_tags(self):
@@ -203,23 +207,23 @@ class TestSortColumns:
                 ],
             }
         ]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert sorted_cols[0]["tags"][0]["tagFQN"] == "Classification.Email"
         assert sorted_cols[0]["tags"][1]["tagFQN"] == "PII.Sensitive"
 
     def test_sort_string_columns(self):
         """Test backward compatibility with string column lists."""
         columns = ["zebra", "alpha", "beta"]
-        sorted_cols = _sort_columns(columns)
+        sorted_cols = _canonicalize({"columns": columns})["columns"]
         assert sorted_cols == ["alpha", "beta", "zebra"]
 
     def test_sort_empty_columns(self):
         """Test handling of empty column lists."""
-        assert _sort_columns([]) == []
-        assert _sort_columns(None) is None
+        assert _canonicalize({"columns": []}) == {"columns": []}
+        assert _canonicalize({"columns": None}) == {"columns": None}
 
 
-class TestNormalizeForHash:
+class TestCanonicalize:
     def test_normalize_columns(self):
         data = {
             "columns": [
@@ -227,7 +231,7 @@ class TestNormalizeForHash:
                 {"name": "col_a", "ordinalPosition": 1},
             ]
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert result["columns"][0]["name"] == "col_a"
         assert result["columns"][1]["name"] == "col_b"
 
@@ -238,7 +242,7 @@ class TestNormalizeForHash:
                 {"tagFQN": "Tag.A"},
             ]
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert result["tags"][0]["tagFQN"] == "Tag.A"
         assert result["tags"][1]["tagFQN"] == "Tag.B"
 
@@ -249,7 +253,7 @@ class TestNormalizeForHash:
                 {"constraintType": "PRIMARY_KEY", "columns": ["id"]},
             ]
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert result["tableConstraints"][0]["constraintType"] == "PRIMARY_KEY"
         assert result["tableConstraints"][1]["constraintType"] == "UNIQUE"
 
@@ -260,7 +264,7 @@ class TestNormalizeForHash:
                 {"fullyQualifiedName": "team.user_a"},
             ]
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert result["owners"][0]["fullyQualifiedName"] == "team.user_a"
         assert result["owners"][1]["fullyQualifiedName"] == "team.user_b"
 
@@ -272,7 +276,7 @@ class TestNormalizeForHash:
                 )
             """
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert result["schemaDefinition"] == "CREATE TABLE foo ( id INT )"
 
     def test_normalize_removes_volatile_fields(self):
@@ -281,7 +285,7 @@ class TestNormalizeForHash:
                 {"name": "user1", "href": "http://example.com", "deleted": False}
             ]
         }
-        result = _normalize_for_hash(data)
+        result = _canonicalize(data)
         assert "href" not in result["owners"][0]
         assert "deleted" not in result["owners"][0]
 
@@ -509,3 +513,83 @@ class TestGenerateSourceHash:
         assert hash_with_exclude == generate_source_hash(
             request2, exclude_fields={"description": True}
         )
+
+
+def _create_table_request(description: str = "Description") -> CreateTableRequest:
+    return CreateTableRequest(
+        name="test_table",
+        databaseSchema="service.db.schema",
+        description=description,
+        columns=[
+            Column(
+                name="b",
+                dataType=DataType.STRUCT,
+                children=[
+                    Column(name="y", dataType=DataType.INT),
+                    Column(name="x", dataType=DataType.INT),
+                ],
+            ),
+            Column(name="a", dataType=DataType.INT),
+        ],
+        tags=[
+            TagLabel(
+                tagFQN="PII.Sensitive",
+                source=TagSource.Classification,
+                labelType=LabelType.Automated,
+                state=State.Suggested,
+            )
+        ],
+        schemaDefinition="CREATE TABLE  test_table (\n  a INT\n)",
+    )
+
+
+class TestSourceHashVersions:
+    def test_legacy_hash_is_unchanged(self):
+        """Hashes stored by the previous releases keep matching"""
+        assert (
+            generate_source_hash(_create_table_request())
+            == "7853b63be60c23ddc4c9f26e16b8eb1a"
+        )
+
+    def test_blake2b_hash(self):
+        request = _create_table_request()
+        source_hash = generate_source_hash(request, version=BLAKE2B_SOURCE_HASH_VERSION)
+        assert source_hash.startswith("2:")
+        assert len(source_hash) == 32
+        assert get_source_hash_version(source_hash) == BLAKE2B_SOURCE_HASH_VERSION
+        assert source_hash != generate_source_hash(
+            _create_table_request(description="Other"),
+            version=BLAKE2B_SOURCE_HASH_VERSION,
+        )
+
+    def test_get_source_hash_version(self):
+        assert get_source_hash_version("cbf1d6c7ba8990582ccb954b76784bdd") == (
+            LEGACY_SOURCE_HASH_VERSION
+        )
+        assert get_source_hash_version("3:abc") == XXH3_SOURCE_HASH_VERSION
+
+    def test_versions_differ(self):
+        """Hashes stored with another version never match, so the entity gets patched"""
+        request = _create_table_request()
+        legacy_hash = generate_source_hash(request)
+        blake2b_hash = generate_source_hash(
+            request, version=BLAKE2B_SOURCE_HASH_VERSION
+        )
+
+        assert legacy_hash != blake2b_hash
+        assert blake2b_hash == generate_source_hash(
+            _create_table_request(), version=BLAKE2B_SOURCE_HASH_VERSION
+        )
+
+    def test_xxh3_without_xxhash(self):
+        with patch("metadata.utils.source_hash.xxhash", None):
+            assert (
+                generate_source_hash(
+                    _create_table_request(), version=XXH3_SOURCE_HASH_VERSION
+                )
+                is None
+            )
+            assert (
+                get_supported_source_hash_version(XXH3_SOURCE_HASH_VERSION)
+                == BLAKE2B_SOURCE_HASH_VERSION
+            )
@@ -0,0 +1,167 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the source hash snapshot refreshes
+"""
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel
+
+from metadata.ingestion.ometa.models import EntityList
+from metadata.utils.source_hash_snapshot import SourceHashRecord, SourceHashSnapshot
+
+
+class MockTable(BaseModel):
+    fullyQualifiedName: str
+    sourceHash: Optional[str] = None
+    deleted: Optional[bool] = None
+
+
+def mock_metadata(
+    tables: List[MockTable], changes: Optional[List[dict]] = None
+) -> MagicMock:
+    """OpenMetadata client listing the given tables and ES changes"""
+    metadata = MagicMock()
+    metadata.list_all_entity_dicts.side_effect = lambda **_: [
+        table.model_dump() for table in tables
+    ]
+
+    def list_entities(include: str, **_):
+        matching = [
+            table
+            for table in tables
+            if include == "all" or bool(table.deleted) == (include == "deleted")
+        ]
+        return EntityList(entities=[], total=len(matching))
+
+    metadata.list_entities.side_effect = list_entities
+    metadata.paginate_es_sources.side_effect = lambda deleted, **_: [
+        change for change in changes or [] if change.get("deleted", False) == deleted
+    ]
+    return metadata
+
+
+class SourceHashSnapshotTest(TestCase):
+    """Validate the full and delta refreshes"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.snapshot = SourceHashSnapshot.create(
+            directory=self.tmp_dir.name,
+            service_name="my service",
+            server="http://localhost:8585/api",
+            max_age_hours=1,
+        )
+        self.tables = [
+            MockTable(fullyQualifiedName="svc.db.schema.t1", sourceHash="h1"),
+            MockTable(
+                fullyQualifiedName="svc.db.schema.t2", sourceHash="h2", deleted=True
+            ),
+        ]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def refresh(self, metadata: MagicMock) -> List[SourceHashRecord]:
+        return self.snapshot.refresh(
+            metadata=metadata,
+            entity=MockTable,
+            parent_fqn="svc.db.schema",
+            params={"database": "svc.db.schema"},
+        )
+
+    def test_full_refresh(self):
+        """Without a snapshot we list all the entities"""
+        metadata = mock_metadata(self.tables)
+
+        records = self.refresh(metadata)
+
+        self.assertEqual(
+            self.snapshot.path, Path(self.tmp_dir.name) / "my_service.sqlite"
+        )
+        self.assertCountEqual(
+            records,
+            [
+                SourceHashRecord("svc.db.schema.t1", "h1", False),
+                SourceHashRecord("svc.db.schema.t2", "h2", True),
+            ],
+        )
+        metadata.list_all_entity_dicts.assert_called_once()
+        metadata.paginate_es_sources.assert_not_called()
+
+    def test_delta_refresh(self):
+        """With a snapshot we only get the changes"""
+        self.refresh(mock_metadata(self.tables))
+
+        self.tables[0].sourceHash = "h1-updated"
+        metadata = mock_metadata(
+            self.tables,
+            changes=[
+                {"fullyQualifiedName": "svc.db.schema.t1", "sourceHash": "h1-updated"}
+            ],
+        )
+        records = self.refresh(metadata)
+
+        self.assertCountEqual(
+            records,
+            [
+                SourceHashRecord("svc.db.schema.t1", "h1-updated", False),
+                SourceHashRecord("svc.db.schema.t2", "h2", True),
+            ],
+        )
+        metadata.list_all_entity_dicts.assert_not_called()
+
+    def test_out_of_sync_refresh(self):
+        """If the changes don't match the API counts, we list all the entities"""
+        self.refresh(mock_metadata(self.tables))
+
+        # A hard deleted table does not show up in the changes
+        metadata = mock_metadata(self.tables[:1])
+        records = self.refresh(metadata)
+
+        self.assertEqual(records, [SourceHashRecord("svc.db.schema.t1", "h1", False)])
+        metadata.list_all_entity_dicts.assert_called_once()
+
+    def test_stale_snapshot(self):
+        """Stale snapshots are refreshed from scratch"""
+        self.refresh(mock_metadata(self.tables))
+
+        self.snapshot.max_age = timedelta(seconds=0)
+        with patch("metadata.utils.source_hash_snapshot.time.time", return_value=1e10):
+            metadata = mock_metadata(self.tables)
+            self.refresh(metadata)
+
+        metadata.list_all_entity_dicts.assert_called_once()
+        metadata.paginate_es_sources.assert_not_called()
+
+    def test_snapshot_from_another_server(self):
+        """Snapshots built for another server or format are discarded"""
+        self.refresh(mock_metadata(self.tables))
+
+        snapshot = SourceHashSnapshot(
+            path=self.snapshot.path,
+            server="http://other:8585/api",
+            max_age=timedelta(hours=1),
+        )
+        metadata = mock_metadata(self.tables)
+        snapshot.refresh(
+            metadata=metadata,
+            entity=MockTable,
+            parent_fqn="svc.db.schema",
+            params={"database": "svc.db.schema"},
+        )
+
+        metadata.list_all_entity_dicts.assert_called_once()
@@ -0,0 +1,93 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the topology checkpoint
+"""
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from metadata.utils.topology_checkpoint import TopologyCheckpoint
+
+
+class TopologyCheckpointTest(TestCase):
+    """Validate how checkpoints are committed and discarded"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def checkpoint(self, fingerprint: str = "config") -> TopologyCheckpoint:
+        return TopologyCheckpoint.create(
+            directory=self.tmp_dir.name,
+            service_name="my service",
+            fingerprint=fingerprint,
+            max_age_hours=1,
+        )
+
+    def test_commit(self):
+        """Only committed entities are completed in the next run"""
+        checkpoint = self.checkpoint()
+        self.assertEqual(checkpoint.path, Path(self.tmp_dir.name) / "my_service.sqlite")
+
+        checkpoint.complete("svc.db1")
+        checkpoint.complete("svc.db2")
+        checkpoint.commit(
+            completed=checkpoint.take_completed(),
+            source_state={"table_source_state": {"svc.db1.schema.table"}},
+        )
+        checkpoint.complete("svc.db3")
+        self.assertEqual(checkpoint.take_completed(), ["svc.db3"])
+        checkpoint.commit(
+            completed=["svc.db3"],
+            source_state={
+                "table_source_state": {
+                    "svc.db1.schema.table",
+                    "svc.db3.schema.table",
+                }
+            },
+        )
+
+        resumed = self.checkpoint()
+        self.assertEqual(resumed.completed, {"svc.db1", "svc.db2", "svc.db3"})
+        self.assertTrue(resumed.is_completed("svc.db1"))
+        self.assertEqual(
+            resumed.source_state,
+            {"table_source_state": {"svc.db1.schema.table", "svc.db3.schema.table"}},
+        )
+
+        resumed.clear()
+        self.assertEqual(self.checkpoint().completed, set())
+
+    def test_discard_other_workflow(self):
+        """Checkpoints built with another configuration are discarded"""
+        checkpoint = self.checkpoint()
+        checkpoint.commit(completed=["svc.db1"], source_state={})
+
+        self.assertEqual(self.checkpoint(fingerprint="other").completed, set())
+        self.assertEqual(self.checkpoint().completed, set())
+
+    def test_discard_stale(self):
+        """Checkpoints started longer than max age ago are discarded"""
+        checkpoint = self.checkpoint()
+        checkpoint.commit(completed=["svc.db1"], source_state={})
+
+        resumed = TopologyCheckpoint(
+            path=checkpoint.path, fingerprint="config", max_age=timedelta(hours=1)
+        )
+        self.assertEqual(resumed.completed, {"svc.db1"})
+
+        with patch("metadata.utils.topology_checkpoint.time.time", return_value=1e10):
+            self.assertEqual(self.checkpoint().completed, set())
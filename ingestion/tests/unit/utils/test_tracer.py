@@ -0,0 +1,169 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the tracer and its exports
+"""
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from metadata.generated.schema.metadataIngestion.workflow import TraceFormat
+from metadata.utils.tracer import TracedProxy, Tracer, to_chrome_trace, to_otlp
+
+
+class MockInspector:
+    dialect = "mysql"
+
+    @staticmethod
+    def get_columns(table_name: str):
+        return [f"{table_name}.c1"]
+
+
+class TracerTest(TestCase):
+    """Validate the recorded spans"""
+
+    def setUp(self):
+        self.tracer = Tracer()
+        self.tracer.take_spans()
+        self.tracer.enable()
+
+    def tearDown(self):
+        self.tracer.enabled = False
+        self.tracer.take_spans()
+
+    def test_disabled(self):
+        """Nothing is recorded when disabled"""
+        self.tracer.enabled = False
+        with self.tracer.span("GET tables", category="http"):
+            pass
+        self.tracer.record("SELECT", category="sql", start=self.tracer.now())
+
+        self.assertEqual(self.tracer.spans, [])
+
+    def test_nested_spans(self):
+        """Spans keep their parent and thread"""
+        with self.tracer.span("yield_table", category="topology"):
+            with self.tracer.span("GET tables", category="http", args={"path": "/"}):
+                pass
+            self.tracer.record("SELECT", category="sql", start=self.tracer.now())
+
+        thread = threading.Thread(
+            target=lambda: self.tracer.span("GET tables", category="http").__enter__()
+        )
+        thread.start()
+        thread.join()
+
+        http, sql, topology, other_thread = self.tracer.spans
+        self.assertIsNone(topology.parent_id)
+        self.assertEqual(http.parent_id, topology.span_id)
+        self.assertEqual(sql.parent_id, topology.span_id)
+        self.assertEqual(http.args, {"path": "/"})
+        self.assertLessEqual(topology.start, http.start)
+        self.assertNotEqual(other_thread.thread_id, topology.thread_id)
+
+    def test_trace_generator(self):
+        """The time of the consumer is not part of the generator spans"""
+
+        def producer():
+            yield 1
+            yield 2
+
+        for _ in self.tracer.trace_generator(
+            producer(), name="get_tables", category="topology"
+        ):
+            time.sleep(0.05)
+
+        spans = self.tracer.spans
+        self.assertEqual(len(spans), 3)
+        self.assertTrue(all(span.duration < 0.05 * 1e9 for span in spans))
+
+    def test_traced_proxy(self):
+        """Only the matching methods are traced"""
+        inspector = TracedProxy(
+            MockInspector(), category="inspector", prefixes=("get_",)
+        )
+
+        self.assertEqual(inspector.get_columns("t"), ["t.c1"])
+        self.assertEqual(inspector.dialect, "mysql")
+        self.assertEqual(
+            [(span.name, span.category) for span in self.tracer.spans],
+            [("get_columns", "inspector")],
+        )
+
+    def test_max_spans(self):
+        """Spans over the limit are dropped"""
+        self.tracer.enable(max_spans=1)
+        for _ in range(3):
+            with self.tracer.span("GET tables", category="http"):
+                pass
+
+        self.assertEqual(len(self.tracer.spans), 1)
+
+
+class TraceExportTest(TestCase):
+    """Validate the exported formats"""
+
+    def setUp(self):
+        self.tracer = Tracer()
+        self.tracer.take_spans()
+        self.tracer.enable()
+        with self.tracer.span("Sink", category="sink"):
+            with self.tracer.span("PUT tables", category="http", args={"path": "/"}):
+                pass
+        self.spans = self.tracer.spans
+
+    def tearDown(self):
+        self.tracer.enabled = False
+        self.tracer.take_spans()
+
+    def test_chrome_trace(self):
+        """Complete events per span and the thread names"""
+        events = to_chrome_trace(self.spans)["traceEvents"]
+
+        http, sink, thread_name = events
+        self.assertEqual(http["ph"], "X")
+        self.assertEqual(http["args"], {"path": "/"})
+        self.assertEqual(http["tid"], sink["tid"])
+        self.assertEqual(http["ts"], self.spans[0].start / 1000)
+        self.assertEqual(thread_name["ph"], "M")
+        self.assertEqual(thread_name["args"], {"name": threading.current_thread().name})
+
+    def test_otlp(self):
+        """A single trace with the parent spans"""
+        resource_spans = to_otlp(self.spans, service_name="svc")["resourceSpans"][0]
+        http, sink = resource_spans["scopeSpans"][0]["spans"]
+
+        self.assertEqual(
+            resource_spans["resource"]["attributes"],
+            [{"key": "service.name", "value": {"stringValue": "svc"}}],
+        )
+        self.assertEqual(http["traceId"], sink["traceId"])
+        self.assertEqual(http["parentSpanId"], sink["spanId"])
+        self.assertNotIn("parentSpanId", sink)
+        self.assertEqual(http["kind"], 3)
+        self.assertEqual(len(http["spanId"]), 16)
+        self.assertIn(
+            {"key": "path", "value": {"stringValue": "/"}}, http["attributes"]
+        )
+
+    def test_export(self):
+        """The trace is written in the configured format"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "traces" / "trace.json"
+            self.tracer.export(
+                path=str(path), trace_format=TraceFormat.otlp, service_name="svc"
+            )
+
+            self.assertIn("resourceSpans", json.loads(path.read_text()))
+            self.assertEqual(list(path.parent.iterdir()), [path])
@@ -0,0 +1,111 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the AIMD worker autoscaling
+"""
+import threading
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from metadata.utils.worker_autoscaler import WorkerAutoscaler, WorkerFeedback
+
+
+def mock_metrics(cpu: float = 10.0, memory: float = 10.0) -> MagicMock:
+    return MagicMock(
+        cpu_usage_percent=cpu * 4, system_cpu_threads=4, memory_usage_percent=memory
+    )
+
+
+class WorkerAutoscalerTest(TestCase):
+    """Validate the adjustments"""
+
+    def setUp(self):
+        self.feedback = WorkerFeedback()
+        self.feedback.take()
+        self.feedback.enabled = True
+        self.autoscaler = WorkerAutoscaler(
+            min_workers=1,
+            max_workers=8,
+            workers=4,
+            interval_seconds=10,
+            max_cpu_percent=80,
+            max_memory_percent=80,
+            latency_tolerance=2,
+            decrease_factor=0.5,
+        )
+
+    def tearDown(self):
+        self.feedback.enabled = False
+        self.feedback.take()
+
+    def adjust(self, metrics: MagicMock = None, saturated: bool = True) -> int:
+        self.autoscaler._saturated = saturated
+        with patch(
+            "metadata.utils.worker_autoscaler.WorkflowResourceMetrics",
+            return_value=metrics or mock_metrics(),
+        ):
+            self.autoscaler.adjust()
+        return self.autoscaler.workers
+
+    def test_additive_increase(self):
+        """Busy workers get one more worker, up to the max"""
+        self.assertEqual(self.adjust(), 5)
+        self.assertEqual(self.adjust(saturated=False), 5)
+        for _ in range(5):
+            self.adjust()
+        self.assertEqual(self.autoscaler.workers, 8)
+
+    def test_multiplicative_decrease(self):
+        """Resources and throttling divide the workers, down to the min"""
+        self.assertEqual(self.adjust(mock_metrics(cpu=90)), 2)
+        self.assertEqual(self.adjust(mock_metrics(memory=90)), 1)
+
+        self.feedback.record_throttled()
+        self.assertEqual(self.adjust(), 1)
+
+    def test_latency(self):
+        """Latencies over the baseline times the tolerance divide the workers"""
+        self.feedback.record_source_query(0.1)
+        self.assertEqual(self.adjust(), 5)
+
+        self.feedback.record_source_query(0.15)
+        self.feedback.record_api_request(0.01)
+        self.assertEqual(self.adjust(), 6)
+
+        self.feedback.record_source_query(0.3)
+        self.assertEqual(self.adjust(), 3)
+
+    def test_slot(self):
+        """At most `workers` entities are processed at the same time"""
+        self.autoscaler.workers = 2
+        cancelled = threading.Event()
+        lock = threading.Lock()
+        active, max_active = [0], [0]
+        release = threading.Event()
+
+        def work():
+            with self.autoscaler.slot(cancelled):
+                with lock:
+                    active[0] += 1
+                    max_active[0] = max(max_active[0], active[0])
+                release.wait(1)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max_active[0], 2)
+        self.assertTrue(self.autoscaler._saturated)
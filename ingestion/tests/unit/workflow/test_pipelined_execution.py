@@ -0,0 +1,183 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the pipelined execution of the workflow steps
+"""
+import random
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+from unittest import TestCase
+
+from metadata.generated.schema.entity.services.ingestionPipelines.status import (
+    StackTraceError,
+)
+from metadata.ingestion.api.models import Either
+from metadata.ingestion.api.step import WorkflowFatalError
+from metadata.ingestion.api.steps import Processor, Sink, Source
+from metadata.workflow.pipelined_execution import PipelinedExecution
+
+
+class KeyedSource(Source):
+    """
+    Yields (key, value) records. Records with a `None` key are barriers
+    and validate that everything sent before has been processed.
+    """
+
+    def __init__(self, records: List[Tuple[Optional[str], int]], sink: "RecordingSink"):
+        super().__init__()
+        self.records = records
+        self.sink = sink
+        self.barrier_checks = []
+        self._last_key = None
+
+    def prepare(self):
+        """Nothing to do"""
+
+    def test_connection(self) -> None:
+        """Nothing to do"""
+
+    @classmethod
+    def create(cls, *_, **__):
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Nothing to do"""
+
+    def _iter(self, *_, **__) -> Iterable[Either]:
+        for idx, (key, value) in enumerate(self.records):
+            self._last_key = key
+            yield Either(right=value)
+            if key is None:
+                # Everything up to the barrier must be processed at this point
+                self.barrier_checks.append(len(self.sink.processed) == idx + 1)
+
+    def get_record_ordering_key(self, record):
+        return self._last_key
+
+
+class DoubleProcessor(Processor):
+    """Multiplies the records by 2"""
+
+    def _run(self, record: int) -> Either:
+        return Either(right=record * 2)
+
+    @classmethod
+    def create(cls, *_, **__):
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Nothing to do"""
+
+
+class RecordingSink(Sink):
+    """Keeps track of the processed records and the threads processing them"""
+
+    def __init__(self, fail_on: Optional[int] = None, fatal_on: Optional[int] = None):
+        super().__init__()
+        self.processed = []
+        self.threads = set()
+        self.fail_on = fail_on
+        self.fatal_on = fatal_on
+        self.lock = threading.Lock()
+
+    def _run(self, record: int) -> Either:
+        # Shuffle the timings to validate the ordering guarantees
+        time.sleep(random.random() / 1000)
+        if record == self.fatal_on:
+            raise WorkflowFatalError("fatal")
+        with self.lock:
+            self.processed.append(record)
+            self.threads.add(threading.get_ident())
+        if record == self.fail_on:
+            return Either(
+                left=StackTraceError(name="bum", error="kaboom", stackTrace="trace")
+            )
+        return Either(right=record)
+
+    @classmethod
+    def create(cls, *_, **__):
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Nothing to do"""
+
+
+class PipelinedExecutionTest(TestCase):
+    """Validate the pipelined execution"""
+
+    def test_records_keep_order_per_key(self):
+        """All the records are processed and the order per key is kept"""
+        records = [(None, 0)] + [(f"key{value % 5}", value) for value in range(1, 200)]
+        sink = RecordingSink()
+        source = KeyedSource(records=records, sink=sink)
+
+        PipelinedExecution(
+            source=source, steps=[sink], sink_workers=4, queue_size=10
+        ).run()
+
+        self.assertCountEqual(sink.processed, [value for _, value in records])
+        for key in range(5):
+            processed_for_key = [value for value in sink.processed if value % 5 == key]
+            self.assertEqual(processed_for_key, sorted(processed_for_key))
+
+        self.assertGreater(len(sink.threads), 1)
+        self.assertEqual(len(sink.status.records), 200)
+
+    def test_barriers(self):
+        """Barrier records wait for the previous ones and get processed before continuing"""
+        records = [
+            (None, 0),
+            ("a", 1),
+            ("b", 2),
+            ("c", 3),
+            (None, 4),
+            ("a", 5),
+            (None, 6),
+        ]
+        sink = RecordingSink()
+        source = KeyedSource(records=records, sink=sink)
+
+        PipelinedExecution(
+            source=source, steps=[sink], sink_workers=3, queue_size=10
+        ).run()
+
+        self.assertEqual(source.barrier_checks, [True, True, True])
+        self.assertEqual(sink.processed[0], 0)
+        self.assertEqual(sink.processed[4], 4)
+        self.assertEqual(sink.processed[6], 6)
+
+    def test_processors_and_status(self):
+        """Records go through the processors and the status is kept per step"""
+        records = [(f"key{value}", value) for value in range(10)]
+        sink = RecordingSink(fail_on=4)
+        source = KeyedSource(records=records, sink=sink)
+        processor = DoubleProcessor()
+
+        PipelinedExecution(
+            source=source, steps=[processor, sink], sink_workers=2, queue_size=2
+        ).run()
+
+        self.assertCountEqual(sink.processed, [value * 2 for value in range(10)])
+        self.assertEqual(len(processor.status.records), 10)
+        self.assertEqual(len(sink.status.records), 9)
+        self.assertEqual(len(sink.status.failures), 1)
+
+    def test_fatal_error(self):
+        """Fatal errors in the workers stop the execution"""
+        records = [(f"key{value}", value) for value in range(100)]
+        sink = RecordingSink(fatal_on=10)
+        source = KeyedSource(records=records, sink=sink)
+
+        with self.assertRaises(WorkflowFatalError):
+            PipelinedExecution(
+                source=source, steps=[sink], sink_workers=2, queue_size=2
+            ).run()
@@ -0,0 +1,300 @@
+#  Copyright 2025 Collate
+#  Licensed under the Collate Community License, Version 1.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#  https://github.com/open-metadata/OpenMetadata/blob/main/ingestion/LICENSE
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Validate the sharded execution of the Metadata Workflow
+"""
+from typing import Any, Dict, Iterable
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel, Field
+from typing_extensions import Annotated
+
+from metadata.generated.schema.entity.services.ingestionPipelines.status import (
+    StackTraceError,
+)
+from metadata.ingestion.api.models import Either
+from metadata.ingestion.api.status import Status
+from metadata.ingestion.api.topology_runner import TopologyRunnerMixin
+from metadata.ingestion.models.topology import (
+    NodeStage,
+    ServiceTopology,
+    TopologyContextManager,
+    TopologyNode,
+    TopologyShard,
+)
+from metadata.utils.execution_time_tracker import (
+    ExecutionTimeMetrics,
+    ExecutionTimeTrackerState,
+)
+from metadata.workflow.sharded_execution import ShardedExecution, ShardResult
+
+
+class MockEntity(BaseModel):
+    name: str
+
+
+class MockSchema(MockEntity):
+    pass
+
+
+class MockTable(MockEntity):
+    pass
+
+
+class MockTopology(ServiceTopology):
+    service: Annotated[TopologyNode, Field(description="Shared node")] = TopologyNode(
+        producer="get_services",
+        stages=[
+            NodeStage(type_=MockEntity, processor="yield_service", context="service")
+        ],
+        children=["schemas"],
+        post_process=["yield_table_constraints", "mark_tables_as_deleted"],
+    )
+    schemas: Annotated[TopologyNode, Field(description="Sharded node")] = TopologyNode(
+        producer="get_schemas",
+        stages=[
+            NodeStage(
+                type_=MockSchema,
+                processor="yield_schema",
+                context="schemas",
+                consumer=["service"],
+            )
+        ],
+        children=["tables"],
+        shard=True,
+    )
+    tables: Annotated[
+        TopologyNode, Field(description="Sharded children")
+    ] = TopologyNode(
+        producer="get_tables",
+        stages=[
+            NodeStage(
+                type_=MockTable,
+                processor="yield_table",
+                context="tables",
+                consumer=["service", "schemas"],
+            )
+        ],
+    )
+
+
+class MockSource(TopologyRunnerMixin):
+    """Every schema has a table with a foreign key, processed after all the tables"""
+
+    topology = MockTopology()
+
+    def __init__(self):
+        self.status = Status()
+        self.table_source_state = set()
+        self.context = TopologyContextManager(self.topology)
+        self.context.get_global().foreign_keys = []
+
+    def get_status(self) -> Status:
+        return self.status
+
+    @staticmethod
+    def get_services() -> Iterable[str]:
+        yield "service"
+
+    def get_schemas(self) -> Iterable[str]:
+        self.status.filter("service.filtered", "Schema Filtered Out")
+        yield from (f"schema{idx}" for idx in range(6))
+
+    @staticmethod
+    def get_tables() -> Iterable[str]:
+        yield from ("table0", "table1")
+
+    @staticmethod
+    def yield_service(name: str) -> Iterable[Either]:
+        yield Either(right=MockEntity(name=name))
+
+    @staticmethod
+    def yield_schema(name: str) -> Iterable[Either]:
+        yield Either(right=MockSchema(name=name))
+
+    def yield_table(self, name: str) -> Iterable[Either]:
+        table_fqn = f"{self.context.get().schemas}.{name}"
+        self.table_source_state.add(table_fqn)
+        if name == "table1":
+            self.context.get_global().foreign_keys.append(table_fqn)
+        yield Either(right=MockTable(name=table_fqn))
+
+    def get_post_process_state(self) -> Dict[str, Any]:
+        return {"foreign_keys": self.context.get_global().foreign_keys}
+
+    def yield_table_constraints(self) -> Iterable[Either]:
+        foreign_keys = self.context.get_global().foreign_keys
+        yield Either(right=MockEntity(name=f"constraints {len(foreign_keys)}"))
+
+    def mark_tables_as_deleted(self) -> Iterable[Either]:
+        yield Either(right=MockEntity(name=f"deleted {len(self.table_source_state)}"))
+
+
+class MockSink:
+    """Keeps the names of the records it gets"""
+
+    def __init__(self):
+        self.status = Status()
+        self.flushes = 0
+
+    def get_status(self) -> Status:
+        return self.status
+
+    def run(self, record: Either) -> None:
+        self.status.records.append(record.right.name)
+
+
+class MockWorkflow:
+    """Built from its configuration in each worker process"""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.source = MockSource()
+        self.sink = MockSink()
+
+    def workflow_steps(self):
+        return [self.source, self.sink]
+
+    def execute_internal(self) -> None:
+        for record in self.source._iter():
+            self.sink.run(record)
+
+    def flush_steps(self) -> None:
+        self.sink.flushes += 1
+
+    def stop(self) -> None:
+        pass
+
+
+class ShardedExecutionTest(TestCase):
+    """Validate the shards and how their results are merged"""
+
+    def test_shard_ownership(self):
+        """Each key belongs to a single worker, and never to the coordinator"""
+        keys = [f"service.database.schema{idx}" for idx in range(100)]
+        shards = [TopologyShard(index=index, count=4) for index in range(4)]
+
+        for key in keys:
+            self.assertEqual(sum(shard.owns(key) for shard in shards), 1)
+            self.assertFalse(TopologyShard(count=4).owns(key))
+
+        # All the workers get some of the keys
+        for shard in shards:
+            self.assertTrue(any(shard.owns(key) for key in keys))
+
+    def test_shard_post_process(self):
+        """Only the coordinator runs the shared post processes, once the workers finish"""
+        worker = TopologyShard(index=0, count=2)
+        coordinator = TopologyShard(count=2)
+        finished_coordinator = TopologyShard(count=2, workers_finished=True)
+
+        self.assertTrue(worker.runs_post_process("yield_procedures", shared=False))
+        self.assertFalse(
+            worker.runs_post_process("yield_table_constraints", shared=True)
+        )
+        self.assertFalse(
+            worker.runs_post_process("mark_tables_as_deleted", shared=False)
+        )
+        for shared in (True, False):
+            self.assertFalse(
+                coordinator.runs_post_process("mark_tables_as_deleted", shared=shared)
+            )
+            self.assertTrue(
+                finished_coordinator.runs_post_process(
+                    "mark_tables_as_deleted", shared=shared
+                )
+            )
+        self.assertFalse(coordinator.runs_post_process("yield_table_constraints", True))
+        self.assertTrue(
+            finished_coordinator.runs_post_process("yield_table_constraints", True)
+        )
+        self.assertFalse(
+            finished_coordinator.runs_post_process("yield_procedures", shared=False)
+        )
+
+    def test_shard_records(self):
+        """The records of the shared nodes are only sent before the workers run"""
+        self.assertTrue(TopologyShard(count=2).sends_records(shared=True))
+        self.assertFalse(
+            TopologyShard(count=2, workers_finished=True).sends_records(shared=True)
+        )
+        self.assertFalse(TopologyShard(index=1, count=2).sends_records(shared=True))
+        self.assertTrue(TopologyShard(index=1, count=2).sends_records(shared=False))
+
+    def test_merge(self):
+        """Status, execution times and source state get added to the workflow"""
+        source_status, sink_status = Status(), Status()
+        source_status.scanned("schema1")
+        sink_status.failed(StackTraceError(name="a", error="b"))
+
+        workflow = MagicMock()
+        workflow.workflow_steps.return_value = [
+            MagicMock(get_status=lambda: source_status),
+            MagicMock(get_status=lambda: sink_status),
+        ]
+
+        worker_source_status = Status()
+        worker_source_status.scanned("schema2")
+        worker_source_status.warning("schema3", "warning")
+        worker_sink_status = Status(record_count=2)
+
+        tracker_state = ExecutionTimeTrackerState()
+        tracker_state.state["ShardedExecutionTest"] = ExecutionTimeMetrics(
+            total_time=1.0, call_count=1, min_time=1.0, max_time=1.0
+        )
+
+        ShardedExecution(workflow=workflow, processes=2).merge(
+            ShardResult(
+                statuses=[worker_source_status, worker_sink_status],
+                execution_times={
+                    "ShardedExecutionTest": ExecutionTimeMetrics(
+                        total_time=3.0, call_count=2, min_time=0.5, max_time=2.5
+                    )
+                },
+                source_state={"database_source_state": {"svc.db.schema2.table"}},
+            )
+        )
+
+        self.assertEqual(source_status.records, ["schema1", "schema2"])
+        self.assertEqual(source_status.warnings, [{"schema3": "warning"}])
+        self.assertEqual(len(sink_status.failures), 1)
+        self.assertEqual(sink_status.record_count, 2)
+
+        metrics = tracker_state.get_metrics("ShardedExecutionTest")
+        self.assertEqual(metrics.total_time, 4.0)
+        self.assertEqual(metrics.call_count, 3)
+        self.assertEqual(metrics.min_time, 0.5)
+        self.assertEqual(metrics.max_time, 2.5)
+        tracker_state.state.pop("ShardedExecutionTest")
+
+        workflow.source.merge_source_state.assert_called_once_with(
+            {"database_source_state": {"svc.db.schema2.table"}}
+        )
+
+    def test_run(self):
+        """Each record is sent once, with the shards running in spawned processes"""
+        workflow = MockWorkflow(config={})
+        ShardedExecution(workflow=workflow, processes=2).run()
+
+        schemas = [f"schema{idx}" for idx in range(6)]
+        tables = [f"{schema}.table{idx}" for schema in schemas for idx in range(2)]
+        self.assertEqual(
+            sorted(workflow.sink.status.records),
+            sorted(["service", *schemas, *tables, "constraints 6", "deleted 12"]),
+        )
+        # The shared entities are created before the workers run
+        self.assertEqual(workflow.sink.status.records[0], "service")
+        self.assertEqual(workflow.sink.flushes, 1)
+        self.assertEqual(
+            workflow.source.status.filtered,
+            [{"service.filtered": "Schema Filtered Out"}],
+        )
@@ -1169,18 +1169,35 @@ export interface AppLimitsConfig {
  * Configuration for the entire Ingestion Workflow.
  */
 export interface WorkflowConfig {
+    checkpoint?:              Checkpoint;
     config?:                  { [key: string]: any };
+    entityCache?:             EntityCache;
+    jsonCodec?:               JSONCodec;
+    latencyMetrics?:          LatencyMetrics;
     loggerLevel?:             LogLevels;
     openMetadataServerConfig: OpenMetadataConnection;
+    pipelinedExecution?:      PipelinedExecution;
+    rateLimit?:               RateLimit;
     /**
      * Control if we want to flag the workflow as failed if we encounter any processing errors.
      */
     raiseOnError?: boolean;
+    shardedExecution?:   ShardedExecution;
+    sourceHashSnapshot?: SourceHashSnapshot;
+    /**
+     * Format of the fingerprints (sourceHash) computed for the ingested entities. 1 is the MD5
+     * of the canonical JSON of the entity. 2 hashes a compact canonical JSON with BLAKE2b, and
+     * 3 with the non-cryptographic XXH3, which requires the `xxhash` package. Changing it
+     * patches every entity once, to store its fingerprint in the new format.
+     */
+    sourceHashVersion?: number;
     /**
      * The percentage of successfully processed records that must be achieved for the pipeline
      * to be considered successful. Otherwise, the pipeline will be marked as failed.
      */
-    successThreshold?: number;
+    successThreshold?:  number;
+    tracing?:           Tracing;
+    workerAutoscaling?: WorkerAutoscaling;
 }
 
 /**
@@ -1468,3 +1485,277 @@ export enum VerifySSL {
     NoSSL = "no-ssl",
     Validate = "validate",
 }
+
+/**
+ * Run the Source, Processors and Sink of the workflow as separate stages joined by bounded
+ * queues, instead of passing each record through all the steps in the same thread.
+ */
+export interface PipelinedExecution {
+    /**
+     * Flag to run the workflow steps as a pipeline.
+     */
+    enabled?: boolean;
+    /**
+     * Maximum number of records waiting to be processed by each worker. The previous step
+     * blocks when the queue is full.
+     */
+    queueSize?: number;
+    /**
+     * Number of threads sending records to the Sink in parallel. Records that depend on each
+     * other are always handled in order by the same worker.
+     */
+    sinkWorkers?: number;
+}
+
+/**
+ * Split the metadata ingestion of the service across multiple processes. Each process runs
+ * its own Source and OpenMetadata client over a deterministic share of the database
+ * schemas. Entities are marked as deleted once, after all the processes finish.
+ */
+export interface ShardedExecution {
+    /**
+     * Number of processes ingesting the metadata in parallel. With a single process, the
+     * workflow is not sharded.
+     */
+    processes?: number;
+}
+
+/**
+ * Keep the fingerprints (sourceHash) of the ingested entities in a local snapshot per
+ * service. Later runs only refresh the entities changed since the previous run, instead of
+ * listing all of them from the API.
+ */
+export interface SourceHashSnapshot {
+    /**
+     * Directory where the snapshots are stored, one file per service. Relative paths are
+     * resolved from the working directory of the workflow.
+     */
+    directory?: string;
+    /**
+     * Flag to keep the fingerprints in a local snapshot between runs.
+     */
+    enabled?: boolean;
+    /**
+     * Snapshots older than this are refreshed from scratch, listing all the entities from the
+     * API.
+     */
+    maxAgeHours?: number;
+}
+
+/**
+ * Keep track of the databases and schemas fully processed by a metadata run in a local
+ * checkpoint per service. If the run fails, the next one resumes from the checkpoint,
+ * skipping the completed entities.
+ */
+export interface Checkpoint {
+    /**
+     * Directory where the checkpoints are stored, one file per service. Relative paths are
+     * resolved from the working directory of the workflow.
+     */
+    directory?: string;
+    /**
+     * Flag to resume failed runs from their checkpoint.
+     */
+    enabled?: boolean;
+    /**
+     * Checkpoints started longer ago than this are discarded, and the run starts from scratch.
+     */
+    maxAgeHours?: number;
+}
+
+/**
+ * Periodically export the latency percentiles of the workflow contexts - topology stages,
+ * REST endpoints, SQL queries,... - to a file or a Prometheus Pushgateway.
+ */
+export interface LatencyMetrics {
+    format?: LatencyMetricsFormat;
+    /**
+     * Seconds between each export of the metrics. They are also exported once the workflow
+     * finishes.
+     */
+    intervalSeconds?: number;
+    /**
+     * File where the latest snapshot of the metrics is written.
+     */
+    path?: string;
+    /**
+     * URL of a Prometheus Pushgateway where the metrics are pushed in the OpenMetrics text
+     * format.
+     */
+    pushgatewayUrl?: string;
+}
+
+/**
+ * Format of the latency metrics files.
+ */
+export enum LatencyMetricsFormat {
+    JSON = "json",
+    Openmetrics = "openmetrics",
+}
+
+/**
+ * Record the spans of the workflow run - topology stages, REST requests, SQL queries and
+ * inspector calls, sink writes - with the thread they ran in, and write them to a trace
+ * file once the workflow finishes.
+ */
+export interface Tracing {
+    /**
+     * Flag to record the trace of the workflow run.
+     */
+    enabled?: boolean;
+    /**
+     * Chrome trace events, to open with Perfetto or chrome://tracing, or OTLP JSON.
+     */
+    format?: TraceFormat;
+    /**
+     * Maximum number of spans kept in memory. Spans recorded afterwards are dropped.
+     */
+    maxSpans?: number;
+    /**
+     * File where the trace is written. Relative paths are resolved from the working directory
+     * of the workflow.
+     */
+    path?: string;
+}
+
+/**
+ * Chrome trace events, to open with Perfetto or chrome://tracing, or OTLP JSON.
+ *
+ * Format of the trace files.
+ */
+export enum TraceFormat {
+    ChromeTrace = "chromeTrace",
+    Otlp = "otlp",
+}
+
+/**
+ * Adapt the number of threads processing the topology entities - e.g., the tables - at
+ * runtime. Workers are added one at a time while they are all busy, and divided when the
+ * process is short on CPU or memory, the source queries or API requests get slower, or the
+ * API throttles the requests.
+ */
+export interface WorkerAutoscaling {
+    /**
+     * Factor applied to the number of workers when reducing them.
+     */
+    decreaseFactor?: number;
+    /**
+     * Flag to adjust the number of workers at runtime. The source `threads` are used as the
+     * initial number of workers.
+     */
+    enabled?: boolean;
+    /**
+     * Seconds between each adjustment of the number of workers.
+     */
+    intervalSeconds?: number;
+    /**
+     * Reduce the workers when the average latency of the source queries or the API requests
+     * exceeds their baseline times this factor.
+     */
+    latencyTolerance?: number;
+    /**
+     * Reduce the workers when the ingestion processes use more CPU than this percentage of the
+     * machine.
+     */
+    maxCpuPercent?: number;
+    /**
+     * Reduce the workers when the ingestion processes use more memory than this percentage of
+     * the machine.
+     */
+    maxMemoryPercent?: number;
+    /**
+     * Maximum number of workers.
+     */
+    maxWorkers?: number;
+    /**
+     * Minimum number of workers.
+     */
+    minWorkers?: number;
+}
+
+/**
+ * Cache the entities the workflow gets by name or id - services, users, tags, tables,... -
+ * so that repeated lookups don't hit the API. The writes of the workflow invalidate the
+ * entities they change.
+ */
+export interface EntityCache {
+    /**
+     * Flag to cache the entities fetched by name or id.
+     */
+    enabled?: boolean;
+    /**
+     * Maximum number of cached entities. The least recently used ones are evicted first.
+     */
+    maxSize?: number;
+    /**
+     * Seconds an entity stays cached, bounding how stale it gets if other clients change it.
+     */
+    ttlSeconds?: number;
+}
+
+/**
+ * Library encoding and decoding the JSON of the API requests, patches and staging files.
+ * `auto` picks the fastest one installed: `orjson`, then `msgspec`, then the standard
+ * library.
+ */
+export enum JSONCodec {
+    Auto = "auto",
+    Msgspec = "msgspec",
+    Orjson = "orjson",
+    Stdlib = "stdlib",
+}
+
+/**
+ * Limit the requests all the threads of the workflow send to the OpenMetadata server, so
+ * that the pipelines sharing a server don't overload it.
+ */
+export interface RateLimit {
+    /**
+     * Caps of all the requests.
+     */
+    all?: RateLimitRule;
+    /**
+     * Caps of the bulk requests.
+     */
+    bulk?: RateLimitRule;
+    /**
+     * Caps of the requests that are neither search nor bulk ones.
+     */
+    crud?: RateLimitRule;
+    /**
+     * Flag to limit the requests sent to the OpenMetadata server.
+     */
+    enabled?: boolean;
+    /**
+     * Caps of the search requests.
+     */
+    search?: RateLimitRule;
+}
+
+/**
+ * Caps of all the requests.
+ *
+ * Caps of the requests sent to the OpenMetadata server. Caps left empty don't limit the
+ * requests.
+ *
+ * Caps of the bulk requests.
+ *
+ * Caps of the requests that are neither search nor bulk ones.
+ *
+ * Caps of the search requests.
+ */
+export interface RateLimitRule {
+    /**
+     * Number of requests that can be sent at once after an idle period. Defaults to the
+     * requests per second.
+     */
+    burst?: number;
+    /**
+     * Maximum number of requests waiting for their response at the same time.
+     */
+    maxInFlight?: number;
+    /**
+     * Maximum number of requests sent per second.
+     */
+    requestsPerSecond?: number;
+}